@@ -0,0 +1,32 @@
+"""add covering index for posts analytics overview
+
+Revision ID: 006_add_posts_overview_index
+Revises: 005_create_character_templates
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006_add_posts_overview_index'
+down_revision: Union[str, None] = '005_create_character_templates'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covering index for the analytics overview aggregates: filter columns first,
+    # engagement counters as INCLUDE columns so sums can be index-only scans
+    op.create_index(
+        'idx_posts_overview',
+        'posts',
+        ['status', 'character_id', 'platform', 'published_at'],
+        postgresql_include=['likes_count', 'comments_count', 'shares_count', 'views_count'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_posts_overview', table_name='posts')
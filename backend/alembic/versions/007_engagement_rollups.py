@@ -0,0 +1,89 @@
+"""create engagement_daily_rollups table
+
+Revision ID: 007_engagement_rollups
+Revises: 006_add_posts_overview_index
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '007_engagement_rollups'
+down_revision: Union[str, None] = '006_add_posts_overview_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create engagement_daily_rollups table (one row per character, platform and day)
+    op.create_table(
+        'engagement_daily_rollups',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('character_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('platform', sa.String(50), nullable=False),
+        sa.Column('day', sa.Date, nullable=False),
+        sa.Column('post_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('likes_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('comments_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('shares_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('views_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('follower_count', sa.Integer, nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    
+    # Create indexes
+    op.create_index(
+        'idx_engagement_rollups_bucket',
+        'engagement_daily_rollups',
+        ['character_id', 'platform', 'day'],
+        unique=True,
+    )
+    op.create_index('idx_engagement_rollups_day', 'engagement_daily_rollups', ['day'])
+    
+    # Create foreign key constraint
+    op.create_foreign_key(
+        'fk_engagement_rollups_character_id',
+        'engagement_daily_rollups', 'characters',
+        ['character_id'], ['id'],
+        ondelete='CASCADE'
+    )
+    
+    # Backfill rollups from existing published posts
+    op.execute("""
+        INSERT INTO engagement_daily_rollups (
+            id, character_id, platform, day,
+            post_count, likes_count, comments_count, shares_count, views_count
+        )
+        SELECT
+            gen_random_uuid(), character_id, platform, DATE(published_at),
+            COUNT(*),
+            COALESCE(SUM(likes_count), 0),
+            COALESCE(SUM(comments_count), 0),
+            COALESCE(SUM(shares_count), 0),
+            COALESCE(SUM(views_count), 0)
+        FROM posts
+        WHERE status = 'published' AND published_at IS NOT NULL
+        GROUP BY character_id, platform, DATE(published_at)
+    """)
+
+    # Backfill recorded follower counts onto their day buckets
+    op.execute("""
+        INSERT INTO engagement_daily_rollups (id, character_id, platform, day, follower_count)
+        SELECT gen_random_uuid(), character_id, platform, metric_date, MAX(metric_value)::integer
+        FROM analytics
+        WHERE metric_type = 'follower_count' AND platform IS NOT NULL
+        GROUP BY character_id, platform, metric_date
+        ON CONFLICT (character_id, platform, day)
+        DO UPDATE SET follower_count = EXCLUDED.follower_count
+    """)
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_engagement_rollups_character_id', 'engagement_daily_rollups', type_='foreignkey')
+    op.drop_index('idx_engagement_rollups_day', table_name='engagement_daily_rollups')
+    op.drop_index('idx_engagement_rollups_bucket', table_name='engagement_daily_rollups')
+    op.drop_table('engagement_daily_rollups')
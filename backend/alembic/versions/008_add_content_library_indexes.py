@@ -0,0 +1,48 @@
+"""add keyset, trigram and tag indexes for the content library
+
+Revision ID: 008_add_content_library_indexes
+Revises: 007_engagement_rollups
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008_add_content_library_indexes'
+down_revision: Union[str, None] = '007_engagement_rollups'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (created_at, id) matches the library order so cursor pages are index range scans
+    op.create_index('idx_content_created_id', 'content', ['created_at', 'id'])
+
+    # Trigram GIN indexes serve the ILIKE '%term%' prompt/file path search
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_content_prompt_trgm',
+        'content',
+        ['prompt'],
+        postgresql_using='gin',
+        postgresql_ops={'prompt': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_content_file_path_trgm',
+        'content',
+        ['file_path'],
+        postgresql_using='gin',
+        postgresql_ops={'file_path': 'gin_trgm_ops'},
+    )
+
+    # Declared on the model already; IF NOT EXISTS covers databases created without it
+    op.create_index('idx_content_tags', 'content', ['tags'], postgresql_using='gin', if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_content_file_path_trgm', table_name='content')
+    op.drop_index('idx_content_prompt_trgm', table_name='content')
+    op.drop_index('idx_content_created_id', table_name='content')
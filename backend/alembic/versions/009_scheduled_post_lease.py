@@ -0,0 +1,49 @@
+"""add dispatch lease columns and indexes to scheduled_posts
+
+Revision ID: 009_scheduled_post_lease
+Revises: 008_add_content_library_indexes
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009_scheduled_post_lease'
+down_revision: Union[str, None] = '008_add_content_library_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('scheduled_posts', sa.Column('claimed_by', sa.String(length=100), nullable=True))
+    op.add_column('scheduled_posts', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Claimed posts are 'processing' until the worker records the outcome
+    op.drop_constraint('scheduled_post_status_check', 'scheduled_posts', type_='check')
+    op.create_check_constraint(
+        'scheduled_post_status_check',
+        'scheduled_posts',
+        "status IN ('pending', 'processing', 'posted', 'cancelled', 'failed')",
+    )
+
+    op.create_index('idx_scheduled_post_due', 'scheduled_posts', ['status', 'scheduled_time'])
+    op.create_index('idx_scheduled_post_character_status', 'scheduled_posts', ['character_id', 'status'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_scheduled_post_character_status', table_name='scheduled_posts')
+    op.drop_index('idx_scheduled_post_due', table_name='scheduled_posts')
+
+    op.execute("UPDATE scheduled_posts SET status = 'pending' WHERE status = 'processing'")
+    op.drop_constraint('scheduled_post_status_check', 'scheduled_posts', type_='check')
+    op.create_check_constraint(
+        'scheduled_post_status_check',
+        'scheduled_posts',
+        "status IN ('pending', 'posted', 'cancelled', 'failed')",
+    )
+
+    op.drop_column('scheduled_posts', 'lease_expires_at')
+    op.drop_column('scheduled_posts', 'claimed_by')
@@ -0,0 +1,60 @@
+"""create automation_pending_actions table
+
+Revision ID: 010_automation_pending
+Revises: 009_scheduled_post_lease
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '010_automation_pending'
+down_revision: Union[str, None] = '009_scheduled_post_lease'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create automation_pending_actions table (one row per timed rule execution)
+    op.create_table(
+        'automation_pending_actions',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('rule_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('platform_account_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('action_type', sa.String(50), nullable=False),
+        sa.Column('execute_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('result', postgresql.JSONB, nullable=True),
+        sa.Column('error_message', sa.Text, nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('executed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.CheckConstraint(
+            "status IN ('pending', 'running', 'executed', 'failed', 'cancelled')",
+            name='automation_pending_action_status_check',
+        ),
+    )
+    
+    # Create indexes
+    op.create_index('idx_automation_pending_actions_due', 'automation_pending_actions', ['status', 'execute_at'])
+    op.create_index('idx_automation_pending_actions_rule', 'automation_pending_actions', ['rule_id'])
+    
+    # Create foreign key constraint
+    op.create_foreign_key(
+        'fk_automation_pending_actions_rule_id',
+        'automation_pending_actions', 'automation_rules',
+        ['rule_id'], ['id'],
+        ondelete='CASCADE'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_automation_pending_actions_rule_id', 'automation_pending_actions', type_='foreignkey')
+    op.drop_index('idx_automation_pending_actions_rule', table_name='automation_pending_actions')
+    op.drop_index('idx_automation_pending_actions_due', table_name='automation_pending_actions')
+    op.drop_table('automation_pending_actions')
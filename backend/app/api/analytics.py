@@ -15,6 +15,7 @@ from app.core.logging import get_logger
 from app.core.config import settings
 from app.core.error_taxonomy import ErrorCode, classify_error, create_error_response
 from app.services.engagement_analytics_service import EngagementAnalyticsService
+from app.services.engagement_rollup_service import EngagementRollupService
 from app.services.character_performance_tracking_service import (
     CharacterPerformanceTrackingService,
 )
@@ -651,6 +652,81 @@ async def create_performance_snapshot(
         )
 
 
+
+def _parse_rollup_params(
+    character_id: Optional[str], from_date: Optional[str], to_date: Optional[str]
+) -> tuple[Optional[UUID], Optional[date], Optional[date]]:
+    """Parse the optional character/date-range parameters of the rollup endpoints."""
+    try:
+        character_id_uuid = UUID(character_id) if character_id else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid character_id format: {character_id}")
+    try:
+        from_day = date.fromisoformat(from_date) if from_date else None
+        to_day = date.fromisoformat(to_date) if to_date else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format, expected YYYY-MM-DD")
+    return character_id_uuid, from_day, to_day
+
+
+@router.get("/daily", tags=["analytics"])
+async def get_daily_engagement(
+    character_id: Optional[str] = Query(None, description="Filter by character ID"),
+    platform: Optional[str] = Query(None, description="Filter by platform"),
+    from_date: Optional[str] = Query(None, description="First day (YYYY-MM-DD)"),
+    to_date: Optional[str] = Query(None, description="Last day (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """
+    Get the daily engagement series from the pre-aggregated rollups.
+
+    Query Parameters:
+        character_id: Optional character ID to filter by.
+        platform: Optional platform name to filter by.
+        from_date: Optional first day (YYYY-MM-DD).
+        to_date: Optional last day (YYYY-MM-DD).
+
+    Returns:
+        Per-day posts, likes, comments, shares, views, engagement and follower count.
+    """
+    character_id_uuid, from_day, to_day = _parse_rollup_params(character_id, from_date, to_date)
+    try:
+        series = await EngagementRollupService(db).get_daily_series(
+            character_id_uuid, platform, from_day, to_day
+        )
+    except Exception as e:
+        logger.exception("Error getting daily engagement series")
+        raise HTTPException(status_code=500, detail=f"Error getting daily series: {str(e)}")
+    return {"series": series}
+
+
+@router.post("/rollups/backfill", tags=["analytics"])
+async def backfill_engagement_rollups(
+    character_id: Optional[str] = Query(None, description="Only rebuild this character"),
+    from_date: Optional[str] = Query(None, description="First day to rebuild (YYYY-MM-DD)"),
+    to_date: Optional[str] = Query(None, description="Last day to rebuild (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """
+    Rebuild daily engagement rollups from posts and recorded follower counts.
+
+    Query Parameters:
+        character_id: Optional character ID to rebuild (all characters if omitted).
+        from_date: Optional first day to rebuild (YYYY-MM-DD).
+        to_date: Optional last day to rebuild (YYYY-MM-DD).
+
+    Returns:
+        Number of rollup rows written and characters touched.
+    """
+    character_id_uuid, from_day, to_day = _parse_rollup_params(character_id, from_date, to_date)
+    try:
+        stats = await EngagementRollupService(db).backfill(character_id_uuid, from_day, to_day)
+    except Exception as e:
+        logger.exception("Error backfilling engagement rollups")
+        raise HTTPException(status_code=500, detail=f"Error backfilling rollups: {str(e)}")
+    return {"ok": True, **stats}
+
+
 # ===== Content Strategy Adjustment Endpoints =====
 
 class StrategyAdjustmentResponse(BaseModel):
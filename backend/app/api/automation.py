@@ -98,6 +98,37 @@ class AutomationRuleExecuteResponse(BaseModel):
     error: str | None = None
 
 
+class AutomationPendingActionResponse(BaseModel):
+    """Response model for a scheduled rule execution."""
+
+    id: str
+    rule_id: str
+    platform_account_id: str
+    action_type: str
+    execute_at: str
+    status: str
+    result: dict | None
+    error_message: str | None
+    executed_at: str | None
+    created_at: str
+
+    @classmethod
+    def from_action(cls, action) -> "AutomationPendingActionResponse":
+        """Build the response from an AutomationPendingAction row."""
+        return cls(
+            id=str(action.id),
+            rule_id=str(action.rule_id),
+            platform_account_id=str(action.platform_account_id),
+            action_type=action.action_type,
+            execute_at=action.execute_at.isoformat(),
+            status=action.status,
+            result=action.result,
+            error_message=action.error_message,
+            executed_at=action.executed_at.isoformat() if action.executed_at else None,
+            created_at=action.created_at.isoformat() if action.created_at else "",
+        )
+
+
 # CRUD Endpoints
 
 @router.post("/rules", response_model=AutomationRuleResponse, tags=["automation"])
@@ -323,13 +354,17 @@ async def execute_automation_rule(
     """
     Execute an automation rule.
 
+    The action is scheduled after a human-like delay and runs in the
+    background; the response carries the pending action (see
+    GET /automation/actions) rather than the action's own result.
+
     Args:
         rule_id: Automation rule UUID.
         req: Execution request (optional platform_account_id override).
         db: Database session dependency.
 
     Returns:
-        Execution result.
+        Execution result with the scheduled pending action.
 
     Raises:
         HTTPException: 404 if rule not found, 400 if execution fails, 500 if unexpected error.
@@ -361,3 +396,74 @@ async def execute_automation_rule(
         logger.error(f"Unexpected error executing automation rule: {exc}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Unexpected error: {exc}")
 
+
+@router.get("/actions", response_model=list[AutomationPendingActionResponse], tags=["automation"])
+async def list_pending_actions(
+    rule_id: str | None = Query(default=None, description="Filter by rule ID"),
+    status: str | None = Query(
+        default="pending", description="Filter by status (pending, running, executed, failed, cancelled)"
+    ),
+    limit: int = Query(default=100, ge=1, le=1000, description="Maximum number of actions"),
+    db: AsyncSession = Depends(get_db),
+) -> list[AutomationPendingActionResponse]:
+    """
+    List scheduled rule executions, soonest first.
+
+    Args:
+        rule_id: Filter by rule ID (optional).
+        status: Filter by status (default: pending).
+        limit: Maximum number of actions returned.
+        db: Database session dependency.
+
+    Returns:
+        List of pending actions.
+
+    Raises:
+        HTTPException: 400 if UUID invalid, 500 if query fails.
+    """
+    try:
+        scheduler = AutomationSchedulerService(db)
+        rule_uuid = UUID(rule_id) if rule_id else None
+
+        actions = await scheduler.list_pending_actions(rule_id=rule_uuid, status=status, limit=limit)
+
+        return [AutomationPendingActionResponse.from_action(action) for action in actions]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid UUID format: {exc}")
+    except Exception as exc:
+        logger.error(f"Unexpected error listing pending actions: {exc}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Unexpected error: {exc}")
+
+
+@router.delete("/actions/{action_id}", response_model=AutomationPendingActionResponse, tags=["automation"])
+async def cancel_pending_action(
+    action_id: str,
+    db: AsyncSession = Depends(get_db),
+) -> AutomationPendingActionResponse:
+    """
+    Cancel a scheduled rule execution that has not started yet.
+
+    Args:
+        action_id: Pending action UUID.
+        db: Database session dependency.
+
+    Returns:
+        The cancelled action.
+
+    Raises:
+        HTTPException: 400 if UUID invalid, 404 if not found, 409 if already started or finished.
+    """
+    try:
+        scheduler = AutomationSchedulerService(db)
+
+        action = await scheduler.cancel_pending_action(UUID(action_id))
+
+        return AutomationPendingActionResponse.from_action(action)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid UUID format: {exc}")
+    except AutomationSchedulerError as exc:
+        status_code = 404 if "not found" in str(exc) else 409
+        raise HTTPException(status_code=status_code, detail=str(exc))
+    except Exception as exc:
+        logger.error(f"Unexpected error cancelling pending action: {exc}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Unexpected error: {exc}")
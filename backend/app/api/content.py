@@ -12,13 +12,12 @@ from __future__ import annotations
 import io
 import json
 import os
-import time
 import zipfile
 from datetime import datetime
 from pathlib import Path
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -26,9 +25,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.paths import images_dir
 from app.models.content import Content
-from app.services.content_service import ContentService
+from app.services.content_service import ContentService, TotalMode, encode_content_cursor
 from app.services.generation_service import generation_service
-from app.services.quality_validator import quality_validator
+from app.services.image_hash_index import DEFAULT_MAX_DISTANCE
+from app.services.image_storage_service import image_storage_service
+from app.services.quality_validator import QualityProfile, quality_validator
+from app.services.zip_stream import ZipEntry, aiter_zip
 from app.services.caption_generation_service import (
     CaptionGenerationRequest,
     caption_generation_service,
@@ -130,13 +132,10 @@ def delete_image(filename: str) -> dict:
     # Basic safety: only allow deleting pngs in our images directory
     if "/" in filename or "\\" in filename or not filename.endswith(".png"):
         return {"ok": False, "error": "invalid_filename"}
-    p = images_dir() / filename
-    if not p.exists():
+    if not (images_dir() / filename).exists():
         return {"ok": False, "error": "not_found"}
-    try:
-        p.unlink()
-    except Exception as exc:  # noqa: BLE001
-        return {"ok": False, "error": str(exc)}
+    if not image_storage_service.delete_image(filename):
+        return {"ok": False, "error": "delete_failed"}
     return {"ok": True}
 
 
@@ -179,13 +178,9 @@ def bulk_delete_images(req: BulkDeleteRequest) -> dict:
         if "/" in filename or "\\" in filename or not filename.endswith(".png"):
             skipped += 1
             continue
-        p = images_dir() / filename
-        try:
-            p.unlink()
+        if image_storage_service.delete_image(filename):
             deleted += 1
-        except FileNotFoundError:
-            skipped += 1
-        except Exception:
+        else:
             skipped += 1
     return {"ok": True, "deleted": deleted, "skipped": skipped}
 
@@ -225,19 +220,80 @@ def cleanup_images(req: CleanupRequest) -> dict:
         }
         ```
     """
-    cutoff = time.time() - (req.older_than_days * 86400)
-    deleted = 0
-    skipped = 0
-    for p in images_dir().glob("*.png"):
-        try:
-            if p.stat().st_mtime < cutoff:
-                p.unlink()
-                deleted += 1
-        except FileNotFoundError:
-            skipped += 1
-        except Exception:
-            skipped += 1
-    return {"ok": True, "deleted": deleted, "skipped": skipped, "older_than_days": req.older_than_days}
+    return {"ok": True, **image_storage_service.cleanup_old_images(req.older_than_days)}
+
+
+@router.get("/images/duplicates")
+def find_duplicate_images(
+    max_distance: int = Query(default=DEFAULT_MAX_DISTANCE, ge=0, le=32),
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> dict:
+    """Group near-duplicate images across the whole image library.
+    
+    Uses the persistent perceptual-hash index filled in when images are saved,
+    so the lookup does not decode or compare image pairs.
+    
+    Args:
+        max_distance: Maximum perceptual-hash Hamming distance (0-32, default: 8).
+            0 matches visually identical images; larger values match looser variants.
+        limit: Maximum number of groups to return (1-1000, default: 100).
+    
+    Returns:
+        dict: Response containing:
+            - groups: List of groups (largest first), each with images (filenames) and count
+            - total_groups: Number of duplicate groups found
+            - duplicate_images: Images that could be removed keeping one per group
+            - max_distance: Applied distance threshold
+    
+    Example:
+        ```json
+        {
+            "groups": [
+                {"images": ["image_001.png", "image_007.png"], "count": 2}
+            ],
+            "total_groups": 1,
+            "duplicate_images": 1,
+            "max_distance": 8
+        }
+        ```
+    """
+    groups = image_storage_service.find_duplicate_images(max_distance=max_distance)
+    return {
+        "groups": [{"images": names, "count": len(names)} for names in groups[:limit]],
+        "total_groups": len(groups),
+        "duplicate_images": sum(len(names) - 1 for names in groups),
+        "max_distance": max_distance,
+    }
+
+
+@router.get("/images/{filename}/similar")
+def find_similar_images(
+    filename: str,
+    max_distance: int = Query(default=DEFAULT_MAX_DISTANCE, ge=0, le=32),
+    limit: int = Query(default=20, ge=1, le=200),
+) -> dict:
+    """Find library images that look like a given image.
+    
+    Args:
+        filename: Name of the reference image file.
+        max_distance: Maximum perceptual-hash Hamming distance (0-32, default: 8).
+        limit: Maximum number of matches to return (1-200, default: 20).
+    
+    Returns:
+        dict: Response containing:
+            - filename: Reference image filename
+            - matches: Closest images first, each with filename, url, phash_distance,
+              dhash_distance and similarity (cosine similarity of color layout, -1 to 1)
+    
+    Raises:
+        HTTPException: 400 if the filename is invalid, 404 if the image does not exist.
+    """
+    if "/" in filename or "\\" in filename or ".." in filename:
+        raise HTTPException(status_code=400, detail="invalid_filename")
+    matches = image_storage_service.find_similar_images(filename, max_distance=max_distance, limit=limit)
+    if matches is None:
+        raise HTTPException(status_code=404, detail="not_found")
+    return {"filename": filename, "matches": matches}
 
 
 @router.get("/images/download")
@@ -292,6 +348,14 @@ class ValidateContentRequest(BaseModel):
     """Request model for content quality validation."""
 
     file_path: str = Field(..., description="Path to content file to validate")
+    profile: QualityProfile = Field(
+        default="full",
+        description="Image check profile: 'fast' for batch triage, 'full' for final approval",
+    )
+    checks: list[str] | None = Field(
+        default=None,
+        description="Explicit image checks to run (overrides profile), e.g. ['blur', 'lighting']",
+    )
 
 
 @router.post("/validate")
@@ -299,7 +363,8 @@ def validate_content(req: ValidateContentRequest) -> dict:
     """Validate content quality.
     
     Args:
-        req: ValidateContentRequest containing file_path to the content file.
+        req: ValidateContentRequest containing file_path to the content file and
+            the check profile (or explicit check list) to run.
     
     Returns:
         dict: Validation result containing:
@@ -335,7 +400,10 @@ def validate_content(req: ValidateContentRequest) -> dict:
         }
         ```
     """
-    result = quality_validator.validate_content(file_path=req.file_path)
+    try:
+        result = quality_validator.validate_content(file_path=req.file_path, profile=req.profile, checks=req.checks)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     return {
         "ok": result.is_valid,
@@ -696,13 +764,19 @@ async def list_content_library(
     search: str | None = Query(default=None, description="Search in prompt and file path"),
     tags: str | None = Query(default=None, description="Filter by tags (comma-separated, content must have all tags)"),
     limit: int = Query(default=50, ge=1, le=500, description="Limit results"),
-    offset: int = Query(default=0, ge=0, description="Offset for pagination"),
+    offset: int = Query(default=0, ge=0, description="Offset for pagination (ignored when cursor is set)"),
+    cursor: str | None = Query(default=None, description="Continue after this cursor (next_cursor of the previous page)"),
+    total: TotalMode = Query(
+        default="exact", description="How to compute the total: exact, cached, estimated or none"
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     List content library with filtering, search, and pagination.
 
     Supports filtering by character, type, category, approval status, date range, tags, and search.
+    Pages are either offset-based or, for constant-cost deep paging, cursor-based: pass the
+    previous response's ``next_cursor`` as ``cursor`` (it is null on the last page).
     """
     try:
         service = ContentService(db)
@@ -749,6 +823,8 @@ async def list_content_library(
             limit=limit,
             offset=offset,
             include_character=True,
+            cursor=cursor,
+            total=total,
         )
 
         # Serialize content
@@ -790,11 +866,15 @@ async def list_content_library(
             "ok": True,
             "items": items,
             "total": total_count,
+            "total_mode": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": encode_content_cursor(content_list[-1]) if len(content_list) == limit else None,
         }
     except HTTPException:
         raise
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     except Exception as exc:
         return {"ok": False, "error": str(exc)}
 
@@ -1205,9 +1285,15 @@ class BatchDownloadRequest(BaseModel):
 @router.post("/library/batch/download", response_model=None)
 async def batch_download_content(
     req: BatchDownloadRequest,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> StreamingResponse | dict:
-    """Batch download content items as ZIP."""
+    """Batch download content items as a streamed ZIP.
+
+    Rows are fetched in one query and the archive is produced chunk by chunk while
+    files are read, so memory use does not grow with the export. Already-compressed
+    media is stored without deflate, and the export stops if the client disconnects.
+    """
     try:
         content_uuids = []
         for content_id in req.content_ids:
@@ -1216,31 +1302,31 @@ async def batch_download_content(
             except ValueError:
                 return {"ok": False, "error": f"Invalid content_id format: {content_id}"}
 
-        service = ContentService(db)
-        mem = io.BytesIO()
-
-        with zipfile.ZipFile(mem, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-            manifest = {"count": 0, "files": []}
+        contents = await ContentService(db).get_contents(content_uuids)
+
+        entries: list[ZipEntry] = []
+        manifest = {"count": 0, "files": []}
+        for content in contents:
+            if not content.file_path:
+                continue
+            file_path = Path(content.file_path)
+            if file_path.is_file():
+                arcname = f"{content.content_type}/{file_path.name}"
+                entries.append(ZipEntry(arcname, path=file_path))
+                manifest["files"].append({
+                    "id": str(content.id),
+                    "type": content.content_type,
+                    "path": arcname,
+                })
+                manifest["count"] += 1
+        entries.append(ZipEntry("manifest.json", data=json.dumps(manifest, indent=2, sort_keys=True).encode()))
 
-            for content_uuid in content_uuids:
-                content = await service.get_content(content_uuid, include_character=False)
-                if content and content.file_path:
-                    file_path = Path(content.file_path)
-                    if file_path.exists() and file_path.is_file():
-                        arcname = f"{content.content_type}/{file_path.name}"
-                        zf.write(file_path, arcname=arcname)
-                        manifest["files"].append({
-                            "id": str(content.id),
-                            "type": content.content_type,
-                            "path": arcname,
-                        })
-                        manifest["count"] += 1
-
-            zf.writestr("manifest.json", json.dumps(manifest, indent=2, sort_keys=True))
-
-        mem.seek(0)
         headers = {"Content-Disposition": 'attachment; filename="ainfluencer-content-library.zip"'}
-        return StreamingResponse(mem, media_type="application/zip", headers=headers)
+        return StreamingResponse(
+            aiter_zip(entries, is_cancelled=request.is_disconnected),
+            media_type="application/zip",
+            headers=headers,
+        )
     except Exception as exc:
         return {"ok": False, "error": str(exc)}
 
@@ -116,6 +116,7 @@ async def report_takedown(
         )
 
         await db.commit()
+        await service.rollups.invalidate_cache()
 
         return TakedownReportResponse(
             ok=True,
@@ -167,6 +168,7 @@ async def batch_report_takedowns(
         )
 
         await db.commit()
+        await service.rollups.invalidate_cache()
 
         return BatchTakedownReportResponse(
             ok=True,
@@ -7,16 +7,14 @@ This module provides API endpoints for generating content including:
 - Batch download of generated content
 """
 
-from __future__ import annotations
-
 import io
 import json
 import zipfile
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
-from fastapi import APIRouter, Request
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.core.middleware import limiter
@@ -26,6 +24,7 @@ from app.services.face_consistency_service import (
     face_consistency_service,
 )
 from app.services.generation_service import generation_service
+from app.services.job_scheduler import QueueFullError
 from app.services.gpu_optimizer import get_gpu_optimizer
 from app.services.text_generation_service import (
     TextGenerationRequest,
@@ -134,6 +133,7 @@ class GenerateImageRequest(BaseModel):
     quality_threshold: float = Field(default=0.6, ge=0.0, le=1.0, description="Quality score threshold for auto-retry (0.0-1.0, default: 0.6). Images below this threshold will be retried if auto_retry_on_low_quality is True.")
     max_auto_retries: int = Field(default=1, ge=0, le=3, description="Maximum number of auto-retry attempts for low-quality images (0-3, default: 1).")
     batch_preset: str | None = Field(default=None, max_length=32, description="Batch generation preset: 'quick' (fast, lower quality), 'quality' (slower, higher quality), 'speed' (fastest, basic quality), or None (use request parameters).")
+    priority: Literal["interactive", "batch"] | None = Field(default=None, description="Queue lane: 'interactive' (served first) or 'batch' (background work). Defaults to 'batch' when batch_size > 1, otherwise 'interactive'.")
 
 
 @router.post("/image")
@@ -153,7 +153,9 @@ def generate_image(request: Request, req: GenerateImageRequest) -> dict:
     Returns:
         dict: Response with job information including job ID, state, and batch_size.
             For batch generation (batch_size > 1), the job will contain image_paths
-            array when completed.
+            array when completed. Includes queue_position while the job waits for a worker.
+            When the generation queue is full, responds with HTTP 429 and the current
+            queue depth so clients can back off and retry.
             
     Raises:
         HTTPException: If validation fails or service error occurs.
@@ -229,12 +231,12 @@ def generate_image(request: Request, req: GenerateImageRequest) -> dict:
             if not face_consistency_method:
                 face_consistency_method = metadata.get("method")
             
-            status = metadata.get("status")
-            if status and status != "ready":
+            embedding_status = metadata.get("status")
+            if embedding_status and embedding_status != "ready":
                 return {
                     "ok": False,
                     "error": "embedding_not_ready",
-                    "message": f"Face embedding '{req.face_embedding_id}' is not ready (status={status})",
+                    "message": f"Face embedding '{req.face_embedding_id}' is not ready (status={embedding_status})",
                 }
         
         # Store auto-retry settings in job params
@@ -261,6 +263,7 @@ def generate_image(request: Request, req: GenerateImageRequest) -> dict:
             face_image_path=face_image_path,
             face_consistency_method=face_consistency_method,
             face_embedding_id=req.face_embedding_id,
+            priority=req.priority,
         )
         
         # Update job params with extra settings
@@ -271,6 +274,7 @@ def generate_image(request: Request, req: GenerateImageRequest) -> dict:
             "job": job.__dict__,
             "batch_size": req.batch_size,
             "is_batch": req.batch_size > 1,
+            "queue_position": generation_service.queue_position(job.id),
         }
         
         # Add recommendations if batch size might be suboptimal
@@ -290,6 +294,18 @@ def generate_image(request: Request, req: GenerateImageRequest) -> dict:
         
         return response
         
+    except QueueFullError as e:
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={
+                "ok": False,
+                "error": "queue_full",
+                "message": str(e),
+                "queue_depth": e.depth,
+                "max_queue_depth": e.max_depth,
+            },
+            headers={"Retry-After": "30"},
+        )
     except ValueError as e:
         return {
             "ok": False,
@@ -336,6 +352,8 @@ def get_image_job(job_id: str) -> dict:
         "is_batch": is_batch,
         "image_count": image_count,
     }
+    if job.state == "queued":
+        response["queue_position"] = generation_service.queue_position(job_id)
     
     # Add batch progress tracking
     if is_batch and job.params:
@@ -363,7 +381,8 @@ def rank_batch_images(job_id: str, min_quality: float = 0.0, limit: int = 10) ->
         limit: Maximum number of top images to return (default: 10)
         
     Returns:
-        dict: Ranked list of images with quality scores
+        dict: Ranked list of images with quality scores. While the batch is still
+            being scored, only images scored so far are ranked ("scoring_complete" is False).
     """
     job = generation_service.get_job(job_id)
     if not job:
@@ -407,6 +426,8 @@ def rank_batch_images(job_id: str, min_quality: float = 0.0, limit: int = 10) ->
         "job_id": job_id,
         "total_images": len(job.image_paths),
         "filtered_count": len(ranked_images),
+        "scored_count": len(quality_results),
+        "scoring_complete": job.state not in ("queued", "running"),
         "min_quality_threshold": min_quality,
         "top_images": top_images,
     }
@@ -495,6 +516,7 @@ def get_batch_queue_stats() -> dict:
     - Queue status (queued, running, completed, failed)
     - Total images queued, processing, and completed
     - Resource usage metrics
+    - Worker pool state (lane depths, active workers, depth limit)
     
     Returns:
         dict: Queue statistics with job counts and image counts
@@ -503,6 +525,7 @@ def get_batch_queue_stats() -> dict:
     return {
         "ok": True,
         "queue_stats": stats,
+        "scheduler": generation_service.queue_stats(),
     }
 
 
@@ -1062,13 +1085,13 @@ def create_ab_test(req: ABTestRequest) -> dict:
         )
         
         # Store A/B test metadata in job params
-        if not job.params:
-            job.params = {}
-        job.params["ab_test_id"] = ab_test_id
-        job.params["variant_name"] = variant_name
-        job.params["variant_index"] = idx
-        job.params["total_variants"] = len(req.variants)
-        generation_service._persist_jobs_to_disk()
+        generation_service._update_job_params(
+            job.id,
+            ab_test_id=ab_test_id,
+            variant_name=variant_name,
+            variant_index=idx,
+            total_variants=len(req.variants),
+        )
         
         variant_jobs.append({
             "variant_name": variant_name,
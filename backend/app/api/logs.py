@@ -2,26 +2,71 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
 
-from app.core.paths import logs_dir, repo_root
+from app.core.paths import repo_root
 from app.services.comfyui_manager import comfyui_manager
 from app.services.installer_service import installer
+from app.services.log_query import get_backend_log_query, iter_lines_reversed
 
 router = APIRouter()
 
 
+def _in_range(timestamp: float, since: float | None, until: float | None) -> bool:
+    return (since is None or timestamp >= since) and (until is None or timestamp <= until)
+
+
+def _system_events(limit: int, level: str | None, since: float | None, until: float | None) -> list[dict[str, Any]]:
+    """Newest matching events of the latest run, read from the end of events.jsonl."""
+    runs_dir = repo_root() / "runs"
+    latest_file = runs_dir / "latest.txt"
+    if not latest_file.exists():
+        return []
+    events_file = runs_dir / latest_file.read_text().strip() / "events.jsonl"
+    if not events_file.exists():
+        return []
+    
+    events: list[dict[str, Any]] = []
+    for line in iter_lines_reversed(events_file):
+        try:
+            event = json.loads(line)
+        except Exception:
+            continue
+        entry = {
+            "timestamp": event.get("ts", 0),
+            "level": event.get("level", "info"),
+            "source": event.get("service", "system"),
+            "message": event.get("message", ""),
+            "raw": event,
+        }
+        if level and str(entry["level"]).lower() != level.lower():
+            continue
+        if not _in_range(entry["timestamp"], since, until):
+            if since is not None and entry["timestamp"] < since:
+                break  # Everything further back is older
+            continue
+        events.append(entry)
+        if len(events) >= limit:
+            break
+    return events
+
+
 @router.get("/logs")
 def get_logs(
     limit: int = Query(default=100, ge=1, le=1000),
     source: str | None = Query(default=None, description="Filter by source: installer, comfyui, system, all"),
     level: str | None = Query(default=None, description="Filter by level: info, warning, error"),
+    since: float | None = Query(default=None, description="Only entries at or after this unix timestamp"),
+    until: float | None = Query(default=None, description="Only entries at or before this unix timestamp"),
 ) -> dict[str, Any]:
     """
     Get unified logs from all sources.
@@ -31,66 +76,17 @@ def get_logs(
     - Installer service
     - ComfyUI manager
     - System logs (from runs/)
+    
+    File-backed sources are read newest-first and stop once ``limit`` matching
+    entries are found; the backend log uses its sidecar index to skip blocks
+    that cannot match the level or time range.
     """
     all_logs: list[dict[str, Any]] = []
     
-    # Get backend application logs from log files
+    # Get backend application logs from log files (active file and rotated backups)
     if source is None or source in ("backend", "system", "all"):
         try:
-            backend_log_file = logs_dir() / "backend.log"
-            # Also check rotated files (backend.log.1, backend.log.2, etc.)
-            log_files = [backend_log_file]
-            for i in range(1, 6):  # Check up to 5 rotated files
-                rotated_file = logs_dir() / f"backend.log.{i}"
-                if rotated_file.exists():
-                    log_files.append(rotated_file)
-            
-            # Read from newest to oldest (reverse order)
-            for log_file in reversed(log_files):
-                if not log_file.exists():
-                    continue
-                try:
-                    with log_file.open("r", encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            if not line:
-                                continue
-                            try:
-                                # Parse JSON log entry
-                                log_entry = json.loads(line)
-                                # Extract timestamp from asctime or use current time
-                                asctime = log_entry.get("asctime", "")
-                                timestamp = 0
-                                if asctime:
-                                    try:
-                                        # Parse ISO format or standard format
-                                        dt = datetime.strptime(asctime, "%Y-%m-%d %H:%M:%S")
-                                        timestamp = dt.timestamp()
-                                    except Exception:
-                                        try:
-                                            dt = datetime.fromisoformat(asctime.replace("Z", "+00:00"))
-                                            timestamp = dt.timestamp()
-                                        except Exception:
-                                            pass
-                                
-                                # Extract level and message
-                                level = log_entry.get("levelname", "info").lower()
-                                message = log_entry.get("message", "")
-                                name = log_entry.get("name", "backend")
-                                
-                                all_logs.append({
-                                    "timestamp": timestamp,
-                                    "level": level,
-                                    "source": "backend",
-                                    "message": message,
-                                    "logger": name,
-                                    "raw": log_entry,
-                                })
-                            except json.JSONDecodeError:
-                                # If not JSON, try to parse as plain text
-                                pass
-                except Exception:
-                    pass  # Non-fatal if file can't be read
+            all_logs.extend(get_backend_log_query().query(limit, level=level, since=since, until=until))
         except Exception:
             pass  # Non-fatal if backend logs can't be read
     
@@ -140,37 +136,15 @@ def get_logs(
     # Get system logs from runs/ directory (if available)
     if source is None or source in ("system", "all"):
         try:
-            # Check for run logs (events.jsonl)
-            runs_dir = repo_root() / "runs"
-            if runs_dir.exists():
-                # Find latest run
-                latest_file = runs_dir / "latest.txt"
-                if latest_file.exists():
-                    latest_run = latest_file.read_text().strip()
-                    events_file = runs_dir / latest_run / "events.jsonl"
-                    if events_file.exists():
-                        with events_file.open("r", encoding="utf-8") as f:
-                            for line in f:
-                                line = line.strip()
-                                if not line:
-                                    continue
-                                try:
-                                    event = json.loads(line)
-                                    all_logs.append({
-                                        "timestamp": event.get("ts", 0),
-                                        "level": event.get("level", "info"),
-                                        "source": event.get("service", "system"),
-                                        "message": event.get("message", ""),
-                                        "raw": event,
-                                    })
-                                except Exception:
-                                    pass
+            all_logs.extend(_system_events(limit, level, since, until))
         except Exception:
             pass  # Non-fatal if system logs can't be read
     
-    # Apply level filter
+    # Apply level and time filters (file-backed sources are already filtered)
     if level:
         all_logs = [log for log in all_logs if log["level"].lower() == level.lower()]
+    if since is not None or until is not None:
+        all_logs = [log for log in all_logs if _in_range(log["timestamp"], since, until)]
     
     # Sort by timestamp (newest first)
     all_logs.sort(key=lambda x: x["timestamp"], reverse=True)
@@ -190,6 +164,65 @@ def get_logs(
     }
 
 
+_TAIL_BATCH = 200
+
+
+@router.get("/logs/tail")
+def tail_logs(
+    cursor: str | None = Query(default=None, description="Cursor returned by the previous call"),
+    limit: int = Query(default=100, ge=1, le=1000),
+    level: str | None = Query(default=None, description="Filter by level: info, warning, error"),
+) -> dict[str, Any]:
+    """
+    Follow the backend log from a cursor.
+    
+    Without a cursor, returns the newest ``limit`` entries and a cursor at the
+    end of the log. Pass the returned cursor back to get only entries written
+    since (oldest first). ``reset`` is true when the cursor's file was rotated
+    away, or the cursor could not be parsed, and reading restarted at the
+    oldest retained file.
+    """
+    tail = get_backend_log_query().tail(cursor, limit, level=level)
+    return {
+        "logs": tail.entries,
+        "count": len(tail.entries),
+        "cursor": tail.cursor,
+        "reset": tail.reset,
+    }
+
+
+@router.get("/logs/stream")
+async def stream_logs(
+    request: Request,
+    cursor: str | None = Query(default=None, description="Cursor to resume from"),
+    level: str | None = Query(default=None, description="Filter by level: info, warning, error"),
+    poll_interval_s: float = Query(default=1.0, ge=0.2, le=30.0),
+) -> StreamingResponse:
+    """
+    Stream new backend log entries as server-sent events.
+    
+    Each event carries a batch of entries and uses the cursor as its ``id``,
+    so an EventSource reconnecting with ``Last-Event-ID`` resumes where it
+    stopped. Without a cursor the stream starts at the current end of the log.
+    """
+    engine = get_backend_log_query()
+    
+    async def events() -> AsyncIterator[str]:
+        position = cursor or request.headers.get("last-event-id")
+        if position is None:
+            position = (await asyncio.to_thread(engine.tail, None, 1, level=level)).cursor
+        while not await request.is_disconnected():
+            tail = await asyncio.to_thread(engine.tail, position, _TAIL_BATCH, level=level)
+            position = tail.cursor
+            if tail.entries or tail.reset:
+                payload = json.dumps({"logs": tail.entries, "reset": tail.reset}, default=str)
+                yield f"id: {position}\ndata: {payload}\n\n"
+            if len(tail.entries) < _TAIL_BATCH:
+                await asyncio.sleep(poll_interval_s)
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @router.get("/logs/stats")
 def get_log_stats() -> dict[str, Any]:
     """
@@ -205,24 +238,10 @@ def get_log_stats() -> dict[str, Any]:
     all_logs: list[dict[str, Any]] = []
     
     # Collect from all sources
+    backend_levels: dict[str, int] = {}
     try:
-        # Backend logs
-        backend_log_file = logs_dir() / "backend.log"
-        if backend_log_file.exists():
-            with backend_log_file.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        log_entry = json.loads(line)
-                        level = log_entry.get("levelname", "info").lower()
-                        all_logs.append({
-                            "source": "backend",
-                            "level": level,
-                        })
-                    except Exception:
-                        pass
+        # Backend logs (counted from the sidecar index, no lines are read)
+        backend_levels = get_backend_log_query().level_counts()
     except Exception:
         pass
     
@@ -256,6 +275,11 @@ def get_log_stats() -> dict[str, Any]:
     level_counts: dict[str, int] = {}
     source_level_counts: dict[str, dict[str, int]] = {}
     
+    if backend_levels:
+        source_counts["backend"] = sum(backend_levels.values())
+        level_counts.update(backend_levels)
+        source_level_counts["backend"] = dict(backend_levels)
+    
     for log in all_logs:
         source = log.get("source", "unknown")
         level = log.get("level", "info")
@@ -272,11 +296,11 @@ def get_log_stats() -> dict[str, Any]:
         source_level_counts[source][level] = source_level_counts[source].get(level, 0) + 1
     
     return {
-        "total": len(all_logs),
+        "total": sum(source_counts.values()),
         "by_source": source_counts,
         "by_level": level_counts,
         "by_source_and_level": source_level_counts,
-        "sources": sorted(set(log.get("source", "unknown") for log in all_logs)),
-        "levels": sorted(set(log.get("level", "info") for log in all_logs)),
+        "sources": sorted(source_counts),
+        "levels": sorted(level_counts),
     }
 
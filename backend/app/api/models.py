@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException
 from fastapi import File, Form, UploadFile
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import cast
 
 from app.services.model_manager import ModelType, model_manager
@@ -26,6 +26,12 @@ class DownloadRequest(BaseModel):
     model_id: str
 
 
+class BandwidthRequest(BaseModel):
+    """Request model for setting the model download bandwidth cap."""
+
+    mbps: float = Field(..., ge=0, description="Combined cap in MB/s (0 = unlimited)")
+
+
 class CancelRequest(BaseModel):
     """Request model for cancelling a model download."""
 
@@ -92,14 +98,43 @@ def custom_catalog() -> dict:
 @router.get("/downloads/active")
 def active() -> dict:
     """
-    Get currently active download.
+    Get currently active downloads.
+    
+    Returns the longest-running download in progress, if any, and all
+    downloads in progress (several models download concurrently).
+    
+    Returns:
+        dict: Active download item or None, and the list of all active items
+    """
+    return {"item": model_manager.active(), "items": model_manager.active_items()}
+
+
+@router.get("/downloads/bandwidth")
+def get_bandwidth() -> dict:
+    """
+    Get the combined model download bandwidth cap.
     
-    Returns the download that is currently in progress, if any.
+    Returns:
+        dict: Cap in MB/s (0 = unlimited)
+    """
+    return {"mbps": model_manager.bandwidth_limit()}
+
+
+@router.put("/downloads/bandwidth")
+def set_bandwidth(req: BandwidthRequest) -> dict:
+    """
+    Set the combined model download bandwidth cap.
+    
+    Applies immediately, including to downloads in progress.
     
+    Args:
+        req: Bandwidth request with the cap in MB/s (0 = unlimited)
+        
     Returns:
-        dict: Active download item or None if no download is active
+        dict: The new cap
     """
-    return {"item": model_manager.active()}
+    model_manager.set_bandwidth_limit(req.mbps)
+    return {"ok": True, "mbps": model_manager.bandwidth_limit()}
 
 
 @router.get("/downloads/queue")
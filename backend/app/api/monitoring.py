@@ -7,49 +7,145 @@ pushing status updates to connected clients when system state changes.
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import deque
 from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 
 from app.api.status import unified_status
+from app.services.status_feed import StatusFeed, StatusUpdate
 from app.services.unified_logging import get_unified_logger
 
 router = APIRouter()
 
-# Store active WebSocket connections
-_active_connections: set[WebSocket] = set()
-
 # Background task for monitoring
 _monitoring_task: asyncio.Task[None] | None = None
 _monitoring_interval = 2.0  # Update every 2 seconds
+_client_queue_max = 8  # Pending messages per client before it is resynced
+_send_timeout_s = 10.0  # A client that cannot take a message this long is dropped
 
+# Versioned status shared by all clients; each change is serialized once
+_status_feed = StatusFeed()
 
-async def broadcast_status() -> None:
-    """Broadcast system status to all connected WebSocket clients."""
-    if not _active_connections:
-        return
+
+class _MonitoringClient:
+    """A connected dashboard with its own outgoing queue and sender task.
     
-    try:
-        status = unified_status()
-        message = json.dumps(status)
-        
-        # Send to all connected clients
-        disconnected = set()
-        for connection in _active_connections:
+    Status messages are queued per client so one slow socket never delays the
+    others. If a client falls ``_client_queue_max`` messages behind, its queued
+    updates are dropped and replaced by a single full snapshot, since later
+    patches cannot be applied without the dropped ones.
+    """
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+        self.version = 0
+        self.dropped = 0
+        self._queue: deque[str] = deque()
+        self._wakeup = asyncio.Event()
+        self._sender: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._sender = asyncio.get_running_loop().create_task(self._send_loop())
+
+    async def stop(self) -> None:
+        if self._sender and not self._sender.done():
+            self._sender.cancel()
+            await asyncio.gather(self._sender, return_exceptions=True)
+
+    def deliver(self, update: StatusUpdate) -> None:
+        """Queue a status update, sending a patch when the client is at the previous version."""
+        if len(self._queue) >= _client_queue_max:
+            self.dropped += len(self._queue)
+            self._queue.clear()
+            message = update.snapshot_message
+        elif update.patch_message is not None and self.version == update.version - 1:
+            message = update.patch_message
+        else:
+            message = update.snapshot_message
+        self.version = update.version
+        self._push(message)
+
+    def deliver_snapshot(self, version: int, snapshot_message: str) -> None:
+        """Queue a full snapshot (initial state)."""
+        self.version = version
+        self._push(snapshot_message)
+
+    def send_control(self, text: str) -> None:
+        """Queue a keepalive message (ping/pong)."""
+        self._push(text)
+
+    def _push(self, message: str) -> None:
+        self._queue.append(message)
+        self._wakeup.set()
+
+    async def _send_loop(self) -> None:
+        while True:
+            while not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            message = self._queue.popleft()
             try:
-                if connection.client_state == WebSocketState.CONNECTED:
-                    await connection.send_text(message)
-                else:
-                    disconnected.add(connection)
+                if self.websocket.client_state != WebSocketState.CONNECTED:
+                    break
+                await asyncio.wait_for(self.websocket.send_text(message), timeout=_send_timeout_s)
+            except asyncio.CancelledError:
+                raise
             except Exception as exc:
                 logger = get_unified_logger()
                 logger.warning("monitoring", f"Failed to send status to client: {exc}")
-                disconnected.add(connection)
-        
-        # Remove disconnected clients
-        _active_connections.difference_update(disconnected)
+                break
+        _clients.pop(self.websocket, None)
+        try:
+            await self.websocket.close()
+        except Exception:
+            pass
+
+
+# Active WebSocket connections
+_clients: dict[WebSocket, _MonitoringClient] = {}
+
+
+def _broadcast_payload(status: dict[str, Any]) -> dict[str, Any]:
+    """Status as broadcast to clients.
+    
+    Freshness ``age_s`` is left out because it changes on every tick; clients
+    derive it from ``updated_at``. This keeps unchanged status from producing
+    a delta.
+    """
+    payload = dict(status)
+    freshness = payload.get("freshness")
+    if isinstance(freshness, dict):
+        payload["freshness"] = {
+            name: {k: v for k, v in info.items() if k != "age_s"} if isinstance(info, dict) else info
+            for name, info in freshness.items()
+        }
+    return payload
+
+
+async def _publish_status() -> StatusUpdate | None:
+    """Collect the current status and publish it to the feed."""
+    status = await asyncio.to_thread(unified_status)
+    return _status_feed.publish(_broadcast_payload(status))
+
+
+async def broadcast_status() -> None:
+    """Broadcast status changes to all connected WebSocket clients.
+    
+    Nothing is sent when the status did not change since the last broadcast.
+    Clients at the previous version receive a JSON patch, others a snapshot.
+    Messages are queued per client and sent concurrently.
+    """
+    if not _clients:
+        return
+    
+    try:
+        update = await _publish_status()
+        if update is None:
+            return
+        for client in list(_clients.values()):
+            client.deliver(update)
     except Exception as exc:
         logger = get_unified_logger()
         logger.error("monitoring", f"Error broadcasting status: {exc}")
@@ -102,14 +198,33 @@ async def websocket_monitoring(websocket: WebSocket) -> None:
     - System information (OS, Python, GPU, disk)
     - Overall system status
     
-    Updates are pushed every 2 seconds automatically, or immediately
-    when system state changes.
+    Status is checked every 2 seconds and only changes are pushed. The first
+    message is a full snapshot; later messages are JSON patches against the
+    previous version. A client that falls behind receives a fresh snapshot.
+    
+    Message types:
+        - ``{"type": "snapshot", "version": 7, "data": {...status...}}``
+        - ``{"type": "patch", "version": 8, "base": 7, "ops": [
+          {"op": "replace", "path": "/backend/state", "value": "running"}]}``
+        - ``"ping"`` / ``"pong"`` keepalive strings
+    
+    Apply a patch only if ``base`` equals the version you hold; otherwise
+    wait for the next snapshot.
     
     Example client connection:
         ```javascript
         const ws = new WebSocket('ws://localhost:8000/api/ws/monitoring');
+        let status = null, version = 0;
         ws.onmessage = (event) => {
-            const status = JSON.parse(event.data);
+            const msg = JSON.parse(event.data);
+            if (msg.type === 'snapshot') {
+                status = msg.data;
+            } else if (msg.type === 'patch' && msg.base === version) {
+                status = applyPatch(status, msg.ops);
+            } else {
+                return;
+            }
+            version = msg.version;
             console.log('System status:', status);
         };
         ```
@@ -117,19 +232,26 @@ async def websocket_monitoring(websocket: WebSocket) -> None:
     logger = get_unified_logger()
     
     await websocket.accept()
-    _active_connections.add(websocket)
-    
-    # Start monitoring task if not already running
-    start_monitoring_task()
+    client = _MonitoringClient(websocket)
     
     # Send initial status immediately
     try:
-        status = unified_status()
-        await websocket.send_text(json.dumps(status))
+        update = await _publish_status()
+        if update is not None:
+            for other in list(_clients.values()):
+                other.deliver(update)
+        if _status_feed.snapshot_message is not None:
+            client.deliver_snapshot(_status_feed.version, _status_feed.snapshot_message)
     except Exception as exc:
         logger.warning("monitoring", f"Failed to send initial status: {exc}")
     
-    logger.info("monitoring", f"WebSocket client connected (total: {len(_active_connections)})")
+    _clients[websocket] = client
+    client.start()
+    
+    # Start monitoring task if not already running
+    start_monitoring_task()
+    
+    logger.info("monitoring", f"WebSocket client connected (total: {len(_clients)})")
     
     try:
         # Keep connection alive and handle client messages
@@ -140,22 +262,23 @@ async def websocket_monitoring(websocket: WebSocket) -> None:
                 
                 # Handle ping messages
                 if data == "ping":
-                    await websocket.send_text("pong")
+                    client.send_control("pong")
             except asyncio.TimeoutError:
                 # Send ping to keep connection alive
-                try:
-                    await websocket.send_text("ping")
-                except Exception:
+                if websocket not in _clients:
                     break
+                client.send_control("ping")
             except WebSocketDisconnect:
                 break
     except Exception as exc:
         logger.warning("monitoring", f"WebSocket error: {exc}")
     finally:
-        _active_connections.discard(websocket)
-        logger.info("monitoring", f"WebSocket client disconnected (total: {len(_active_connections)})")
+        await client.stop()
+        _clients.pop(websocket, None)
+        if client.dropped:
+            logger.info("monitoring", f"Client fell behind; {client.dropped} queued updates replaced by snapshots")
+        logger.info("monitoring", f"WebSocket client disconnected (total: {len(_clients)})")
         
         # Stop monitoring task if no clients connected
-        if not _active_connections:
+        if not _clients:
             stop_monitoring_task()
-
@@ -8,18 +8,35 @@ This module provides API endpoints for:
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
 from fastapi.responses import JSONResponse
 
 from app.core.error_taxonomy import ErrorCode, create_error_response
 from app.core.middleware import limiter
-from app.models.pipeline_contracts import GenerateRequest, GenerateResponse, JobStatus
+from app.models.pipeline_contracts import GenerateRequest, GenerateResponse, JobHistory, JobStatus
 from app.services.pipeline_manager import pipeline_manager
 from app.services.workflow_preset_registry import preset_registry
 
 router = APIRouter()
 
 
+def _job_status(job: JobHistory) -> dict:
+    """Build the public JobStatus payload for a job history record."""
+    return JobStatus(
+        job_id=job.job_id,
+        status=job.status,  # type: ignore[arg-type]
+        preset_id=job.preset_id,
+        progress=0.0,  # TODO: Track progress
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        estimated_time_seconds=None,
+        output_url=job.outputs.get("output_url") if job.status == "completed" else None,
+        error=job.error if job.status == "failed" else None,
+        error_code=job.error_code if job.status == "failed" else None,
+    ).model_dump()
+
+
 @router.get("/presets")
 def list_presets(category: str | None = None, engine: str | None = None) -> dict:
     """List all available workflow presets.
@@ -146,6 +163,39 @@ async def generate_image(request: Request, req: GenerateRequest) -> dict:
         )
 
 
+@router.get("/jobs")
+async def list_jobs(
+    limit: int = Query(default=50, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    status_filter: str | None = Query(default=None, alias="status"),
+    preset_id: str | None = None,
+) -> dict:
+    """List pipeline jobs, newest first.
+    
+    Args:
+        limit: Maximum number of jobs to return (1-500)
+        offset: Number of matching jobs to skip
+        status_filter: Optional status filter (queued, running, completed, failed, cancelled)
+        preset_id: Optional preset ID filter
+        
+    Returns:
+        Dictionary with job status list and pagination info
+    """
+    jobs, total = await pipeline_manager.list_jobs(
+        limit=limit,
+        offset=offset,
+        status=status_filter,
+        preset_id=preset_id,
+    )
+    return {
+        "ok": True,
+        "jobs": [_job_status(job) for job in jobs],
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    }
+
+
 @router.get("/jobs/{job_id}")
 async def get_job(job_id: str) -> dict:
     """Get job status and details.
@@ -167,19 +217,7 @@ async def get_job(job_id: str) -> dict:
             content=error_response,
         )
 
-    return JobStatus(
-        job_id=job.job_id,
-        status=job.status,  # type: ignore[arg-type]
-        preset_id=job.preset_id,
-        progress=0.0,  # TODO: Track progress
-        created_at=job.created_at,
-        started_at=job.started_at,
-        finished_at=job.finished_at,
-        estimated_time_seconds=None,
-        output_url=job.outputs.get("output_url") if job.status == "completed" else None,
-        error=job.error if job.status == "failed" else None,
-        error_code=job.error_code if job.status == "failed" else None,
-    ).model_dump()
+    return _job_status(job)
 
 
 @router.get("/jobs/{job_id}/artifacts")
@@ -270,24 +270,23 @@ async def cross_post_image(
         # Create integrated posting service
         posting_service = IntegratedPostingService(db)
 
-        # Cross-post to all platforms
-        results = await posting_service.cross_post_image(
+        # Cross-post to all platforms concurrently
+        outcome = await posting_service.cross_post_image_detailed(
             content_id=content_uuid,
             platform_account_ids=platform_account_uuids,
             caption=req.caption or "",
             hashtags=req.hashtags,
             mentions=req.mentions,
         )
+        if not outcome.posts:
+            raise IntegratedPostingError(f"Cross-posting failed for all platforms. Errors: {outcome.errors}")
 
         # Convert successful posts to response format
         successful_posts = {
             platform: PostResponse.model_validate(post)
-            for platform, post in results.items()
+            for platform, post in outcome.posts.items()
         }
-
-        # Note: Failed platforms are logged but not returned in results
-        # We could enhance this to track failures separately if needed
-        failed_platforms: dict[str, str] = {}
+        failed_platforms = outcome.errors
 
         return CrossPostImageResponse(
             ok=True,
@@ -593,6 +592,8 @@ async def simulate_character_interaction(
         
         collaboration_service = CharacterCollaborationService(db)
         updated_post = await collaboration_service.simulate_interaction(actor_uuid, post_uuid)
+        await db.commit()
+        await collaboration_service.rollups.invalidate_cache()
         
         if not updated_post:
             return {
@@ -652,6 +653,8 @@ async def simulate_interactions_for_character(
             limit=limit,
             max_posts_per_target=max_posts_per_target,
         )
+        await db.commit()
+        await collaboration_service.rollups.invalidate_cache()
         
         return {
             "ok": True,
@@ -697,6 +700,8 @@ async def simulate_collaboration_network(
             platform=platform,
             interactions_per_character=interactions_per_character,
         )
+        await db.commit()
+        await collaboration_service.rollups.invalidate_cache()
         
         return {
             "ok": True,
@@ -5,6 +5,8 @@ This module provides REST API endpoints for:
 - Getting resource limits and thresholds
 - Triggering resource cleanup operations
 - Getting resource usage summary with alerts
+- Getting windowed usage aggregates (min/avg/p95/max)
+- Getting event loop lag and platform I/O executor load
 """
 
 from __future__ import annotations
@@ -13,6 +15,9 @@ from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
 from app.services.gpu_optimizer import get_gpu_optimizer
+from app.services.instagram_session_pool import get_instagram_session_pool
+from app.services.loop_lag import get_loop_lag_monitor
+from app.services.platform_executor import get_platform_executor
 from app.services.resource_manager import get_resource_manager, ResourceLimits
 
 
@@ -67,15 +72,36 @@ def get_resource_usage() -> dict:
     }
 
 
+@router.get("/usage/window")
+def get_resource_usage_window(
+    minutes: float = Query(default=5.0, gt=0, le=1440, description="Window length in minutes"),
+) -> dict:
+    """Get min/avg/p95/max resource usage over the last N minutes.
+    
+    Args:
+        minutes: Window length in minutes.
+    
+    Returns:
+        Dictionary containing sample count, window bounds, and per-metric aggregates.
+    """
+    manager = get_resource_manager()
+    return manager.get_usage_window(minutes)
+
+
 @router.get("/summary")
-def get_resource_summary() -> dict:
+def get_resource_summary(
+    window_minutes: float | None = Query(default=None, gt=0, le=1440, description="Aggregate/alert window in minutes"),
+) -> dict:
     """Get comprehensive resource usage summary with alerts.
     
+    Args:
+        window_minutes: Window for aggregates and alerts (server default if omitted).
+    
     Returns:
-        Dictionary containing usage metrics, alerts, and limits.
+        Dictionary containing usage metrics, windowed aggregates, alerts, and limits.
     """
     manager = get_resource_manager()
-    return manager.get_usage_summary()
+    return manager.get_usage_summary(window_minutes)
 
 
 @router.get("/limits")
@@ -152,14 +178,19 @@ def update_resource_limits(limits_update: ResourceLimitsUpdate) -> dict:
 
 
 @router.get("/alerts")
-def get_resource_alerts() -> dict:
+def get_resource_alerts(
+    window_minutes: float | None = Query(default=None, gt=0, le=1440, description="Alert window in minutes"),
+) -> dict:
     """Get current resource alerts (warnings and critical issues).
     
+    Args:
+        window_minutes: Window the usage is averaged over (server default if omitted).
+    
     Returns:
         Dictionary containing list of active resource alerts.
     """
     manager = get_resource_manager()
-    alerts = manager.check_alerts()
+    alerts = manager.check_alerts(window_minutes=window_minutes)
     
     return {
         "alerts": [
@@ -265,3 +296,22 @@ def should_wait_for_gpu(
     optimizer = get_gpu_optimizer()
     return optimizer.should_wait_for_gpu(min_memory_gb=min_memory_gb)
 
+
+
+@router.get("/event-loop")
+def get_event_loop_status() -> dict:
+    """Get event loop lag and platform I/O load.
+    
+    High lag means something is blocking the event loop and stalling every
+    request on this worker.
+    
+    Returns:
+        Dictionary with loop lag statistics (ms), platform executor load
+        (calls in flight, totals and timeouts per platform) and Instagram
+        session pool usage.
+    """
+    return {
+        "loop_lag": get_loop_lag_monitor().stats(),
+        "platform_executor": get_platform_executor().stats(),
+        "instagram_sessions": get_instagram_session_pool().stats(),
+    }
@@ -1,7 +1,13 @@
-"""Unified system status API endpoint."""
+"""Unified system status API endpoint.
+
+Status fields are collected by independent probes on their own schedules
+(see StatusAggregator) and ``/status`` serves the latest in-memory snapshot.
+"""
 
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import APIRouter
 
 from app.core.paths import repo_root
@@ -9,6 +15,7 @@ from app.services.backend_service import BackendServiceManager
 from app.services.frontend_service import FrontendServiceManager
 from app.services.comfyui_service import ComfyUIServiceManager
 from app.services.comfyui_manager import comfyui_manager
+from app.services.status_aggregator import StatusAggregator, StatusProbe
 from app.services.system_check import system_check
 from app.services.comfyui_client import ComfyUiClient, ComfyUiError
 from app.core.runtime_settings import get_comfyui_base_url
@@ -21,6 +28,136 @@ _frontend_service_manager = FrontendServiceManager()
 _comfyui_service_manager = ComfyUIServiceManager()
 
 
+def _backend_probe() -> dict[str, Any]:
+    """Backend service status (PID file and port check)."""
+    backend_status = _backend_service_manager.status()
+    return {
+        "status": "ok" if backend_status.state == "running" else "error",
+        "message": backend_status.message or "Backend status unknown",
+        "state": backend_status.state,
+        "port": backend_status.port,
+        "host": backend_status.host,
+        "process_id": backend_status.process_id,
+        "last_check": backend_status.last_check,
+    }
+
+
+def _frontend_probe() -> dict[str, Any]:
+    """Frontend service status (PID file and port check)."""
+    frontend_status_obj = _frontend_service_manager.status()
+    return {
+        "status": "ok" if frontend_status_obj.state == "running" else "error",
+        "message": frontend_status_obj.message or "Frontend status unknown",
+        "state": frontend_status_obj.state,
+        "port": frontend_status_obj.port,
+        "host": frontend_status_obj.host,
+        "process_id": frontend_status_obj.process_id,
+        "last_check": frontend_status_obj.last_check,
+    }
+
+
+def _comfyui_service_probe() -> dict[str, Any]:
+    """ComfyUI service status plus a reachability check against its API."""
+    comfyui_status_obj = _comfyui_service_manager.status()
+    comfyui_service = {
+        "state": comfyui_status_obj.state,
+        "port": comfyui_status_obj.port,
+        "host": comfyui_status_obj.host,
+        "process_id": comfyui_status_obj.process_id,
+        "message": comfyui_status_obj.message,
+        "error": comfyui_status_obj.error,
+        "last_check": comfyui_status_obj.last_check,
+        "installed": comfyui_status_obj.installed,
+        "base_url": comfyui_status_obj.base_url,
+        "reachable": False,
+        "stats": None,
+    }
+    
+    # Try to reach ComfyUI if it's running
+    if comfyui_status_obj.state == "running" and comfyui_status_obj.base_url:
+        try:
+            client = ComfyUiClient(base_url=comfyui_status_obj.base_url)
+            stats = client.get_system_stats()
+            comfyui_service["reachable"] = True
+            comfyui_service["stats"] = stats
+        except ComfyUiError as exc:
+            comfyui_service["error"] = str(exc)
+    return comfyui_service
+
+
+def _comfyui_manager_probe() -> dict[str, Any]:
+    """ComfyUI manager status (for backward compatibility)."""
+    manager_status = comfyui_manager.status()
+    return {
+        "state": manager_status.state,
+        "installed_path": manager_status.installed_path,
+        "process_id": manager_status.process_id,
+        "port": manager_status.port,
+        "base_url": manager_status.base_url,
+        "message": manager_status.message,
+        "error": manager_status.error,
+        "last_check": manager_status.last_check,
+        "is_installed": comfyui_manager.is_installed(),
+    }
+
+
+def _system_probe() -> dict[str, Any]:
+    """System check (tools, GPU via nvidia-smi, disk, RAM)."""
+    return system_check(repo_root())
+
+
+# Port/process checks are cheap and change often; the system check shells out
+# to nvidia-smi and rarely changes, so it is refreshed far less frequently.
+_status_aggregator = StatusAggregator(
+    [
+        StatusProbe("backend", 2.0, _backend_probe),
+        StatusProbe("frontend", 2.0, _frontend_probe),
+        StatusProbe("comfyui_manager", 2.0, _comfyui_manager_probe),
+        StatusProbe("comfyui_service", 5.0, _comfyui_service_probe),
+        StatusProbe("system", 120.0, _system_probe),
+    ]
+)
+
+
+def start_status_aggregator() -> None:
+    """Start refreshing status probes in the background (call from the event loop)."""
+    _status_aggregator.start()
+
+
+async def stop_status_aggregator() -> None:
+    """Stop the background status probes."""
+    await _status_aggregator.stop()
+
+
+def _overall_status(snapshot: dict[str, Any]) -> str:
+    """Derive the overall status (ok/warning/error) from a status snapshot."""
+    system_info = snapshot.get("system") or {}
+    backend_state = (snapshot.get("backend") or {}).get("state")
+    frontend_state = (snapshot.get("frontend") or {}).get("state")
+    comfyui_service = snapshot.get("comfyui_service") or {}
+    comfyui_state = comfyui_service.get("state")
+
+    # Overall status (green/yellow/red)
+    overall_status = "ok"
+    if system_info.get("issues"):
+        critical_issues = [i for i in system_info["issues"] if i.get("severity") == "error"]
+        if critical_issues:
+            overall_status = "error"
+        else:
+            overall_status = "warning"
+    
+    # Check service states
+    if backend_state == "error" or frontend_state == "error" or comfyui_state == "error":
+        overall_status = "error"
+    elif backend_state != "running" or frontend_state != "running":
+        if overall_status != "error":
+            overall_status = "warning"
+    elif comfyui_state == "stopped" or not comfyui_service.get("installed"):
+        if overall_status != "error":
+            overall_status = "warning"
+    return overall_status
+
+
 @router.get("/status")
 def unified_status() -> dict:
     """Unified system status endpoint that aggregates all service and system information.
@@ -33,6 +170,10 @@ def unified_status() -> dict:
     - System information (OS, Python, Node.js, GPU, disk space)
     - Overall system status (ok/warning/error)
     
+    The response is served from an in-memory snapshot; no probe runs on the
+    request path once the background refresh is started. Each field reports
+    when it was last refreshed under ``freshness``.
+    
     Returns:
         dict: Unified status information including:
             - overall_status: Overall system status ("ok", "warning", or "error")
@@ -41,6 +182,7 @@ def unified_status() -> dict:
             - comfyui_manager: ComfyUI manager status (installation, process state)
             - comfyui_service: ComfyUI service status (running state, reachability, stats)
             - system: System check information (OS, Python, Node.js, GPU, disk, issues)
+            - freshness: Per-field updated_at, age_s, interval_s, duration_ms and error
     
     The overall_status is determined by:
         - "error": Critical system issues or service errors
@@ -100,104 +242,21 @@ def unified_status() -> dict:
                 "gpu_available": true,
                 "disk_free_gb": 100.5,
                 "issues": []
+            },
+            "freshness": {
+                "backend": {"updated_at": 1700000000.0, "age_s": 0.8, "interval_s": 2.0, "duration_ms": 1.2, "error": null},
+                "system": {"updated_at": 1699999950.0, "age_s": 50.3, "interval_s": 120.0, "duration_ms": 412.0, "error": null}
             }
         }
         ```
     """
-    root = repo_root()
-    
-    # Backend service status (using service manager)
-    backend_status = _backend_service_manager.status()
-    backend_health = {
-        "status": "ok" if backend_status.state == "running" else "error",
-        "message": backend_status.message or "Backend status unknown",
-        "state": backend_status.state,
-        "port": backend_status.port,
-        "host": backend_status.host,
-        "process_id": backend_status.process_id,
-        "last_check": backend_status.last_check,
-    }
-    
-    # Frontend service status (using service manager)
-    frontend_status_obj = _frontend_service_manager.status()
-    frontend_status = {
-        "status": "ok" if frontend_status_obj.state == "running" else "error",
-        "message": frontend_status_obj.message or "Frontend status unknown",
-        "state": frontend_status_obj.state,
-        "port": frontend_status_obj.port,
-        "host": frontend_status_obj.host,
-        "process_id": frontend_status_obj.process_id,
-        "last_check": frontend_status_obj.last_check,
-    }
-    
-    # ComfyUI service status (using service manager)
-    comfyui_status_obj = _comfyui_service_manager.status()
-    comfyui_service = {
-        "state": comfyui_status_obj.state,
-        "port": comfyui_status_obj.port,
-        "host": comfyui_status_obj.host,
-        "process_id": comfyui_status_obj.process_id,
-        "message": comfyui_status_obj.message,
-        "error": comfyui_status_obj.error,
-        "last_check": comfyui_status_obj.last_check,
-        "installed": comfyui_status_obj.installed,
-        "base_url": comfyui_status_obj.base_url,
-        "reachable": False,
-        "stats": None,
-    }
-    
-    # Try to reach ComfyUI if it's running
-    if comfyui_status_obj.state == "running" and comfyui_status_obj.base_url:
-        try:
-            client = ComfyUiClient(base_url=comfyui_status_obj.base_url)
-            stats = client.get_system_stats()
-            comfyui_service["reachable"] = True
-            comfyui_service["stats"] = stats
-        except ComfyUiError as exc:
-            comfyui_service["error"] = str(exc)
-    
-    # ComfyUI Manager status (for backward compatibility)
-    manager_status = comfyui_manager.status()
-    manager_dict = {
-        "state": manager_status.state,
-        "installed_path": manager_status.installed_path,
-        "process_id": manager_status.process_id,
-        "port": manager_status.port,
-        "base_url": manager_status.base_url,
-        "message": manager_status.message,
-        "error": manager_status.error,
-        "last_check": manager_status.last_check,
-        "is_installed": comfyui_manager.is_installed(),
-    }
-    
-    # System check
-    system_info = system_check(root)
-    
-    # Overall status (green/yellow/red)
-    overall_status = "ok"
-    if system_info.get("issues"):
-        critical_issues = [i for i in system_info["issues"] if i.get("severity") == "error"]
-        if critical_issues:
-            overall_status = "error"
-        else:
-            overall_status = "warning"
-    
-    # Check service states
-    if backend_status.state == "error" or frontend_status_obj.state == "error" or comfyui_status_obj.state == "error":
-        overall_status = "error"
-    elif backend_status.state != "running" or frontend_status_obj.state != "running":
-        if overall_status != "error":
-            overall_status = "warning"
-    elif comfyui_status_obj.state == "stopped" or not comfyui_status_obj.installed:
-        if overall_status != "error":
-            overall_status = "warning"
-    
+    snapshot = _status_aggregator.snapshot()
     return {
-        "overall_status": overall_status,
-        "backend": backend_health,
-        "frontend": frontend_status,
-        "comfyui_manager": manager_dict,
-        "comfyui_service": comfyui_service,
-        "system": system_info,
+        "overall_status": _overall_status(snapshot),
+        "backend": snapshot["backend"],
+        "frontend": snapshot["frontend"],
+        "comfyui_manager": snapshot["comfyui_manager"],
+        "comfyui_service": snapshot["comfyui_service"],
+        "system": snapshot["system"],
+        "freshness": snapshot["freshness"],
     }
-
@@ -7,6 +7,7 @@ from pydantic import BaseModel
 
 from app.core.logging import get_logger
 from app.core.middleware import limiter
+from app.services.platform_executor import PlatformCallTimeout, run_platform_call
 from app.services.tiktok_client import TikTokApiClient, TikTokApiError
 
 logger = get_logger(__name__)
@@ -243,7 +244,9 @@ async def upload_video(
         
         try:
             client = TikTokApiClient()
-            upload_data = client.upload_video(
+            upload_data = await run_platform_call(
+                "tiktok",
+                client.upload_video,
                 video_path=tmp_path,
                 caption=caption,
                 privacy_level=privacy_level,
@@ -260,6 +263,9 @@ async def upload_video(
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
                 
+    except PlatformCallTimeout as exc:
+        logger.error(f"TikTok video upload timed out: {exc}")
+        raise HTTPException(status_code=504, detail=str(exc)) from exc
     except TikTokApiError as exc:
         error_msg = str(exc)
         logger.error(f"Failed to upload TikTok video: {exc}")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -23,6 +25,13 @@ class Settings(BaseSettings):
     comfyui_base_url: str = "http://localhost:8188"
     """Base URL for ComfyUI API endpoint."""
     
+    comfyui_websocket_enabled: bool = True
+    """Listen for ComfyUI execution events over its /ws endpoint.
+    
+    When enabled, jobs waiting for ComfyUI results are woken by websocket events
+    instead of polling /history. Polling is still used while the socket is down.
+    """
+    
     default_checkpoint: str | None = None
     """Default Stable Diffusion checkpoint model name to use when none is specified.
     
@@ -40,6 +49,40 @@ class Settings(BaseSettings):
     redis_url: str = "redis://localhost:6379/0"
     """Redis connection URL."""
     
+    generation_workers: int = 2
+    """Number of worker threads that run image generation jobs concurrently."""
+    
+    generation_queue_max_depth: int = 100
+    """Maximum number of image generation jobs waiting in the queue.
+    
+    When the queue is full, new generation requests are rejected with HTTP 429
+    until workers catch up.
+    """
+    
+    quality_validation_workers: int = max(1, min(4, (os.cpu_count() or 2) - 1))
+    """Worker processes used to score batch images in parallel (1 validates inline)."""
+    
+    job_history_max_jobs: int = 5000
+    """Maximum number of jobs kept when a job journal is compacted (newest first)."""
+
+    resource_sample_interval_s: float = 5.0
+    """Seconds between background CPU/memory/disk/GPU samples taken by the resource manager."""
+
+    resource_sample_history_minutes: float = 60.0
+    """Minutes of resource samples kept in memory for windowed aggregates."""
+
+    resource_alert_window_minutes: float = 5.0
+    """Window (minutes) over which resource alerts are evaluated, so short spikes do not alert."""
+
+    model_download_workers: int = 2
+    """Number of model downloads that run concurrently."""
+
+    model_download_segments: int = 4
+    """Parallel HTTP Range segments per model download (1 downloads as a single stream)."""
+
+    model_download_bandwidth_mbps: float = 0.0
+    """Combined bandwidth cap for model downloads in MB/s (0 = unlimited)."""
+
     instagram_access_token: str | None = None
     """Instagram Graph API access token for authenticated requests."""
     
@@ -48,7 +91,40 @@ class Settings(BaseSettings):
     
     instagram_app_secret: str | None = None
     """Instagram App Secret (for OAuth token exchange)."""
-    
+
+    instagram_session_idle_ttl_s: float = 1800.0
+    """Seconds a pooled instagrapi session may stay unused before it is logged out of the pool."""
+
+    instagram_session_pool_size: int = 50
+    """Maximum number of pooled instagrapi sessions (one per platform account)."""
+
+    platform_io_workers: int = 16
+    """Threads for blocking platform SDK calls (uploads, likes, ...) made from async code."""
+
+    scheduled_post_dispatcher_enabled: bool = False
+    """Run the background dispatcher that posts due scheduled posts in this process."""
+
+    scheduled_post_workers: int = 8
+    """Accounts (character and platform) whose due scheduled posts are posted concurrently (per process)."""
+
+    scheduled_post_batch_size: int = 100
+    """Maximum due scheduled posts claimed by one dispatcher round."""
+
+    scheduled_post_lease_s: float = 600.0
+    """Seconds a claimed scheduled post stays reserved without a heartbeat before another process may take it."""
+
+    scheduled_post_poll_interval_s: float = 5.0
+    """Seconds the dispatcher waits between rounds when nothing was due."""
+
+    automation_timer_workers: int = 8
+    """Deferred automation actions executed at once when they come due (per process)."""
+
+    automation_timer_resync_s: float = 60.0
+    """Seconds between reloads of pending automation actions, picking up ones scheduled by other processes."""
+
+    automation_timer_running_timeout_s: float = 900.0
+    """Seconds an automation action may stay running before it is assumed lost with its process and run again."""
+
     twitter_bearer_token: str | None = None
     """Twitter Bearer Token for OAuth 2.0 authentication (preferred for read-only operations)."""
     
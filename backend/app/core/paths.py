@@ -35,6 +35,15 @@ def logs_dir() -> Path:
     return data_dir() / "logs"
 
 
+def log_index_dir() -> Path:
+    """Get the directory holding sidecar indexes of the backend log files.
+    
+    Returns:
+        Path to .ainfluencer/logs/.index/ directory.
+    """
+    return logs_dir() / ".index"
+
+
 def config_dir() -> Path:
     """Get the configuration directory.
     
@@ -62,6 +71,24 @@ def images_dir() -> Path:
     return content_dir() / "images"
 
 
+def image_catalog_file() -> Path:
+    """Get the path to the stored image catalog database.
+    
+    Returns:
+        Path to .ainfluencer/content/image_catalog.sqlite3 file.
+    """
+    return content_dir() / "image_catalog.sqlite3"
+
+
+def image_hash_index_file() -> Path:
+    """Get the path to the perceptual-hash index of stored images.
+    
+    Returns:
+        Path to .ainfluencer/content/image_hashes.sqlite3 file.
+    """
+    return content_dir() / "image_hashes.sqlite3"
+
+
 def videos_dir() -> Path:
     """Get the videos storage directory.
     
@@ -80,6 +107,24 @@ def jobs_file() -> Path:
     return content_dir() / "jobs.json"
 
 
+def jobs_journal_file() -> Path:
+    """Get the path to the image generation job journal.
+    
+    Returns:
+        Path to .ainfluencer/content/jobs.jsonl file.
+    """
+    return content_dir() / "jobs.jsonl"
+
+
+def image_job_queue_file() -> Path:
+    """Get the path to the persisted image job queue file.
+    
+    Returns:
+        Path to .ainfluencer/content/image_job_queue.json file.
+    """
+    return content_dir() / "image_job_queue.json"
+
+
 def video_jobs_file() -> Path:
     """Get the path to the video jobs JSON file.
     
@@ -89,6 +134,33 @@ def video_jobs_file() -> Path:
     return content_dir() / "video_jobs.json"
 
 
+def video_jobs_journal_file() -> Path:
+    """Get the path to the video generation job journal.
+    
+    Returns:
+        Path to .ainfluencer/content/video_jobs.jsonl file.
+    """
+    return content_dir() / "video_jobs.jsonl"
+
+
+def audio_video_sync_jobs_journal_file() -> Path:
+    """Get the path to the audio-video sync job journal.
+    
+    Returns:
+        Path to .ainfluencer/content/audio_video_sync_jobs.jsonl file.
+    """
+    return content_dir() / "audio_video_sync_jobs.jsonl"
+
+
+def video_editing_jobs_journal_file() -> Path:
+    """Get the path to the video editing job journal.
+    
+    Returns:
+        Path to .ainfluencer/content/video_editing_jobs.jsonl file.
+    """
+    return content_dir() / "video_editing_jobs.jsonl"
+
+
 def thumbnails_dir() -> Path:
     """Get the thumbnails storage directory.
     
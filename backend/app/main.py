@@ -7,6 +7,9 @@ mounting.
 
 from __future__ import annotations
 
+import asyncio
+import threading
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
@@ -18,10 +21,23 @@ from pydantic import ValidationError
 from app.core.error_taxonomy import ErrorCode, create_error_response
 
 from app.api.router import router as api_router
+from app.api.status import start_status_aggregator, stop_status_aggregator
+from app.core.config import settings
 from app.core.logging import configure_logging
 from app.core.middleware import error_handler_middleware, limiter
 from app.core.paths import content_dir
 from app.core.redis_client import close_redis, get_redis
+from app.services.automation_timer import get_automation_timer
+from app.services.comfyui_events import stop_comfyui_event_listeners
+from app.services.instagram_session_pool import close_instagram_session_pool
+from app.services.loop_lag import get_loop_lag_monitor
+from app.services.platform_executor import shutdown_platform_executor
+from app.services.job_logger import close_job_loggers
+from app.services.quality_validator import shutdown_validation_pool
+from app.services.resource_manager import get_resource_manager
+from app.services.scheduled_post_dispatcher import get_scheduled_post_dispatcher
+from app.services.generation_service import generation_service
+from app.services.image_storage_service import image_storage_service
 from app.services.unified_logging import get_unified_logger
 
 
@@ -132,6 +148,19 @@ def create_app() -> FastAPI:
         logger.info("backend", "Application startup: initializing services")
         await get_redis()
         logger.info("backend", "Application startup: Redis connection established")
+        # Pick up images added or removed while the app was down before serving listings
+        await asyncio.to_thread(image_storage_service.reconcile_catalog)
+        logger.info("backend", "Application startup: image catalog reconciled")
+        start_status_aggregator()
+        get_resource_manager().start_sampler()
+        get_loop_lag_monitor().start()
+        # Fire automation actions that were waiting when the app last stopped
+        get_automation_timer().start()
+        if settings.scheduled_post_dispatcher_enabled:
+            get_scheduled_post_dispatcher().start()
+            logger.info("backend", "Application startup: scheduled post dispatcher started")
+        # Fingerprint images saved while the index was unavailable (decodes run off the event loop)
+        threading.Thread(target=image_storage_service.sync_hash_index, name="image-hash-sync", daemon=True).start()
     
     @app.on_event("shutdown")
     async def shutdown_event() -> None:
@@ -140,6 +169,19 @@ def create_app() -> FastAPI:
         logger.info("backend", "Application shutdown: closing connections")
         await close_redis()
         logger.info("backend", "Application shutdown: Redis connection closed")
+        await stop_status_aggregator()
+        get_resource_manager().stop_sampler()
+        await get_loop_lag_monitor().stop()
+        await get_scheduled_post_dispatcher().stop()
+        await get_automation_timer().stop()
+        generation_service.shutdown()
+        logger.info("backend", "Application shutdown: image generation workers stopped")
+        stop_comfyui_event_listeners()
+        close_job_loggers()
+        logger.info("backend", "Application shutdown: job logs flushed")
+        shutdown_validation_pool()
+        close_instagram_session_pool()
+        shutdown_platform_executor()
     
     @app.get("/")
     def root():
@@ -7,11 +7,12 @@ from app.models.character import Character, CharacterPersonality, CharacterAppea
 from app.models.character_style import CharacterImageStyle
 from app.models.competitor import Competitor, CompetitorMonitoringSnapshot
 from app.models.content import Content, ScheduledPost
+from app.models.engagement_rollup import EngagementDailyRollup
 from app.models.payment import Payment, Subscription, PaymentStatus, SubscriptionStatus
 from app.models.platform_account import PlatformAccount
 from app.models.post import Post
 from app.models.user import User
-from app.models.automation_rule import AutomationRule
+from app.models.automation_rule import AutomationPendingAction, AutomationRule
 from app.models.team import Team, TeamMember, TeamRole
 from app.models.white_label import WhiteLabelConfig
 from app.models.character_template import CharacterTemplate
@@ -30,6 +31,7 @@ __all__ = [
     "CompetitorMonitoringSnapshot",
     "Content",
     "ScheduledPost",
+    "EngagementDailyRollup",
     "Payment",
     "Subscription",
     "PaymentStatus",
@@ -37,6 +39,7 @@ __all__ = [
     "PlatformAccount",
     "Post",
     "User",
+    "AutomationPendingAction",
     "AutomationRule",
     "Team",
     "TeamMember",
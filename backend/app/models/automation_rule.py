@@ -154,3 +154,68 @@ class AutomationRule(Base):
     def __repr__(self) -> str:
         return f"<AutomationRule(id={self.id}, character_id={self.character_id}, name={self.name}, action_type={self.action_type})>"
 
+
+
+class AutomationPendingAction(Base):
+    """Timed execution of an automation rule waiting for its human-like delay.
+    
+    Created when a rule execution is scheduled and fired by the automation
+    timer once execute_at is reached. Rows are kept after firing as a record
+    of the outcome.
+    
+    Attributes:
+        id: Unique identifier (UUID) for the pending action.
+        rule_id: Foreign key to the AutomationRule to execute.
+        platform_account_id: Platform account the action runs on.
+        action_type: Action type of the rule when scheduled.
+        execute_at: When the action is due (required, indexed).
+        status: Action status (pending, running, executed, failed, cancelled, default: "pending").
+        result: JSONB result of the action once executed (optional).
+        error_message: Error message if the action failed (optional).
+        started_at: Timestamp when a timer claimed the action to run it (optional).
+        executed_at: Timestamp when the action finished (optional).
+        created_at: Timestamp when the action was scheduled.
+        updated_at: Timestamp when the action was last updated.
+    """
+
+    __tablename__ = "automation_pending_actions"
+
+    id = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid4)
+    rule_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("automation_rules.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    platform_account_id = Column(PostgresUUID(as_uuid=True), nullable=False)
+    action_type = Column(String(50), nullable=False)
+
+    # Timing
+    execute_at = Column(DateTime(timezone=True), nullable=False)
+    status = Column(
+        String(20), default="pending", nullable=False
+    )  # pending, running, executed, failed, cancelled
+
+    # Outcome
+    result = Column(JSONB, nullable=True)
+    error_message = Column(Text, nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    executed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    # Constraints
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'running', 'executed', 'failed', 'cancelled')",
+            name="automation_pending_action_status_check",
+        ),
+        Index("idx_automation_pending_actions_due", "status", "execute_at"),
+        Index("idx_automation_pending_actions_rule", "rule_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<AutomationPendingAction(id={self.id}, rule_id={self.rule_id}, execute_at={self.execute_at}, status={self.status})>"
@@ -141,7 +141,21 @@ class Content(Base):
         Index("idx_content_approved", "is_approved"),
         Index("idx_content_nsfw", "is_nsfw"),
         Index("idx_content_created", "created_at"),
+        Index("idx_content_created_id", "created_at", "id"),  # Keyset pagination order
         Index("idx_content_tags", "tags", postgresql_using="gin"),  # GIN index for array search
+        # Trigram indexes for ILIKE '%...%' library search (requires the pg_trgm extension)
+        Index(
+            "idx_content_prompt_trgm",
+            "prompt",
+            postgresql_using="gin",
+            postgresql_ops={"prompt": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_content_file_path_trgm",
+            "file_path",
+            postgresql_using="gin",
+            postgresql_ops={"file_path": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -160,13 +174,15 @@ class ScheduledPost(Base):
         content_id: Foreign key to the Content item to post (optional, can schedule without content).
         scheduled_time: Scheduled posting time with timezone (required, indexed).
         timezone: Timezone string (e.g., "America/New_York", optional).
-        status: Post status (pending, posted, cancelled, failed, default: "pending").
+        status: Post status (pending, processing, posted, cancelled, failed, default: "pending").
         platform: Target platform (instagram, twitter, facebook, etc., optional).
         caption: Post caption/text content (optional).
         post_settings: JSON object with platform-specific posting settings (optional).
         posted_at: Timestamp when post was actually posted (optional).
         error_message: Error message if posting failed (optional).
         retry_count: Number of retry attempts (default: 0).
+        claimed_by: Claim token of the dispatcher worker currently posting it (optional).
+        lease_expires_at: When the worker's claim lapses and the post may be claimed again (optional).
         created_at: Timestamp when scheduled post was created.
         updated_at: Timestamp when scheduled post was last updated.
         character: Relationship back to Character (many-to-one).
@@ -194,7 +210,7 @@ class ScheduledPost(Base):
     timezone = Column(String(50), nullable=True)  # e.g., "America/New_York"
     status = Column(
         String(20), default="pending", nullable=False
-    )  # pending, posted, cancelled, failed
+    )  # pending, processing, posted, cancelled, failed
 
     # Posting Details
     platform = Column(String(50), nullable=True)  # instagram, twitter, facebook, etc.
@@ -206,6 +222,10 @@ class ScheduledPost(Base):
     error_message = Column(Text, nullable=True)
     retry_count = Column(Integer, default=0, nullable=False)
 
+    # Dispatch lease (see ScheduledPostDispatcher)
+    claimed_by = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(
@@ -219,13 +239,17 @@ class ScheduledPost(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint(
-            "status IN ('pending', 'posted', 'cancelled', 'failed')", name="scheduled_post_status_check"
+            "status IN ('pending', 'processing', 'posted', 'cancelled', 'failed')",
+            name="scheduled_post_status_check",
         ),
         Index("idx_scheduled_post_character", "character_id"),
         Index("idx_scheduled_post_content", "content_id"),
         Index("idx_scheduled_post_time", "scheduled_time"),
         Index("idx_scheduled_post_status", "status"),
         Index("idx_scheduled_post_platform", "platform"),
+        # Due-post scan of the dispatcher, and its per-account lane checks
+        Index("idx_scheduled_post_due", "status", "scheduled_time"),
+        Index("idx_scheduled_post_character_status", "character_id", "status"),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,67 @@
+"""Daily engagement rollup model for pre-aggregated analytics series."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String, func
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+
+from app.core.database import Base
+
+
+class EngagementDailyRollup(Base):
+    """Engagement totals of one character's published posts on one platform and day.
+
+    Rows are derived from ``posts`` (grouped by the day a post was published)
+    and kept current by the analytics record/snapshot endpoints and engagement
+    syncs, which recompute only the buckets they touch. A backfill rebuilds
+    them for a whole range. Analytics dashboards read daily series from here
+    in O(days) instead of scanning posts.
+
+    Attributes:
+        id: Unique identifier (UUID) for the rollup row.
+        character_id: Foreign key to the Character.
+        platform: Platform name (instagram, twitter, etc.).
+        day: Day the posts were published.
+        post_count: Number of published posts.
+        likes_count: Sum of likes.
+        comments_count: Sum of comments.
+        shares_count: Sum of shares.
+        views_count: Sum of views.
+        follower_count: Follower count recorded for the day, if any.
+        updated_at: Timestamp of the last refresh.
+    """
+
+    __tablename__ = "engagement_daily_rollups"
+
+    id = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid4)
+    character_id = Column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("characters.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    platform = Column(String(50), nullable=False)
+    day = Column(Date, nullable=False)
+
+    post_count = Column(Integer, default=0, nullable=False)
+    likes_count = Column(Integer, default=0, nullable=False)
+    comments_count = Column(Integer, default=0, nullable=False)
+    shares_count = Column(Integer, default=0, nullable=False)
+    views_count = Column(Integer, default=0, nullable=False)
+    follower_count = Column(Integer, nullable=True)
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("idx_engagement_rollups_bucket", "character_id", "platform", "day", unique=True),
+        Index("idx_engagement_rollups_day", "day"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EngagementDailyRollup(character_id={self.character_id}, platform={self.platform}, "
+            f"day={self.day}, posts={self.post_count})>"
+        )
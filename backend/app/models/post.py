@@ -132,6 +132,15 @@ class Post(Base):
         Index("idx_posts_status", "status"),
         Index("idx_posts_published", "published_at"),
         Index("idx_posts_platform_post_id", "platform", "platform_post_id"),
+        # Analytics overview filters; INCLUDE makes the engagement aggregates index-only on PostgreSQL
+        Index(
+            "idx_posts_overview",
+            "status",
+            "character_id",
+            "platform",
+            "published_at",
+            postgresql_include=["likes_count", "comments_count", "shares_count", "views_count"],
+        ),
     )
 
     def __repr__(self) -> str:
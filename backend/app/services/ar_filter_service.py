@@ -15,6 +15,7 @@ from typing import Any
 
 from app.core.logging import get_logger
 from app.core.paths import images_dir
+from app.services.image_storage_service import image_storage_service
 
 logger = get_logger(__name__)
 
@@ -368,6 +369,7 @@ class ARFilterService:
                 img.save(output_path, format="PNG", quality=95)
             else:
                 img.save(output_path, format="PNG", quality=95)
+            image_storage_service.register_image(output_path)
             
             logger.info(f"Saved AR filtered image: {output_path}, filters: {applied_filters}")
             
@@ -6,6 +6,7 @@ ensuring proper timing, duration matching, and audio-video alignment.
 
 from __future__ import annotations
 
+import json
 import subprocess
 import threading
 import time
@@ -15,8 +16,10 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Literal, Optional
 
+from app.core.config import settings
 from app.core.logging import get_logger
-from app.core.paths import video_jobs_file
+from app.core.paths import audio_video_sync_jobs_journal_file, video_jobs_file
+from app.services.job_store import JobStore
 
 logger = get_logger(__name__)
 
@@ -72,47 +75,41 @@ class AudioVideoSyncService:
         self._lock = threading.Lock()
         self._jobs: dict[str, AudioVideoSyncJob] = {}
         video_jobs_file().parent.mkdir(parents=True, exist_ok=True)
+        self._store = JobStore(audio_video_sync_jobs_journal_file(), max_jobs=settings.job_history_max_jobs)
         self._load_jobs_from_disk()
     
     def _load_jobs_from_disk(self) -> None:
-        """Load jobs from disk if available."""
+        """Load jobs from the job journal, importing the legacy shared video_jobs.json once."""
+        records = self._store.load()
+        if not records and not self._store.exists():
+            records = self._load_legacy_jobs()
+            for job_id, record in records.items():
+                self._store.put(job_id, record)
+        for job_id, job_data in records.items():
+            try:
+                self._jobs[job_id] = AudioVideoSyncJob(**job_data)
+            except Exception as e:
+                self.logger.warning(f"Skipping malformed audio-video sync job {job_id}: {e}")
+    
+    def _load_legacy_jobs(self) -> dict[str, dict[str, Any]]:
+        """Read jobs from the legacy "sync_jobs" section of video_jobs.json."""
         try:
             if video_jobs_file().exists():
                 with open(video_jobs_file(), "r") as f:
-                    import json
                     data = json.load(f)
-                    for job_data in data.get("sync_jobs", []):
-                        job = AudioVideoSyncJob(**job_data)
-                        self._jobs[job.id] = job
-        except Exception as e:
-            self.logger.warning(f"Failed to load audio-video sync jobs from disk: {e}")
-    
-    def _save_jobs_to_disk(self) -> None:
-        """Save jobs to disk."""
-        try:
-            import json
-            data = {
-                "sync_jobs": [
-                    {
-                        "id": job.id,
-                        "state": job.state,
-                        "message": job.message,
-                        "created_at": job.created_at,
-                        "started_at": job.started_at,
-                        "finished_at": job.finished_at,
-                        "cancelled_at": job.cancelled_at,
-                        "output_path": job.output_path,
-                        "error": job.error,
-                        "params": job.params,
-                        "cancel_requested": job.cancel_requested,
+                if isinstance(data, dict):
+                    return {
+                        job_data["id"]: job_data
+                        for job_data in data.get("sync_jobs", [])
+                        if isinstance(job_data, dict) and isinstance(job_data.get("id"), str)
                     }
-                    for job in self._jobs.values()
-                ]
-            }
-            with open(video_jobs_file(), "w") as f:
-                json.dump(data, f, indent=2)
         except Exception as e:
-            self.logger.error(f"Failed to save audio-video sync jobs to disk: {e}")
+            self.logger.warning(f"Failed to load legacy audio-video sync jobs from disk: {e}")
+        return {}
+    
+    def _persist_job(self, job: AudioVideoSyncJob) -> None:
+        """Append the job's current state to the job journal (caller holds self._lock)."""
+        self._store.put(job.id, job.__dict__)
     
     def _check_ffmpeg_available(self) -> bool:
         """Check if ffmpeg is available on the system.
@@ -261,7 +258,7 @@ class AudioVideoSyncService:
         
         with self._lock:
             self._jobs[job_id] = job
-            self._save_jobs_to_disk()
+            self._persist_job(job)
         
         # Start processing in background thread
         thread = threading.Thread(
@@ -299,7 +296,7 @@ class AudioVideoSyncService:
             job.state = "running"
             job.started_at = time.time()
             job.message = "Processing audio-video synchronization"
-            self._save_jobs_to_disk()
+            self._persist_job(job)
         
         try:
             video_path = job.params["video_path"]
@@ -347,7 +344,7 @@ class AudioVideoSyncService:
                     job.finished_at = time.time()
                     job.error = error_msg
                     job.message = f"Synchronization failed: {error_msg[:100]}"
-                    self._save_jobs_to_disk()
+                    self._persist_job(job)
                 return
             
             # Verify output file exists
@@ -360,7 +357,7 @@ class AudioVideoSyncService:
                     job.finished_at = time.time()
                     job.error = error_msg
                     job.message = error_msg
-                    self._save_jobs_to_disk()
+                    self._persist_job(job)
                 return
             
             # Success
@@ -369,7 +366,7 @@ class AudioVideoSyncService:
                 job.finished_at = time.time()
                 job.output_path = output_path
                 job.message = f"Audio-video synchronization completed successfully"
-                self._save_jobs_to_disk()
+                self._persist_job(job)
             
             self.logger.info(f"Sync job {job_id} completed successfully: {output_path}")
             
@@ -383,7 +380,7 @@ class AudioVideoSyncService:
                     job.finished_at = time.time()
                     job.error = error_msg
                     job.message = f"Synchronization failed: {error_msg[:100]}"
-                    self._save_jobs_to_disk()
+                    self._persist_job(job)
     
     def _build_ffmpeg_command(
         self,
@@ -571,7 +568,7 @@ class AudioVideoSyncService:
                 job.state = "cancelled"
                 job.cancelled_at = time.time()
                 job.message = "Cancellation requested"
-                self._save_jobs_to_disk()
+                self._persist_job(job)
                 return True
         
         return False
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import asyncio
 from datetime import datetime, timedelta
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
+from app.models.automation_rule import AutomationPendingAction
 from app.services.automation_rule_service import AutomationRuleService
+from app.services.automation_timer import AutomationTimer, get_automation_timer
 from app.services.behavior_randomization_service import BehaviorRandomizationService
 from app.services.comment_generation_service import (
     CommentGenerationRequest,
@@ -31,14 +32,16 @@ class AutomationSchedulerError(RuntimeError):
 class AutomationSchedulerService:
     """Service for executing automation rules."""
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, timer: AutomationTimer | None = None) -> None:
         """
         Initialize automation scheduler service.
 
         Args:
             db: Database session for accessing automation rules and platform accounts.
+            timer: Timer that runs delayed executions (defaults to the global automation timer).
         """
         self.db = db
+        self.timer = timer or get_automation_timer()
         self.rule_service = AutomationRuleService(db)
         self.engagement_service = IntegratedEngagementService(db)
         self.posting_service = IntegratedPostingService(db)
@@ -90,17 +93,24 @@ class AutomationSchedulerService:
 
     async def execute_rule(self, rule_id: UUID, platform_account_id: UUID | None = None) -> dict:
         """
-        Execute an automation rule.
+        Schedule an automation rule for execution after a human-like delay.
+
+        The rule is checked now; the action itself is stored as a pending
+        action and run by the automation timer once the delay has passed, so
+        the caller and its database session are not held for the delay. If
+        the rule already has an action waiting or running, that action is
+        returned instead of scheduling another one.
 
         Args:
             rule_id: Automation rule UUID.
             platform_account_id: Optional platform account ID (if not specified, uses rule's platform_account_id).
 
         Returns:
-            Dictionary with execution result.
+            Dictionary with the scheduled pending action (id, execute_at, delay;
+            no delay when an existing action is returned).
 
         Raises:
-            AutomationSchedulerError: If execution fails.
+            AutomationSchedulerError: If the rule cannot be executed.
         """
         rule = await self.rule_service.get_rule(rule_id)
         if not rule:
@@ -116,6 +126,22 @@ class AutomationSchedulerService:
         if not target_account_id:
             raise AutomationSchedulerError("No platform account specified for rule execution")
 
+        # Limits and cooldown only see executions that finished; don't stack another one
+        existing = await self.timer.find_active(rule.id)
+        if existing is not None:
+            logger.debug(f"Rule {rule_id} already has {existing.status} action {existing.id}")
+            return {
+                "success": True,
+                "rule_id": str(rule_id),
+                "action_type": rule.action_type,
+                "result": {
+                    "status": "scheduled" if existing.status == "pending" else existing.status,
+                    "pending_action_id": str(existing.id),
+                    "execute_at": existing.execute_at.isoformat(),
+                    "already_scheduled": True,
+                },
+            }
+
         # Check if action should be skipped based on human-like activity patterns
         if self.timing_service.should_skip_action():
             logger.info(
@@ -143,32 +169,69 @@ class AutomationSchedulerService:
                 )
                 raise AutomationSchedulerError("Skipped engagement (selective engagement pattern)")
 
-        try:
-            # Wait for human-like delay before executing action
-            base_delay = self.timing_service.get_engagement_delay(action_type=rule.action_type)
-            # Add random variation to delay (behavior randomization)
-            varied_delay = self.behavior_service.get_engagement_delay_variation(
-                base_delay, variation_percent=0.3
-            )
-            logger.debug(f"Waiting engagement delay: {varied_delay:.1f}s (base: {base_delay:.1f}s)")
-            await asyncio.sleep(varied_delay)
+        # Human-like delay before executing action
+        base_delay = self.timing_service.get_engagement_delay(action_type=rule.action_type)
+        # Add random variation to delay (behavior randomization)
+        varied_delay = self.behavior_service.get_engagement_delay_variation(
+            base_delay, variation_percent=0.3
+        )
+        action = await self.timer.schedule(rule.id, target_account_id, rule.action_type, varied_delay)
+        logger.debug(
+            f"Scheduled rule {rule_id} as action {action.id} in {varied_delay:.1f}s (base: {base_delay:.1f}s)"
+        )
 
+        return {
+            "success": True,
+            "rule_id": str(rule_id),
+            "action_type": rule.action_type,
+            "result": {
+                "status": "scheduled",
+                "pending_action_id": str(action.id),
+                "execute_at": action.execute_at.isoformat(),
+                "delay_seconds": round(varied_delay, 1),
+            },
+        }
+
+    async def run_rule_action(self, rule_id: UUID, platform_account_id: UUID) -> dict:
+        """
+        Run an automation rule's action now and update its statistics.
+
+        Called by the automation timer when a scheduled execution is due. The
+        rule is checked again (enabled, cooldown, limits), since it may have
+        changed or run meanwhile.
+
+        Args:
+            rule_id: Automation rule UUID.
+            platform_account_id: Platform account to run the action on.
+
+        Returns:
+            Dictionary with execution result.
+
+        Raises:
+            AutomationSchedulerError: If the rule can no longer be executed, or the action fails.
+        """
+        can_execute, reason = await self.can_execute_rule(rule_id)
+        if not can_execute:
+            raise AutomationSchedulerError(f"Cannot execute rule: {reason}")
+        rule = await self.rule_service.get_rule(rule_id)
+
+        try:
             # Execute action based on action_type
             result = None
             if rule.action_type == "comment":
-                result = await self._execute_comment_action(rule, target_account_id)
+                result = await self._execute_comment_action(rule, platform_account_id)
             elif rule.action_type == "like":
-                result = await self._execute_like_action(rule, target_account_id)
+                result = await self._execute_like_action(rule, platform_account_id)
             elif rule.action_type == "follow":
-                result = await self._execute_follow_action(rule, target_account_id)
+                result = await self._execute_follow_action(rule, platform_account_id)
             elif rule.action_type == "unfollow":
-                result = await self._execute_unfollow_action(rule, target_account_id)
+                result = await self._execute_unfollow_action(rule, platform_account_id)
             elif rule.action_type == "story":
-                result = await self._execute_story_action(rule, target_account_id)
+                result = await self._execute_story_action(rule, platform_account_id)
             elif rule.action_type == "dm_response":
-                result = await self._execute_dm_response_action(rule, target_account_id)
+                result = await self._execute_dm_response_action(rule, platform_account_id)
             elif rule.action_type == "dm_send":
-                result = await self._execute_dm_send_action(rule, target_account_id)
+                result = await self._execute_dm_send_action(rule, platform_account_id)
             else:
                 raise AutomationSchedulerError(f"Unknown action type: {rule.action_type}")
 
@@ -196,6 +259,42 @@ class AutomationSchedulerService:
             logger.error(f"Failed to execute automation rule {rule_id}: {exc}")
             raise AutomationSchedulerError(f"Failed to execute rule: {exc}") from exc
 
+    async def list_pending_actions(
+        self, rule_id: UUID | None = None, status: str | None = "pending", limit: int = 100
+    ) -> list[AutomationPendingAction]:
+        """
+        List scheduled rule executions, soonest first.
+
+        Args:
+            rule_id: Only actions of this rule (optional).
+            status: Only actions with this status (None for all, default: pending).
+            limit: Maximum number of actions returned.
+
+        Returns:
+            List of pending actions.
+        """
+        return await self.timer.list_actions(rule_id=rule_id, status=status, limit=limit)
+
+    async def cancel_pending_action(self, action_id: UUID) -> AutomationPendingAction:
+        """
+        Cancel a scheduled rule execution that has not started yet.
+
+        Args:
+            action_id: Pending action UUID.
+
+        Returns:
+            The cancelled action.
+
+        Raises:
+            AutomationSchedulerError: If the action does not exist or already started.
+        """
+        action = await self.timer.cancel(action_id)
+        if action is None:
+            raise AutomationSchedulerError(f"Pending action {action_id} not found")
+        if action.status != "cancelled":
+            raise AutomationSchedulerError(f"Pending action {action_id} is already {action.status}")
+        return action
+
     async def _execute_comment_action(
         self, rule: "AutomationRule", platform_account_id: UUID
     ) -> dict:
@@ -0,0 +1,418 @@
+"""Timer for deferred automation rule executions.
+
+Automation actions wait a human-like delay before they run. Instead of a
+coroutine sleeping for each one while holding its request and database
+session, every delayed execution is stored as an ``AutomationPendingAction``
+row and kept in an in-memory min-heap keyed by due time. A single task per
+process sleeps until the earliest entry is due, so waiting costs one heap
+entry rather than a coroutine and a session.
+
+When an entry fires it is claimed with a conditional UPDATE (pending ->
+running) and executed on a short-lived session, so an action loaded by
+several processes, or cancelled meanwhile, runs at most once. Pending rows
+are reloaded on start and periodically, so entries survive restarts and
+entries scheduled by a process that died are picked up by the others. An
+action cut off by stop() is stored as failed; one left running by a process
+that died is returned to pending once its running timeout has passed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.logging import get_logger
+from app.models.automation_rule import AutomationPendingAction
+
+logger = get_logger(__name__)
+
+FireAction = Callable[[AsyncSession, AutomationPendingAction], Awaitable[dict[str, Any]]]
+"""Executes a due pending action on the given session and returns its result."""
+
+STOP_GRACE_S = 10.0
+"""Seconds stop() waits for firing actions before cancelling them."""
+
+
+async def _run_rule_action(db: AsyncSession, action: AutomationPendingAction) -> dict[str, Any]:
+    # Imported here: the scheduler service schedules through this module
+    from app.services.automation_scheduler_service import AutomationSchedulerService
+
+    return await AutomationSchedulerService(db).run_rule_action(action.rule_id, action.platform_account_id)
+
+
+def _timestamp(value: datetime) -> float:
+    # SQLite hands timezone-aware columns back naive; they are stored in UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _json_safe(value: Any) -> Any:
+    return json.loads(json.dumps(value, default=str))
+
+
+class AutomationTimer:
+    """Fires persisted automation actions when they become due."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        fire: FireAction | None = None,
+        max_concurrent: int | None = None,
+        resync_s: float | None = None,
+        running_timeout_s: float | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        """
+        Initialize the timer.
+
+        Args:
+            session_factory: Factory for the short-lived sessions used to
+                store, claim and run actions.
+            fire: Coroutine that executes a due action (defaults to
+                AutomationSchedulerService.run_rule_action).
+            max_concurrent: Actions executed at once (defaults to
+                settings.automation_timer_workers).
+            resync_s: Seconds between reloads of pending rows from the
+                database (defaults to settings.automation_timer_resync_s).
+            running_timeout_s: Seconds after which a running action is
+                assumed lost and returned to pending (defaults to
+                settings.automation_timer_running_timeout_s).
+            clock: Returns the current UNIX time that due times are set
+                and compared against (defaults to time.time).
+        """
+        self.session_factory = session_factory
+        self.fire = fire or _run_rule_action
+        self.max_concurrent = max(1, max_concurrent or settings.automation_timer_workers)
+        self.resync_s = resync_s or settings.automation_timer_resync_s
+        self.running_timeout_s = running_timeout_s or settings.automation_timer_running_timeout_s
+        self.clock = clock or time.time
+        self._heap: list[tuple[float, int, UUID]] = []
+        self._due_at: dict[UUID, float] = {}
+        self._sequence = 0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._firing: dict[UUID, asyncio.Task[None]] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+        self._counts = {"fired": 0, "executed": 0, "failed": 0, "skipped": 0}
+
+    # ===== Scheduling =====
+
+    def _push(self, action_id: UUID, due: float) -> None:
+        self._sequence += 1
+        self._due_at[action_id] = due
+        heapq.heappush(self._heap, (due, self._sequence, action_id))
+        if self._heap[0][2] == action_id:
+            self._wakeup.set()
+
+    async def schedule(
+        self, rule_id: UUID, platform_account_id: UUID, action_type: str, delay_s: float
+    ) -> AutomationPendingAction:
+        """
+        Store an action and fire it after a delay.
+
+        Args:
+            rule_id: Automation rule to execute.
+            platform_account_id: Platform account the action runs on.
+            action_type: Action type of the rule.
+            delay_s: Seconds to wait before executing.
+
+        Returns:
+            The stored pending action.
+        """
+        async with self.session_factory() as db:
+            action = AutomationPendingAction(
+                rule_id=rule_id,
+                platform_account_id=platform_account_id,
+                action_type=action_type,
+                execute_at=datetime.fromtimestamp(self.clock() + max(0.0, delay_s), timezone.utc),
+                status="pending",
+            )
+            db.add(action)
+            await db.commit()
+
+        self._push(action.id, _timestamp(action.execute_at))
+        return action
+
+    async def cancel(self, action_id: UUID) -> AutomationPendingAction | None:
+        """
+        Cancel a pending action.
+
+        Args:
+            action_id: Pending action UUID.
+
+        Returns:
+            The action after the attempt (status "cancelled" unless it had
+            already started or finished), or None if it does not exist.
+        """
+        self._due_at.pop(action_id, None)
+        async with self.session_factory() as db:
+            await db.execute(
+                update(AutomationPendingAction)
+                .where(AutomationPendingAction.id == action_id, AutomationPendingAction.status == "pending")
+                .values(status="cancelled")
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            return await db.get(AutomationPendingAction, action_id)
+
+    async def list_actions(
+        self, rule_id: UUID | None = None, status: str | None = "pending", limit: int = 100
+    ) -> list[AutomationPendingAction]:
+        """
+        List actions, soonest first.
+
+        Args:
+            rule_id: Only actions of this rule.
+            status: Only actions with this status (None for all).
+            limit: Maximum number of actions returned.
+
+        Returns:
+            List of pending actions ordered by execute_at.
+        """
+        query = select(AutomationPendingAction)
+        if rule_id is not None:
+            query = query.where(AutomationPendingAction.rule_id == rule_id)
+        if status is not None:
+            query = query.where(AutomationPendingAction.status == status)
+        query = query.order_by(AutomationPendingAction.execute_at.asc()).limit(limit)
+        async with self.session_factory() as db:
+            return list((await db.execute(query)).scalars().all())
+
+    async def find_active(self, rule_id: UUID) -> AutomationPendingAction | None:
+        """
+        Find an action of a rule that is waiting or running.
+
+        Args:
+            rule_id: Automation rule UUID.
+
+        Returns:
+            The rule's earliest pending or running action, or None.
+        """
+        query = (
+            select(AutomationPendingAction)
+            .where(
+                AutomationPendingAction.rule_id == rule_id,
+                AutomationPendingAction.status.in_(("pending", "running")),
+            )
+            .order_by(AutomationPendingAction.execute_at.asc())
+            .limit(1)
+        )
+        async with self.session_factory() as db:
+            return (await db.execute(query)).scalar_one_or_none()
+
+    async def load_pending(self) -> int:
+        """
+        Add pending rows from the database that are not in the heap yet.
+
+        Running rows started longer than the running timeout ago (by a process
+        that died mid-action) are returned to pending first.
+
+        Returns:
+            Number of actions added.
+        """
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=self.running_timeout_s)
+        async with self.session_factory() as db:
+            stale = update(AutomationPendingAction).where(
+                AutomationPendingAction.status == "running",
+                or_(
+                    AutomationPendingAction.started_at.is_(None),
+                    AutomationPendingAction.started_at < stale_before,
+                ),
+            )
+            if self._firing:
+                stale = stale.where(AutomationPendingAction.id.not_in(list(self._firing)))
+            reset = await db.execute(
+                stale.values(status="pending", started_at=None).execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            if reset.rowcount:
+                logger.warning(f"Returned {reset.rowcount} stale running automation actions to pending")
+
+            result = await db.execute(
+                select(AutomationPendingAction.id, AutomationPendingAction.execute_at).where(
+                    AutomationPendingAction.status == "pending"
+                )
+            )
+            rows = result.all()
+        added = 0
+        for action_id, execute_at in rows:
+            if action_id not in self._due_at and action_id not in self._firing:
+                self._push(action_id, _timestamp(execute_at))
+                added += 1
+        return added
+
+    # ===== Firing =====
+
+    async def _claim(self, action_id: UUID) -> bool:
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(AutomationPendingAction)
+                .where(AutomationPendingAction.id == action_id, AutomationPendingAction.status == "pending")
+                .values(status="running", started_at=datetime.now(timezone.utc))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        return result.rowcount == 1
+
+    async def _mark_interrupted(self, action_id: UUID) -> bool:
+        """Store a running action cut off by stop() as failed; False if it had already finished."""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(AutomationPendingAction)
+                .where(AutomationPendingAction.id == action_id, AutomationPendingAction.status == "running")
+                .values(
+                    status="failed",
+                    error_message="Interrupted: the automation timer stopped before the action finished",
+                    executed_at=datetime.now(timezone.utc),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        return result.rowcount == 1
+
+    async def _fire(self, action_id: UUID) -> None:
+        claimed = False
+        try:
+            async with self._semaphore:
+                if not await self._claim(action_id):
+                    # Cancelled, or fired by another process
+                    self._counts["skipped"] += 1
+                    return
+                claimed = True
+                self._counts["fired"] += 1
+                async with self.session_factory() as db:
+                    action = await db.get(AutomationPendingAction, action_id)
+                    try:
+                        result = await self.fire(db, action)
+                        action.status = "executed"
+                        action.result = _json_safe(result)
+                        self._counts["executed"] += 1
+                    except Exception as exc:
+                        logger.error(f"Automation action {action_id} (rule {action.rule_id}) failed: {exc}")
+                        await db.rollback()
+                        action = await db.get(AutomationPendingAction, action_id, populate_existing=True)
+                        action.status = "failed"
+                        action.error_message = str(exc)
+                        self._counts["failed"] += 1
+                    action.executed_at = datetime.now(timezone.utc)
+                    await db.commit()
+        except asyncio.CancelledError:
+            # The action may have reached the platform already, so it is not retried
+            if claimed:
+                try:
+                    if await asyncio.shield(self._mark_interrupted(action_id)):
+                        self._counts["failed"] += 1
+                except Exception as exc:
+                    logger.error(f"Failed to mark interrupted automation action {action_id}: {exc}")
+            raise
+        except Exception as exc:
+            logger.error(f"Failed to fire automation action {action_id}: {exc}")
+        finally:
+            self._firing.pop(action_id, None)
+
+    def _fire_due(self) -> None:
+        now = self.clock()
+        while self._heap and self._heap[0][0] <= now:
+            due, _, action_id = heapq.heappop(self._heap)
+            # Stale heap entry: cancelled, or rescheduled with another due time
+            if self._due_at.get(action_id) != due:
+                continue
+            del self._due_at[action_id]
+            self._firing[action_id] = asyncio.create_task(self._fire(action_id))
+
+    async def _run(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        next_resync = time.monotonic()
+        while True:
+            if time.monotonic() >= next_resync:
+                try:
+                    await self.load_pending()
+                except Exception as exc:
+                    logger.warning(f"Failed to load pending automation actions: {exc}")
+                next_resync = time.monotonic() + self.resync_s
+
+            self._wakeup.clear()
+            self._fire_due()
+
+            timeout = next_resync - time.monotonic()
+            if self._heap:
+                timeout = min(timeout, self._heap[0][0] - self.clock())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), max(0.0, timeout))
+            except asyncio.TimeoutError:
+                pass
+
+    # ===== Lifecycle =====
+
+    @property
+    def running(self) -> bool:
+        """Whether the timer task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Load pending actions and start firing them on the running event loop."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the timer, giving actions already firing a grace period to finish.
+
+        Actions still running after the grace period are cancelled and stored
+        as failed.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        firing = list(self._firing.values())
+        if firing:
+            _, still_running = await asyncio.wait(firing, timeout=STOP_GRACE_S)
+            for pending in still_running:
+                pending.cancel()
+            await asyncio.gather(*firing, return_exceptions=True)
+        # Pending rows stay in the database and are reloaded on the next start
+        self._heap.clear()
+        self._due_at.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Describe the timer.
+
+        Returns:
+            Dictionary with queued and firing counts, seconds until the next
+            action and totals of fired, executed, failed and skipped actions.
+        """
+        next_due = min(self._due_at.values(), default=None)
+        return {
+            "running": self.running,
+            "queued": len(self._due_at),
+            "firing": len(self._firing),
+            "next_due_in_s": None if next_due is None else round(max(0.0, next_due - self.clock()), 3),
+            **self._counts,
+        }
+
+
+# Global instance for easy import
+_automation_timer: AutomationTimer | None = None
+
+
+def get_automation_timer() -> AutomationTimer:
+    """Get or create the global automation timer."""
+    global _automation_timer
+    if _automation_timer is None:
+        _automation_timer = AutomationTimer(async_session_maker)
+    return _automation_timer
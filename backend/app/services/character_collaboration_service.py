@@ -14,6 +14,7 @@ from sqlalchemy.orm import selectinload
 from app.core.logging import get_logger
 from app.models.post import Post
 from app.models.character import Character, CharacterPersonality
+from app.services.engagement_rollup_service import EngagementRollupService
 
 logger = get_logger(__name__)
 
@@ -31,6 +32,7 @@ class CharacterCollaborationService:
     def __init__(self, db: AsyncSession) -> None:
         """Initialize character collaboration simulation service."""
         self.db = db
+        self.rollups = EngagementRollupService(db)
 
     def _calculate_compatibility_score(
         self,
@@ -146,6 +148,9 @@ class CharacterCollaborationService:
     ) -> Optional[Post]:
         """Simulate a single character interacting with another character's post.
         
+        Does not commit; after committing, call ``self.rollups.invalidate_cache()``
+        so cached engagement series pick up the change.
+        
         Args:
             actor_character_id: UUID of character performing the interaction
             target_post_id: UUID of post to interact with
@@ -233,6 +238,8 @@ class CharacterCollaborationService:
         
         post.last_engagement_sync_at = datetime.utcnow()
         
+        # The caller commits, then calls self.rollups.invalidate_cache()
+        await self.rollups.refresh_post(post)
         await self.db.flush()
         await self.db.refresh(post)
         
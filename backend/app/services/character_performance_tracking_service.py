@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logging import get_logger
 from app.models.analytics import Analytics
 from app.models.post import Post
+from app.services.engagement_rollup_service import EngagementRollupService
 
 logger = get_logger(__name__)
 
@@ -28,6 +29,7 @@ class CharacterPerformanceTrackingService:
             db: Database session.
         """
         self.db = db
+        self.rollups = EngagementRollupService(db)
 
     async def record_metrics(
         self,
@@ -98,7 +100,13 @@ class CharacterPerformanceTrackingService:
                 )
                 self.db.add(analytics_record)
 
+        if platform and "follower_count" in metrics:
+            await self.rollups.record_follower_count(
+                character_id, platform, metric_date, int(metrics["follower_count"])
+            )
+
         await self.db.commit()
+        await self.rollups.invalidate_cache()
         logger.info(
             f"Recorded {len(metrics)} metrics for character {character_id} on {metric_date}"
         )
@@ -234,33 +242,33 @@ class CharacterPerformanceTrackingService:
         if snapshot_date is None:
             snapshot_date = date.today()
 
-        # Calculate metrics from posts
-        query = select(Post).where(Post.character_id == character_id).where(
-            Post.status == "published"
+        # Aggregate metrics by platform in SQL
+        query = (
+            select(
+                Post.platform,
+                func.count().label("post_count"),
+                func.coalesce(func.sum(Post.likes_count), 0).label("likes_count"),
+                func.coalesce(func.sum(Post.comments_count), 0).label("comments_count"),
+                func.coalesce(func.sum(Post.shares_count), 0).label("shares_count"),
+                func.coalesce(func.sum(Post.views_count), 0).label("views_count"),
+            )
+            .where(Post.character_id == character_id, Post.status == "published")
+            .group_by(Post.platform)
         )
-
         result = await self.db.execute(query)
-        posts = result.scalars().all()
-
-        # Aggregate metrics by platform
-        platform_metrics: dict[str, dict[str, Any]] = {}
-
-        for post in posts:
-            platform = post.platform
-            if platform not in platform_metrics:
-                platform_metrics[platform] = {
-                    "post_count": 0,
-                    "likes_count": 0,
-                    "comments_count": 0,
-                    "shares_count": 0,
-                    "views_count": 0,
-                }
+        platform_metrics: dict[str, dict[str, Any]] = {
+            row.platform: {
+                "post_count": int(row.post_count),
+                "likes_count": int(row.likes_count),
+                "comments_count": int(row.comments_count),
+                "shares_count": int(row.shares_count),
+                "views_count": int(row.views_count),
+            }
+            for row in result.all()
+        }
 
-            platform_metrics[platform]["post_count"] += 1
-            platform_metrics[platform]["likes_count"] += post.likes_count or 0
-            platform_metrics[platform]["comments_count"] += post.comments_count or 0
-            platform_metrics[platform]["shares_count"] += post.shares_count or 0
-            platform_metrics[platform]["views_count"] += post.views_count or 0
+        # Bring the snapshot day's rollups up to date with the posts
+        await self.rollups.refresh_days(character_id, [snapshot_date])
 
         # Record metrics for each platform
         for platform, metrics in platform_metrics.items():
@@ -10,6 +10,7 @@ import httpx
 
 from app.core.config import settings
 from app.core.runtime_settings import get_comfyui_base_url
+from app.services.comfyui_events import PromptEvents, get_comfyui_event_listener
 
 
 class ComfyUiError(RuntimeError):
@@ -58,8 +59,13 @@ class ComfyUiClient:
             ComfyUiError: If unable to reach ComfyUI or if the request fails.
         """
         url = f"{self.base_url}/prompt"
+        payload: dict[str, Any] = {"prompt": workflow}
+        listener = get_comfyui_event_listener(self.base_url)
+        if listener is not None:
+            # Route execution events for this prompt to the shared listener socket
+            payload["client_id"] = listener.client_id
         try:
-            r = self._client.post(url, json={"prompt": workflow}, timeout=30)
+            r = self._client.post(url, json=payload, timeout=30)
         except httpx.RequestError as exc:
             raise ComfyUiError(f"Unable to reach ComfyUI at {self.base_url}") from exc
         if r.status_code != 200:
@@ -75,86 +81,92 @@ class ComfyUiClient:
         prompt_id: str,
         timeout_s: float = 300,
         should_cancel: Callable[[], bool] | None = None,
+        on_progress: Callable[[PromptEvents], None] | None = None,
     ) -> dict[str, Any]:
-        """Wait until history contains output images, return first output entry."""
-        url = f"{self.base_url}/history/{prompt_id}"
-        deadline = time.time() + timeout_s
-        start_time = time.time()
-        # Adaptive polling: start with 2s intervals, increase to 1s as deadline approaches
-        poll_interval = 2.0
-        
-        while time.time() < deadline:
-            if should_cancel and should_cancel():
-                raise ComfyUiError("Cancelled")
-            try:
-                r = self._client.get(url, timeout=15)
-            except httpx.RequestError as exc:
-                raise ComfyUiError(f"Unable to reach ComfyUI at {self.base_url}") from exc
-            if r.status_code != 200:
-                raise ComfyUiError(f"ComfyUI /history failed: {r.status_code} {r.text}")
-            data = r.json()
-            entry = data.get(prompt_id)
-            if isinstance(entry, dict):
-                outputs = entry.get("outputs")
-                if isinstance(outputs, dict):
-                    # Find first image file ref
-                    for node_out in outputs.values():
-                        images = node_out.get("images") if isinstance(node_out, dict) else None
-                        if isinstance(images, list) and images:
-                            first = images[0]
-                            if isinstance(first, dict) and "filename" in first:
-                                return first
-            # Adaptive polling: reduce interval as deadline approaches
-            elapsed = time.time() - start_time
-            remaining = deadline - time.time()
-            if remaining < 30:
-                poll_interval = 0.5  # Poll more frequently near deadline
-            elif remaining < 60:
-                poll_interval = 1.0
-            else:
-                poll_interval = 2.0
-            time.sleep(poll_interval)
-
-        raise ComfyUiError("Timed out waiting for ComfyUI output")
+        """Wait until the prompt produces output images, return first output entry."""
+        return self._wait_for_outputs(prompt_id, timeout_s, should_cancel, on_progress)[0]
 
     def wait_for_images(
         self,
         prompt_id: str,
         timeout_s: float = 300,
         should_cancel: Callable[[], bool] | None = None,
+        on_progress: Callable[[PromptEvents], None] | None = None,
     ) -> list[dict[str, Any]]:
-        """Wait until history contains output images, return all image file refs."""
-        url = f"{self.base_url}/history/{prompt_id}"
+        """Wait until the prompt produces output images, return all image file refs."""
+        return self._wait_for_outputs(prompt_id, timeout_s, should_cancel, on_progress)
+
+    def _wait_for_outputs(
+        self,
+        prompt_id: str,
+        timeout_s: float,
+        should_cancel: Callable[[], bool] | None,
+        on_progress: Callable[[PromptEvents], None] | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Wait for prompt completion using websocket events, polling /history as fallback.
+
+        While the shared event listener is connected, /history is only read once per
+        connection (to catch events missed before connecting) and once on completion.
+        When the socket is down, /history is polled with adaptive intervals.
+
+        Args:
+            prompt_id: ComfyUI prompt identifier.
+            timeout_s: Maximum time to wait.
+            should_cancel: Optional callable returning True to abort.
+            on_progress: Optional callback receiving prompt state on each websocket event.
+
+        Returns:
+            Non-empty list of image file refs.
+
+        Raises:
+            ComfyUiError: On cancellation, timeout, execution error or request failure.
+        """
         deadline = time.time() + timeout_s
-        start_time = time.time()
-        # Adaptive polling: start with 2s intervals, increase to 0.5s as deadline approaches
-        poll_interval = 2.0
-        
+        listener = get_comfyui_event_listener(self.base_url)
+        checked_connection_id: int | None = None
+        empty_history_checks = 0
+
         while time.time() < deadline:
             if should_cancel and should_cancel():
                 raise ComfyUiError("Cancelled")
-            try:
-                r = self._client.get(url, timeout=15)
-            except httpx.RequestError as exc:
-                raise ComfyUiError(f"Unable to reach ComfyUI at {self.base_url}") from exc
-            if r.status_code != 200:
-                raise ComfyUiError(f"ComfyUI /history failed: {r.status_code} {r.text}")
-            data = r.json()
-            entry = data.get(prompt_id)
-            if isinstance(entry, dict):
-                outputs = entry.get("outputs")
-                if isinstance(outputs, dict):
-                    found: list[dict[str, Any]] = []
-                    for node_out in outputs.values():
-                        images = node_out.get("images") if isinstance(node_out, dict) else None
-                        if isinstance(images, list) and images:
-                            for img in images:
-                                if isinstance(img, dict) and "filename" in img:
-                                    found.append(img)
+
+            if listener is not None and listener.connected:
+                connection_id = listener.connection_id
+                if connection_id != checked_connection_id:
+                    # Events may have been missed before this connection was established
+                    checked_connection_id = connection_id
+                    found = self._fetch_history_images(prompt_id)
                     if found:
                         return found
+                state = listener.wait(prompt_id, timeout_s=min(1.0, max(0.0, deadline - time.time())))
+                if state is None:
+                    continue
+                if on_progress:
+                    try:
+                        on_progress(state)
+                    except Exception:  # noqa: BLE001
+                        pass
+                if state.status == "failed":
+                    raise ComfyUiError(f"ComfyUI execution failed: {state.error}")
+                if state.status == "interrupted":
+                    raise ComfyUiError("Cancelled")
+                if state.status == "succeeded":
+                    # History also includes outputs of cached nodes, which are not sent as events
+                    found = self._fetch_history_images(prompt_id) or state.images
+                    if found:
+                        return found
+                    # execution_success can arrive just before ComfyUI writes history
+                    empty_history_checks += 1
+                    if empty_history_checks >= 20:
+                        raise ComfyUiError("ComfyUI finished without output images")
+                    time.sleep(0.25)
+                continue
+
+            found = self._fetch_history_images(prompt_id)
+            if found:
+                return found
             # Adaptive polling: reduce interval as deadline approaches
-            elapsed = time.time() - start_time
             remaining = deadline - time.time()
             if remaining < 30:
                 poll_interval = 0.5  # Poll more frequently near deadline
@@ -162,10 +174,49 @@ class ComfyUiClient:
                 poll_interval = 1.0
             else:
                 poll_interval = 2.0
-            time.sleep(poll_interval)
+            wait_s = max(0.0, min(poll_interval, remaining))
+            if listener is not None:
+                # Switch back to event-driven waiting as soon as the socket reconnects
+                listener.wait_connected(wait_s)
+            else:
+                time.sleep(wait_s)
 
         raise ComfyUiError("Timed out waiting for ComfyUI output")
 
+    def _fetch_history_images(self, prompt_id: str) -> list[dict[str, Any]]:
+        """
+        Read /history/{prompt_id} once and extract output image file refs.
+
+        Args:
+            prompt_id: ComfyUI prompt identifier.
+
+        Returns:
+            List of image file refs (empty if the prompt has no outputs yet).
+
+        Raises:
+            ComfyUiError: If unable to reach ComfyUI or if the request fails.
+        """
+        url = f"{self.base_url}/history/{prompt_id}"
+        try:
+            r = self._client.get(url, timeout=15)
+        except httpx.RequestError as exc:
+            raise ComfyUiError(f"Unable to reach ComfyUI at {self.base_url}") from exc
+        if r.status_code != 200:
+            raise ComfyUiError(f"ComfyUI /history failed: {r.status_code} {r.text}")
+        data = r.json()
+        entry = data.get(prompt_id) if isinstance(data, dict) else None
+        found: list[dict[str, Any]] = []
+        if isinstance(entry, dict):
+            outputs = entry.get("outputs")
+            if isinstance(outputs, dict):
+                for node_out in outputs.values():
+                    images = node_out.get("images") if isinstance(node_out, dict) else None
+                    if isinstance(images, list) and images:
+                        for img in images:
+                            if isinstance(img, dict) and "filename" in img:
+                                found.append(img)
+        return found
+
     def download_image_bytes(self, filename: str, subfolder: str = "", image_type: str = "output") -> bytes:
         """
         Download image bytes from ComfyUI.
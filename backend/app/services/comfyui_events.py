@@ -0,0 +1,333 @@
+"""Shared ComfyUI websocket listener that pushes execution events to waiting jobs.
+
+ComfyUI reports execution progress over ``/ws``. Instead of every job polling
+``GET /history/{prompt_id}``, one listener per ComfyUI base URL keeps a socket
+open, records per-prompt state, and wakes up threads waiting on a prompt.
+When the socket is unavailable, callers fall back to polling.
+"""
+
+from __future__ import annotations
+
+import collections
+import json
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+try:
+    from websockets.sync.client import connect as ws_connect  # type: ignore
+
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    ws_connect = None  # type: ignore[assignment]
+    WEBSOCKETS_AVAILABLE = False
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+PromptStatus = Literal["pending", "running", "succeeded", "failed", "interrupted"]
+
+
+@dataclass
+class PromptEvents:
+    """Execution state for a single ComfyUI prompt, built from websocket events.
+
+    Attributes:
+        prompt_id: ComfyUI prompt identifier.
+        status: Current execution status.
+        node: Node currently executing, None when idle.
+        progress_value: Sampler progress value from the latest progress event.
+        progress_max: Sampler progress maximum from the latest progress event.
+        images: Image file refs reported by executed nodes (cached nodes are not reported).
+        error: Error message from execution_error, None otherwise.
+        updated_at: Timestamp of the last event for this prompt (Unix timestamp).
+    """
+    prompt_id: str
+    status: PromptStatus = "pending"
+    node: str | None = None
+    progress_value: int | None = None
+    progress_max: int | None = None
+    images: list[dict[str, Any]] = field(default_factory=list)
+    error: str | None = None
+    updated_at: float = 0.0
+
+    @property
+    def finished(self) -> bool:
+        """Whether the prompt reached a terminal state."""
+        return self.status in ("succeeded", "failed", "interrupted")
+
+
+class ComfyUiEventListener:
+    """Background websocket connection to one ComfyUI instance.
+
+    The listener connects lazily on first use and reconnects with exponential
+    backoff. ``connection_id`` increments on every successful connect so waiters
+    can tell when events may have been missed and re-check history once.
+    """
+
+    _MAX_TRACKED_PROMPTS = 512
+
+    def __init__(self, base_url: str) -> None:
+        """
+        Initialize listener for a ComfyUI base URL (no connection is made yet).
+
+        Args:
+            base_url: ComfyUI HTTP base URL (e.g. http://localhost:8188).
+        """
+        self.base_url = base_url.rstrip("/")
+        self.client_id = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._cv = threading.Condition(self._lock)
+        self._prompts: collections.OrderedDict[str, PromptEvents] = collections.OrderedDict()
+        self._connected = False
+        self._connection_id = 0
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def ws_url(self) -> str:
+        """Websocket URL including this listener's client ID."""
+        if self.base_url.startswith("https://"):
+            root = "wss://" + self.base_url[len("https://"):]
+        elif self.base_url.startswith("http://"):
+            root = "ws://" + self.base_url[len("http://"):]
+        else:
+            root = "ws://" + self.base_url
+        return f"{root}/ws?clientId={self.client_id}"
+
+    @property
+    def connected(self) -> bool:
+        """Whether the websocket is currently connected."""
+        with self._lock:
+            return self._connected
+
+    @property
+    def connection_id(self) -> int:
+        """Counter incremented on every successful (re)connect."""
+        with self._lock:
+            return self._connection_id
+
+    def ensure_started(self) -> None:
+        """Start the listener thread if it is not already running."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"comfyui-events-{self.client_id[:8]}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout_s: float = 5.0) -> None:
+        """
+        Stop the listener thread and close the socket.
+
+        Args:
+            timeout_s: Maximum time to wait for the thread to exit.
+        """
+        self._stop.set()
+        with self._cv:
+            self._cv.notify_all()
+            thread = self._thread
+        if thread:
+            thread.join(timeout=timeout_s)
+
+    def wait_connected(self, timeout_s: float) -> bool:
+        """
+        Block until the websocket is connected or the timeout expires.
+
+        Args:
+            timeout_s: Maximum time to wait.
+
+        Returns:
+            True if connected.
+        """
+        with self._cv:
+            self._cv.wait_for(lambda: self._connected or self._stop.is_set(), timeout=max(0.0, timeout_s))
+            return self._connected
+
+    def get(self, prompt_id: str) -> PromptEvents | None:
+        """
+        Get a snapshot of recorded events for a prompt.
+
+        Args:
+            prompt_id: ComfyUI prompt identifier.
+
+        Returns:
+            Copy of the prompt state, or None if no event has been seen.
+        """
+        with self._lock:
+            state = self._prompts.get(prompt_id)
+            if state is None:
+                return None
+            return PromptEvents(**{**state.__dict__, "images": list(state.images)})
+
+    def wait(self, prompt_id: str, timeout_s: float) -> PromptEvents | None:
+        """
+        Block until a new event arrives for the prompt, it finishes, or the socket drops.
+
+        Args:
+            prompt_id: ComfyUI prompt identifier.
+            timeout_s: Maximum time to wait.
+
+        Returns:
+            Latest prompt state snapshot, or None if no event has been seen.
+        """
+        deadline = time.time() + max(0.0, timeout_s)
+        with self._cv:
+            state = self._prompts.get(prompt_id)
+            seen = state.updated_at if state else 0.0
+            connection_id = self._connection_id
+            while True:
+                state = self._prompts.get(prompt_id)
+                if state and (state.finished or state.updated_at != seen):
+                    break
+                if not self._connected or self._connection_id != connection_id or self._stop.is_set():
+                    break
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._cv.wait(timeout=remaining)
+        return self.get(prompt_id)
+
+    def handle_message(self, message: dict[str, Any]) -> None:
+        """
+        Apply a single ComfyUI websocket message to the tracked prompt state.
+
+        Args:
+            message: Decoded JSON message with "type" and "data" keys.
+        """
+        msg_type = message.get("type")
+        data = message.get("data")
+        if not isinstance(data, dict):
+            return
+        prompt_id = data.get("prompt_id")
+        if not isinstance(prompt_id, str):
+            return
+
+        with self._cv:
+            state = self._prompts.get(prompt_id)
+            if state is None:
+                state = PromptEvents(prompt_id=prompt_id)
+                self._prompts[prompt_id] = state
+                while len(self._prompts) > self._MAX_TRACKED_PROMPTS:
+                    self._prompts.popitem(last=False)
+            else:
+                self._prompts.move_to_end(prompt_id)
+
+            if msg_type == "execution_start":
+                state.status = "running"
+            elif msg_type == "executing":
+                node = data.get("node")
+                if node is None:
+                    # ComfyUI signals the end of a prompt with node=None
+                    if state.status not in ("failed", "interrupted"):
+                        state.status = "succeeded"
+                    state.node = None
+                else:
+                    state.status = "running"
+                    state.node = str(node)
+            elif msg_type == "progress":
+                state.status = "running"
+                value, maximum = data.get("value"), data.get("max")
+                state.progress_value = int(value) if isinstance(value, (int, float)) else None
+                state.progress_max = int(maximum) if isinstance(maximum, (int, float)) else None
+            elif msg_type == "executed":
+                output = data.get("output")
+                images = output.get("images") if isinstance(output, dict) else None
+                if isinstance(images, list):
+                    state.images.extend(img for img in images if isinstance(img, dict) and "filename" in img)
+            elif msg_type == "execution_success":
+                state.status = "succeeded"
+                state.node = None
+            elif msg_type == "execution_error":
+                state.status = "failed"
+                state.error = str(data.get("exception_message") or "ComfyUI execution error")
+            elif msg_type == "execution_interrupted":
+                state.status = "interrupted"
+            else:
+                return
+
+            state.updated_at = time.time()
+            self._cv.notify_all()
+
+    def _set_connected(self, connected: bool) -> None:
+        with self._cv:
+            self._connected = connected
+            if connected:
+                self._connection_id += 1
+            self._cv.notify_all()
+
+    def _run(self) -> None:
+        """
+        Listener thread loop: connect, dispatch messages, reconnect with backoff.
+        """
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                with ws_connect(self.ws_url, open_timeout=5, close_timeout=2, max_size=None) as ws:
+                    self._set_connected(True)
+                    backoff = 1.0
+                    logger.info(f"ComfyUI event stream connected: {self.base_url}")
+                    while not self._stop.is_set():
+                        try:
+                            raw = ws.recv(timeout=1.0)
+                        except TimeoutError:
+                            continue
+                        if not isinstance(raw, str):
+                            # Binary frames carry preview images; not needed for completion
+                            continue
+                        try:
+                            message = json.loads(raw)
+                        except ValueError:
+                            continue
+                        if isinstance(message, dict):
+                            self.handle_message(message)
+            except Exception as exc:  # noqa: BLE001
+                if self.connected:
+                    logger.warning(f"ComfyUI event stream dropped ({self.base_url}): {exc}")
+            finally:
+                self._set_connected(False)
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+
+_listeners: dict[str, ComfyUiEventListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def get_comfyui_event_listener(base_url: str) -> ComfyUiEventListener | None:
+    """
+    Get (and lazily start) the shared event listener for a ComfyUI base URL.
+
+    Args:
+        base_url: ComfyUI HTTP base URL.
+
+    Returns:
+        Shared listener, or None if websockets are disabled or unavailable.
+    """
+    if not WEBSOCKETS_AVAILABLE or not settings.comfyui_websocket_enabled:
+        return None
+    key = base_url.rstrip("/")
+    with _listeners_lock:
+        listener = _listeners.get(key)
+        if listener is None:
+            listener = ComfyUiEventListener(key)
+            _listeners[key] = listener
+    listener.ensure_started()
+    return listener
+
+
+def stop_comfyui_event_listeners() -> None:
+    """Stop all shared listeners (called on application shutdown)."""
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+    for listener in listeners:
+        listener.stop()
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.logging import get_logger
 from app.models.content import Content, ScheduledPost
@@ -421,124 +421,113 @@ class ContentDistributionService:
 
         return results
 
-    async def execute_scheduled_posts(
-        self, character_id: UUID | None = None, max_posts: int = 10
-    ) -> dict[str, Any]:
+    async def execute_scheduled_post(self, scheduled_post: ScheduledPost) -> dict[str, Any]:
         """
-        Execute scheduled posts that are due.
+        Post one scheduled post to its platform accounts.
+
+        Sets the post's status (and posted_at, error_message, retry_count)
+        but does not commit; the caller owns the transaction.
 
         Args:
-            character_id: Optional character ID filter.
-            max_posts: Maximum number of posts to execute in one batch.
+            scheduled_post: Scheduled post to execute.
 
         Returns:
-            Dictionary with execution results.
+            Result entry with scheduled_post_id, success and either the
+            platforms posted to or the error.
         """
-        now = datetime.now()
+        try:
+            # Get content
+            content = await self.content_service.get_content(scheduled_post.content_id)
 
-        query = select(ScheduledPost).where(
-            ScheduledPost.status == "pending",
-            ScheduledPost.scheduled_time <= now,
-        )
+            if not content:
+                raise ContentDistributionError(
+                    f"Content {scheduled_post.content_id} not found"
+                )
 
-        if character_id:
-            query = query.where(ScheduledPost.character_id == character_id)
+            # Get platform accounts
+            platform_accounts = await self._get_platform_accounts_for_character(
+                scheduled_post.character_id, scheduled_post.platform
+            )
 
-        query = query.order_by(ScheduledPost.scheduled_time.asc()).limit(max_posts)
+            if not platform_accounts:
+                raise ContentDistributionError(
+                    f"No connected {scheduled_post.platform} account found"
+                )
 
-        result = await self.db.execute(query)
-        scheduled_posts = result.scalars().all()
+            # Extract post settings
+            post_settings = scheduled_post.post_settings or {}
+            hashtags = post_settings.get("hashtags", [])
+            mentions = post_settings.get("mentions", [])
 
-        execution_results: dict[str, Any] = {
-            "total": len(scheduled_posts),
-            "succeeded": 0,
-            "failed": 0,
-            "results": [],
-        }
+            # Post content
+            account_ids = [acc.id for acc in platform_accounts]
 
-        for scheduled_post in scheduled_posts:
-            try:
-                # Get content
-                content = await self.content_service.get_content(scheduled_post.content_id)
+            if content.content_type == "image":
+                results = await self.posting_service.cross_post_image(
+                    content_id=content.id,
+                    platform_account_ids=account_ids,
+                    caption=scheduled_post.caption or "",
+                    hashtags=hashtags,
+                    mentions=mentions,
+                )
 
-                if not content:
-                    raise ContentDistributionError(
-                        f"Content {scheduled_post.content_id} not found"
-                    )
+                # Update scheduled post
+                scheduled_post.status = "posted"
+                scheduled_post.posted_at = datetime.now(timezone.utc)
 
-                # Get platform accounts
-                platform_accounts = await self._get_platform_accounts_for_character(
-                    scheduled_post.character_id, scheduled_post.platform
-                )
+                return {
+                    "scheduled_post_id": str(scheduled_post.id),
+                    "success": True,
+                    "platforms": list(results.keys()),
+                }
 
-                if not platform_accounts:
-                    raise ContentDistributionError(
-                        f"No connected {scheduled_post.platform} account found"
-                    )
-
-                # Extract post settings
-                post_settings = scheduled_post.post_settings or {}
-                hashtags = post_settings.get("hashtags", [])
-                mentions = post_settings.get("mentions", [])
-
-                # Post content
-                account_ids = [acc.id for acc in platform_accounts]
-
-                if content.content_type == "image":
-                    results = await self.posting_service.cross_post_image(
-                        content_id=content.id,
-                        platform_account_ids=account_ids,
-                        caption=scheduled_post.caption or "",
-                        hashtags=hashtags,
-                        mentions=mentions,
-                    )
-
-                    # Update scheduled post
-                    scheduled_post.status = "posted"
-                    scheduled_post.posted_at = datetime.now()
-                    await self.db.commit()
-
-                    execution_results["succeeded"] += 1
-                    execution_results["results"].append(
-                        {
-                            "scheduled_post_id": str(scheduled_post.id),
-                            "success": True,
-                            "platforms": list(results.keys()),
-                        }
-                    )
-
-                else:
-                    # For other content types, handle individually
-                    # This is a simplified version - you'd add platform-specific posting logic
-                    scheduled_post.status = "failed"
-                    scheduled_post.error_message = f"Content type {content.content_type} not yet supported for scheduled posting"
-                    await self.db.commit()
-
-                    execution_results["failed"] += 1
-                    execution_results["results"].append(
-                        {
-                            "scheduled_post_id": str(scheduled_post.id),
-                            "success": False,
-                            "error": scheduled_post.error_message,
-                        }
-                    )
+            # For other content types, handle individually
+            # This is a simplified version - you'd add platform-specific posting logic
+            scheduled_post.status = "failed"
+            scheduled_post.error_message = f"Content type {content.content_type} not yet supported for scheduled posting"
 
-            except Exception as exc:
-                logger.error(f"Failed to execute scheduled post {scheduled_post.id}: {exc}")
-
-                scheduled_post.status = "failed"
-                scheduled_post.error_message = str(exc)
-                scheduled_post.retry_count += 1
-                await self.db.commit()
-
-                execution_results["failed"] += 1
-                execution_results["results"].append(
-                    {
-                        "scheduled_post_id": str(scheduled_post.id),
-                        "success": False,
-                        "error": str(exc),
-                    }
-                )
+            return {
+                "scheduled_post_id": str(scheduled_post.id),
+                "success": False,
+                "error": scheduled_post.error_message,
+            }
+
+        except Exception as exc:
+            logger.error(f"Failed to execute scheduled post {scheduled_post.id}: {exc}")
+
+            scheduled_post.status = "failed"
+            scheduled_post.error_message = str(exc)
+            scheduled_post.retry_count += 1
+
+            return {
+                "scheduled_post_id": str(scheduled_post.id),
+                "success": False,
+                "error": str(exc),
+            }
+
+    async def execute_scheduled_posts(
+        self, character_id: UUID | None = None, max_posts: int = 10
+    ) -> dict[str, Any]:
+        """
+        Execute scheduled posts that are due.
+
+        Due posts are claimed and run by a ScheduledPostDispatcher, so several
+        backend processes can call this at once without double-posting.
+        Posts of one character on one platform run in schedule order;
+        different characters, or platforms of one character, run concurrently.
+
+        Args:
+            character_id: Optional character ID filter.
+            max_posts: Maximum number of posts to execute in one batch.
+
+        Returns:
+            Dictionary with execution results.
+        """
+        # Imported here: the dispatcher runs posts through this service
+        from app.services.scheduled_post_dispatcher import ScheduledPostDispatcher
+
+        dispatcher = ScheduledPostDispatcher(async_sessionmaker(bind=self.db.bind, expire_on_commit=False))
+        execution_results = await dispatcher.dispatch_once(max_posts=max_posts, character_id=character_id)
 
         logger.info(
             f"Executed {execution_results['succeeded']}/{execution_results['total']} scheduled posts "
@@ -546,4 +535,3 @@ class ContentDistributionService:
         )
 
         return execution_results
-
@@ -2,21 +2,69 @@
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import Select, select, func, or_, and_, tuple_
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from app.core.logging import get_logger
+from app.core.redis_client import get_redis
 from app.models.content import Content
 from app.models.character import Character
 from app.services.quality_validator import QualityResult, quality_validator
 
 logger = get_logger(__name__)
 
+TotalMode = Literal["exact", "cached", "estimated", "none"]
+
+# How long exact library totals are reused in "cached" mode
+COUNT_CACHE_TTL_SECONDS = 30
+_COUNT_CACHE_PREFIX = "content:library:count"
+
+
+class _ExplainJson(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_ExplainJson, "postgresql")
+def _compile_explain_json(element: _ExplainJson, compiler: Any, **kw: Any) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+def encode_content_cursor(content: Content) -> str:
+    """Encode the keyset position (created_at, id) of a content item as an opaque cursor."""
+    payload = json.dumps([content.created_at.isoformat(), str(content.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_content_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by ``encode_content_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, content_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), UUID(content_id)
+    except (TypeError, ValueError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
 
 class ContentService:
     """Service for content library management operations."""
@@ -39,6 +87,21 @@ class ContentService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_contents(
+        self,
+        content_ids: list[UUID],
+        include_character: bool = False,
+    ) -> list[Content]:
+        """Get several content items in one query, in the order of ``content_ids`` (missing ids are skipped)."""
+        if not content_ids:
+            return []
+        query = select(Content).where(Content.id.in_(content_ids))
+        if include_character:
+            query = query.options(selectinload(Content.character))
+        result = await self.db.execute(query)
+        by_id = {content.id: content for content in result.scalars().all()}
+        return [by_id[content_id] for content_id in dict.fromkeys(content_ids) if content_id in by_id]
+
     async def list_content(
         self,
         character_id: UUID | None = None,
@@ -54,16 +117,31 @@ class ContentService:
         limit: int = 50,
         offset: int = 0,
         include_character: bool = True,
-    ) -> tuple[list[Content], int]:
+        cursor: str | None = None,
+        total: TotalMode = "exact",
+    ) -> tuple[list[Content], int | None]:
         """
         List content with filtering, search, and pagination.
 
+        Results are ordered newest first by (created_at, id). Passing the
+        ``cursor`` of the last item of a page (see ``encode_content_cursor``)
+        continues after it using the (created_at, id) index, so the cost of a
+        page does not depend on its depth; ``offset`` is ignored in that case.
+
+        Args:
+            total: How to compute the total: "exact" counts every match,
+                "cached" reuses an exact count for COUNT_CACHE_TTL_SECONDS,
+                "estimated" uses the query planner's row estimate on PostgreSQL
+                (exact elsewhere), and "none" skips it.
+
         Returns:
-            Tuple of (content list, total count)
+            Tuple of (content list, total count or None if total is "none")
+
+        Raises:
+            ValueError: If the cursor is malformed.
         """
         # Build base query
         query = select(Content)
-        count_query = select(func.count()).select_from(Content)
 
         # Apply filters
         conditions = []
@@ -92,50 +170,84 @@ class ContentService:
         if date_to:
             conditions.append(Content.created_at <= date_to)
 
-        # Search in prompt, file_path, and character name
+        # Search in prompt and file_path (served by the trigram indexes on PostgreSQL)
         if search:
-            search_conditions = [
-                Content.prompt.ilike(f"%{search}%"),
-                Content.file_path.ilike(f"%{search}%"),
-            ]
-            # If including character, search in character name too
-            if include_character:
-                # We'll need to join for this, but for now just search in content fields
-                pass
-            conditions.append(or_(*search_conditions))
+            conditions.append(
+                or_(
+                    Content.prompt.ilike(f"%{search}%"),
+                    Content.file_path.ilike(f"%{search}%"),
+                )
+            )
 
         # Filter by tags (content must contain all specified tags)
         if tags:
-            for tag in tags:
-                # PostgreSQL array contains check - use @> operator to check if array contains value
-                # Content.tags @> ARRAY[tag] checks if tags array contains the tag
-                conditions.append(Content.tags.op('@>')([tag]))
+            # Single containment check (tags @> ARRAY[...]) so the GIN index on tags applies
+            conditions.append(Content.tags.contains(tags))
 
         # Apply all conditions
         if conditions:
-            where_clause = and_(*conditions)
-            query = query.where(where_clause)
-            count_query = count_query.where(where_clause)
+            query = query.where(and_(*conditions))
+
+        total_count = await self._count(query, total)
+
+        if cursor:
+            created_at, content_id = decode_content_cursor(cursor)
+            query = query.where(tuple_(Content.created_at, Content.id) < tuple_(created_at, content_id))
 
         # Include character relationship if requested
         if include_character:
             query = query.options(selectinload(Content.character))
 
-        # Order by created_at descending (newest first)
-        query = query.order_by(Content.created_at.desc())
-
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        # Newest first, with id as tie-breaker so keyset positions are unique
+        query = query.order_by(Content.created_at.desc(), Content.id.desc()).limit(limit)
+        if not cursor:
+            query = query.offset(offset)
 
-        # Execute queries
         result = await self.db.execute(query)
         content_list = result.scalars().all()
 
-        count_result = await self.db.execute(count_query)
-        total_count = count_result.scalar_one()
-
         return content_list, total_count
 
+    async def _count(self, query: Select, mode: TotalMode) -> int | None:
+        """Total number of rows matching a filtered content query, per ``list_content``'s total mode."""
+        if mode == "none":
+            return None
+        count_query = select(func.count()).select_from(query.subquery())
+
+        dialect = self.db.get_bind().dialect
+        if mode == "estimated" and dialect.name == "postgresql":
+            try:
+                # Savepoint, so a failed EXPLAIN does not abort the caller's transaction
+                async with self.db.begin_nested():
+                    plan = (await self.db.execute(_ExplainJson(query))).scalar_one()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]["Plan"]["Plan Rows"])
+            except (SQLAlchemyError, LookupError, TypeError, ValueError) as exc:
+                logger.warning(f"Falling back to exact content count: {exc}")
+
+        cache_key = None
+        if mode == "cached":
+            compiled = count_query.compile()
+            fingerprint = f"{compiled}|{sorted(compiled.params.items())}"
+            cache_key = f"{_COUNT_CACHE_PREFIX}:{hashlib.sha1(fingerprint.encode()).hexdigest()}"
+            try:
+                cached = await (await get_redis()).get(cache_key)
+                if cached is not None:
+                    return int(cached)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug(f"Content count cache read failed: {exc}")
+                cache_key = None
+
+        count = (await self.db.execute(count_query)).scalar_one()
+
+        if cache_key is not None:
+            try:
+                await (await get_redis()).setex(cache_key, COUNT_CACHE_TTL_SECONDS, count)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug(f"Content count cache write failed: {exc}")
+        return count
+
     async def create_content(
         self,
         character_id: UUID,
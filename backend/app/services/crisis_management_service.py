@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logging import get_logger
 from app.models.post import Post
 from app.models.content import Content
+from app.services.engagement_rollup_service import EngagementRollupService
 
 logger = get_logger(__name__)
 
@@ -22,6 +23,7 @@ class CrisisManagementService:
     def __init__(self, db: AsyncSession) -> None:
         """Initialize crisis management service with database session."""
         self.db = db
+        self.rollups = EngagementRollupService(db)
 
     async def report_takedown(
         self,
@@ -33,6 +35,9 @@ class CrisisManagementService:
     ) -> Post:
         """Report a content takedown from a platform.
         
+        Does not commit; after committing, call ``self.rollups.invalidate_cache()``
+        so cached engagement series drop the post.
+        
         Args:
             post_id: UUID of the post that was taken down
             platform: Platform name (instagram, twitter, facebook, etc.)
@@ -83,6 +88,15 @@ class CrisisManagementService:
         )
 
         await self.db.flush()
+
+        # Best effort in a savepoint, so a rollup failure cannot lose the takedown;
+        # the caller commits, then calls self.rollups.invalidate_cache()
+        try:
+            async with self.db.begin_nested():
+                await self.rollups.refresh_post(post)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Failed to refresh engagement rollups for post {post_id}: {exc}")
+
         await self.db.refresh(post)
         return post
 
@@ -2,19 +2,44 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
 from app.models.post import Post
+from app.services.engagement_rollup_service import EngagementRollupService
 
 logger = get_logger(__name__)
 
 
+def _engagement_expr() -> ColumnElement[int]:
+    """SQL expression for a post's total engagement (likes + comments + shares)."""
+    return Post.likes_count + Post.comments_count + Post.shares_count
+
+
+def _published_filters(
+    character_id: UUID | None,
+    platform: str | None,
+    from_date: datetime | None,
+    to_date: datetime | None,
+) -> list[ColumnElement[bool]]:
+    """WHERE clauses for published posts, in idx_posts_overview column order."""
+    filters: list[ColumnElement[bool]] = [Post.status == "published"]
+    if character_id:
+        filters.append(Post.character_id == character_id)
+    if platform:
+        filters.append(Post.platform == platform)
+    if from_date:
+        filters.append(Post.published_at >= from_date)
+    if to_date:
+        filters.append(Post.published_at <= to_date)
+    return filters
+
+
 class EngagementAnalyticsService:
     """Service for calculating engagement analytics and metrics."""
 
@@ -46,29 +71,41 @@ class EngagementAnalyticsService:
         Returns:
             Dictionary containing analytics overview data.
         """
-        # Build base query
-        query = select(Post).where(Post.status == "published")
-
-        if character_id:
-            query = query.where(Post.character_id == character_id)
-        if platform:
-            query = query.where(Post.platform == platform)
-        if from_date:
-            query = query.where(Post.published_at >= from_date)
-        if to_date:
-            query = query.where(Post.published_at <= to_date)
+        filters = _published_filters(character_id, platform, from_date, to_date)
+        engagement = _engagement_expr()
 
-        # Execute query to get posts
-        result = await self.db.execute(query)
-        posts = result.scalars().all()
+        # Platform breakdown (one grouped aggregate; totals are summed from it)
+        breakdown_query = (
+            select(
+                Post.platform,
+                func.count().label("posts"),
+                func.coalesce(func.sum(engagement), 0).label("engagement"),
+                func.coalesce(func.sum(Post.likes_count), 0).label("likes"),
+                func.coalesce(func.sum(Post.comments_count), 0).label("comments"),
+                func.coalesce(func.sum(Post.shares_count), 0).label("shares"),
+                func.coalesce(func.sum(Post.views_count), 0).label("views"),
+            )
+            .where(*filters)
+            .group_by(Post.platform)
+        )
+        breakdown_result = await self.db.execute(breakdown_query)
+        platform_breakdown: dict[str, dict[str, int]] = {
+            row.platform: {
+                "posts": int(row.posts),
+                "engagement": int(row.engagement),
+                "likes": int(row.likes),
+                "comments": int(row.comments),
+                "shares": int(row.shares),
+                "views": int(row.views),
+            }
+            for row in breakdown_result.all()
+        }
 
         # Calculate metrics
-        total_posts = len(posts)
-        total_engagement = sum(
-            post.likes_count + post.comments_count + post.shares_count for post in posts
-        )
+        total_posts = sum(data["posts"] for data in platform_breakdown.values())
+        total_engagement = sum(data["engagement"] for data in platform_breakdown.values())
         total_followers = 0  # TODO: Get from platform accounts when available
-        total_reach = sum(post.views_count for post in posts)
+        total_reach = sum(data["views"] for data in platform_breakdown.values())
 
         # Calculate engagement rate (engagement / reach, or default to 0.05 if no reach)
         engagement_rate = (
@@ -78,81 +115,70 @@ class EngagementAnalyticsService:
         # Calculate follower growth (placeholder - would need historical data)
         follower_growth = 0  # TODO: Calculate from historical platform account data
 
-        # Get top performing posts (by total engagement)
-        top_posts = sorted(
-            posts,
-            key=lambda p: p.likes_count + p.comments_count + p.shares_count,
-            reverse=True,
-        )[:10]
+        # Get top performing posts (by total engagement), selecting only the columns shown
+        top_query = (
+            select(
+                Post.id,
+                Post.platform,
+                Post.post_type,
+                Post.likes_count,
+                Post.comments_count,
+                Post.shares_count,
+                Post.views_count,
+                Post.published_at,
+            )
+            .where(*filters)
+            .order_by(engagement.desc())
+            .limit(10)
+        )
+        top_result = await self.db.execute(top_query)
 
         top_performing_posts = [
             {
-                "id": str(post.id),
-                "platform": post.platform,
-                "post_type": post.post_type,
-                "likes": post.likes_count,
-                "comments": post.comments_count,
-                "shares": post.shares_count,
-                "views": post.views_count,
-                "published_at": post.published_at.isoformat() if post.published_at else None,
+                "id": str(row.id),
+                "platform": row.platform,
+                "post_type": row.post_type,
+                "likes": row.likes_count,
+                "comments": row.comments_count,
+                "shares": row.shares_count,
+                "views": row.views_count,
+                "published_at": row.published_at.isoformat() if row.published_at else None,
             }
-            for post in top_posts
+            for row in top_result.all()
         ]
 
-        # Platform breakdown
-        platform_breakdown: dict[str, dict[str, int]] = {}
-        for post in posts:
-            if post.platform not in platform_breakdown:
-                platform_breakdown[post.platform] = {
-                    "posts": 0,
-                    "engagement": 0,
-                    "likes": 0,
-                    "comments": 0,
-                    "shares": 0,
-                    "views": 0,
-                }
-            platform_breakdown[post.platform]["posts"] += 1
-            platform_breakdown[post.platform]["engagement"] += (
-                post.likes_count + post.comments_count + post.shares_count
-            )
-            platform_breakdown[post.platform]["likes"] += post.likes_count
-            platform_breakdown[post.platform]["comments"] += post.comments_count
-            platform_breakdown[post.platform]["shares"] += post.shares_count
-            platform_breakdown[post.platform]["views"] += post.views_count
-
         # Calculate trends (last 30 days by default)
         end_date = to_date or datetime.now()
         start_date = from_date or (end_date - timedelta(days=30))
 
-        # Get daily engagement data
-        daily_query = (
-            select(
-                func.date(Post.published_at).label("date"),
-                func.sum(Post.likes_count + Post.comments_count + Post.shares_count).label(
-                    "engagement"
-                ),
-            )
-            .where(Post.status == "published")
-            .where(Post.published_at >= start_date)
-            .where(Post.published_at <= end_date)
+        # Daily engagement and follower counts come from the pre-aggregated rollups;
+        # days without rolled-up posts fall back to grouping the posts themselves
+        rollups = EngagementRollupService(self.db)
+        series = await rollups.get_daily_series(
+            character_id, platform, start_date.date(), end_date.date()
         )
-
-        if character_id:
-            daily_query = daily_query.where(Post.character_id == character_id)
-        if platform:
-            daily_query = daily_query.where(Post.platform == platform)
-
-        daily_query = daily_query.group_by(func.date(Post.published_at)).order_by(
-            func.date(Post.published_at)
+        unrolled = await rollups.get_unrolled_daily_engagement(
+            character_id,
+            platform,
+            start_date.date(),
+            end_date.date(),
+            skip_days={date.fromisoformat(point["date"]) for point in series if point["posts"]},
         )
-
-        daily_result = await self.db.execute(daily_query)
-        daily_data = daily_result.all()
-
-        engagement_trend = [int(row.engagement or 0) for row in daily_data]
-
-        # Follower growth trend (placeholder - would need historical data)
-        follower_growth_trend = [0] * len(engagement_trend)
+        points = {date.fromisoformat(point["date"]): point for point in series}
+        for day, totals in unrolled.items():
+            points[day] = {**points.get(day, {"follower_count": None}), **totals}
+
+        engagement_trend: list[int] = []
+        follower_growth_trend: list[int] = []
+        last_followers: int | None = None
+        for _, point in sorted(points.items()):
+            followers = point["follower_count"]
+            if point["posts"]:
+                engagement_trend.append(point["engagement"])
+                growth = followers - last_followers if followers is not None and last_followers is not None else 0
+                follower_growth_trend.append(growth)
+            if followers is not None:
+                last_followers = followers
 
         return {
             "total_posts": total_posts,
@@ -192,19 +218,6 @@ class EngagementAnalyticsService:
             to_date=to_date,
         )
 
-        # Get platform-specific breakdown for this character
-        query = select(Post).where(Post.character_id == character_id).where(
-            Post.status == "published"
-        )
-
-        if from_date:
-            query = query.where(Post.published_at >= from_date)
-        if to_date:
-            query = query.where(Post.published_at <= to_date)
-
-        result = await self.db.execute(query)
-        posts = result.scalars().all()
-
         # Calculate average engagement per post
         avg_engagement_per_post = (
             overview["total_engagement"] / overview["total_posts"]
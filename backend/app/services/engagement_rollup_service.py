@@ -0,0 +1,419 @@
+"""Daily engagement rollups: incremental refresh, backfill and cached series reads.
+
+``engagement_daily_rollups`` holds one row per (character, platform, day) with
+the engagement totals of that day's published posts. Writers that change post
+engagement (engagement syncs, snapshots) recompute only the buckets they touch;
+``backfill`` rebuilds a whole range from ``posts``.
+
+Daily series are cached in Redis. Each character has a version counter that
+is bumped when one of its buckets changes, plus a global counter for
+all-character series; cache keys embed the versions, so a change invalidates
+exactly the affected series and stale entries simply expire.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.core.redis_client import get_redis
+from app.models.analytics import Analytics
+from app.models.engagement_rollup import EngagementDailyRollup
+from app.models.post import Post
+from app.services.caching_strategy import CACHE_TTL
+
+logger = get_logger(__name__)
+
+CACHE_PREFIX = "analytics:rollups"
+_GLOBAL_VERSION_KEY = f"{CACHE_PREFIX}:version:all"
+
+_COUNT_FIELDS = ("post_count", "likes_count", "comments_count", "shares_count", "views_count")
+
+
+def _as_date(value: Any) -> date:
+    """Normalize ``func.date`` results (date on PostgreSQL, text on SQLite)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _version_key(character_id: UUID) -> str:
+    return f"{CACHE_PREFIX}:version:{character_id}"
+
+
+def _posts_by_bucket_query(*filters: Any) -> Any:
+    """Grouped post totals per (character, platform, day) for published posts."""
+    day = func.date(Post.published_at)
+    return (
+        select(
+            Post.character_id,
+            Post.platform,
+            day.label("day"),
+            func.count().label("post_count"),
+            func.coalesce(func.sum(Post.likes_count), 0).label("likes_count"),
+            func.coalesce(func.sum(Post.comments_count), 0).label("comments_count"),
+            func.coalesce(func.sum(Post.shares_count), 0).label("shares_count"),
+            func.coalesce(func.sum(Post.views_count), 0).label("views_count"),
+        )
+        .where(Post.status == "published", Post.published_at.isnot(None), *filters)
+        .group_by(Post.character_id, Post.platform, day)
+    )
+
+
+class EngagementRollupService:
+    """Maintains and reads daily engagement rollups."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize engagement rollup service.
+
+        Args:
+            db: Database session.
+        """
+        self.db = db
+        self._dirty: set[UUID] = set()
+
+    async def refresh_days(
+        self,
+        character_id: UUID,
+        days: Iterable[date],
+        platform: str | None = None,
+    ) -> None:
+        """
+        Recompute a character's buckets for the given days from its posts.
+
+        Does not commit; call ``invalidate_cache`` after the caller commits.
+
+        Args:
+            character_id: Character ID.
+            days: Days to recompute.
+            platform: Only recompute this platform (all platforms if None).
+        """
+        wanted = set(days)
+        if not wanted:
+            return
+        # Widen by a day on each side so timezone differences between Python and
+        # the database's date() never drop a post; results are filtered by day below
+        filters = [
+            Post.character_id == character_id,
+            Post.published_at >= datetime.combine(min(wanted) - timedelta(days=1), time.min),
+            Post.published_at < datetime.combine(max(wanted) + timedelta(days=2), time.min),
+        ]
+        if platform:
+            filters.append(Post.platform == platform)
+        result = await self.db.execute(_posts_by_bucket_query(*filters))
+        fresh = {
+            (row.platform, _as_date(row.day)): row
+            for row in result.all()
+            if _as_date(row.day) in wanted
+        }
+
+        existing_query = select(EngagementDailyRollup).where(
+            EngagementDailyRollup.character_id == character_id,
+            EngagementDailyRollup.day.in_(wanted),
+        )
+        if platform:
+            existing_query = existing_query.where(EngagementDailyRollup.platform == platform)
+        existing = (await self.db.execute(existing_query)).scalars().all()
+
+        for rollup in existing:
+            row = fresh.pop((rollup.platform, rollup.day), None)
+            if row is None and rollup.follower_count is None:
+                await self.db.delete(rollup)
+                continue
+            for field in _COUNT_FIELDS:
+                setattr(rollup, field, int(getattr(row, field)) if row is not None else 0)
+
+        for (row_platform, day), row in fresh.items():
+            self.db.add(
+                EngagementDailyRollup(
+                    character_id=character_id,
+                    platform=row_platform,
+                    day=day,
+                    **{field: int(getattr(row, field)) for field in _COUNT_FIELDS},
+                )
+            )
+        self._dirty.add(character_id)
+
+    async def refresh_post(self, post: Post) -> None:
+        """
+        Recompute the bucket a post belongs to (after its engagement or status changed).
+
+        Does not commit; call ``invalidate_cache`` after the caller commits.
+
+        Args:
+            post: Post whose bucket to refresh.
+        """
+        day = await self.db.scalar(select(func.date(Post.published_at)).where(Post.id == post.id))
+        if day is None:
+            return
+        await self.refresh_days(post.character_id, [_as_date(day)], platform=post.platform)
+
+    async def record_follower_count(
+        self,
+        character_id: UUID,
+        platform: str,
+        day: date,
+        follower_count: int,
+    ) -> None:
+        """
+        Store a recorded follower count on the day's bucket.
+
+        Does not commit; call ``invalidate_cache`` after the caller commits.
+
+        Args:
+            character_id: Character ID.
+            platform: Platform name.
+            day: Day the count was recorded for.
+            follower_count: Follower count.
+        """
+        rollup = await self.db.scalar(
+            select(EngagementDailyRollup).where(
+                EngagementDailyRollup.character_id == character_id,
+                EngagementDailyRollup.platform == platform,
+                EngagementDailyRollup.day == day,
+            )
+        )
+        if rollup is None:
+            rollup = EngagementDailyRollup(
+                character_id=character_id,
+                platform=platform,
+                day=day,
+                **{field: 0 for field in _COUNT_FIELDS},
+            )
+            self.db.add(rollup)
+        rollup.follower_count = int(follower_count)
+        self._dirty.add(character_id)
+
+    async def backfill(
+        self,
+        character_id: UUID | None = None,
+        from_day: date | None = None,
+        to_day: date | None = None,
+    ) -> dict[str, int]:
+        """
+        Rebuild rollups from posts (and recorded follower counts) and commit.
+
+        Existing rows in the range are replaced in one transaction, so readers
+        see either the old or the new rollups.
+
+        Args:
+            character_id: Only rebuild this character (all if None).
+            from_day: First day to rebuild (inclusive, unbounded if None).
+            to_day: Last day to rebuild (inclusive, unbounded if None).
+
+        Returns:
+            Dictionary with the number of rollup rows written and characters touched.
+        """
+        post_filters: list[Any] = []
+        rollup_filters: list[Any] = []
+        follower_filters: list[Any] = [Analytics.metric_type == "follower_count", Analytics.platform.isnot(None)]
+        if character_id:
+            post_filters.append(Post.character_id == character_id)
+            rollup_filters.append(EngagementDailyRollup.character_id == character_id)
+            follower_filters.append(Analytics.character_id == character_id)
+        if from_day:
+            post_filters.append(Post.published_at >= datetime.combine(from_day, time.min))
+            rollup_filters.append(EngagementDailyRollup.day >= from_day)
+            follower_filters.append(Analytics.metric_date >= from_day)
+        if to_day:
+            post_filters.append(Post.published_at < datetime.combine(to_day + timedelta(days=1), time.min))
+            rollup_filters.append(EngagementDailyRollup.day <= to_day)
+            follower_filters.append(Analytics.metric_date <= to_day)
+
+        buckets: dict[tuple[UUID, str, date], dict[str, Any]] = {}
+        for row in (await self.db.execute(_posts_by_bucket_query(*post_filters))).all():
+            key = (row.character_id, row.platform, _as_date(row.day))
+            buckets[key] = {field: int(getattr(row, field)) for field in _COUNT_FIELDS}
+
+        follower_query = select(
+            Analytics.character_id, Analytics.platform, Analytics.metric_date, Analytics.metric_value
+        ).where(*follower_filters)
+        for row in (await self.db.execute(follower_query)).all():
+            key = (row.character_id, row.platform, row.metric_date)
+            bucket = buckets.setdefault(key, {field: 0 for field in _COUNT_FIELDS})
+            bucket["follower_count"] = int(row.metric_value)
+
+        await self.db.execute(delete(EngagementDailyRollup).where(*rollup_filters))
+        rows = [
+            {
+                "character_id": key[0],
+                "platform": key[1],
+                "day": key[2],
+                "follower_count": bucket.pop("follower_count", None),
+                **bucket,
+            }
+            for key, bucket in buckets.items()
+        ]
+        for start in range(0, len(rows), 1000):
+            await self.db.execute(insert(EngagementDailyRollup), rows[start:start + 1000])
+        await self.db.commit()
+
+        characters = {key[0] for key in buckets}
+        self._dirty.update(characters)
+        await self.invalidate_cache()
+        logger.info(f"Backfilled {len(rows)} engagement rollups for {len(characters)} characters")
+        return {"rows": len(rows), "characters": len(characters)}
+
+    async def get_daily_series(
+        self,
+        character_id: UUID | None = None,
+        platform: str | None = None,
+        from_day: date | None = None,
+        to_day: date | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get per-day engagement totals from the rollups (cached).
+
+        Args:
+            character_id: Optional character ID to filter by.
+            platform: Optional platform name to filter by.
+            from_day: Optional first day (inclusive).
+            to_day: Optional last day (inclusive).
+
+        Returns:
+            List of per-day dicts ordered by date with date, posts, likes,
+            comments, shares, views, engagement and follower_count (summed over
+            platforms, None if no count was recorded).
+        """
+        cache_key = await self._cache_key(character_id, platform, from_day, to_day)
+        if cache_key is not None:
+            try:
+                cached = await (await get_redis()).get(cache_key)
+                if cached:
+                    return json.loads(cached)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug(f"Rollup cache read failed: {exc}")
+
+        query = select(
+            EngagementDailyRollup.day,
+            func.sum(EngagementDailyRollup.post_count).label("posts"),
+            func.sum(EngagementDailyRollup.likes_count).label("likes"),
+            func.sum(EngagementDailyRollup.comments_count).label("comments"),
+            func.sum(EngagementDailyRollup.shares_count).label("shares"),
+            func.sum(EngagementDailyRollup.views_count).label("views"),
+            func.sum(EngagementDailyRollup.follower_count).label("follower_count"),
+        )
+        if character_id:
+            query = query.where(EngagementDailyRollup.character_id == character_id)
+        if platform:
+            query = query.where(EngagementDailyRollup.platform == platform)
+        if from_day:
+            query = query.where(EngagementDailyRollup.day >= from_day)
+        if to_day:
+            query = query.where(EngagementDailyRollup.day <= to_day)
+        query = query.group_by(EngagementDailyRollup.day).order_by(EngagementDailyRollup.day)
+
+        series = [
+            {
+                "date": _as_date(row.day).isoformat(),
+                "posts": int(row.posts or 0),
+                "likes": int(row.likes or 0),
+                "comments": int(row.comments or 0),
+                "shares": int(row.shares or 0),
+                "views": int(row.views or 0),
+                "engagement": int((row.likes or 0) + (row.comments or 0) + (row.shares or 0)),
+                "follower_count": int(row.follower_count) if row.follower_count is not None else None,
+            }
+            for row in (await self.db.execute(query)).all()
+        ]
+
+        if cache_key is not None:
+            try:
+                await (await get_redis()).setex(cache_key, CACHE_TTL["analytics"], json.dumps(series))
+            except Exception as exc:  # noqa: BLE001
+                logger.debug(f"Rollup cache write failed: {exc}")
+        return series
+
+    async def get_unrolled_daily_engagement(
+        self,
+        character_id: UUID | None = None,
+        platform: str | None = None,
+        from_day: date | None = None,
+        to_day: date | None = None,
+        skip_days: Iterable[date] = (),
+    ) -> dict[date, dict[str, int]]:
+        """
+        Per-day post and engagement totals read from posts, for days the rollups don't cover.
+
+        Used as a fallback next to ``get_daily_series`` so posts that reached the
+        table without a rollup refresh still show up in trends.
+
+        Args:
+            character_id: Optional character ID to filter by.
+            platform: Optional platform name to filter by.
+            from_day: Optional first day (inclusive).
+            to_day: Optional last day (inclusive).
+            skip_days: Days already covered by rollups.
+
+        Returns:
+            Mapping of day to a dict with posts and engagement.
+        """
+        day = func.date(Post.published_at)
+        query = select(
+            day.label("day"),
+            func.count().label("posts"),
+            func.coalesce(
+                func.sum(Post.likes_count + Post.comments_count + Post.shares_count), 0
+            ).label("engagement"),
+        ).where(Post.status == "published", Post.published_at.isnot(None))
+        if character_id:
+            query = query.where(Post.character_id == character_id)
+        if platform:
+            query = query.where(Post.platform == platform)
+        if from_day:
+            query = query.where(Post.published_at >= datetime.combine(from_day, time.min))
+        if to_day:
+            query = query.where(Post.published_at < datetime.combine(to_day + timedelta(days=1), time.min))
+        query = query.group_by(day)
+
+        skip = set(skip_days)
+        totals: dict[date, dict[str, int]] = {}
+        for row in (await self.db.execute(query)).all():
+            row_day = _as_date(row.day)
+            if row_day not in skip:
+                totals[row_day] = {"posts": int(row.posts), "engagement": int(row.engagement)}
+        return totals
+
+    async def invalidate_cache(self) -> None:
+        """Invalidate cached series of characters whose buckets changed (call after commit)."""
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline()
+            pipe.incr(_GLOBAL_VERSION_KEY)
+            for character_id in dirty:
+                pipe.incr(_version_key(character_id))
+            await pipe.execute()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Could not invalidate rollup cache: {exc}")
+
+    async def _cache_key(
+        self,
+        character_id: UUID | None,
+        platform: str | None,
+        from_day: date | None,
+        to_day: date | None,
+    ) -> str | None:
+        """Versioned cache key for a series, or None if Redis is unavailable."""
+        version_key = _version_key(character_id) if character_id else _GLOBAL_VERSION_KEY
+        try:
+            version = await (await get_redis()).get(version_key) or "0"
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Rollup cache unavailable: {exc}")
+            return None
+        params = f"{platform}|{from_day}|{to_day}"
+        digest = hashlib.md5(params.encode()).hexdigest()[:12]
+        return f"{CACHE_PREFIX}:series:{character_id or 'all'}:v{version}:{digest}"
@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logging import get_logger
 from app.models.post import Post
 from app.models.platform_account import PlatformAccount
+from app.services.engagement_rollup_service import EngagementRollupService
 
 logger = get_logger(__name__)
 
@@ -262,7 +263,10 @@ class FollowerInteractionSimulationService:
             post.views_count = max(post.views_count, engagement["views"])
         
         post.last_engagement_sync_at = datetime.now()
+        rollups = EngagementRollupService(self.db)
+        await rollups.refresh_post(post)
         await self.db.commit()
+        await rollups.invalidate_cache()
         await self.db.refresh(post)
         
         logger.info(
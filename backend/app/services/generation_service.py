@@ -11,13 +11,16 @@ from typing import Any, Literal, cast
 
 from app.core.config import settings
 from app.core.logging import get_logger
-from app.core.paths import images_dir, jobs_file
+from app.core.paths import image_job_queue_file, images_dir, jobs_file, jobs_journal_file
 from app.services.comfyui_client import ComfyUiClient, ComfyUiError
+from app.services.comfyui_events import PromptEvents
 from app.services.face_consistency_service import (
     FaceConsistencyMethod,
     face_consistency_service,
 )
 from app.services.image_storage_service import image_storage_service
+from app.services.job_scheduler import JobLane, JobScheduler, QueueFullError
+from app.services.job_store import JobStore
 from app.services.quality_validator import quality_validator
 from app.services.nsfw_content_service import nsfw_content_service, NSFWContentConfig
 
@@ -62,37 +65,91 @@ class GenerationService:
     """Service for managing image generation jobs and workflows."""
 
     def __init__(self) -> None:
-        """Initialize generation service with thread lock and job storage."""
+        """Initialize generation service with thread lock, job storage and worker pool."""
         self._lock = threading.Lock()
         self._jobs: dict[str, ImageJob] = {}
         self._image_storage = image_storage_service
         images_dir().mkdir(parents=True, exist_ok=True)
         jobs_file().parent.mkdir(parents=True, exist_ok=True)
+        self._store = JobStore(jobs_journal_file(), max_jobs=settings.job_history_max_jobs)
         self._load_jobs_from_disk()
+        self._scheduler = JobScheduler(
+            name="image-jobs",
+            runner=self._run_queued_job,
+            state_path=image_job_queue_file(),
+            workers=settings.generation_workers,
+            max_depth=settings.generation_queue_max_depth,
+        )
+        self._restore_queue()
+        self._scheduler.start()
+
+    def _restore_queue(self) -> None:
+        """
+        Re-enqueue jobs that were waiting or running when the service last stopped.
+        
+        Jobs listed in the persisted queue file keep their lane and order. Jobs that
+        were running are placed at the head of their lane, and any other queued jobs
+        missing from the file are appended by creation time.
+        """
+        persisted = self._scheduler.load_persisted()
+        restored: list[tuple[str, JobLane, bool]] = []
+        with self._lock:
+            interrupted = sorted(
+                (j for j in self._jobs.values() if j.state == "running"),
+                key=lambda j: j.created_at,
+                reverse=True,
+            )
+            for job in interrupted:
+                job.state = "queued"
+                job.started_at = None
+                job.message = "Re-queued after restart"
+                self._store.patch(
+                    job.id,
+                    fields={"state": job.state, "started_at": None, "message": job.message},
+                )
+                restored.append((job.id, self._job_lane(job), True))
+            seen = {job_id for job_id, _, _ in restored}
+            for lane, ids in persisted.items():
+                for job_id in ids:
+                    job = self._jobs.get(job_id)
+                    if job and job.state == "queued" and job_id not in seen:
+                        restored.append((job_id, lane, False))
+                        seen.add(job_id)
+            leftovers = sorted(
+                (j for j in self._jobs.values() if j.state == "queued" and j.id not in seen),
+                key=lambda j: j.created_at,
+            )
+            for job in leftovers:
+                restored.append((job.id, self._job_lane(job), False))
+
+        for job_id, lane, front in restored:
+            self._scheduler.submit(job_id, lane=lane, force=True, front=front)
+        if restored:
+            logger.info(f"Restored {len(restored)} image generation job(s) to the queue")
+
+    @staticmethod
+    def _job_lane(job: ImageJob) -> JobLane:
+        """Get the scheduler lane for a job (batch jobs default to the batch lane)."""
+        params = job.params or {}
+        lane = params.get("queue_lane")
+        if lane in ("interactive", "batch"):
+            return cast(JobLane, lane)
+        return "batch" if params.get("batch_size", 1) > 1 else "interactive"
 
     def _load_jobs_from_disk(self) -> None:
         """
-        Load image generation jobs from disk storage.
+        Load image generation jobs from the job journal.
         
-        Reads jobs from JSON file and populates in-memory job dictionary.
-        Silently handles missing files, invalid JSON, or malformed data.
+        On first start with a journal, jobs from the legacy jobs.json snapshot are
+        imported into it. Malformed records are skipped.
         """
-        path = jobs_file()
-        if not path.exists():
-            return
-        try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return
-        if not isinstance(raw, list):
-            return
+        records = self._store.load()
+        if not records and not self._store.exists():
+            records = self._load_legacy_jobs()
+            for job_id, record in records.items():
+                self._store.put(job_id, record)
         loaded: dict[str, ImageJob] = {}
-        for item in raw:
-            if not isinstance(item, dict):
-                continue
-            job_id = item.get("id")
-            if not isinstance(job_id, str):
-                continue
+        for job_id, item in records.items():
             try:
                 loaded[job_id] = ImageJob(**item)
             except Exception:
@@ -100,21 +157,30 @@ class GenerationService:
         with self._lock:
             self._jobs = loaded
 
-    def _persist_jobs_to_disk(self) -> None:
+    @staticmethod
+    def _load_legacy_jobs() -> dict[str, dict[str, Any]]:
         """
-        Persist image generation jobs to disk storage.
+        Read jobs from the legacy jobs.json snapshot file.
+        
+        Silently handles missing files, invalid JSON, or malformed data.
         
-        Saves jobs to JSON file, keeping only the most recent 200 jobs
-        to prevent unbounded growth. Uses atomic write (tmp file + replace).
+        Returns:
+            Mapping of job ID to job record dict.
         """
         path = jobs_file()
-        tmp = path.with_suffix(".tmp")
-        # Keep last N jobs to avoid unbounded growth
-        jobs = list(self._jobs.values())
-        jobs.sort(key=lambda j: j.created_at, reverse=True)
-        jobs = jobs[:200]
-        tmp.write_text(json.dumps([j.__dict__ for j in jobs], indent=2, sort_keys=True), encoding="utf-8")
-        tmp.replace(path)
+        if not path.exists():
+            return {}
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        if not isinstance(raw, list):
+            return {}
+        return {
+            item["id"]: item
+            for item in raw
+            if isinstance(item, dict) and isinstance(item.get("id"), str)
+        }
 
     def create_image_job(
         self,
@@ -135,9 +201,10 @@ class GenerationService:
         face_consistency_method: str | None = None,
         face_embedding_id: str | None = None,
         workflow_pack: dict[str, Any] | None = None,
+        priority: JobLane | None = None,
     ) -> ImageJob:
         """
-        Create a new image generation job.
+        Create a new image generation job and enqueue it on the worker pool.
 
         Args:
             prompt: Text prompt for image generation.
@@ -156,10 +223,20 @@ class GenerationService:
             face_consistency_method: Optional face consistency method ('ip_adapter', 'ip_adapter_plus', 'instantid', 'faceid').
             face_embedding_id: Optional face embedding ID referencing stored embeddings.
             workflow_pack: Optional workflow pack metadata for traceability.
+            priority: Queue lane ("interactive" or "batch"). Defaults to "batch" when
+                batch_size > 1, otherwise "interactive".
 
         Returns:
             ImageJob object with job ID and initial state.
+
+        Raises:
+            ValueError: If NSFW safety validation fails or priority is unknown.
+            QueueFullError: If the job queue is at its depth limit.
         """
+        if priority is not None and priority not in ("interactive", "batch"):
+            raise ValueError(f"Invalid priority '{priority}'. Use 'interactive' or 'batch'.")
+        lane: JobLane = priority or ("batch" if batch_size > 1 else "interactive")
+
         # Use NSFW content service for +18 content if requested
         final_prompt = prompt
         final_negative_prompt = negative_prompt
@@ -204,37 +281,80 @@ class GenerationService:
                 "final_prompt": final_prompt,  # Store modified prompt
                 "final_negative_prompt": final_negative_prompt,  # Store modified negative prompt
                 "workflow_pack": self._summarize_pack(workflow_pack),
+                "queue_lane": lane,
             },
         )
         with self._lock:
             self._jobs[job_id] = job
-            self._persist_jobs_to_disk()
+            self._store.put(job_id, job.__dict__)
 
-        t = threading.Thread(
-            target=self._run_image_job,
-            args=(
-                job_id,
-                final_prompt,  # Use modified prompt
-                final_negative_prompt,  # Use modified negative prompt
-                seed,
-                effective_checkpoint,
-                width,
-                height,
-                steps,
-                cfg,
-                sampler_name,
-                scheduler,
-                batch_size,
-                face_image_path,
-                face_consistency_method,
-                face_embedding_id,
-            ),
-            name=f"image-job-{job_id}",
-            daemon=True,
-        )
-        t.start()
+        try:
+            self._scheduler.submit(job_id, lane=lane)
+        except QueueFullError:
+            with self._lock:
+                self._jobs.pop(job_id, None)
+                self._store.delete(job_id)
+            raise
         return job
 
+    def _run_queued_job(self, job_id: str) -> None:
+        """
+        Worker pool entry point: run a queued job using its stored parameters.
+        
+        Jobs that were cancelled or deleted while waiting are skipped.
+        
+        Args:
+            job_id: Job ID taken from the queue
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.state != "queued":
+                return
+            params = dict(job.params or {})
+        self._run_image_job(
+            job_id,
+            params.get("final_prompt") or params.get("prompt") or "",
+            params.get("final_negative_prompt"),
+            params.get("seed"),
+            params.get("checkpoint"),
+            int(params.get("width", 1024)),
+            int(params.get("height", 1024)),
+            int(params.get("steps", 25)),
+            float(params.get("cfg", 7.0)),
+            params.get("sampler_name", "euler"),
+            params.get("scheduler", "normal"),
+            int(params.get("batch_size", 1)),
+            params.get("face_image_path"),
+            params.get("face_consistency_method"),
+            params.get("face_embedding_id"),
+        )
+
+    def queue_position(self, job_id: str) -> int | None:
+        """
+        Get the 1-based position of a waiting job in the worker pool queue.
+
+        Args:
+            job_id: Job ID to look up.
+
+        Returns:
+            Queue position, or None if the job is not waiting.
+        """
+        return self._scheduler.position(job_id)
+
+    def queue_stats(self) -> dict[str, Any]:
+        """
+        Get worker pool statistics (lane depths, active jobs, limits).
+
+        Returns:
+            dict with scheduler statistics.
+        """
+        return self._scheduler.stats()
+
+    def shutdown(self) -> None:
+        """Stop worker threads and close the job journal; waiting jobs stay persisted."""
+        self._scheduler.shutdown()
+        self._store.close()
+
     def get_job(self, job_id: str) -> ImageJob | None:
         """
         Get image generation job by ID.
@@ -394,6 +514,26 @@ class GenerationService:
             if j.state in ("failed", "succeeded", "cancelled"):
                 return True
             
+            # Jobs still waiting in the queue are cancelled immediately
+            if j.state == "queued" and self._scheduler.remove(job_id):
+                now = time.time()
+                j.state = "cancelled"
+                j.cancel_requested = True
+                j.finished_at = now
+                j.cancelled_at = now
+                j.message = "Cancelled"
+                self._store.patch(
+                    job_id,
+                    fields={
+                        "state": j.state,
+                        "cancel_requested": True,
+                        "finished_at": now,
+                        "cancelled_at": now,
+                        "message": j.message,
+                    },
+                )
+                return True
+            
             # If preserving partial results, save what we have
             if preserve_partial and j.state == "running":
                 # Check if we have any partial images (this would be set during generation)
@@ -401,10 +541,11 @@ class GenerationService:
                 if not isinstance(j.params, dict):
                     j.params = {}
                 j.params["preserve_partial_on_cancel"] = True
+                self._store.patch(job_id, params={"preserve_partial_on_cancel": True})
             
             j.cancel_requested = True
             j.message = "Cancelling… (partial results will be preserved)" if preserve_partial else "Cancelling…"
-            self._persist_jobs_to_disk()
+            self._store.patch(job_id, fields={"cancel_requested": True, "message": j.message})
             return True
 
     def _extract_pack_checkpoint(self, workflow_pack: dict[str, Any] | None) -> str | None:
@@ -490,7 +631,8 @@ class GenerationService:
                 job.cancel_requested = True
             files = job.image_paths or ([job.image_path] if job.image_path else [])
             del self._jobs[job_id]
-            self._persist_jobs_to_disk()
+            self._store.delete(job_id)
+        self._scheduler.remove(job_id)
 
         if delete_images:
             for name in files:
@@ -512,7 +654,8 @@ class GenerationService:
         with self._lock:
             jobs = list(self._jobs.values())
             self._jobs = {}
-            self._persist_jobs_to_disk()
+            self._store.clear()
+        self._scheduler.clear()
         deleted = 0
         if delete_images:
             for job in jobs:
@@ -526,7 +669,7 @@ class GenerationService:
 
     def _set_job(self, job_id: str, **kwargs: Any) -> None:
         """
-        Update job attributes atomically and persist to disk.
+        Update job attributes atomically and append the change to the job journal.
         
         Args:
             job_id: Job ID to update
@@ -536,7 +679,7 @@ class GenerationService:
             j = self._jobs[job_id]
             for k, v in kwargs.items():
                 setattr(j, k, v)
-            self._persist_jobs_to_disk()
+            self._store.patch(job_id, fields=kwargs)
 
     def _is_cancel_requested(self, job_id: str) -> bool:
         """
@@ -554,7 +697,7 @@ class GenerationService:
 
     def _update_job_params(self, job_id: str, **updates: Any) -> None:
         """
-        Update job parameters dictionary and persist to disk.
+        Update job parameters dictionary and append the change to the job journal.
         
         Args:
             job_id: Job ID to update
@@ -565,7 +708,105 @@ class GenerationService:
             if not isinstance(j.params, dict):
                 j.params = {}
             j.params.update(updates)
-            self._persist_jobs_to_disk()
+            self._store.patch(job_id, params=updates)
+
+    def _score_images(
+        self,
+        job_id: str,
+        image_paths: list[str],
+        generation_context: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """
+        Validate generated images in parallel and record results as each one finishes.
+        
+        ``quality_results`` in the job params is updated after every image, so
+        ranking endpoints see partial results while the batch is still scoring.
+        
+        Args:
+            image_paths: Saved image paths (relative to the content directory)
+            generation_context: Generation parameters stored with image metadata
+        
+        Returns:
+            Quality result dicts in the same order as image_paths
+        """
+        results_by_path: dict[str, dict[str, Any]] = {}
+        resolved = {str(self._image_storage.resolve_path(path)): path for path in image_paths}
+        try:
+            for dest, quality_result in quality_validator.validate_batch(list(resolved)):
+                out_name = resolved[dest]
+                quality_data: dict[str, Any] = {
+                    "image_path": out_name,
+                    "quality_score": float(quality_result.quality_score) if quality_result.quality_score else None,
+                    "is_valid": quality_result.is_valid,
+                    "checks_passed": quality_result.checks_passed,
+                    "checks_failed": quality_result.checks_failed,
+                    "warnings": quality_result.warnings,
+                    "metadata": quality_result.metadata,
+                }
+                if quality_result.quality_score is not None:
+                    logger.info(
+                        f"Image quality validated: {out_name}",
+                        extra={
+                            "job_id": job_id,
+                            "image_path": out_name,
+                            "quality_score": float(quality_result.quality_score),
+                            "is_valid": quality_result.is_valid,
+                            "checks_passed_count": len(quality_result.checks_passed),
+                            "checks_failed_count": len(quality_result.checks_failed),
+                        },
+                    )
+                else:
+                    logger.warning(
+                        f"Image quality validation failed: {out_name}",
+                        extra={
+                            "job_id": job_id,
+                            "image_path": out_name,
+                            "errors": quality_result.errors,
+                        },
+                    )
+                self._record_quality_result(job_id, quality_data, results_by_path, image_paths, generation_context)
+        except Exception as qexc:  # noqa: BLE001
+            # Quality validation failure shouldn't fail the job
+            logger.warning(
+                f"Quality validation error for job {job_id}: {qexc}",
+                extra={"job_id": job_id, "error": str(qexc)},
+            )
+            for out_name in image_paths:
+                if out_name not in results_by_path:
+                    quality_data = {
+                        "image_path": out_name,
+                        "quality_score": None,
+                        "is_valid": False,
+                        "error": str(qexc),
+                    }
+                    self._record_quality_result(job_id, quality_data, results_by_path, image_paths, generation_context)
+        return [results_by_path[path] for path in image_paths if path in results_by_path]
+
+    def _record_quality_result(
+        self,
+        job_id: str,
+        quality_data: dict[str, Any],
+        results_by_path: dict[str, dict[str, Any]],
+        image_paths: list[str],
+        generation_context: dict[str, Any],
+    ) -> None:
+        """Store one image's quality result in job params and its image metadata."""
+        out_name = quality_data["image_path"]
+        results_by_path[out_name] = quality_data
+        self._update_job_params(
+            job_id,
+            quality_results=[results_by_path[path] for path in image_paths if path in results_by_path],
+        )
+        # Update stored metadata with quality metrics when available
+        try:
+            self._image_storage.upsert_metadata(
+                out_name,
+                generation_params=generation_context,
+                quality_metrics=quality_data,
+            )
+        except Exception:
+            # Metadata enrichment is best-effort and should not fail the job
+            pass
 
     def _basic_sdxl_workflow(
         self,
@@ -815,9 +1056,23 @@ class GenerationService:
             def _should_cancel() -> bool:
                 return self._is_cancel_requested(job_id)
 
-            outs = client.wait_for_images(prompt_id, timeout_s=600, should_cancel=_should_cancel)
+            last_progress: tuple[int | None, int | None] | None = None
+
+            def _on_progress(events: PromptEvents) -> None:
+                nonlocal last_progress
+                current = (events.progress_value, events.progress_max)
+                if events.progress_max is None or current == last_progress:
+                    return
+                last_progress = current
+                self._set_job(job_id, message=f"Sampling {events.progress_value}/{events.progress_max}")
+
+            outs = client.wait_for_images(
+                prompt_id,
+                timeout_s=600,
+                should_cancel=_should_cancel,
+                on_progress=_on_progress,
+            )
             saved: list[str] = []
-            quality_results: list[dict[str, Any]] = []
             failed_images: list[dict[str, Any]] = []
             generation_context = {
                 "prompt": prompt,
@@ -867,7 +1122,6 @@ class GenerationService:
                         generation_params=generation_context,
                     )
                     out_name = save_result["path"]
-                    dest = self._image_storage.resolve_path(out_name)
                     saved.append(out_name)
                 except Exception as img_exc:  # noqa: BLE001
                     # Track failed images in batch but continue processing
@@ -887,67 +1141,11 @@ class GenerationService:
                     else:
                         # For single image jobs, fail immediately
                         raise
-                
-                # Validate image quality
-                quality_data: dict[str, Any] | None = None
-                try:
-                    quality_result = quality_validator.validate_content(file_path=str(dest))
-                    quality_data = {
-                        "image_path": out_name,
-                        "quality_score": float(quality_result.quality_score) if quality_result.quality_score else None,
-                        "is_valid": quality_result.is_valid,
-                        "checks_passed": quality_result.checks_passed,
-                        "checks_failed": quality_result.checks_failed,
-                        "warnings": quality_result.warnings,
-                        "metadata": quality_result.metadata,
-                    }
-                    quality_results.append(quality_data)
-                    
-                    # Log quality results
-                    if quality_result.quality_score is not None:
-                        logger.info(
-                            f"Image quality validated: {out_name}",
-                            extra={
-                                "job_id": job_id,
-                                "image_path": out_name,
-                                "quality_score": float(quality_result.quality_score),
-                                "is_valid": quality_result.is_valid,
-                                "checks_passed_count": len(quality_result.checks_passed),
-                                "checks_failed_count": len(quality_result.checks_failed),
-                            },
-                        )
-                    else:
-                        logger.warning(
-                            f"Image quality validation failed: {out_name}",
-                            extra={
-                                "job_id": job_id,
-                                "image_path": out_name,
-                                "errors": quality_result.errors,
-                            },
-                        )
-                except Exception as qexc:  # noqa: BLE001
-                    # Quality validation failure shouldn't fail the job
-                    logger.warning(
-                        f"Quality validation error for {out_name}: {qexc}",
-                        extra={"job_id": job_id, "image_path": out_name, "error": str(qexc)},
-                    )
-                    quality_results.append({
-                        "image_path": out_name,
-                        "quality_score": None,
-                        "is_valid": False,
-                        "error": str(qexc),
-                    })
-                    quality_data = quality_results[-1]
-                # Update stored metadata with quality metrics when available
-                try:
-                    self._image_storage.upsert_metadata(
-                        out_name,
-                        generation_params=generation_context,
-                        quality_metrics=quality_data,
-                    )
-                except Exception:
-                    # Metadata enrichment is best-effort and should not fail the job
-                    pass
+            
+            # Publish batch images before scoring so ranking can start on early results
+            if len(saved) > 1:
+                self._set_job(job_id, image_paths=list(saved), message=f"Scoring {len(saved)} images")
+            quality_results = self._score_images(job_id, saved, generation_context)
             
             # Handle partial batch failures
             if batch_size > 1:
@@ -0,0 +1,281 @@
+"""SQLite catalog of stored images for listing, search and statistics.
+
+The catalog mirrors what the image directory and its ``.metadata`` sidecars
+contain (filename, mtime, size, prompt and the metadata dict) so listing,
+sorting, searching, stats and age-based cleanup are indexed queries instead of
+directory walks. Search uses an FTS5 trigram index over filename and prompt,
+which matches arbitrary substrings of three or more characters; shorter queries
+fall back to LIKE.
+
+The catalog is kept current by ImageStorageService on save/delete, and a
+reconcile pass at startup picks up files added or removed behind its back.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA_VERSION = 1
+_FTS_MIN_QUERY = 3
+
+_ORDER_BY = {
+    "newest": "mtime DESC, filename",
+    "oldest": "mtime ASC, filename",
+    "name": "filename COLLATE NOCASE, filename",
+}
+
+_UPSERT = """
+    INSERT INTO images (filename, mtime, size_bytes, prompt, metadata) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (filename) DO UPDATE SET
+        mtime = excluded.mtime,
+        size_bytes = excluded.size_bytes,
+        prompt = excluded.prompt,
+        metadata = excluded.metadata
+"""
+
+
+def _prompt_of(metadata: dict[str, Any] | None) -> str:
+    params = (metadata or {}).get("generation_params") or {}
+    prompt = params.get("prompt") if isinstance(params, dict) else None
+    return prompt if isinstance(prompt, str) else ""
+
+
+class ImageCatalog:
+    """Indexed catalog of image files (one row per image)."""
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        Open (or create) the catalog database.
+
+        Args:
+            db_path: SQLite database file.
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._lock, self._db:
+            if self._db.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                self._db.execute("DROP TABLE IF EXISTS images_fts")
+                self._db.execute("DROP TABLE IF EXISTS images")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS images (
+                    id INTEGER PRIMARY KEY,
+                    filename TEXT NOT NULL UNIQUE,
+                    mtime REAL NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    prompt TEXT NOT NULL DEFAULT '',
+                    metadata TEXT
+                )
+                """
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS ix_images_mtime ON images (mtime)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS ix_images_name ON images (filename COLLATE NOCASE)")
+            self._db.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS images_fts USING fts5(
+                    filename, prompt, content='images', content_rowid='id', tokenize='trigram'
+                )
+                """
+            )
+            # External-content FTS: mirror every row change into the index
+            self._db.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS images_ai AFTER INSERT ON images BEGIN
+                    INSERT INTO images_fts (rowid, filename, prompt) VALUES (new.id, new.filename, new.prompt);
+                END
+                """
+            )
+            self._db.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS images_ad AFTER DELETE ON images BEGIN
+                    INSERT INTO images_fts (images_fts, rowid, filename, prompt)
+                    VALUES ('delete', old.id, old.filename, old.prompt);
+                END
+                """
+            )
+            self._db.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS images_au AFTER UPDATE ON images BEGIN
+                    INSERT INTO images_fts (images_fts, rowid, filename, prompt)
+                    VALUES ('delete', old.id, old.filename, old.prompt);
+                    INSERT INTO images_fts (rowid, filename, prompt) VALUES (new.id, new.filename, new.prompt);
+                END
+                """
+            )
+            self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, filename: str, *, mtime: float, size_bytes: int, metadata: dict[str, Any] | None) -> None:
+        """
+        Insert or update one image.
+
+        Args:
+            filename: Image filename.
+            mtime: File modification time.
+            size_bytes: File size in bytes.
+            metadata: Metadata dict (as stored in the sidecar), if any.
+        """
+        with self._lock, self._db:
+            self._db.execute(_UPSERT, self._row(filename, mtime, size_bytes, metadata))
+
+    def remove(self, filename: str) -> bool:
+        """
+        Remove one image.
+
+        Args:
+            filename: Image filename.
+
+        Returns:
+            True if the image was cataloged.
+        """
+        with self._lock, self._db:
+            return self._db.execute("DELETE FROM images WHERE filename = ?", (filename,)).rowcount > 0
+
+    def reconcile(
+        self,
+        root: Path,
+        load_metadata: Callable[[str], dict[str, Any] | None],
+        *,
+        suffix: str = ".png",
+    ) -> dict[str, int]:
+        """
+        Bring the catalog in line with the files on disk.
+
+        Files that are new or whose mtime/size changed are (re)cataloged with
+        their sidecar metadata; rows for files that no longer exist are dropped.
+
+        Args:
+            root: Image directory.
+            load_metadata: Returns the metadata dict for a filename, or None.
+            suffix: Image file suffix to catalog.
+
+        Returns:
+            Dict with added, updated, removed and unchanged counts.
+        """
+        with self._lock:
+            known = {
+                name: (mtime, size)
+                for name, mtime, size in self._db.execute("SELECT filename, mtime, size_bytes FROM images")
+            }
+
+        rows = []
+        added = updated = unchanged = 0
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if not entry.name.endswith(suffix):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                previous = known.pop(entry.name, None)
+                if previous == (st.st_mtime, st.st_size):
+                    unchanged += 1
+                    continue
+                if previous is None:
+                    added += 1
+                else:
+                    updated += 1
+                rows.append(self._row(entry.name, st.st_mtime, st.st_size, load_metadata(entry.name)))
+
+        with self._lock, self._db:
+            self._db.executemany(_UPSERT, rows)
+            self._db.executemany("DELETE FROM images WHERE filename = ?", [(name,) for name in known])
+        return {"added": added, "updated": updated, "removed": len(known), "unchanged": unchanged}
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def list_images(self, *, q: str = "", sort: str = "newest", limit: int = 50, offset: int = 0) -> tuple[list[dict[str, Any]], int]:
+        """
+        List one page of images.
+
+        Args:
+            q: Substring to match against filename or prompt (case-insensitive).
+            sort: "newest", "oldest" or "name".
+            limit: Page size.
+            offset: Number of matching images to skip.
+
+        Returns:
+            Tuple of (items, total matching). Items have path, mtime,
+            size_bytes and metadata.
+        """
+        where, params = self._search_clause(q)
+        order_by = _ORDER_BY.get(sort, _ORDER_BY["newest"])
+        with self._lock:
+            total = self._db.execute(f"SELECT COUNT(*) FROM images {where}", params).fetchone()[0]
+            rows = self._db.execute(
+                f"SELECT filename, mtime, size_bytes, metadata FROM images {where} ORDER BY {order_by} LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            ).fetchall()
+        items = [
+            {
+                "path": filename,
+                "mtime": mtime,
+                "size_bytes": size_bytes,
+                "metadata": json.loads(metadata) if metadata else None,
+            }
+            for filename, mtime, size_bytes, metadata in rows
+        ]
+        return items, total
+
+    def stats(self) -> dict[str, int]:
+        """Return image count and total bytes."""
+        with self._lock:
+            count, total = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM images").fetchone()
+        return {"images_count": count, "images_bytes": total}
+
+    def older_than(self, cutoff: float) -> list[str]:
+        """
+        Filenames whose mtime is before a cutoff.
+
+        Args:
+            cutoff: Unix timestamp.
+
+        Returns:
+            Matching filenames, oldest first.
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT filename FROM images WHERE mtime < ? ORDER BY mtime", (cutoff,)).fetchall()
+        return [name for (name,) in rows]
+
+    @staticmethod
+    def _row(filename: str, mtime: float, size_bytes: int, metadata: dict[str, Any] | None) -> tuple[Any, ...]:
+        return (
+            filename,
+            mtime,
+            size_bytes,
+            _prompt_of(metadata),
+            json.dumps(metadata, default=str) if metadata is not None else None,
+        )
+
+    @staticmethod
+    def _search_clause(q: str) -> tuple[str, tuple[Any, ...]]:
+        if not q:
+            return "", ()
+        if len(q) >= _FTS_MIN_QUERY:
+            phrase = '"' + q.replace('"', '""') + '"'
+            return "WHERE id IN (SELECT rowid FROM images_fts WHERE images_fts MATCH ?)", (phrase,)
+        pattern = "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return "WHERE (filename LIKE ? ESCAPE '\\' OR prompt LIKE ? ESCAPE '\\')", (pattern, pattern)
@@ -0,0 +1,230 @@
+"""Shared per-image intermediates for the quality analysers.
+
+``ImageFeatures`` wraps a decoded PIL image and lazily computes the arrays the
+QualityValidator checks have in common (grayscale, luminance, RGB, gradients,
+Sobel and Laplacian maps, histograms, a downscaled pyramid). Each intermediate
+is computed at most once per image and shared by every check that needs it.
+
+Cached float arrays are read-only; analysers must copy before modifying them.
+Arrays handed to OpenCV (uint8 RGB, cv_gray, cv_hsv, pyramid levels) stay
+writable because some cv2 builds reject read-only inputs.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+from app.services.image_filters import correlate2d
+
+SOBEL_H = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]], dtype=np.float32)
+"""Sobel kernel responding to horizontal edges."""
+
+SOBEL_V = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]], dtype=np.float32)
+"""Sobel kernel responding to vertical edges."""
+
+_LAPLACIAN = ImageFilter.Kernel((3, 3), [0, -1, 0, -1, 4, -1, 0, -1, 0], scale=1)
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+class ImageFeatures:
+    """Lazily computed, cached intermediates for one decoded image."""
+
+    def __init__(self, img: Image.Image) -> None:
+        """
+        Wrap a PIL image (pixel data is loaded immediately).
+
+        Args:
+            img: Decoded PIL image in any mode.
+        """
+        img.load()
+        self.image = img
+        self.mode = img.mode
+        self.width, self.height = img.size
+        self._histograms: dict[int, np.ndarray] = {}
+
+    @classmethod
+    def of(cls, img: Image.Image | ImageFeatures) -> ImageFeatures:
+        """
+        Return features for an image, reusing an existing ImageFeatures instance.
+
+        Args:
+            img: PIL image or already wrapped features.
+
+        Returns:
+            ImageFeatures for the image.
+        """
+        return img if isinstance(img, ImageFeatures) else cls(img)
+
+    @property
+    def is_color(self) -> bool:
+        """Whether the source image is RGB/RGBA (color checks apply)."""
+        return self.mode in ("RGB", "RGBA")
+
+    # ------------------------------------------------------------------
+    # Decoded pixel data
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def rgb_image(self) -> Image.Image:
+        """Image converted to RGB."""
+        return self.image if self.mode == "RGB" else self.image.convert("RGB")
+
+    @cached_property
+    def gray_image(self) -> Image.Image:
+        """Image converted to 8-bit grayscale ("L")."""
+        return self.image if self.mode == "L" else self.image.convert("L")
+
+    @cached_property
+    def rgb_uint8(self) -> np.ndarray:
+        """RGB pixels as a uint8 (H, W, 3) array."""
+        return np.array(self.rgb_image)
+
+    @cached_property
+    def rgb(self) -> np.ndarray:
+        """RGB pixels as a float32 (H, W, 3) array in 0-255."""
+        return _frozen(self.rgb_uint8.astype(np.float32))
+
+    @cached_property
+    def gray(self) -> np.ndarray:
+        """Grayscale pixels as a float32 (H, W) array in 0-255."""
+        return _frozen(np.array(self.gray_image, dtype=np.float32))
+
+    @cached_property
+    def luminance(self) -> np.ndarray:
+        """Grayscale pixels scaled to 0.0-1.0."""
+        return _frozen(self.gray / 255.0)
+
+    # ------------------------------------------------------------------
+    # Gradients and filter responses
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def grad_h(self) -> np.ndarray:
+        """Signed vertical neighbour differences of the grayscale image, shape (H-1, W)."""
+        return _frozen(np.diff(self.gray, axis=0))
+
+    @cached_property
+    def grad_w(self) -> np.ndarray:
+        """Signed horizontal neighbour differences of the grayscale image, shape (H, W-1)."""
+        return _frozen(np.diff(self.gray, axis=1))
+
+    @cached_property
+    def abs_grad_h(self) -> np.ndarray:
+        """Absolute vertical neighbour differences of the grayscale image."""
+        return _frozen(np.abs(self.grad_h))
+
+    @cached_property
+    def abs_grad_w(self) -> np.ndarray:
+        """Absolute horizontal neighbour differences of the grayscale image."""
+        return _frozen(np.abs(self.grad_w))
+
+    @cached_property
+    def rgb_gradient_stats(self) -> tuple[float, float]:
+        """Mean and standard deviation of absolute neighbour differences over all RGB channels."""
+        rgb = self.rgb
+        h_diff = np.abs(np.diff(rgb, axis=1))
+        v_diff = np.abs(np.diff(rgb, axis=0))
+        count = h_diff.size + v_diff.size
+        if count == 0:
+            return 0.0, 0.0
+        mean = (float(h_diff.sum(dtype=np.float64)) + float(v_diff.sum(dtype=np.float64))) / count
+        sq = float(np.square(h_diff - mean, dtype=np.float64).sum()) + float(np.square(v_diff - mean, dtype=np.float64).sum())
+        return mean, (sq / count) ** 0.5
+
+    @cached_property
+    def sobel_h(self) -> np.ndarray:
+        """Horizontal-edge Sobel response of the grayscale image."""
+        return _frozen(correlate2d(self.gray, SOBEL_H))
+
+    @cached_property
+    def sobel_v(self) -> np.ndarray:
+        """Vertical-edge Sobel response of the grayscale image."""
+        return _frozen(correlate2d(self.gray, SOBEL_V))
+
+    @cached_property
+    def edge_magnitude(self) -> np.ndarray:
+        """Sobel gradient magnitude of the grayscale image."""
+        return _frozen(np.sqrt(self.sobel_h**2 + self.sobel_v**2))
+
+    @cached_property
+    def laplacian(self) -> np.ndarray:
+        """3x3 Laplacian of the grayscale image (PIL filter, clipped to 0-255)."""
+        return _frozen(np.array(self.gray_image.filter(_LAPLACIAN)))
+
+    def histogram(self, bins: int = 256) -> np.ndarray:
+        """
+        Grayscale histogram over 0-255 (cached per bin count).
+
+        Args:
+            bins: Number of equal-width bins.
+
+        Returns:
+            Counts per bin.
+        """
+        hist = self._histograms.get(bins)
+        if hist is None:
+            hist, _ = np.histogram(self.gray, bins=bins, range=(0, 255))
+            self._histograms[bins] = _frozen(hist)
+        return hist
+
+    # ------------------------------------------------------------------
+    # OpenCV views and pyramid
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def cv_gray(self) -> np.ndarray:
+        """Grayscale uint8 array converted by OpenCV (requires cv2)."""
+        import cv2
+
+        return cv2.cvtColor(self.rgb_uint8, cv2.COLOR_RGB2GRAY)
+
+    @cached_property
+    def cv_hsv(self) -> np.ndarray:
+        """HSV uint8 array converted by OpenCV (requires cv2)."""
+        import cv2
+
+        return cv2.cvtColor(self.rgb_uint8, cv2.COLOR_RGB2HSV)
+
+    @cached_property
+    def pyramid(self) -> list[np.ndarray]:
+        """Grayscale uint8 pyramid, each level downscaled 2x until the short side is below 128 px."""
+        levels = [np.array(self.gray_image)]
+        level_img = self.gray_image
+        while min(level_img.size) >= 128:
+            level_img = level_img.reduce(2)
+            levels.append(np.array(level_img))
+        return levels
+
+    def pyramid_level(self, max_side: int) -> tuple[np.ndarray, int]:
+        """
+        Largest pyramid level whose longest side fits ``max_side``.
+
+        Args:
+            max_side: Maximum longest side in pixels.
+
+        Returns:
+            Tuple of (level array, downscale factor relative to the original).
+        """
+        for index, level in enumerate(self.pyramid):
+            if max(level.shape) <= max_side:
+                return level, 2**index
+        return self.pyramid[-1], 2 ** (len(self.pyramid) - 1)
+
+    def crop(self, x: int, y: int, w: int, h: int) -> Image.Image:
+        """
+        Crop a region of the RGB image.
+
+        Args:
+            x, y, w, h: Bounding box in pixels.
+
+        Returns:
+            RGB PIL image of the region.
+        """
+        return Image.fromarray(np.ascontiguousarray(self.rgb_uint8[y:y+h, x:x+w]))
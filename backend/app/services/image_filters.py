@@ -0,0 +1,124 @@
+"""Vectorized image filtering primitives shared by the quality analysers.
+
+All functions operate on 2D NumPy arrays (grayscale images) and avoid Python
+per-pixel loops:
+
+- ``correlate2d`` applies a kernel with edge padding. Small kernels use shifted
+  slice accumulation, large kernels use an FFT; the method is picked by size.
+- ``local_std`` / ``local_var`` compute statistics of square windows laid out
+  on a regular grid using strided window views.
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+CorrelateMethod = Literal["auto", "direct", "fft"]
+
+FFT_MIN_KERNEL_AREA = 64
+"""Kernel area (kh * kw) from which ``method="auto"`` switches to the FFT path."""
+
+
+def correlate2d(image: np.ndarray, kernel: np.ndarray, method: CorrelateMethod = "auto") -> np.ndarray:
+    """
+    Apply a kernel to a 2D image ("same" size output, edge-replicated borders).
+
+    The kernel is applied without flipping (cross-correlation), i.e.
+    ``out[i, j] = sum(padded[i:i+kh, j:j+kw] * kernel)`` with the image padded by
+    ``kh // 2`` / ``kw // 2`` on each side.
+
+    Args:
+        image: 2D image array.
+        kernel: 2D kernel array.
+        method: "direct" (shifted slices), "fft", or "auto" to choose by kernel size.
+
+    Returns:
+        Filtered array with the same shape and dtype as ``image``.
+
+    Raises:
+        ValueError: If image or kernel is not 2D, or method is unknown.
+    """
+    if image.ndim != 2 or kernel.ndim != 2:
+        raise ValueError("correlate2d expects 2D image and kernel arrays")
+    if method == "auto":
+        method = "fft" if kernel.size >= FFT_MIN_KERNEL_AREA else "direct"
+    if method not in ("direct", "fft"):
+        raise ValueError(f"Unknown correlation method: {method}")
+
+    h, w = image.shape
+    kh, kw = kernel.shape
+    padded = np.pad(image, ((kh // 2, kh // 2), (kw // 2, kw // 2)), mode="edge")
+
+    if method == "direct":
+        result = _correlate_direct(padded, kernel, h, w)
+    else:
+        result = _correlate_fft(padded, kernel, h, w)
+    return result.astype(image.dtype, copy=False)
+
+
+def _correlate_direct(padded: np.ndarray, kernel: np.ndarray, h: int, w: int) -> np.ndarray:
+    dtype = np.result_type(padded.dtype, kernel.dtype, np.float32)
+    result = np.zeros((h, w), dtype=dtype)
+    for ki in range(kernel.shape[0]):
+        for kj in range(kernel.shape[1]):
+            weight = kernel[ki, kj]
+            if weight:
+                result += padded[ki:ki + h, kj:kj + w] * weight
+    return result
+
+
+def _correlate_fft(padded: np.ndarray, kernel: np.ndarray, h: int, w: int) -> np.ndarray:
+    kh, kw = kernel.shape
+    ph, pw = padded.shape
+    # Linear convolution with the flipped kernel equals correlation
+    shape = (ph + kh - 1, pw + kw - 1)
+    spectrum = np.fft.rfft2(padded.astype(np.float64, copy=False), shape)
+    spectrum *= np.fft.rfft2(kernel[::-1, ::-1].astype(np.float64, copy=False), shape)
+    full = np.fft.irfft2(spectrum, shape)
+    return full[kh - 1:kh - 1 + h, kw - 1:kw - 1 + w]
+
+
+def _grid_windows(image: np.ndarray, window: int, step: int) -> np.ndarray:
+    if image.ndim != 2:
+        raise ValueError("Window statistics expect a 2D image array")
+    if window < 1 or step < 1:
+        raise ValueError("window and step must be positive")
+    if image.shape[0] < window or image.shape[1] < window:
+        return np.empty((0, 0, window, window), dtype=image.dtype)
+    return sliding_window_view(image, (window, window))[::step, ::step]
+
+
+def local_std(image: np.ndarray, window: int, step: int) -> np.ndarray:
+    """
+    Standard deviation of each ``window`` x ``window`` block on a grid.
+
+    Blocks start at ``(i, j)`` for ``i in range(0, h - window + 1, step)`` (same
+    for ``j``), matching a nested loop over ``image[i:i+window, j:j+window]``.
+
+    Args:
+        image: 2D image array.
+        window: Block side length in pixels.
+        step: Distance between block origins.
+
+    Returns:
+        2D array of per-block standard deviations (empty if the image is smaller than a block).
+    """
+    return _grid_windows(image, window, step).std(axis=(-2, -1))
+
+
+def local_var(image: np.ndarray, window: int, step: int) -> np.ndarray:
+    """
+    Variance of each ``window`` x ``window`` block on a grid.
+
+    Args:
+        image: 2D image array.
+        window: Block side length in pixels.
+        step: Distance between block origins.
+
+    Returns:
+        2D array of per-block variances (empty if the image is smaller than a block).
+    """
+    return _grid_windows(image, window, step).var(axis=(-2, -1))
@@ -0,0 +1,466 @@
+"""Persistent perceptual-hash index for near-duplicate image lookup.
+
+Every stored image gets three compact fingerprints:
+
+- ``phash``: 64-bit DCT perceptual hash (robust to resizing and re-encoding).
+- ``dhash``: 64-bit gradient ("difference") hash, used as a second opinion.
+- ``embedding``: small L2-normalised colour-layout vector (4x4 RGB thumbnail)
+  for ranking candidates by cosine similarity.
+
+Fingerprints are persisted in SQLite so they survive restarts and are only
+computed once per image. Lookups go through an in-memory multi-index hash
+table over the pHash (an LSH scheme for Hamming space), so a radius query
+probes a few buckets instead of comparing every pair.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+HASH_BITS = 64
+"""Number of bits in the pHash and dHash fingerprints."""
+
+DEFAULT_MAX_DISTANCE = 8
+"""Default pHash Hamming radius treated as a near-duplicate."""
+
+EMBEDDING_GRID = 4
+"""Side of the RGB thumbnail used as the colour-layout embedding."""
+
+_PHASH_SIZE = 32
+_PHASH_LOW = 8
+_BLOCKS = 4
+_BLOCK_BITS = HASH_BITS // _BLOCKS
+_BLOCK_MASK = (1 << _BLOCK_BITS) - 1
+_INDEX_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ImageHashes:
+    """Perceptual fingerprints of one image."""
+
+    phash: int
+    dhash: int
+    embedding: np.ndarray
+
+
+@lru_cache(maxsize=1)
+def _dct_matrix() -> np.ndarray:
+    n = np.arange(_PHASH_SIZE)
+    return np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * _PHASH_SIZE))
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), "big")
+
+
+def compute_image_hashes(img: Image.Image) -> ImageHashes:
+    """
+    Compute pHash, dHash and colour-layout embedding for an image.
+
+    Args:
+        img: Decoded PIL image in any mode.
+
+    Returns:
+        ImageHashes for the image.
+    """
+    gray = img.convert("L")
+
+    small = np.asarray(gray.resize((_PHASH_SIZE, _PHASH_SIZE), Image.LANCZOS), dtype=np.float64)
+    dct = _dct_matrix()
+    low = (dct @ small @ dct.T)[:_PHASH_LOW, :_PHASH_LOW]
+    # Median over the low frequencies, excluding the DC term
+    phash = _bits_to_int(low > np.median(low.ravel()[1:]))
+
+    grid = np.asarray(gray.resize((9, 8), Image.LANCZOS), dtype=np.int16)
+    dhash = _bits_to_int(grid[:, 1:] > grid[:, :-1])
+
+    thumb = np.asarray(
+        img.convert("RGB").resize((EMBEDDING_GRID, EMBEDDING_GRID), Image.BOX), dtype=np.float32
+    ).ravel()
+    thumb -= thumb.mean()
+    norm = float(np.linalg.norm(thumb))
+    embedding = thumb / norm if norm > 0 else thumb
+    return ImageHashes(phash=phash, dhash=dhash, embedding=embedding)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def _to_signed(value: int) -> int:
+    # SQLite INTEGER is signed 64-bit
+    return value - (1 << HASH_BITS) if value >= 1 << (HASH_BITS - 1) else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << HASH_BITS) if value < 0 else value
+
+
+@lru_cache(maxsize=None)
+def _block_masks(max_bits: int) -> tuple[int, ...]:
+    """All ``_BLOCK_BITS``-bit masks with at most ``max_bits`` bits set."""
+    return tuple(mask for mask in range(1 << _BLOCK_BITS) if mask.bit_count() <= max_bits)
+
+
+def _blocks(value: int) -> tuple[int, ...]:
+    return tuple((value >> (shift * _BLOCK_BITS)) & _BLOCK_MASK for shift in range(_BLOCKS))
+
+
+class HammingIndex:
+    """Multi-index hash table answering Hamming radius queries over 64-bit hashes.
+
+    Each hash is split into ``_BLOCKS`` 16-bit blocks and bucketed once per
+    block. If two hashes differ in at most ``r`` bits, at least one block differs
+    in at most ``r // _BLOCKS`` bits (pigeonhole), so a radius query only probes
+    buckets whose block lies within that smaller radius and verifies the
+    candidates. When a radius needs more probes than there are hashes, the
+    query falls back to a plain scan.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._values: set[int] = set()
+        self._tables: list[dict[int, set[int]]] = [{} for _ in range(_BLOCKS)]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, value: int) -> bool:
+        """
+        Insert a hash.
+
+        Args:
+            value: Hash to insert.
+
+        Returns:
+            True if inserted, False if it was already present.
+        """
+        if value in self._values:
+            return False
+        self._values.add(value)
+        for table, block in zip(self._tables, _blocks(value), strict=True):
+            table.setdefault(block, set()).add(value)
+        return True
+
+    def discard(self, value: int) -> None:
+        """Remove a hash if present."""
+        if value not in self._values:
+            return
+        self._values.discard(value)
+        for table, block in zip(self._tables, _blocks(value), strict=True):
+            bucket = table[block]
+            bucket.discard(value)
+            if not bucket:
+                del table[block]
+
+    def query(self, value: int, radius: int) -> list[tuple[int, int]]:
+        """
+        Find all hashes within a Hamming radius.
+
+        Args:
+            value: Query hash.
+            radius: Maximum Hamming distance (inclusive).
+
+        Returns:
+            List of (distance, hash) tuples in no particular order.
+        """
+        masks = _block_masks(min(radius // _BLOCKS, _BLOCK_BITS))
+        if len(masks) * _BLOCKS >= len(self._values):
+            candidates: set[int] = self._values
+        else:
+            candidates = set()
+            for table, block in zip(self._tables, _blocks(value), strict=True):
+                for mask in masks:
+                    bucket = table.get(block ^ mask)
+                    if bucket:
+                        candidates.update(bucket)
+        found = []
+        for candidate in candidates:
+            distance = (value ^ candidate).bit_count()
+            if distance <= radius:
+                found.append((distance, candidate))
+        return found
+
+
+class ImageHashIndex:
+    """SQLite-backed perceptual-hash index with an in-memory Hamming lookup table.
+
+    Rows are written through to SQLite immediately; the lookup table and
+    embeddings are loaded lazily on the first query.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        Open (or create) the index database.
+
+        Args:
+            db_path: SQLite database file.
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            if self._db.execute("PRAGMA user_version").fetchone()[0] != _INDEX_SCHEMA_VERSION:
+                self._db.execute("DROP TABLE IF EXISTS image_hashes")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS image_hashes (
+                    filename TEXT PRIMARY KEY,
+                    phash INTEGER NOT NULL,
+                    dhash INTEGER NOT NULL,
+                    embedding BLOB NOT NULL,
+                    mtime REAL NOT NULL,
+                    indexed_at REAL NOT NULL
+                )
+                """
+            )
+            self._db.execute(f"PRAGMA user_version = {_INDEX_SCHEMA_VERSION}")
+        self._loaded = False
+        self._phashes = HammingIndex()
+        self._by_phash: dict[int, set[str]] = {}
+        self._entries: dict[str, ImageHashes] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM image_hashes").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, filename: str, hashes: ImageHashes, *, mtime: float | None = None) -> None:
+        """
+        Insert or replace the fingerprints of an image.
+
+        Args:
+            filename: Image filename (index key).
+            hashes: Fingerprints computed by ``compute_image_hashes``.
+            mtime: File modification time, used by ``sync`` to detect changes.
+        """
+        row = (
+            filename,
+            _to_signed(hashes.phash),
+            _to_signed(hashes.dhash),
+            hashes.embedding.astype(np.float32).tobytes(),
+            mtime if mtime is not None else time.time(),
+            time.time(),
+        )
+        with self._lock:
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO image_hashes (filename, phash, dhash, embedding, mtime, indexed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    row,
+                )
+            if self._loaded:
+                self._forget(filename)
+                self._remember(filename, hashes)
+
+    def add_file(self, path: Path) -> ImageHashes:
+        """
+        Decode an image file, fingerprint it and add it under its filename.
+
+        Args:
+            path: Image file path.
+
+        Returns:
+            The computed fingerprints.
+        """
+        with Image.open(path) as img:
+            hashes = compute_image_hashes(img)
+        self.add(path.name, hashes, mtime=path.stat().st_mtime)
+        return hashes
+
+    def remove(self, filename: str) -> bool:
+        """
+        Drop an image from the index.
+
+        Args:
+            filename: Image filename.
+
+        Returns:
+            True if the image was indexed.
+        """
+        with self._lock:
+            with self._db:
+                removed = self._db.execute("DELETE FROM image_hashes WHERE filename = ?", (filename,)).rowcount > 0
+            if self._loaded:
+                self._forget(filename)
+        return removed
+
+    def sync(self, root: Path, pattern: str = "*.png") -> dict[str, int]:
+        """
+        Reconcile the index with the image files on disk.
+
+        New or modified files are fingerprinted, rows for missing files are removed.
+
+        Args:
+            root: Directory containing the images.
+            pattern: Glob pattern of image files.
+
+        Returns:
+            Dict with added, removed, unchanged and failed counts.
+        """
+        with self._lock:
+            indexed = dict(self._db.execute("SELECT filename, mtime FROM image_hashes").fetchall())
+        added = unchanged = failed = 0
+        for path in root.glob(pattern):
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if indexed.pop(path.name, None) == mtime:
+                unchanged += 1
+                continue
+            try:
+                self.add_file(path)
+                added += 1
+            except Exception as exc:  # noqa: BLE001
+                failed += 1
+                logger.warning(f"Failed to index image hashes for {path.name}: {exc}")
+        for filename in indexed:
+            self.remove(filename)
+        return {"added": added, "removed": len(indexed), "unchanged": unchanged, "failed": failed}
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, filename: str) -> ImageHashes | None:
+        """Return the stored fingerprints of an image, if indexed."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._entries.get(filename)
+
+    def query(
+        self,
+        hashes: ImageHashes,
+        *,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        limit: int = 20,
+        exclude: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Find indexed images whose pHash lies within ``max_distance`` of ``hashes``.
+
+        Args:
+            hashes: Query fingerprints.
+            max_distance: Maximum pHash Hamming distance (0-64).
+            limit: Maximum number of matches to return.
+            exclude: Filename to leave out (typically the query image itself).
+
+        Returns:
+            Matches ordered by pHash distance, then dHash distance, then
+            descending embedding similarity. Each match has filename,
+            phash_distance, dhash_distance and similarity.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            matches = []
+            for distance, phash in self._phashes.query(hashes.phash, max_distance):
+                for filename in self._by_phash.get(phash, ()):
+                    if filename == exclude:
+                        continue
+                    entry = self._entries[filename]
+                    matches.append(
+                        {
+                            "filename": filename,
+                            "phash_distance": distance,
+                            "dhash_distance": hamming_distance(hashes.dhash, entry.dhash),
+                            "similarity": round(float(np.dot(hashes.embedding, entry.embedding)), 4),
+                        }
+                    )
+        matches.sort(key=lambda m: (m["phash_distance"], m["dhash_distance"], -m["similarity"], m["filename"]))
+        return matches[:limit]
+
+    def find_duplicates(self, *, max_distance: int = DEFAULT_MAX_DISTANCE) -> list[list[str]]:
+        """
+        Group indexed images that are near-duplicates of each other.
+
+        Two images are linked when their pHash distance is at most
+        ``max_distance``; groups are the connected components of that graph.
+
+        Args:
+            max_distance: Maximum pHash Hamming distance (0-64).
+
+        Returns:
+            Groups of two or more filenames (sorted), largest groups first.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            parent: dict[int, int] = {}
+
+            def find(value: int) -> int:
+                root = value
+                while parent.get(root, root) != root:
+                    root = parent[root]
+                while value != root:
+                    parent[value], value = root, parent.get(value, value)
+                return root
+
+            for phash in self._by_phash:
+                for _, other in self._phashes.query(phash, max_distance):
+                    if other != phash:
+                        a, b = find(phash), find(other)
+                        if a != b:
+                            parent[a] = b
+
+            components: dict[int, list[str]] = {}
+            for phash, filenames in self._by_phash.items():
+                components.setdefault(find(phash), []).extend(filenames)
+
+        groups = [sorted(names) for names in components.values() if len(names) > 1]
+        groups.sort(key=lambda names: (-len(names), names[0]))
+        return groups
+
+    # ------------------------------------------------------------------
+    # In-memory state (caller holds self._lock)
+    # ------------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        rows = self._db.execute("SELECT filename, phash, dhash, embedding FROM image_hashes").fetchall()
+        for filename, phash, dhash, embedding in rows:
+            self._remember(
+                filename,
+                ImageHashes(
+                    phash=_to_unsigned(phash),
+                    dhash=_to_unsigned(dhash),
+                    embedding=np.frombuffer(embedding, dtype=np.float32),
+                ),
+            )
+        self._loaded = True
+        logger.info(f"Loaded image hash index: {len(self._entries)} images, {len(self._phashes)} distinct hashes")
+
+    def _remember(self, filename: str, hashes: ImageHashes) -> None:
+        self._entries[filename] = hashes
+        self._by_phash.setdefault(hashes.phash, set()).add(filename)
+        self._phashes.add(hashes.phash)
+
+    def _forget(self, filename: str) -> None:
+        entry = self._entries.pop(filename, None)
+        if entry is None:
+            return
+        names = self._by_phash.get(entry.phash)
+        if names is not None:
+            names.discard(filename)
+            if not names:
+                del self._by_phash[entry.phash]
+                self._phashes.discard(entry.phash)
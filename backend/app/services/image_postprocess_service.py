@@ -18,6 +18,7 @@ from typing import Any
 
 from app.core.logging import get_logger
 from app.core.paths import images_dir
+from app.services.image_storage_service import image_storage_service
 
 logger = get_logger(__name__)
 
@@ -323,6 +324,7 @@ class ImagePostProcessService:
         output_path = images_dir() / output_name
         
         img.save(output_path, format="PNG", quality=95)
+        image_storage_service.register_image(output_path)
         logger.info(f"Saved processed image: {output_path}, operations: {applied_ops}")
         
         return {
@@ -431,6 +433,7 @@ class ImagePostProcessService:
             result.save(output_path, format="PNG", quality=95)
         else:
             result.save(output_path, format="PNG", quality=95)
+        image_storage_service.register_image(output_path)
         
         logger.info(f"Background replaced: {output_path}")
         
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import io
 import time
 import uuid
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
+from PIL import Image
+
 from app.core.logging import get_logger
-from app.core.paths import images_dir
+from app.core.paths import image_catalog_file, image_hash_index_file, images_dir
+from app.services.image_catalog import ImageCatalog
+from app.services.image_hash_index import DEFAULT_MAX_DISTANCE, ImageHashIndex, compute_image_hashes
 from app.services.image_metadata_service import ImageMetadataService
 
 logger = get_logger(__name__)
 
+_CATALOG_SUFFIX = ".png"
+
 
 class ImageStorageService:
     """Service for managing image file storage and metadata."""
@@ -23,6 +30,8 @@ class ImageStorageService:
         self._root = images_dir()
         self._root.mkdir(parents=True, exist_ok=True)
         self._metadata_service = ImageMetadataService()
+        self._hash_index = ImageHashIndex(image_hash_index_file())
+        self._catalog = ImageCatalog(image_catalog_file())
 
     def resolve_path(self, filename: str) -> Path:
         """Resolve an image filename to an absolute path within storage."""
@@ -61,6 +70,8 @@ class ImageStorageService:
             generation_params=generation_params,
             quality_metrics=quality_metrics,
         )
+        self._catalog_image(dest, metadata)
+        self._index_hashes(dest, data)
 
         return {
             "path": dest.name,
@@ -79,7 +90,47 @@ class ImageStorageService:
         path = self.resolve_path(filename)
         if not path.exists():
             return None
-        return self._write_metadata(path, generation_params=generation_params, quality_metrics=quality_metrics)
+        metadata = self._write_metadata(path, generation_params=generation_params, quality_metrics=quality_metrics)
+        self._catalog_image(path, metadata)
+        return metadata
+
+    def register_image(
+        self,
+        path: Path | str,
+        *,
+        generation_params: dict[str, Any] | None = None,
+        quality_metrics: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Catalog and fingerprint an image written into storage by another service.
+
+        Services that save derived images (upscales, filters, post-processing)
+        straight into the images directory call this after saving, so the image
+        shows up in listings, stats, cleanup and similarity search right away
+        instead of after the next catalog reconcile.
+
+        Args:
+            path: Path (or filename) of the image inside the images directory.
+            generation_params: Optional generation parameters to persist as metadata.
+            quality_metrics: Optional quality metrics to persist as metadata.
+
+        Returns:
+            Extracted metadata, or None if the file is missing or outside storage.
+        """
+        dest = self.resolve_path(str(path))
+        if Path(path).is_absolute() and Path(path).resolve() != dest.resolve():
+            logger.warning(f"Not registering image outside storage: {path}")
+            return None
+        if not dest.exists():
+            return None
+
+        metadata = self._write_metadata(dest, generation_params=generation_params, quality_metrics=quality_metrics)
+        self._catalog_image(dest, metadata)
+        try:
+            self._hash_index.add_file(dest)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Failed to index image hashes for {dest.name}: {exc}")
+        return metadata
 
     def get_metadata(self, filename: str) -> dict[str, Any] | None:
         """Return stored metadata for an image, if present."""
@@ -94,56 +145,38 @@ class ImageStorageService:
         limit: int = 50,
         offset: int = 0,
     ) -> dict[str, Any]:
-        """List stored images with optional filtering and pagination."""
+        """List stored images with optional filename/prompt search and pagination (catalog query)."""
         query = (q or "").strip().lower()
-        paths = [p for p in self._root.glob("*.png") if p.is_file()]
-        if query:
-            paths = [p for p in paths if query in p.name.lower()]
-
-        if sort == "oldest":
-            paths.sort(key=lambda x: x.stat().st_mtime)
-        elif sort == "name":
-            paths.sort(key=lambda x: x.name.lower())
-        else:
-            paths.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-
         if offset < 0:
             offset = 0
         if limit < 1:
             limit = 1
-        page = paths[offset : offset + limit]
-
-        items: list[dict[str, Any]] = []
-        for p in page:
-            try:
-                st = p.stat()
-                metadata = self.get_metadata(p.name)
-                items.append(
-                    {
-                        "path": p.name,
-                        "mtime": st.st_mtime,
-                        "size_bytes": st.st_size,
-                        "url": f"/content/images/{p.name}",
-                        "metadata": metadata,
-                    }
-                )
-            except FileNotFoundError:
-                continue
-
-        return {"items": items, "total": len(paths), "limit": limit, "offset": offset, "sort": sort, "q": query}
+        items, total = self._catalog.list_images(q=query, sort=sort, limit=limit, offset=offset)
+        for item in items:
+            item["url"] = f"/content/images/{item['path']}"
+        return {"items": items, "total": total, "limit": limit, "offset": offset, "sort": sort, "q": query}
 
     def storage_stats(self) -> dict[str, Any]:
         """Return storage statistics for stored images."""
-        total = 0
-        count = 0
-        for p in self._root.glob("*.png"):
-            try:
-                st = p.stat()
-            except FileNotFoundError:
-                continue
-            total += st.st_size
-            count += 1
-        return {"images_count": count, "images_bytes": total}
+        return self._catalog.stats()
+
+    def reconcile_catalog(self) -> dict[str, int]:
+        """
+        Sync the image catalog with the files on disk (new, changed and removed images).
+
+        Returns:
+            Dict with added, updated, removed and unchanged counts.
+        """
+        result = self._catalog.reconcile(self._root, self.get_metadata, suffix=_CATALOG_SUFFIX)
+        if result["added"] or result["updated"] or result["removed"]:
+            logger.info(
+                "Reconciled image catalog: %s added, %s updated, %s removed, %s unchanged",
+                result["added"],
+                result["updated"],
+                result["removed"],
+                result["unchanged"],
+            )
+        return result
 
     def delete_image(self, filename: str) -> bool:
         """Delete a single image and its metadata."""
@@ -155,6 +188,8 @@ class ImageStorageService:
         metadata_path = self._metadata_path_for(filename)
 
         if not path.exists():
+            # Already gone from disk; make sure it is not listed any more
+            self._catalog.remove(path.name)
             return False
 
         try:
@@ -169,6 +204,8 @@ class ImageStorageService:
         except Exception:
             # Metadata cleanup best-effort
             pass
+        self._catalog.remove(path.name)
+        self._hash_index.remove(path.name)
 
         return True
 
@@ -185,26 +222,112 @@ class ImageStorageService:
 
     def cleanup_old_images(self, older_than_days: int = 30) -> dict[str, Any]:
         """Delete images older than a threshold (in days)."""
-        import time
-
         cutoff = time.time() - (older_than_days * 86400)
         deleted = 0
         skipped = 0
 
-        for p in self._root.glob("*.png"):
-            try:
-                if p.stat().st_mtime < cutoff:
-                    if self.delete_image(p.name):
-                        deleted += 1
-                    else:
-                        skipped += 1
-            except FileNotFoundError:
-                skipped += 1
-            except Exception:
+        for name in self._catalog.older_than(cutoff):
+            if self.delete_image(name):
+                deleted += 1
+            else:
                 skipped += 1
 
         return {"deleted": deleted, "skipped": skipped, "older_than_days": older_than_days}
 
+    def find_similar_images(
+        self,
+        filename: str,
+        *,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        limit: int = 20,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Find stored images that look like a given stored image.
+
+        Args:
+            filename: Name of the reference image.
+            max_distance: Maximum perceptual-hash Hamming distance (0-64).
+            limit: Maximum number of matches.
+
+        Returns:
+            Matches (filename, url, phash_distance, dhash_distance, similarity),
+            closest first, or None if the reference image does not exist.
+        """
+        path = self.resolve_path(filename)
+        hashes = self._hash_index.get(path.name)
+        if hashes is None:
+            if not path.exists():
+                return None
+            hashes = self._hash_index.add_file(path)
+
+        matches = []
+        for match in self._hash_index.query(hashes, max_distance=max_distance, limit=limit, exclude=path.name):
+            if not self.resolve_path(match["filename"]).exists():
+                # Deleted outside this service; drop the stale entry
+                self._hash_index.remove(match["filename"])
+                continue
+            match["url"] = f"/content/images/{match['filename']}"
+            matches.append(match)
+        return matches
+
+    def find_duplicate_images(self, *, max_distance: int = DEFAULT_MAX_DISTANCE) -> list[list[str]]:
+        """
+        Group stored images that are near-duplicates of each other.
+
+        Args:
+            max_distance: Maximum perceptual-hash Hamming distance (0-64).
+
+        Returns:
+            Groups of two or more filenames, largest groups first.
+        """
+        groups = []
+        for names in self._hash_index.find_duplicates(max_distance=max_distance):
+            existing = []
+            for name in names:
+                if self.resolve_path(name).exists():
+                    existing.append(name)
+                else:
+                    self._hash_index.remove(name)
+            if len(existing) > 1:
+                groups.append(existing)
+        return groups
+
+    def sync_hash_index(self) -> dict[str, int]:
+        """
+        Fingerprint stored images missing from the hash index and drop deleted ones.
+
+        Returns:
+            Dict with added, removed, unchanged and failed counts.
+        """
+        result = self._hash_index.sync(self._root)
+        if result["added"] or result["removed"]:
+            logger.info(
+                "Synced image hash index: %s added, %s removed, %s unchanged",
+                result["added"],
+                result["removed"],
+                result["unchanged"],
+            )
+        return result
+
+    def _catalog_image(self, path: Path, metadata: dict[str, Any] | None) -> None:
+        """Record an image (and its metadata) in the listing catalog."""
+        if path.suffix != _CATALOG_SUFFIX:
+            return
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return
+        self._catalog.upsert(path.name, mtime=st.st_mtime, size_bytes=st.st_size, metadata=metadata)
+
+    def _index_hashes(self, path: Path, data: bytes) -> None:
+        """Fingerprint a freshly written image for near-duplicate lookups (best-effort)."""
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                hashes = compute_image_hashes(img)
+            self._hash_index.add(path.name, hashes, mtime=path.stat().st_mtime)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Failed to index image hashes for {path.name}: {exc}")
+
     def _metadata_path_for(self, filename: str) -> Path:
         """Get the metadata path for a given filename."""
         stem = Path(filename).stem
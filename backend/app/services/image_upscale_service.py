@@ -12,6 +12,7 @@ from typing import Any
 
 from app.core.logging import get_logger
 from app.core.paths import images_dir
+from app.services.image_storage_service import image_storage_service
 from app.services.comfyui_client import ComfyUiClient, ComfyUiError
 
 logger = get_logger(__name__)
@@ -183,6 +184,7 @@ class ImageUpscaleService:
         
         # Save image
         img.save(output_path, format="PNG", quality=95)
+        image_storage_service.register_image(output_path)
         logger.info(f"Saved upscaled image: {output_path}")
         
         return output_path
@@ -26,7 +26,13 @@ class InstagramEngagementError(RuntimeError):
 class InstagramEngagementService:
     """Service for engagement actions on Instagram using instagrapi."""
 
-    def __init__(self, username: str | None = None, password: str | None = None, session_file: str | None = None):
+    def __init__(
+        self,
+        username: str | None = None,
+        password: str | None = None,
+        session_file: str | None = None,
+        client: Client | None = None,
+    ):
         """
         Initialize Instagram engagement service.
 
@@ -34,11 +40,14 @@ class InstagramEngagementService:
             username: Instagram username for authentication.
             password: Instagram password for authentication.
             session_file: Path to session file for persistent login (optional).
+            client: Already authenticated client to use, e.g. one borrowed from the
+                session pool; it is not logged in again or saved on close.
         """
         self.username = username
         self.password = password
         self.session_file = session_file
-        self.client: Client | None = None
+        self.client: Client | None = client
+        self._owns_client = client is None
 
     def _get_client(self) -> Client:
         """
@@ -903,7 +912,7 @@ class InstagramEngagementService:
 
     def close(self) -> None:
         """Close the Instagram client session."""
-        if self.client:
+        if self.client and self._owns_client:
             try:
                 # Save session before closing
                 if self.session_file:
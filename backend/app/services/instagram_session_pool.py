@@ -0,0 +1,283 @@
+"""Pool of long-lived, authenticated instagrapi sessions.
+
+Logging in to Instagram is slow and every login counts towards Instagram's
+rate limits, so posting and engagement borrow a warm client per platform
+account from this pool instead of creating and logging in a new one for each
+action. Each session has its own lock (instagrapi clients are not thread
+safe), sessions idle for longer than the TTL are evicted with their settings
+saved, and an action that fails with ``LoginRequired`` is retried once on a
+fresh login.
+
+instagrapi is imported lazily, so this module can be imported without it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class InstagramSessionError(RuntimeError):
+    """Error raised when an Instagram session cannot be established."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class InstagramCredentials:
+    """Login details of an Instagram platform account.
+
+    Attributes:
+        username: Instagram username.
+        password: Instagram password.
+        session_file: Path where instagrapi settings are persisted (optional).
+    """
+
+    username: str
+    password: str
+    session_file: str | None = None
+
+
+@dataclass
+class _PooledSession:
+    credentials: InstagramCredentials
+    client: Any = None
+    last_used: float = field(default_factory=time.monotonic)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _default_client_factory() -> Any:
+    from instagrapi import Client
+
+    return Client()
+
+
+def _is_login_required(exc: BaseException) -> bool:
+    """Whether an exception (or one it was raised from) is instagrapi's LoginRequired."""
+    try:
+        from instagrapi.exceptions import LoginRequired
+    except ImportError:
+        LoginRequired = None  # type: ignore[assignment, misc]
+
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if LoginRequired is not None and isinstance(current, LoginRequired):
+            return True
+        if type(current).__name__ == "LoginRequired":
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class InstagramSessionPool:
+    """Keeps authenticated instagrapi clients warm, keyed by platform account."""
+
+    def __init__(
+        self,
+        idle_ttl_s: float | None = None,
+        max_sessions: int | None = None,
+        client_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        """
+        Initialize the session pool.
+
+        Args:
+            idle_ttl_s: Seconds a session may stay unused before it is evicted
+                (defaults to settings.instagram_session_idle_ttl_s).
+            max_sessions: Maximum number of pooled sessions; the least recently
+                used idle session is evicted beyond it (defaults to
+                settings.instagram_session_pool_size).
+            client_factory: Callable returning a new, unauthenticated client
+                (defaults to ``instagrapi.Client``).
+        """
+        self.idle_ttl_s = settings.instagram_session_idle_ttl_s if idle_ttl_s is None else idle_ttl_s
+        self.max_sessions = settings.instagram_session_pool_size if max_sessions is None else max_sessions
+        self._client_factory = client_factory or _default_client_factory
+        self._sessions: OrderedDict[str, _PooledSession] = OrderedDict()
+        self._lock = threading.Lock()
+        self.logins = 0
+
+    def run(self, key: str, credentials: InstagramCredentials, action: Callable[[Any], T]) -> T:
+        """
+        Run an action with the pooled client of an account.
+
+        The session is locked for the duration of the action, so actions on the
+        same account run one at a time. If the action fails because Instagram
+        dropped the session (``LoginRequired``), the client logs in again and
+        the action is retried once.
+
+        Args:
+            key: Pool key, normally the platform account ID.
+            credentials: Login details of the account.
+            action: Callable receiving the authenticated client.
+
+        Returns:
+            Whatever the action returns.
+
+        Raises:
+            InstagramSessionError: If logging in fails.
+        """
+        self.evict_idle()
+        session = self._checkout(key, credentials)
+        try:
+            with session.lock:
+                if session.client is None or session.credentials != credentials:
+                    session.credentials = credentials
+                    session.client = self._login(credentials, reuse_settings=True)
+                try:
+                    return action(session.client)
+                except Exception as exc:
+                    if not _is_login_required(exc):
+                        raise
+                    logger.warning(f"Instagram session for {credentials.username} expired, logging in again")
+                    session.client = None
+                    session.client = self._login(credentials, reuse_settings=False)
+                    return action(session.client)
+        finally:
+            session.last_used = time.monotonic()
+
+    def _checkout(self, key: str, credentials: InstagramCredentials) -> _PooledSession:
+        evicted: list[_PooledSession] = []
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = _PooledSession(credentials=credentials)
+                self._sessions[key] = session
+                for other_key in list(self._sessions):
+                    if len(self._sessions) <= self.max_sessions:
+                        break
+                    other = self._sessions[other_key]
+                    if other is not session and not other.lock.locked():
+                        evicted.append(self._sessions.pop(other_key))
+            self._sessions.move_to_end(key)
+            session.last_used = time.monotonic()
+        for old in evicted:
+            self._save(old)
+        return session
+
+    def _login(self, credentials: InstagramCredentials, reuse_settings: bool) -> Any:
+        client = self._client_factory()
+        session_file = credentials.session_file
+        try:
+            if reuse_settings and session_file and Path(session_file).exists():
+                try:
+                    client.load_settings(session_file)
+                except Exception as exc:
+                    logger.warning(f"Failed to load Instagram session from {session_file}: {exc}")
+            client.login(credentials.username, credentials.password)
+        except Exception as exc:
+            if "PleaseWaitFewMinutes" in type(exc).__name__:
+                raise InstagramSessionError(
+                    f"Instagram rate limit: Please wait a few minutes before trying again: {exc}"
+                ) from exc
+            raise InstagramSessionError(f"Instagram login failed: {exc}") from exc
+        self.logins += 1
+        logger.info(f"Logged in to Instagram as {credentials.username}")
+
+        if session_file:
+            try:
+                client.dump_settings(session_file)
+            except Exception as exc:
+                logger.warning(f"Failed to save Instagram session: {exc}")
+        return client
+
+    def _save(self, session: _PooledSession) -> None:
+        """Persist a session's settings so the next login can reuse them."""
+        if session.client is not None and session.credentials.session_file:
+            try:
+                session.client.dump_settings(session.credentials.session_file)
+            except Exception as exc:
+                logger.warning(f"Failed to save Instagram session: {exc}")
+        session.client = None
+
+    def evict_idle(self) -> int:
+        """
+        Drop sessions that have not been used within the idle TTL.
+
+        Sessions currently running an action are never evicted.
+
+        Returns:
+            Number of sessions evicted.
+        """
+        cutoff = time.monotonic() - self.idle_ttl_s
+        with self._lock:
+            expired = [
+                key
+                for key, session in self._sessions.items()
+                if session.last_used < cutoff and not session.lock.locked()
+            ]
+            evicted = [self._sessions.pop(key) for key in expired]
+        for session in evicted:
+            self._save(session)
+        return len(evicted)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop the session of an account, e.g. after its credentials were changed or it was disconnected.
+
+        Args:
+            key: Pool key of the account.
+        """
+        with self._lock:
+            session = self._sessions.pop(key, None)
+        if session is not None:
+            with session.lock:
+                self._save(session)
+
+    def close(self) -> None:
+        """Save and drop every pooled session."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            with session.lock:
+                self._save(session)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Describe the pool.
+
+        Returns:
+            Dictionary with session count, busy sessions and total logins.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+        return {
+            "sessions": len(sessions),
+            "busy": sum(1 for s in sessions if s.lock.locked()),
+            "logins": self.logins,
+            "idle_ttl_s": self.idle_ttl_s,
+            "max_sessions": self.max_sessions,
+        }
+
+
+# Global instance for easy import
+_session_pool: InstagramSessionPool | None = None
+
+
+def get_instagram_session_pool() -> InstagramSessionPool:
+    """Get or create the global Instagram session pool."""
+    global _session_pool
+    if _session_pool is None:
+        _session_pool = InstagramSessionPool()
+    return _session_pool
+
+
+def close_instagram_session_pool() -> None:
+    """Save and drop all pooled Instagram sessions (called on shutdown)."""
+    if _session_pool is not None:
+        _session_pool.close()
@@ -6,6 +6,8 @@ using platform accounts stored in the database instead of direct credentials.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import select
@@ -13,6 +15,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
 from app.models.platform_account import PlatformAccount
+from app.services.instagram_session_pool import (
+    InstagramCredentials,
+    InstagramSessionError,
+    get_instagram_session_pool,
+)
+from app.services.platform_executor import PlatformCallTimeout, run_platform_call
 
 # Optional Instagram support - import only if available
 try:
@@ -112,6 +120,37 @@ class IntegratedEngagementService:
 
         return username, password, session_file
 
+    async def _run_instagram(self, account: PlatformAccount, action: Callable[[Any], Any]) -> Any:
+        """
+        Run an engagement action with the account's pooled Instagram session.
+
+        The authenticated client is borrowed from the session pool, so repeated
+        actions on the same account do not log in again each time, and the
+        blocking instagrapi calls run on the platform executor instead of the
+        event loop.
+
+        Args:
+            account: Instagram platform account.
+            action: Callable receiving an InstagramEngagementService bound to the pooled client.
+
+        Returns:
+            The action's result.
+
+        Raises:
+            IntegratedEngagementError: If credentials are missing.
+            InstagramSessionError: If logging in fails.
+            InstagramEngagementError: If the action fails.
+            PlatformCallTimeout: If the action does not finish in time.
+        """
+        username, password, session_file = self._extract_instagram_credentials(account)
+        return await run_platform_call(
+            "instagram",
+            get_instagram_session_pool().run,
+            str(account.id),
+            InstagramCredentials(username, password, session_file),
+            lambda client: action(InstagramEngagementService(client=client)),
+        )
+
     async def comment_on_post(
         self,
         platform_account_id: UUID,
@@ -139,29 +178,22 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
-            )
-            result = engagement_service.comment_on_post(
-                media_id=media_id,
-                comment_text=comment_text,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.comment_on_post(
+                    media_id=media_id,
+                    comment_text=comment_text,
+                ),
             )
             logger.info(
                 f"Successfully commented on post {media_id} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to comment on post using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to comment on post: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def like_post(
         self,
@@ -188,26 +220,19 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.like_post(media_id=media_id),
             )
-            result = engagement_service.like_post(media_id=media_id)
             logger.info(
                 f"Successfully liked post {media_id} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to like post using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to like post: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def unlike_post(
         self,
@@ -234,26 +259,19 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.unlike_post(media_id=media_id),
             )
-            result = engagement_service.unlike_post(media_id=media_id)
             logger.info(
                 f"Successfully unliked post {media_id} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to unlike post using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to unlike post: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def follow_user(
         self,
@@ -280,26 +298,19 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.follow_user(user_id=target_user_id),
             )
-            result = engagement_service.follow_user(user_id=target_user_id)
             logger.info(
                 f"Successfully followed user {target_user_id} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to follow user using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to follow user: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def unfollow_user(
         self,
@@ -326,26 +337,19 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.unfollow_user(user_id=target_user_id),
             )
-            result = engagement_service.unfollow_user(user_id=target_user_id)
             logger.info(
                 f"Successfully unfollowed user {target_user_id} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to unfollow user using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to unfollow user: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def send_dm(
         self,
@@ -374,26 +378,19 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.send_dm(thread_id=thread_id, message_text=message_text),
             )
-            result = engagement_service.send_dm(thread_id=thread_id, message_text=message_text)
             logger.info(
                 f"Successfully sent DM to thread {thread_id} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to send DM using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to send DM: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def get_inbox(
         self,
@@ -420,26 +417,19 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.get_inbox(limit=limit),
             )
-            result = engagement_service.get_inbox(limit=limit)
             logger.info(
                 f"Retrieved inbox for platform account {platform_account_id}: {result.get('count', 0)} threads"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to get inbox using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to get inbox: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def get_thread_messages(
         self,
@@ -468,28 +458,21 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.get_thread_messages(thread_id=thread_id, limit=limit),
             )
-            result = engagement_service.get_thread_messages(thread_id=thread_id, limit=limit)
             logger.info(
                 f"Retrieved {result.get('count', 0)} messages from thread {thread_id} for platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(
                 f"Failed to get thread messages using platform account {platform_account_id}: {exc}"
             )
             raise IntegratedEngagementError(f"Failed to get thread messages: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def get_unread_threads(
         self,
@@ -514,28 +497,21 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.get_unread_threads(),
             )
-            result = engagement_service.get_unread_threads()
             logger.info(
                 f"Found {result.get('count', 0)} unread threads for platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(
                 f"Failed to get unread threads using platform account {platform_account_id}: {exc}"
             )
             raise IntegratedEngagementError(f"Failed to get unread threads: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def mark_thread_read(
         self,
@@ -562,28 +538,21 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.mark_thread_read(thread_id=thread_id),
             )
-            result = engagement_service.mark_thread_read(thread_id=thread_id)
             logger.info(
                 f"Marked thread {thread_id} as read for platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(
                 f"Failed to mark thread as read using platform account {platform_account_id}: {exc}"
             )
             raise IntegratedEngagementError(f"Failed to mark thread as read: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def get_user_stories(
         self,
@@ -612,28 +581,21 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.get_user_stories(user_id=user_id, amount=amount),
             )
-            result = engagement_service.get_user_stories(user_id=user_id, amount=amount)
             logger.info(
                 f"Retrieved {result.get('count', 0)} stories from user {user_id} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(
                 f"Failed to get user stories using platform account {platform_account_id}: {exc}"
             )
             raise IntegratedEngagementError(f"Failed to get user stories: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def mark_stories_seen(
         self,
@@ -662,30 +624,23 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
-            )
-            result = engagement_service.mark_stories_seen(
-                story_pks=story_pks, skipped_story_pks=skipped_story_pks
+            result = await self._run_instagram(
+                account,
+                lambda service: service.mark_stories_seen(
+                    story_pks=story_pks, skipped_story_pks=skipped_story_pks
+                ),
             )
             logger.info(
                 f"Marked {len(story_pks)} stories as seen using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(
                 f"Failed to mark stories as seen using platform account {platform_account_id}: {exc}"
             )
             raise IntegratedEngagementError(f"Failed to mark stories as seen: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def like_story(
         self,
@@ -712,28 +667,21 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.like_story(story_id=story_id),
             )
-            result = engagement_service.like_story(story_id=story_id)
             logger.info(
                 f"Successfully liked story {story_id} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(
                 f"Failed to like story using platform account {platform_account_id}: {exc}"
             )
             raise IntegratedEngagementError(f"Failed to like story: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def unlike_story(
         self,
@@ -760,28 +708,21 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.unlike_story(story_id=story_id),
             )
-            result = engagement_service.unlike_story(story_id=story_id)
             logger.info(
                 f"Successfully unliked story {story_id} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(
                 f"Failed to unlike story using platform account {platform_account_id}: {exc}"
             )
             raise IntegratedEngagementError(f"Failed to unlike story: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def get_hashtag_posts(
         self,
@@ -810,23 +751,16 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.get_hashtag_posts(hashtag=hashtag, amount=amount),
             )
-            result = engagement_service.get_hashtag_posts(hashtag=hashtag, amount=amount)
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to get hashtag posts using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to get hashtag posts: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def get_user_posts(
         self,
@@ -855,23 +789,16 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.get_user_posts(user_id=user_id, amount=amount),
             )
-            result = engagement_service.get_user_posts(user_id=user_id, amount=amount)
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to get user posts using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to get user posts: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def like_posts_from_hashtag(
         self,
@@ -902,30 +829,23 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
-            )
-            result = engagement_service.like_posts_from_hashtag(
-                hashtag=hashtag,
-                amount=amount,
-                max_likes=max_likes,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.like_posts_from_hashtag(
+                    hashtag=hashtag,
+                    amount=amount,
+                    max_likes=max_likes,
+                ),
             )
             logger.info(
                 f"Successfully liked posts from hashtag #{hashtag} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to like posts from hashtag using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to like posts from hashtag: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
     async def like_posts_from_user(
         self,
@@ -956,28 +876,21 @@ class IntegratedEngagementService:
             )
         
         account = await self._get_platform_account(platform_account_id)
-        username, password, session_file = self._extract_instagram_credentials(account)
 
-        engagement_service = None
         try:
-            engagement_service = InstagramEngagementService(
-                username=username,
-                password=password,
-                session_file=session_file,
-            )
-            result = engagement_service.like_posts_from_user(
-                user_id=user_id,
-                amount=amount,
-                max_likes=max_likes,
+            result = await self._run_instagram(
+                account,
+                lambda service: service.like_posts_from_user(
+                    user_id=user_id,
+                    amount=amount,
+                    max_likes=max_likes,
+                ),
             )
             logger.info(
                 f"Successfully liked posts from user {user_id} using platform account {platform_account_id}"
             )
             return result
-        except InstagramEngagementError as exc:
+        except (InstagramEngagementError, InstagramSessionError, PlatformCallTimeout) as exc:
             logger.error(f"Failed to like posts from user using platform account {platform_account_id}: {exc}")
             raise IntegratedEngagementError(f"Failed to like posts from user: {exc}") from exc
-        finally:
-            if engagement_service:
-                engagement_service.close()
 
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 from uuid import UUID
@@ -14,6 +18,13 @@ from app.models.content import Content
 from app.models.platform_account import PlatformAccount
 from app.models.post import Post
 from app.services.content_service import ContentService
+from app.services.engagement_rollup_service import EngagementRollupService
+from app.services.instagram_session_pool import (
+    InstagramCredentials,
+    InstagramSessionError,
+    get_instagram_session_pool,
+)
+from app.services.platform_executor import PlatformCallTimeout, run_platform_call
 from app.services.post_service import PostService
 
 # Optional Instagram support - import only if available
@@ -41,6 +52,65 @@ class IntegratedPostingError(RuntimeError):
     pass
 
 
+class CrossPostUploadError(RuntimeError):
+    """Error raised when a cross-post upload fails after all its attempts."""
+
+    def __init__(self, message: str, attempts: int) -> None:
+        super().__init__(message)
+        self.attempts = attempts
+
+
+@dataclass
+class CrossPostOutcome:
+    """Per-platform result of a cross-post.
+
+    Attributes:
+        posts: Published posts by platform key.
+        errors: Error messages by platform key for targets that failed.
+        attempts: Upload attempts by platform key.
+    """
+
+    posts: dict[str, Post] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    attempts: dict[str, int] = field(default_factory=dict)
+
+
+CROSS_POST_MAX_RETRIES = 2
+"""Retries per platform for transient upload errors."""
+
+CROSS_POST_RETRY_BACKOFF_S = 1.0
+"""Delay before the first retry; doubles for each further retry."""
+
+CROSS_POST_MEDIA_PLATFORMS: dict[str, Platform] = {"instagram": Platform.INSTAGRAM}
+"""Platforms whose cross-post uploads the image, and the optimization profile used for it."""
+
+_TRANSIENT_ERROR_NAMES = frozenset({"ConnectError", "ConnectTimeout", "TooManyRequests", "TwitterServerError"})
+_TRANSIENT_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """
+    Whether a failed upload is safe and worthwhile to retry.
+
+    Only errors where the platform certainly did not publish the post count:
+    refused connections, rate limiting and gateway errors, found anywhere in
+    the exception's cause chain.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, PlatformCallTimeout):
+            return False
+        if isinstance(current, ConnectionRefusedError) or type(current).__name__ in _TRANSIENT_ERROR_NAMES:
+            return True
+        status_code = getattr(getattr(current, "response", None), "status_code", None)
+        if status_code in _TRANSIENT_STATUS_CODES:
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
 class IntegratedPostingService:
     """Service for posting content to platforms using content library and platform accounts."""
 
@@ -54,8 +124,34 @@ class IntegratedPostingService:
         self.db = db
         self.content_service = ContentService(db)
         self.post_service = PostService(db)
+        self.rollups = EngagementRollupService(db)
         self.image_optimizer = PlatformImageOptimizationService()
 
+    async def _refresh_rollups(self, posts: list[Post]) -> None:
+        """
+        Recompute the engagement rollups of committed, published posts.
+
+        Best effort: the posts are already recorded (and live on the platform),
+        so a rollup failure is only logged; the next engagement sync or a
+        backfill repairs the buckets.
+
+        Args:
+            posts: Published posts, already committed and refreshed.
+        """
+        if not posts:
+            return
+        try:
+            for post in posts:
+                await self.rollups.refresh_post(post)
+            await self.db.commit()
+        except Exception as exc:  # noqa: BLE001
+            await self.db.rollback()
+            logger.warning(f"Failed to refresh engagement rollups for {len(posts)} posts: {exc}")
+        else:
+            await self.rollups.invalidate_cache()
+        for post in posts:
+            await self.db.refresh(post)
+
     async def _get_platform_account(self, platform_account_id: UUID) -> PlatformAccount:
         """
         Get platform account by ID.
@@ -141,6 +237,41 @@ class IntegratedPostingService:
 
         return username, password, session_file
 
+    async def _run_instagram(
+        self,
+        account: PlatformAccount,
+        credentials: InstagramCredentials,
+        action: Callable[[Any], dict[str, Any]],
+        timeout_s: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run a posting action with the account's pooled Instagram session.
+
+        The upload runs on the platform executor so it does not block the event loop.
+
+        Args:
+            account: Instagram platform account.
+            credentials: Login details extracted from the account.
+            action: Callable receiving an InstagramPostingService bound to the pooled client.
+            timeout_s: Timeout override (defaults to the Instagram platform timeout).
+
+        Returns:
+            The action's result.
+
+        Raises:
+            InstagramSessionError: If logging in fails.
+            InstagramPostingError: If posting fails.
+            PlatformCallTimeout: If posting does not finish in time.
+        """
+        return await run_platform_call(
+            "instagram",
+            get_instagram_session_pool().run,
+            str(account.id),
+            credentials,
+            lambda client: action(InstagramPostingService(client=client)),
+            timeout_s=timeout_s,
+        )
+
     async def post_image_to_instagram(
         self,
         content_id: UUID,
@@ -180,7 +311,7 @@ class IntegratedPostingService:
             )
 
         # Extract credentials
-        username, password, session_file = self._extract_instagram_credentials(account)
+        credentials = InstagramCredentials(*self._extract_instagram_credentials(account))
 
         # Verify content file exists
         image_path = Path(content.file_path)
@@ -219,19 +350,16 @@ class IntegratedPostingService:
                 "Note: instagrapi requires pydantic 1.10.9 which conflicts with pydantic 2.x used by this application."
             )
         
-        posting_service = None
         try:
-            posting_service = InstagramPostingService(
-                username=username,
-                password=password,
-                session_file=session_file,
-            )
-
-            result = posting_service.post_image(
-                image_path=image_path,
-                caption=caption,
-                hashtags=hashtags,
-                mentions=mentions,
+            result = await self._run_instagram(
+                account,
+                credentials,
+                lambda service: service.post_image(
+                    image_path=image_path,
+                    caption=caption,
+                    hashtags=hashtags,
+                    mentions=mentions,
+                ),
             )
 
             # Update post with platform response
@@ -246,6 +374,7 @@ class IntegratedPostingService:
 
             await self.db.commit()
             await self.db.refresh(post)
+            await self._refresh_rollups([post])
 
             logger.info(
                 f"Successfully posted image {content_id} to Instagram as post {post.id} "
@@ -254,7 +383,7 @@ class IntegratedPostingService:
 
             return post
 
-        except InstagramPostingError as exc:
+        except (InstagramPostingError, InstagramSessionError, PlatformCallTimeout) as exc:
             # Update post with error
             post.status = "failed"
             post.error_message = str(exc)
@@ -264,10 +393,6 @@ class IntegratedPostingService:
             logger.error(f"Failed to post image {content_id} to Instagram: {exc}")
             raise IntegratedPostingError(f"Instagram posting failed: {exc}") from exc
 
-        finally:
-            if posting_service:
-                posting_service.close()
-
     async def post_carousel_to_instagram(
         self,
         content_ids: list[UUID],
@@ -322,7 +447,7 @@ class IntegratedPostingService:
             )
 
         # Extract credentials
-        username, password, session_file = self._extract_instagram_credentials(account)
+        credentials = InstagramCredentials(*self._extract_instagram_credentials(account))
 
         # Verify all content files exist
         image_paths = []
@@ -356,19 +481,16 @@ class IntegratedPostingService:
                 "Note: instagrapi requires pydantic 1.10.9 which conflicts with pydantic 2.x used by this application."
             )
         
-        posting_service = None
         try:
-            posting_service = InstagramPostingService(
-                username=username,
-                password=password,
-                session_file=session_file,
-            )
-
-            result = posting_service.post_carousel(
-                image_paths=image_paths,
-                caption=caption,
-                hashtags=hashtags,
-                mentions=mentions,
+            result = await self._run_instagram(
+                account,
+                credentials,
+                lambda service: service.post_carousel(
+                    image_paths=image_paths,
+                    caption=caption,
+                    hashtags=hashtags,
+                    mentions=mentions,
+                ),
             )
 
             # Update post with platform response
@@ -384,6 +506,7 @@ class IntegratedPostingService:
 
             await self.db.commit()
             await self.db.refresh(post)
+            await self._refresh_rollups([post])
 
             logger.info(
                 f"Successfully posted carousel ({len(content_ids)} images) to Instagram as post {post.id} "
@@ -392,7 +515,7 @@ class IntegratedPostingService:
 
             return post
 
-        except InstagramPostingError as exc:
+        except (InstagramPostingError, InstagramSessionError, PlatformCallTimeout) as exc:
             # Update post with error
             post.status = "failed"
             post.error_message = str(exc)
@@ -402,10 +525,6 @@ class IntegratedPostingService:
             logger.error(f"Failed to post carousel to Instagram: {exc}")
             raise IntegratedPostingError(f"Instagram posting failed: {exc}") from exc
 
-        finally:
-            if posting_service:
-                posting_service.close()
-
     async def post_reel_to_instagram(
         self,
         content_id: UUID,
@@ -447,7 +566,7 @@ class IntegratedPostingService:
             )
 
         # Extract credentials
-        username, password, session_file = self._extract_instagram_credentials(account)
+        credentials = InstagramCredentials(*self._extract_instagram_credentials(account))
 
         # Verify content file exists
         video_path = Path(content.file_path)
@@ -486,20 +605,17 @@ class IntegratedPostingService:
                 "Note: instagrapi requires pydantic 1.10.9 which conflicts with pydantic 2.x used by this application."
             )
         
-        posting_service = None
         try:
-            posting_service = InstagramPostingService(
-                username=username,
-                password=password,
-                session_file=session_file,
-            )
-
-            result = posting_service.post_reel(
-                video_path=video_path,
-                caption=caption,
-                hashtags=hashtags,
-                mentions=mentions,
-                thumbnail_path=thumbnail_path,
+            result = await self._run_instagram(
+                account,
+                credentials,
+                lambda service: service.post_reel(
+                    video_path=video_path,
+                    caption=caption,
+                    hashtags=hashtags,
+                    mentions=mentions,
+                    thumbnail_path=thumbnail_path,
+                ),
             )
 
             # Update post with platform response
@@ -514,6 +630,7 @@ class IntegratedPostingService:
 
             await self.db.commit()
             await self.db.refresh(post)
+            await self._refresh_rollups([post])
 
             logger.info(
                 f"Successfully posted reel {content_id} to Instagram as post {post.id} "
@@ -522,7 +639,7 @@ class IntegratedPostingService:
 
             return post
 
-        except InstagramPostingError as exc:
+        except (InstagramPostingError, InstagramSessionError, PlatformCallTimeout) as exc:
             # Update post with error
             post.status = "failed"
             post.error_message = str(exc)
@@ -532,10 +649,6 @@ class IntegratedPostingService:
             logger.error(f"Failed to post reel {content_id} to Instagram: {exc}")
             raise IntegratedPostingError(f"Instagram posting failed: {exc}") from exc
 
-        finally:
-            if posting_service:
-                posting_service.close()
-
     async def post_story_to_instagram(
         self,
         content_id: UUID,
@@ -583,7 +696,7 @@ class IntegratedPostingService:
             )
 
         # Extract credentials
-        username, password, session_file = self._extract_instagram_credentials(account)
+        credentials = InstagramCredentials(*self._extract_instagram_credentials(account))
 
         # Verify content file exists
         media_path = Path(content.file_path)
@@ -610,28 +723,18 @@ class IntegratedPostingService:
                 "Note: instagrapi requires pydantic 1.10.9 which conflicts with pydantic 2.x used by this application."
             )
         
-        posting_service = None
+        media_kwargs = {"video_path": media_path} if is_video else {"image_path": media_path}
         try:
-            posting_service = InstagramPostingService(
-                username=username,
-                password=password,
-                session_file=session_file,
-            )
-
-            if is_video:
-                result = posting_service.post_story(
-                    video_path=media_path,
-                    caption=caption,
-                    hashtags=hashtags,
-                    mentions=mentions,
-                )
-            else:
-                result = posting_service.post_story(
-                    image_path=media_path,
+            result = await self._run_instagram(
+                account,
+                credentials,
+                lambda service: service.post_story(
+                    **media_kwargs,
                     caption=caption,
                     hashtags=hashtags,
                     mentions=mentions,
-                )
+                ),
+            )
 
             # Update post with platform response
             post.platform_post_id = result.get("platform_post_id")
@@ -645,6 +748,7 @@ class IntegratedPostingService:
 
             await self.db.commit()
             await self.db.refresh(post)
+            await self._refresh_rollups([post])
 
             logger.info(
                 f"Successfully posted story {content_id} to Instagram as post {post.id} "
@@ -653,7 +757,7 @@ class IntegratedPostingService:
 
             return post
 
-        except InstagramPostingError as exc:
+        except (InstagramPostingError, InstagramSessionError, PlatformCallTimeout) as exc:
             # Update post with error
             post.status = "failed"
             post.error_message = str(exc)
@@ -663,10 +767,6 @@ class IntegratedPostingService:
             logger.error(f"Failed to post story {content_id} to Instagram: {exc}")
             raise IntegratedPostingError(f"Instagram posting failed: {exc}") from exc
 
-        finally:
-            if posting_service:
-                posting_service.close()
-
     def _extract_twitter_credentials(self, account: PlatformAccount) -> tuple[str, str, str, str]:
         """
         Extract Twitter credentials from platform account auth_data.
@@ -728,33 +828,234 @@ class IntegratedPostingService:
 
         return access_token, app_id, app_secret
 
-    async def cross_post_image(
+    async def _get_platform_accounts(self, platform_account_ids: list[UUID]) -> list[PlatformAccount]:
+        """
+        Get several platform accounts with a single query.
+
+        Args:
+            platform_account_ids: Platform account UUIDs.
+
+        Returns:
+            PlatformAccount objects in the order of the IDs (duplicates removed).
+
+        Raises:
+            IntegratedPostingError: If an account is not found or not connected.
+        """
+        ids = list(dict.fromkeys(platform_account_ids))
+        result = await self.db.execute(select(PlatformAccount).where(PlatformAccount.id.in_(ids)))
+        by_id = {account.id: account for account in result.scalars().all()}
+
+        accounts = []
+        for account_id in ids:
+            account = by_id.get(account_id)
+            if not account:
+                raise IntegratedPostingError(f"Platform account {account_id} not found")
+            if not account.is_connected:
+                raise IntegratedPostingError(
+                    f"Platform account {account_id} is not connected (status: {account.connection_status})"
+                )
+            accounts.append(account)
+        return accounts
+
+    async def _prepare_derivatives(self, image_path: Path, platforms: set[str]) -> dict[str, Path]:
+        """
+        Create the platform-optimized copies of an image in parallel.
+
+        Args:
+            image_path: Source image.
+            platforms: Platforms that upload the image.
+
+        Returns:
+            Mapping of platform to the image to upload; the original is used
+            where optimization fails.
+        """
+        platforms = sorted(p for p in platforms if p in CROSS_POST_MEDIA_PLATFORMS)
+
+        async def optimize(platform: str) -> Path:
+            try:
+                path = await asyncio.to_thread(
+                    self.image_optimizer.optimize_for_platform,
+                    image_path=image_path,
+                    platform=CROSS_POST_MEDIA_PLATFORMS[platform],
+                )
+                logger.info(f"Optimized image for {platform}: {path}")
+                return path
+            except PlatformImageOptimizationError as exc:
+                logger.warning(f"Failed to optimize image for {platform}, using original: {exc}")
+                return image_path
+
+        paths = await asyncio.gather(*(optimize(platform) for platform in platforms))
+        return dict(zip(platforms, paths))
+
+    def _build_cross_post_upload(
+        self,
+        account: PlatformAccount,
+        image_path: Path,
+        caption: str,
+        hashtags: list[str] | None,
+        mentions: list[str] | None,
+        timeout_s: float | None,
+    ) -> tuple[str, str, Callable[[], Awaitable[dict[str, Any]]]]:
+        """
+        Prepare the upload for one cross-post target.
+
+        Args:
+            account: Target platform account.
+            image_path: Image to upload (platform derivative where available).
+            caption: Post caption.
+            hashtags: Hashtags (without #).
+            mentions: Usernames to mention (without @).
+            timeout_s: Per-attempt timeout override.
+
+        Returns:
+            Tuple of (post_type, caption stored on the post, async upload callable
+            returning platform_post_id and platform_post_url).
+
+        Raises:
+            IntegratedPostingError: If the platform is unsupported or credentials are missing.
+        """
+        platform = account.platform
+        hashtag_text = " ".join(f"#{tag}" for tag in hashtags) if hashtags else ""
+
+        if platform == "instagram":
+            if not INSTAGRAM_AVAILABLE:
+                raise IntegratedPostingError(
+                    "Instagram posting is not available. Install instagrapi to enable Instagram support."
+                )
+            credentials = InstagramCredentials(*self._extract_instagram_credentials(account))
+
+            async def upload() -> dict[str, Any]:
+                return await self._run_instagram(
+                    account,
+                    credentials,
+                    lambda service: service.post_image(
+                        image_path=image_path,
+                        caption=caption,
+                        hashtags=hashtags,
+                        mentions=mentions,
+                    ),
+                    timeout_s=timeout_s,
+                )
+
+            return "post", caption, upload
+
+        if platform == "twitter":
+            consumer_key, consumer_secret, access_token, access_token_secret = (
+                self._extract_twitter_credentials(account)
+            )
+            twitter_client = TwitterApiClient(
+                consumer_key=consumer_key,
+                consumer_secret=consumer_secret,
+                access_token=access_token,
+                access_token_secret=access_token_secret,
+            )
+
+            tweet_text = f"{caption} {hashtag_text}".strip() if hashtag_text else caption
+            # Note: Twitter API v2 requires media upload first, then attach media_ids
+            # For now, we'll post text-only. Media upload can be added later.
+            if len(tweet_text) > 280:
+                tweet_text = tweet_text[:277] + "..."
+
+            async def upload() -> dict[str, Any]:
+                result = await run_platform_call(
+                    "twitter", twitter_client.post_tweet, text=tweet_text, timeout_s=timeout_s
+                )
+                return {"platform_post_id": result.get("id"), "platform_post_url": None}
+
+            return "tweet", tweet_text, upload
+
+        if platform == "facebook":
+            access_token, app_id, app_secret = self._extract_facebook_credentials(account)
+            facebook_client = FacebookApiClient(
+                access_token=access_token,
+                app_id=app_id,
+                app_secret=app_secret,
+            )
+            post_message = f"{caption} {hashtag_text}".strip() if hashtag_text else caption
+
+            async def upload() -> dict[str, Any]:
+                result = await run_platform_call(
+                    "facebook",
+                    facebook_client.create_post,
+                    message=post_message,
+                    page_id=account.account_id,
+                    timeout_s=timeout_s,
+                )
+                return {"platform_post_id": result.get("id"), "platform_post_url": None}
+
+            return "post", post_message, upload
+
+        raise IntegratedPostingError(f"Cross-posting not yet supported for platform: {platform}")
+
+    async def _upload_with_retries(
+        self,
+        platform: str,
+        upload: Callable[[], Awaitable[dict[str, Any]]],
+        max_retries: int,
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Run an upload, retrying transient failures with exponential backoff.
+
+        Timeouts are not retried: the call may still complete on the platform,
+        and retrying could publish the post twice.
+
+        Args:
+            platform: Platform name (for logging).
+            upload: Async upload callable.
+            max_retries: Retries after the first attempt.
+
+        Returns:
+            Tuple of (upload result, number of attempts).
+
+        Raises:
+            CrossPostUploadError: If the upload fails, carrying the attempt count.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await upload(), attempt
+            except Exception as exc:
+                if attempt > max_retries or not _is_transient_error(exc):
+                    raise CrossPostUploadError(str(exc), attempt) from exc
+                delay = CROSS_POST_RETRY_BACKOFF_S * 2 ** (attempt - 1)
+                logger.warning(f"Cross-post to {platform} failed (attempt {attempt}), retrying in {delay:.1f}s: {exc}")
+                await asyncio.sleep(delay)
+
+    async def cross_post_image_detailed(
         self,
         content_id: UUID,
         platform_account_ids: list[UUID],
         caption: str = "",
         hashtags: list[str] | None = None,
         mentions: list[str] | None = None,
-    ) -> dict[str, Post]:
+        max_retries: int = CROSS_POST_MAX_RETRIES,
+        timeout_s: float | None = None,
+    ) -> CrossPostOutcome:
         """
-        Cross-post an image to multiple platforms simultaneously.
+        Cross-post an image to several platforms concurrently and report per-platform results.
 
-        Posts the same content to multiple platforms (Instagram, Twitter, Facebook)
-        using their respective platform accounts. Each platform is posted to independently,
-        and failures on one platform do not prevent posting to others.
+        Accounts are loaded with one query and the platform-optimized images are
+        prepared in parallel. A draft post is recorded for every target, then all
+        uploads run at the same time, each with its platform's timeout and its own
+        retries, so the total latency is that of the slowest platform rather than
+        the sum. A failure on one platform never affects the others.
 
         Args:
             content_id: Content UUID (must be image type and approved).
-            platform_account_ids: List of platform account UUIDs to post to.
+            platform_account_ids: Platform account UUIDs to post to.
             caption: Post caption/text content.
             hashtags: List of hashtags (without #).
             mentions: List of usernames to mention (without @).
+            max_retries: Retries per platform for transient errors (rate limits, 5xx, refused connections).
+            timeout_s: Per-attempt timeout overriding the platform defaults.
 
         Returns:
-            Dictionary mapping platform names to Post objects (successful posts only).
+            CrossPostOutcome with the published posts and the errors, keyed by platform
+            (or "platform:account_id" when several accounts share a platform).
 
         Raises:
-            IntegratedPostingError: If content validation fails or no valid platform accounts provided.
+            IntegratedPostingError: If content or account validation fails.
         """
         # Get content
         content = await self._get_content(content_id)
@@ -770,11 +1071,7 @@ class IntegratedPostingService:
         if not image_path.exists():
             raise IntegratedPostingError(f"Content file not found: {image_path}")
 
-        # Get all platform accounts
-        accounts = []
-        for account_id in platform_account_ids:
-            account = await self._get_platform_account(account_id)
-            accounts.append(account)
+        accounts = await self._get_platform_accounts(platform_account_ids)
 
         # Verify all accounts belong to same character
         character_id = accounts[0].character_id
@@ -785,160 +1082,133 @@ class IntegratedPostingService:
         if content.character_id != character_id:
             raise IntegratedPostingError("Content must belong to the same character as platform accounts")
 
-        # Post to each platform
-        results: dict[str, Post] = {}
-        errors: dict[str, str] = {}
+        platform_counts: dict[str, int] = {}
+        for account in accounts:
+            platform_counts[account.platform] = platform_counts.get(account.platform, 0) + 1
+
+        def result_key(account: PlatformAccount) -> str:
+            if platform_counts[account.platform] > 1:
+                return f"{account.platform}:{account.id}"
+            return account.platform
+
+        outcome = CrossPostOutcome()
+        derivatives = await self._prepare_derivatives(image_path, set(platform_counts))
 
+        # Record a draft post per target before uploading (the session is not shared across uploads)
+        targets: list[tuple[str, PlatformAccount, Post, Callable[[], Awaitable[dict[str, Any]]]]] = []
         for account in accounts:
-            platform = account.platform
+            key = result_key(account)
             try:
-                if platform == "instagram":
-                    post = await self.post_image_to_instagram(
-                        content_id=content_id,
-                        platform_account_id=account.id,
-                        caption=caption,
-                        hashtags=hashtags,
-                        mentions=mentions,
-                    )
-                    results[platform] = post
-                    logger.info(f"Successfully cross-posted to Instagram: post {post.id}")
-
-                elif platform == "twitter":
-                    # Extract Twitter credentials
-                    consumer_key, consumer_secret, access_token, access_token_secret = (
-                        self._extract_twitter_credentials(account)
-                    )
-
-                    # Create Twitter client
-                    twitter_client = TwitterApiClient(
-                        consumer_key=consumer_key,
-                        consumer_secret=consumer_secret,
-                        access_token=access_token,
-                        access_token_secret=access_token_secret,
-                    )
-
-                    # Build tweet text from caption and hashtags
-                    tweet_text = caption
-                    if hashtags:
-                        hashtag_text = " ".join([f"#{tag}" for tag in hashtags])
-                        if tweet_text:
-                            tweet_text = f"{tweet_text} {hashtag_text}"
-                        else:
-                            tweet_text = hashtag_text
-
-                    # Note: Twitter API v2 requires media upload first, then attach media_ids
-                    # For now, we'll post text-only. Media upload can be added later.
-                    if len(tweet_text) > 280:
-                        tweet_text = tweet_text[:277] + "..."
-
-                    # Post tweet
-                    tweet_result = twitter_client.post_tweet(text=tweet_text)
-
-                    # Create post record
-                    post = await self.post_service.create_post(
-                        character_id=character_id,
-                        platform_account_id=account.id,
-                        platform="twitter",
-                        post_type="tweet",
-                        content_id=content_id,
-                        caption=tweet_text,
-                        hashtags=hashtags,
-                        mentions=mentions,
-                        status="published",
-                    )
-
-                    # Update post with platform response
-                    post.platform_post_id = tweet_result.get("id")
-                    post.published_at = post.updated_at
-
-                    # Update content usage
-                    content.times_used += 1
-                    content.last_used_at = post.published_at
-
-                    await self.db.commit()
-                    await self.db.refresh(post)
-
-                    results[platform] = post
-                    logger.info(f"Successfully cross-posted to Twitter: post {post.id}")
-
-                elif platform == "facebook":
-                    # Extract Facebook credentials
-                    access_token, app_id, app_secret = self._extract_facebook_credentials(account)
-
-                    # Create Facebook client
-                    facebook_client = FacebookApiClient(
-                        access_token=access_token,
-                        app_id=app_id,
-                        app_secret=app_secret,
-                    )
-
-                    # Build post message from caption and hashtags
-                    post_message = caption
-                    if hashtags:
-                        hashtag_text = " ".join([f"#{tag}" for tag in hashtags])
-                        if post_message:
-                            post_message = f"{post_message} {hashtag_text}"
-                        else:
-                            post_message = hashtag_text
-
-                    # Get page_id from account if available
-                    page_id = account.account_id
-
-                    # Post to Facebook
-                    post_result = facebook_client.create_post(
-                        message=post_message,
-                        page_id=page_id,
-                    )
-
-                    # Create post record
-                    post = await self.post_service.create_post(
-                        character_id=character_id,
-                        platform_account_id=account.id,
-                        platform="facebook",
-                        post_type="post",
-                        content_id=content_id,
-                        caption=post_message,
-                        hashtags=hashtags,
-                        mentions=mentions,
-                        status="published",
-                    )
-
-                    # Update post with platform response
-                    post.platform_post_id = post_result.get("id")
-                    post.published_at = post.updated_at
+                post_type, post_caption, upload = self._build_cross_post_upload(
+                    account,
+                    derivatives.get(account.platform, image_path),
+                    caption,
+                    hashtags,
+                    mentions,
+                    timeout_s,
+                )
+            except IntegratedPostingError as exc:
+                outcome.errors[key] = str(exc)
+                logger.warning(f"Cannot cross-post to {key}: {exc}")
+                continue
+            post = await self.post_service.create_post(
+                character_id=character_id,
+                platform_account_id=account.id,
+                platform=account.platform,
+                post_type=post_type,
+                content_id=content_id,
+                caption=post_caption,
+                hashtags=hashtags,
+                mentions=mentions,
+                status="draft",
+            )
+            targets.append((key, account, post, upload))
+        await self.db.commit()
 
-                    # Update content usage
-                    content.times_used += 1
-                    content.last_used_at = post.published_at
+        uploads = await asyncio.gather(
+            *(self._upload_with_retries(account.platform, upload, max_retries) for _, account, _, upload in targets),
+            return_exceptions=True,
+        )
 
-                    await self.db.commit()
-                    await self.db.refresh(post)
+        for (key, account, post, _), result in zip(targets, uploads):
+            if isinstance(result, BaseException):
+                attempts = result.attempts if isinstance(result, CrossPostUploadError) else 1
+                post.status = "failed"
+                post.error_message = str(result)
+                post.retry_count += attempts - 1
+                outcome.errors[key] = str(result)
+                outcome.attempts[key] = attempts
+                logger.error(f"Failed to cross-post to {key}: {result}")
+                continue
+
+            response, attempts = result
+            post.platform_post_id = response.get("platform_post_id")
+            post.platform_post_url = response.get("platform_post_url")
+            post.status = "published"
+            post.published_at = datetime.now(timezone.utc)
+            post.retry_count += attempts - 1
 
-                    results[platform] = post
-                    logger.info(f"Successfully cross-posted to Facebook: post {post.id}")
+            # Update content usage
+            content.times_used += 1
+            content.last_used_at = post.published_at
 
-                else:
-                    errors[platform] = f"Cross-posting not yet supported for platform: {platform}"
-                    logger.warning(f"Cross-posting not supported for platform: {platform}")
+            outcome.posts[key] = post
+            outcome.attempts[key] = attempts
+            logger.info(f"Successfully cross-posted to {key}: post {post.id}")
 
-            except Exception as exc:
-                error_msg = str(exc)
-                errors[platform] = error_msg
-                logger.error(f"Failed to cross-post to {platform}: {exc}", exc_info=True)
+        await self.db.commit()
+        for post in outcome.posts.values():
+            await self.db.refresh(post)
+        await self._refresh_rollups(list(outcome.posts.values()))
 
         # Log summary
-        if results:
-            logger.info(
-                f"Cross-posting completed: {len(results)} successful, {len(errors)} failed. "
-                f"Platforms: {', '.join(results.keys())}"
-            )
-        if errors:
-            logger.warning(f"Cross-posting errors: {errors}")
+        logger.info(
+            f"Cross-posting completed: {len(outcome.posts)} successful, {len(outcome.errors)} failed. "
+            f"Platforms: {', '.join(outcome.posts.keys())}"
+        )
+        if outcome.errors:
+            logger.warning(f"Cross-posting errors: {outcome.errors}")
 
-        if not results:
-            raise IntegratedPostingError(
-                f"Cross-posting failed for all platforms. Errors: {errors}"
-            )
+        return outcome
 
-        return results
+    async def cross_post_image(
+        self,
+        content_id: UUID,
+        platform_account_ids: list[UUID],
+        caption: str = "",
+        hashtags: list[str] | None = None,
+        mentions: list[str] | None = None,
+    ) -> dict[str, Post]:
+        """
+        Cross-post an image to multiple platforms simultaneously.
+
+        Posts the same content to multiple platforms (Instagram, Twitter, Facebook)
+        using their respective platform accounts. The uploads run concurrently and
+        failures on one platform do not prevent posting to others; see
+        ``cross_post_image_detailed`` for the per-platform errors.
+
+        Args:
+            content_id: Content UUID (must be image type and approved).
+            platform_account_ids: List of platform account UUIDs to post to.
+            caption: Post caption/text content.
+            hashtags: List of hashtags (without #).
+            mentions: List of usernames to mention (without @).
 
+        Returns:
+            Dictionary mapping platform names to Post objects (successful posts only).
+
+        Raises:
+            IntegratedPostingError: If content validation fails or posting fails on every platform.
+        """
+        outcome = await self.cross_post_image_detailed(
+            content_id=content_id,
+            platform_account_ids=platform_account_ids,
+            caption=caption,
+            hashtags=hashtags,
+            mentions=mentions,
+        )
+        if not outcome.posts:
+            raise IntegratedPostingError(
+                f"Cross-posting failed for all platforms. Errors: {outcome.errors}"
+            )
+        return outcome.posts
@@ -1,12 +1,16 @@
 """Job history persistence service.
 
 This module provides file-based persistence for pipeline job history.
-Each job is stored as a JSON file with complete execution details.
+Each job is stored as a JSON file with complete execution details, and a
+SQLite index (jobs/index.sqlite3) keyed by created_at/status/preset_id serves
+filtered, paginated listings without opening the individual job files.
 """
 
 from __future__ import annotations
 
 import json
+import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -19,17 +23,90 @@ from app.services.job_logger import redact_secrets
 logger = get_logger(__name__)
 
 
+_INDEX_SCHEMA_VERSION = 1
+
+
 class JobHistoryStore:
-    """File-based job history storage."""
+    """File-based job history storage with a SQLite listing index."""
 
     def __init__(self, jobs_dir: Path | None = None) -> None:
         """Initialize job history store.
         
+        Opens (or creates) the listing index. When the index is new or its schema
+        version changed, it is rebuilt once from the existing job files.
+        
         Args:
             jobs_dir: Base directory for job history (defaults to data_dir() / "jobs")
         """
         self.jobs_dir = jobs_dir or (data_dir() / "jobs")
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self._index_lock = threading.Lock()
+        self._index = sqlite3.connect(str(self.jobs_dir / "index.sqlite3"), check_same_thread=False)
+        self._index.execute("PRAGMA journal_mode=WAL")
+        self._index.execute("PRAGMA synchronous=NORMAL")
+        self._init_index()
+
+    def _init_index(self) -> None:
+        """Create index tables and rebuild from job files if the index is stale."""
+        with self._index_lock, self._index:
+            version = self._index.execute("PRAGMA user_version").fetchone()[0]
+            if version != _INDEX_SCHEMA_VERSION:
+                self._index.execute("DROP TABLE IF EXISTS jobs")
+            self._index.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    created_at REAL NOT NULL,
+                    status TEXT NOT NULL,
+                    preset_id TEXT NOT NULL,
+                    user_id TEXT,
+                    record TEXT NOT NULL
+                )
+                """
+            )
+            self._index.execute("CREATE INDEX IF NOT EXISTS ix_jobs_created ON jobs (created_at DESC)")
+            self._index.execute("CREATE INDEX IF NOT EXISTS ix_jobs_status_created ON jobs (status, created_at DESC)")
+            self._index.execute("CREATE INDEX IF NOT EXISTS ix_jobs_preset_created ON jobs (preset_id, created_at DESC)")
+            needs_rebuild = version != _INDEX_SCHEMA_VERSION
+            self._index.execute(f"PRAGMA user_version = {_INDEX_SCHEMA_VERSION}")
+        if needs_rebuild:
+            self.rebuild_index()
+
+    def rebuild_index(self) -> int:
+        """Rebuild the listing index by scanning all job files.
+        
+        Returns:
+            Number of jobs indexed
+        """
+        rows = []
+        for job_file in self.jobs_dir.glob("*.json"):
+            if job_file.name == "metadata.json":
+                continue
+            try:
+                with open(job_file, "r") as f:
+                    job_data = json.load(f)
+                rows.append(self._index_row(JobHistory(**job_data), job_data))
+            except Exception as e:
+                logger.warning(f"Failed to index job from {job_file}: {e}")
+        with self._index_lock, self._index:
+            self._index.execute("DELETE FROM jobs")
+            self._index.executemany(
+                "INSERT OR REPLACE INTO jobs (job_id, created_at, status, preset_id, user_id, record) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        logger.info(f"Rebuilt job history index: {len(rows)} jobs")
+        return len(rows)
+
+    @staticmethod
+    def _index_row(job: JobHistory, job_data: dict[str, Any]) -> tuple[Any, ...]:
+        return (
+            job.job_id,
+            job.created_at.timestamp(),
+            job.status,
+            job.preset_id,
+            job.user_id,
+            json.dumps(job_data, default=str),
+        )
 
     def save_job(self, job: JobHistory) -> None:
         """Save job history to file.
@@ -49,6 +126,13 @@ class JobHistoryStore:
         with open(job_file, "w") as f:
             json.dump(job_data, f, indent=2, default=str)
 
+        # Keep listing index in sync (single-row upsert)
+        with self._index_lock, self._index:
+            self._index.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, created_at, status, preset_id, user_id, record) VALUES (?, ?, ?, ?, ?, ?)",
+                self._index_row(job, job_data),
+            )
+
         logger.debug(f"Saved job history: {job_file}")
 
     def get_job(self, job_id: str) -> JobHistory | None:
@@ -134,37 +218,58 @@ class JobHistoryStore:
         limit: int = 100,
         status: str | None = None,
         preset_id: str | None = None,
+        offset: int = 0,
+        user_id: str | None = None,
     ) -> list[JobHistory]:
         """List recent jobs with optional filtering.
         
+        Served entirely from the listing index; job files are not read.
+        
         Args:
             limit: Maximum number of jobs to return
             status: Optional status filter
             preset_id: Optional preset ID filter
+            offset: Number of matching jobs to skip (for pagination)
+            user_id: Optional user ID filter
             
         Returns:
             List of JobHistory instances, sorted by created_at descending
         """
-        jobs: list[JobHistory] = []
-
-        # Scan job files
-        for job_file in self.jobs_dir.glob("*.json"):
-            if job_file.name == "metadata.json":
-                continue
+        where, args = self._filters(status=status, preset_id=preset_id, user_id=user_id)
+        query = f"SELECT job_id, record FROM jobs{where} ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        with self._index_lock:
+            rows = self._index.execute(query, (*args, max(0, limit), max(0, offset))).fetchall()
 
+        jobs: list[JobHistory] = []
+        for job_id, record in rows:
             try:
-                job = self.get_job(job_file.stem)
-                if job:
-                    # Apply filters
-                    if status and job.status != status:
-                        continue
-                    if preset_id and job.preset_id != preset_id:
-                        continue
-                    jobs.append(job)
+                jobs.append(JobHistory(**json.loads(record)))
             except Exception as e:
-                logger.warning(f"Failed to load job from {job_file}: {e}")
+                logger.warning(f"Failed to load indexed job {job_id}: {e}")
+        return jobs
 
-        # Sort by created_at descending
-        jobs.sort(key=lambda j: j.created_at, reverse=True)
+    def count_jobs(
+        self,
+        status: str | None = None,
+        preset_id: str | None = None,
+        user_id: str | None = None,
+    ) -> int:
+        """Count jobs matching the given filters (from the listing index).
+        
+        Args:
+            status: Optional status filter
+            preset_id: Optional preset ID filter
+            user_id: Optional user ID filter
+            
+        Returns:
+            Number of matching jobs
+        """
+        where, args = self._filters(status=status, preset_id=preset_id, user_id=user_id)
+        with self._index_lock:
+            return int(self._index.execute(f"SELECT COUNT(*) FROM jobs{where}", args).fetchone()[0])
 
-        return jobs[:limit]
+    @staticmethod
+    def _filters(**filters: str | None) -> tuple[str, tuple[Any, ...]]:
+        clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        args = tuple(value for value in filters.values() if value is not None)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
@@ -2,14 +2,24 @@
 
 This module provides structured logging for pipeline jobs with automatic
 secret redaction to prevent sensitive information from being stored.
+
+Events are appended to ``<jobs_dir>/<job_id>/logs.jsonl`` by a background
+writer thread. The request thread only redacts, serializes and enqueues the
+line; the writer batches lines per job and keeps recently used file handles
+open, so a chatty job does not cost an open/close per event.
 """
 
 from __future__ import annotations
 
+import collections
 import json
+import re
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from app.core.paths import data_dir
 from app.core.logging import get_logger
@@ -29,6 +39,15 @@ SECRET_PATTERNS = [
     "bearer",
 ]
 
+# Compiled once at import; keys are matched case-insensitively as substrings
+_SECRET_KEY_RE = re.compile("|".join(re.escape(pattern) for pattern in SECRET_PATTERNS), re.IGNORECASE)
+_SECRET_VALUE_RE = re.compile("key|token|secret", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _is_secret_key(key: str) -> bool:
+    return _SECRET_KEY_RE.search(key) is not None
+
 
 def redact_secrets(data: dict[str, Any] | list[Any] | Any) -> dict[str, Any] | list[Any] | Any:
     """Recursively redact secrets from data structure.
@@ -43,17 +62,13 @@ def redact_secrets(data: dict[str, Any] | list[Any] | Any) -> dict[str, Any] | l
         redacted: dict[str, Any] = {}
         for key, value in data.items():
             # Check if key matches secret pattern
-            key_lower = str(key).lower()
-            if any(pattern.lower() in key_lower for pattern in SECRET_PATTERNS):
+            if _is_secret_key(str(key)):
                 redacted[key] = "***REDACTED***"
             elif isinstance(value, (dict, list)):
                 redacted[key] = redact_secrets(value)
-            elif isinstance(value, str) and any(pattern.lower() in value.lower() for pattern in ["key", "token", "secret"]):
+            elif isinstance(value, str) and len(value) > 10 and _SECRET_VALUE_RE.search(value):
                 # Redact if value looks like a secret (contains key/token/secret and is long)
-                if len(value) > 10:
-                    redacted[key] = "***REDACTED***"
-                else:
-                    redacted[key] = value
+                redacted[key] = "***REDACTED***"
             else:
                 redacted[key] = value
         return redacted
@@ -63,6 +78,181 @@ def redact_secrets(data: dict[str, Any] | list[Any] | Any) -> dict[str, Any] | l
         return data
 
 
+class JobLogWriter:
+    """Background writer that appends buffered lines to per-job log files.
+
+    Lines are written when ``flush_bytes`` are pending, when the oldest pending
+    line is ``flush_interval_s`` old, or when ``flush()`` is called. At most
+    ``max_open_files`` job log files are kept open (least recently used are closed).
+    """
+
+    def __init__(
+        self,
+        jobs_dir: Path,
+        *,
+        flush_interval_s: float = 0.5,
+        flush_bytes: int = 64 * 1024,
+        max_open_files: int = 64,
+    ) -> None:
+        """
+        Initialize writer (the thread starts on the first write).
+
+        Args:
+            jobs_dir: Base directory containing one subdirectory per job.
+            flush_interval_s: Maximum time a line stays buffered.
+            flush_bytes: Pending size that triggers an immediate write.
+            max_open_files: Number of job log file handles kept open.
+        """
+        self.jobs_dir = jobs_dir
+        self._flush_interval_s = max(0.0, float(flush_interval_s))
+        self._flush_bytes = max(1, int(flush_bytes))
+        self._max_open_files = max(1, int(max_open_files))
+        self._cv = threading.Condition(threading.Lock())
+        self._pending: list[tuple[str, str]] = []
+        self._pending_bytes = 0
+        self._oldest_pending: float | None = None
+        self._enqueued = 0
+        self._written = 0
+        self._flush_requested = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        # Only touched by the writer thread
+        self._handles: collections.OrderedDict[str, IO[str]] = collections.OrderedDict()
+
+    def write(self, job_id: str, line: str) -> None:
+        """
+        Enqueue a line for a job's log file.
+
+        Args:
+            job_id: Job identifier.
+            line: Serialized log line including the trailing newline.
+        """
+        with self._cv:
+            if self._closed:
+                # Late events after shutdown are written synchronously
+                self._write_batch([(job_id, line)])
+                self._close_handles()
+                return
+            self._pending.append((job_id, line))
+            self._pending_bytes += len(line)
+            self._enqueued += 1
+            if self._oldest_pending is None:
+                self._oldest_pending = time.monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="job-log-writer", daemon=True)
+                self._thread.start()
+            if self._pending_bytes >= self._flush_bytes:
+                self._cv.notify_all()
+
+    def flush(self, timeout_s: float | None = 5.0) -> bool:
+        """
+        Block until every line enqueued so far is written.
+
+        Args:
+            timeout_s: Maximum time to wait, None waits indefinitely.
+
+        Returns:
+            True if all lines were written before the timeout.
+        """
+        with self._cv:
+            target = self._enqueued
+            if self._written >= target:
+                return True
+            self._flush_requested = True
+            self._cv.notify_all()
+            return self._cv.wait_for(lambda: self._written >= target, timeout=timeout_s)
+
+    def close(self, timeout_s: float | None = 5.0) -> None:
+        """
+        Write pending lines, stop the writer thread and close file handles.
+
+        Args:
+            timeout_s: Maximum time to wait for the writer thread.
+        """
+        with self._cv:
+            self._closed = True
+            self._cv.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout_s)
+        with self._cv:
+            self._thread = None
+
+    def _due(self) -> bool:
+        if self._closed or self._flush_requested or self._pending_bytes >= self._flush_bytes:
+            return True
+        return (
+            self._oldest_pending is not None
+            and time.monotonic() - self._oldest_pending >= self._flush_interval_s
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                while self._pending or not self._closed:
+                    if self._pending and self._due():
+                        break
+                    if self._oldest_pending is None:
+                        self._cv.wait()
+                    else:
+                        remaining = self._oldest_pending + self._flush_interval_s - time.monotonic()
+                        self._cv.wait(timeout=max(0.0, remaining))
+                batch = self._pending
+                self._pending = []
+                self._pending_bytes = 0
+                self._oldest_pending = None
+                self._flush_requested = False
+                closing = self._closed and not batch
+            if closing:
+                self._close_handles()
+                return
+            self._write_batch(batch)
+            with self._cv:
+                self._written += len(batch)
+                self._cv.notify_all()
+
+    def _write_batch(self, batch: list[tuple[str, str]]) -> None:
+        by_job: dict[str, list[str]] = {}
+        for job_id, line in batch:
+            by_job.setdefault(job_id, []).append(line)
+        for job_id, lines in by_job.items():
+            try:
+                fh = self._handle(job_id)
+                fh.write("".join(lines))
+                fh.flush()
+            except OSError as exc:
+                logger.error(f"Failed to write job log for {job_id}: {exc}")
+                stale = self._handles.pop(job_id, None)
+                if stale is not None:
+                    stale.close()
+
+    def _handle(self, job_id: str) -> IO[str]:
+        fh = self._handles.get(job_id)
+        if fh is not None:
+            self._handles.move_to_end(job_id)
+            return fh
+        job_log_dir = self.jobs_dir / job_id
+        job_log_dir.mkdir(parents=True, exist_ok=True)
+        fh = (job_log_dir / "logs.jsonl").open("a", encoding="utf-8")
+        self._handles[job_id] = fh
+        while len(self._handles) > self._max_open_files:
+            _, evicted = self._handles.popitem(last=False)
+            evicted.close()
+        return fh
+
+    def _close_handles(self) -> None:
+        while self._handles:
+            _, fh = self._handles.popitem(last=False)
+            try:
+                fh.close()
+            except OSError:
+                pass
+
+
+_writers: list[JobLogWriter] = []
+_writers_lock = threading.Lock()
+
+
 class JobLogger:
     """Logger for pipeline jobs with secret redaction."""
 
@@ -74,6 +264,9 @@ class JobLogger:
         """
         self.jobs_dir = jobs_dir or (data_dir() / "jobs")
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self._writer = JobLogWriter(self.jobs_dir)
+        with _writers_lock:
+            _writers.append(self._writer)
 
     def log_job_event(
         self,
@@ -84,16 +277,15 @@ class JobLogger:
     ) -> None:
         """Log job event with secret redaction.
         
+        The event is buffered and written by a background thread; call
+        ``flush()`` before reading the job's log file.
+        
         Args:
             job_id: Job identifier
             level: Log level ("info", "warning", "error")
             message: Log message
             metadata: Optional metadata (will be redacted)
         """
-        # Create job log directory
-        job_log_dir = self.jobs_dir / job_id
-        job_log_dir.mkdir(parents=True, exist_ok=True)
-
         # Redact secrets from metadata
         redacted_metadata = redact_secrets(metadata) if metadata else None
 
@@ -106,11 +298,36 @@ class JobLogger:
         if redacted_metadata:
             log_entry["metadata"] = redacted_metadata
 
-        # Append to JSONL file
-        log_file = job_log_dir / "logs.jsonl"
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        # Append to JSONL file (buffered)
+        self._writer.write(job_id, json.dumps(log_entry) + "\n")
 
         # Also log to application logger
         log_func = getattr(logger, level, logger.info)
         log_func(f"[Job {job_id}] {message}", extra={"job_id": job_id, "metadata": redacted_metadata})
+
+    def flush(self, timeout_s: float | None = 5.0) -> bool:
+        """Write all buffered events to disk.
+        
+        Args:
+            timeout_s: Maximum time to wait, None waits indefinitely
+            
+        Returns:
+            True if all buffered events were written
+        """
+        return self._writer.flush(timeout_s)
+
+    def close(self) -> None:
+        """Write buffered events and stop the background writer."""
+        self._writer.close()
+        with _writers_lock:
+            if self._writer in _writers:
+                _writers.remove(self._writer)
+
+
+def close_job_loggers() -> None:
+    """Flush and stop every job log writer (called on application shutdown)."""
+    with _writers_lock:
+        writers = list(_writers)
+        _writers.clear()
+    for writer in writers:
+        writer.close()
@@ -0,0 +1,315 @@
+"""Bounded worker pool with priority lanes and a persistent queue for background jobs."""
+
+from __future__ import annotations
+
+import collections
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Literal
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+JobLane = Literal["interactive", "batch"]
+
+LANES: tuple[JobLane, ...] = ("interactive", "batch")
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a job is submitted while the scheduler queue is at its depth limit.
+
+    Attributes:
+        depth: Number of jobs currently waiting in the queue.
+        max_depth: Configured maximum queue depth.
+    """
+
+    def __init__(self, depth: int, max_depth: int) -> None:
+        super().__init__(f"Job queue is full ({depth}/{max_depth} jobs waiting)")
+        self.depth = depth
+        self.max_depth = max_depth
+
+
+class JobScheduler:
+    """Runs queued jobs on a fixed number of worker threads.
+
+    Jobs are identified by ID and placed in one of two lanes. Workers prefer the
+    interactive lane, but after ``interactive_burst`` consecutive interactive jobs
+    a waiting batch job is taken so batch work is never starved. The lane contents
+    are written to ``state_path`` on every change so pending jobs survive a restart.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        runner: Callable[[str], None],
+        state_path: Path,
+        workers: int = 2,
+        max_depth: int = 100,
+        interactive_burst: int = 4,
+    ) -> None:
+        """
+        Initialize scheduler (workers are not started until start() is called).
+
+        Args:
+            name: Scheduler name used for worker thread names and logging.
+            runner: Callable executed on a worker thread with the job ID.
+            state_path: JSON file used to persist queued job IDs per lane.
+            workers: Number of worker threads (minimum 1).
+            max_depth: Maximum number of waiting jobs before submit() rejects.
+            interactive_burst: Interactive jobs taken in a row before a batch job is served.
+        """
+        self._name = name
+        self._runner = runner
+        self._state_path = state_path
+        self._workers = max(1, int(workers))
+        self._max_depth = max(1, int(max_depth))
+        self._interactive_burst = max(1, int(interactive_burst))
+
+        self._lock = threading.Lock()
+        self._cv = threading.Condition(self._lock)
+        self._lanes: dict[JobLane, collections.deque[str]] = {lane: collections.deque() for lane in LANES}
+        self._active: set[str] = set()
+        self._interactive_streak = 0
+        self._threads: list[threading.Thread] = []
+        self._stopping = False
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start worker threads (idempotent)."""
+        with self._cv:
+            if self._threads:
+                return
+            self._stopping = False
+            for idx in range(self._workers):
+                t = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"{self._name}-worker-{idx}",
+                    daemon=True,
+                )
+                self._threads.append(t)
+                t.start()
+
+    def shutdown(self, timeout_s: float = 5.0) -> None:
+        """
+        Stop accepting work and wait for idle workers to exit.
+
+        Queued jobs stay in the persisted state file and are restored on next start.
+
+        Args:
+            timeout_s: Maximum time to wait for each worker thread.
+        """
+        with self._cv:
+            self._stopping = True
+            self._cv.notify_all()
+            threads = list(self._threads)
+            self._threads = []
+        for t in threads:
+            t.join(timeout=timeout_s)
+
+    # ------------------------------------------------------------------
+    # Queue operations
+    # ------------------------------------------------------------------
+
+    def submit(self, job_id: str, *, lane: JobLane = "interactive", force: bool = False, front: bool = False) -> int:
+        """
+        Add a job to a lane.
+
+        Args:
+            job_id: Job ID passed to the runner.
+            lane: Lane to enqueue into ("interactive" or "batch").
+            force: If True, bypass the depth limit (used when restoring after restart).
+            front: If True, place the job at the head of its lane.
+
+        Returns:
+            1-based queue position across both lanes.
+
+        Raises:
+            QueueFullError: If the queue is at its depth limit and force is False.
+            ValueError: If lane is unknown.
+        """
+        if lane not in self._lanes:
+            raise ValueError(f"Unknown job lane: {lane}")
+        with self._cv:
+            if self._contains(job_id):
+                return self._position(job_id) or 0
+            depth = self._depth()
+            if not force and depth >= self._max_depth:
+                raise QueueFullError(depth, self._max_depth)
+            if front:
+                self._lanes[lane].appendleft(job_id)
+            else:
+                self._lanes[lane].append(job_id)
+            self._persist()
+            self._cv.notify()
+            return self._position(job_id) or 0
+
+    def remove(self, job_id: str) -> bool:
+        """
+        Remove a waiting job from the queue.
+
+        Args:
+            job_id: Job ID to remove.
+
+        Returns:
+            True if the job was waiting and has been removed, False otherwise.
+        """
+        with self._cv:
+            for q in self._lanes.values():
+                if job_id in q:
+                    q.remove(job_id)
+                    self._persist()
+                    return True
+            return False
+
+    def clear(self) -> int:
+        """
+        Drop all waiting jobs.
+
+        Returns:
+            Number of jobs removed.
+        """
+        with self._cv:
+            removed = self._depth()
+            for q in self._lanes.values():
+                q.clear()
+            self._persist()
+            return removed
+
+    def position(self, job_id: str) -> int | None:
+        """
+        Get the 1-based position of a waiting job in dispatch order.
+
+        Args:
+            job_id: Job ID to look up.
+
+        Returns:
+            Queue position, or None if the job is not waiting.
+        """
+        with self._cv:
+            return self._position(job_id)
+
+    def load_persisted(self) -> dict[JobLane, list[str]]:
+        """
+        Read the persisted lane contents from disk.
+
+        Returns:
+            Mapping of lane name to queued job IDs (empty lanes if file missing or invalid).
+        """
+        result: dict[JobLane, list[str]] = {lane: [] for lane in LANES}
+        path = self._state_path
+        if not path.exists():
+            return result
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return result
+        if not isinstance(raw, dict):
+            return result
+        for lane in LANES:
+            ids = raw.get(lane)
+            if isinstance(ids, list):
+                result[lane] = [i for i in ids if isinstance(i, str)]
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            dict with per-lane depth, active job count, worker count and depth limit.
+        """
+        with self._cv:
+            return {
+                "workers": self._workers,
+                "max_depth": self._max_depth,
+                "depth": self._depth(),
+                "lanes": {lane: len(q) for lane, q in self._lanes.items()},
+                "active": len(self._active),
+                "running": bool(self._threads),
+            }
+
+    # ------------------------------------------------------------------
+    # Internals (callers hold self._cv)
+    # ------------------------------------------------------------------
+
+    def _depth(self) -> int:
+        return sum(len(q) for q in self._lanes.values())
+
+    def _contains(self, job_id: str) -> bool:
+        return any(job_id in q for q in self._lanes.values())
+
+    def _dispatch_order(self) -> list[str]:
+        """Simulate _next_job() without mutating state to compute queue positions."""
+        interactive = list(self._lanes["interactive"])
+        batch = list(self._lanes["batch"])
+        streak = self._interactive_streak
+        order: list[str] = []
+        while interactive or batch:
+            if interactive and (not batch or streak < self._interactive_burst):
+                order.append(interactive.pop(0))
+                streak += 1
+            else:
+                order.append(batch.pop(0))
+                streak = 0
+        return order
+
+    def _position(self, job_id: str) -> int | None:
+        if not self._contains(job_id):
+            return None
+        return self._dispatch_order().index(job_id) + 1
+
+    def _next_job(self) -> str | None:
+        interactive = self._lanes["interactive"]
+        batch = self._lanes["batch"]
+        if interactive and (not batch or self._interactive_streak < self._interactive_burst):
+            self._interactive_streak += 1
+            return interactive.popleft()
+        if batch:
+            self._interactive_streak = 0
+            return batch.popleft()
+        return None
+
+    def _persist(self) -> None:
+        """Write lane contents to disk (atomic tmp file + replace)."""
+        path = self._state_path
+        tmp = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({lane: list(q) for lane, q in self._lanes.items()}), encoding="utf-8")
+            tmp.replace(path)
+        except OSError as exc:
+            logger.warning(f"Failed to persist {self._name} queue: {exc}")
+
+    def _worker_loop(self) -> None:
+        """
+        Background worker thread loop.
+
+        Takes the next job according to lane priority and runs it. Runner exceptions
+        are logged and never stop the worker.
+        """
+        while True:
+            with self._cv:
+                job_id = None
+                while not self._stopping:
+                    job_id = self._next_job()
+                    if job_id is not None:
+                        break
+                    self._cv.wait(timeout=1.0)
+                if job_id is None:
+                    return
+                self._active.add(job_id)
+                self._persist()
+
+            try:
+                self._runner(job_id)
+            except Exception as exc:  # noqa: BLE001
+                logger.error(f"{self._name} job {job_id} crashed: {exc}")
+            finally:
+                with self._cv:
+                    self._active.discard(job_id)
@@ -0,0 +1,280 @@
+"""Append-only journal for background job state shared by the job services.
+
+Each state change is appended to a JSONL journal as a single delta line instead
+of rewriting every job on each update. The journal is periodically compacted in
+a background thread into a snapshot file, so startup replay stays short.
+
+Files for a journal at ``jobs.jsonl``:
+    jobs.jsonl              live journal receiving appends
+    jobs.jsonl.compacting   journal segment being folded into the snapshot
+    jobs.snapshot.jsonl     compacted state (one "put" line per job)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import IO, Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class JobStore:
+    """Thread-safe append-only job journal with background compaction.
+
+    Operations are recorded as JSON lines:
+        {"op": "put", "id": ..., "job": {...}}            full job record
+        {"op": "patch", "id": ..., "fields": {...}, "params": {...}}
+        {"op": "delete", "id": ...}
+        {"op": "clear"}
+
+    ``fields`` replace top-level job attributes; ``params`` is merged into the
+    job's ``params`` dict. Replaying a segment twice yields the same state, which
+    keeps compaction crash-safe.
+    """
+
+    def __init__(self, path: Path, *, max_jobs: int | None = None, compact_threshold: int = 2000) -> None:
+        """
+        Initialize job store (files are created lazily on first write).
+
+        Args:
+            path: Journal file path (e.g. .ainfluencer/content/jobs.jsonl).
+            max_jobs: Keep only the newest N jobs (by created_at) when compacting, None keeps all.
+            compact_threshold: Number of appended lines that triggers background compaction.
+        """
+        self._path = path
+        self._segment_path = path.with_name(path.name + ".compacting")
+        self._snapshot_path = path.with_name(f"{path.stem}.snapshot.jsonl")
+        self._max_jobs = max_jobs
+        self._compact_threshold = max(1, int(compact_threshold))
+        self._lock = threading.Lock()
+        self._fh: IO[str] | None = None
+        self._appended = 0
+        self._compacting: threading.Thread | None = None
+
+    @property
+    def path(self) -> Path:
+        """Journal file path."""
+        return self._path
+
+    def exists(self) -> bool:
+        """Whether any journal or snapshot file exists on disk."""
+        return any(p.exists() for p in (self._path, self._segment_path, self._snapshot_path))
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """
+        Rebuild job records by replaying snapshot, pending segment and journal.
+
+        Malformed lines (e.g. a torn final write) are skipped.
+
+        Returns:
+            Mapping of job ID to job record dict.
+        """
+        with self._lock:
+            self._wait_for_compaction_locked()
+            records: dict[str, dict[str, Any]] = {}
+            for path in (self._snapshot_path, self._segment_path, self._path):
+                self._replay(path, records)
+            return records
+
+    @staticmethod
+    def _replay(path: Path, records: dict[str, dict[str, Any]]) -> None:
+        if not path.exists():
+            return
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict):
+                        JobStore._apply(entry, records)
+        except OSError as exc:
+            logger.warning(f"Failed to read job journal {path}: {exc}")
+
+    @staticmethod
+    def _apply(entry: dict[str, Any], records: dict[str, dict[str, Any]]) -> None:
+        op = entry.get("op")
+        if op == "clear":
+            records.clear()
+            return
+        job_id = entry.get("id")
+        if not isinstance(job_id, str):
+            return
+        if op == "put" and isinstance(entry.get("job"), dict):
+            records[job_id] = entry["job"]
+        elif op == "patch":
+            record = records.get(job_id)
+            if record is None:
+                return
+            fields = entry.get("fields")
+            if isinstance(fields, dict):
+                record.update(fields)
+            params = entry.get("params")
+            if isinstance(params, dict):
+                if not isinstance(record.get("params"), dict):
+                    record["params"] = {}
+                record["params"].update(params)
+        elif op == "delete":
+            records.pop(job_id, None)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def put(self, job_id: str, record: dict[str, Any]) -> None:
+        """
+        Record the full state of a job.
+
+        Args:
+            job_id: Job ID.
+            record: Serializable job record (typically ``job.__dict__``).
+        """
+        self._append({"op": "put", "id": job_id, "job": record})
+
+    def patch(self, job_id: str, *, fields: dict[str, Any] | None = None, params: dict[str, Any] | None = None) -> None:
+        """
+        Record a partial job update.
+
+        Args:
+            job_id: Job ID.
+            fields: Top-level job attributes to replace.
+            params: Keys to merge into the job's params dict.
+        """
+        entry: dict[str, Any] = {"op": "patch", "id": job_id}
+        if fields:
+            entry["fields"] = fields
+        if params:
+            entry["params"] = params
+        self._append(entry)
+
+    def delete(self, job_id: str) -> None:
+        """
+        Record removal of a job.
+
+        Args:
+            job_id: Job ID.
+        """
+        self._append({"op": "delete", "id": job_id})
+
+    def clear(self) -> None:
+        """Record removal of all jobs."""
+        self._append({"op": "clear"})
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        line = json.dumps(entry, default=str, separators=(",", ":")) + "\n"
+        with self._lock:
+            try:
+                if self._fh is None:
+                    self._open_journal_locked()
+                self._fh.write(line)
+                self._fh.flush()
+            except OSError as exc:
+                logger.error(f"Failed to append to job journal {self._path}: {exc}")
+                return
+            self._appended += 1
+            if self._appended >= self._compact_threshold and self._compacting is None:
+                self._start_compaction_locked()
+
+    def _open_journal_locked(self) -> None:
+        """Open the journal for appending, terminating a torn final line left by a crash."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        torn = False
+        if self._path.exists() and self._path.stat().st_size > 0:
+            with self._path.open("rb") as fh:
+                fh.seek(-1, os.SEEK_END)
+                torn = fh.read(1) != b"\n"
+        self._fh = self._path.open("a", encoding="utf-8")
+        if torn:
+            # Without this the next record would be glued onto the torn line and lost on replay
+            self._fh.write("\n")
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def compact(self, *, wait: bool = True) -> None:
+        """
+        Fold the journal into the snapshot file.
+
+        Args:
+            wait: If True, block until compaction finishes.
+        """
+        with self._lock:
+            if self._compacting is None:
+                self._start_compaction_locked()
+            thread = self._compacting
+        if wait and thread is not None:
+            thread.join()
+
+    def close(self) -> None:
+        """Wait for running compaction and close the journal file handle."""
+        with self._lock:
+            self._wait_for_compaction_locked()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def _wait_for_compaction_locked(self) -> None:
+        thread = self._compacting
+        if thread is None:
+            return
+        self._lock.release()
+        try:
+            thread.join()
+        finally:
+            self._lock.acquire()
+
+    def _start_compaction_locked(self) -> None:
+        """Rotate the live journal into a segment and fold it in the background (O(1) under lock)."""
+        if self._segment_path.exists():
+            # A previous compaction was interrupted; its segment must be folded first
+            pass
+        elif self._path.exists():
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            os.replace(self._path, self._segment_path)
+        else:
+            return
+        self._appended = 0
+        self._compacting = threading.Thread(
+            target=self._compact_segment,
+            name=f"job-store-compact-{self._path.stem}",
+            daemon=True,
+        )
+        self._compacting.start()
+
+    def _compact_segment(self) -> None:
+        try:
+            records: dict[str, dict[str, Any]] = {}
+            self._replay(self._snapshot_path, records)
+            self._replay(self._segment_path, records)
+            jobs = list(records.items())
+            if self._max_jobs is not None and len(jobs) > self._max_jobs:
+                jobs.sort(key=lambda item: item[1].get("created_at") or 0.0, reverse=True)
+                jobs = jobs[: self._max_jobs]
+            tmp = self._snapshot_path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as fh:
+                for job_id, record in jobs:
+                    fh.write(json.dumps({"op": "put", "id": job_id, "job": record}, default=str, separators=(",", ":")))
+                    fh.write("\n")
+            os.replace(tmp, self._snapshot_path)
+            self._segment_path.unlink(missing_ok=True)
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Job journal compaction failed for {self._path}: {exc}")
+        finally:
+            with self._lock:
+                self._compacting = None
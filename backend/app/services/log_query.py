@@ -0,0 +1,415 @@
+"""Tail-first query engine for the rotating JSON backend log.
+
+``backend.log`` (plus ``backend.log.1`` .. ``backend.log.N`` after rotation) can
+hold tens of MB of JSON lines. Dashboards only ever want the newest entries, so
+queries read the files backwards block by block and stop as soon as ``limit``
+matching entries are found.
+
+Each file gets a small sidecar index: one record per ~64 KB block with the
+block's byte offset, its first timestamp and how many entries of each level
+it contains. Blocks that cannot match a level or time-range filter are skipped
+without being read. Indexes are keyed by a hash of the file's first line, so
+they survive rotation renames, and are extended incrementally as the file
+grows (only the appended bytes are scanned).
+
+Cursors (``"<file id>:<offset>"``) point just after the last returned line and
+let callers follow the log across rotations.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from app.core.logging import get_logger
+from app.core.paths import log_index_dir, logs_dir
+
+logger = get_logger(__name__)
+
+BLOCK_BYTES = 64 * 1024
+"""Target size of an indexed block; reads and skips happen in whole blocks."""
+
+_ASCTIME_RE = re.compile(rb'"asctime": "([^"]*)"')
+_LEVEL_RE = re.compile(rb'"levelname": "([^"]*)"')
+
+
+@lru_cache(maxsize=4096)
+def _second_timestamp(value: str) -> float:
+    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S").timestamp()
+
+
+def parse_asctime(asctime: str) -> float:
+    """
+    Convert a log ``asctime`` value to a unix timestamp.
+
+    Handles the logging default (``2024-01-01 12:00:00,123``) with a cached
+    per-second parse, and falls back to ISO 8601.
+
+    Args:
+        asctime: Timestamp string from a log record.
+
+    Returns:
+        Unix timestamp, or 0.0 if the value cannot be parsed.
+    """
+    try:
+        seconds = _second_timestamp(asctime[:19])
+        fraction = asctime[20:23]
+        return seconds + (int(fraction) / 1000 if fraction.isdigit() else 0.0)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(asctime.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _scan(line: bytes) -> tuple[float | None, str | None]:
+    """Extract (timestamp, lowercase level) from a raw JSON log line without decoding it."""
+    level_match = _LEVEL_RE.search(line)
+    if level_match is None:
+        return None, None
+    time_match = _ASCTIME_RE.search(line)
+    timestamp = parse_asctime(time_match.group(1).decode("utf-8", "replace")) if time_match else 0.0
+    return timestamp, level_match.group(1).decode("ascii", "replace").lower()
+
+
+def _entry(line: bytes) -> dict[str, Any] | None:
+    """Decode a JSON log line into the ``/logs`` entry shape."""
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(record, dict):
+        return None
+    return {
+        "timestamp": parse_asctime(record.get("asctime") or ""),
+        "level": str(record.get("levelname", "info")).lower(),
+        "source": "backend",
+        "message": record.get("message", ""),
+        "logger": record.get("name", "backend"),
+        "raw": record,
+    }
+
+
+def iter_lines_reversed(path: Path, block_bytes: int = BLOCK_BYTES) -> Iterator[bytes]:
+    """
+    Yield the non-empty lines of a file from last to first, reading backwards in blocks.
+
+    Args:
+        path: File to read.
+        block_bytes: Bytes read per step.
+
+    Yields:
+        Raw lines without the trailing newline.
+    """
+    with path.open("rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            step = min(block_bytes, position)
+            position -= step
+            f.seek(position)
+            chunk = f.read(step) + remainder
+            lines = chunk.split(b"\n")
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
+
+
+@dataclass
+class _FileIndex:
+    file_id: str
+    size: int = 0
+    # [offset, first timestamp or None, {level: count}] per block
+    blocks: list[list[Any]] = field(default_factory=list)
+
+    def block_end(self, position: int) -> int:
+        return self.blocks[position + 1][0] if position + 1 < len(self.blocks) else self.size
+
+
+@dataclass(frozen=True)
+class LogTail:
+    """Result of following the log from a cursor."""
+
+    entries: list[dict[str, Any]]
+    cursor: str
+    reset: bool = False
+
+
+class LogQueryEngine:
+    """Indexed, newest-first queries over a rotating JSON log file."""
+
+    def __init__(
+        self,
+        log_file: Path,
+        index_dir: Path,
+        *,
+        backup_count: int = 5,
+        block_bytes: int = BLOCK_BYTES,
+    ) -> None:
+        """
+        Create an engine for one log file and its rotated backups.
+
+        Args:
+            log_file: Active log file (backups are ``<name>.1`` .. ``<name>.N``).
+            index_dir: Directory for sidecar index files.
+            backup_count: Number of rotated backups to consider.
+            block_bytes: Target indexed block size.
+        """
+        self._log_file = log_file
+        self._index_dir = index_dir
+        self._backup_count = backup_count
+        self._block_bytes = block_bytes
+        self._lock = threading.Lock()
+        self._indexes: dict[str, _FileIndex] = {}
+
+    def files(self) -> list[Path]:
+        """Existing log files, newest (active file) first."""
+        candidates = [self._log_file] + [
+            self._log_file.with_name(f"{self._log_file.name}.{i}") for i in range(1, self._backup_count + 1)
+        ]
+        return [path for path in candidates if path.exists()]
+
+    def query(
+        self,
+        limit: int,
+        *,
+        level: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Return the newest matching entries.
+
+        Args:
+            limit: Maximum number of entries.
+            level: Only entries with this level (case-insensitive).
+            since: Only entries at or after this unix timestamp.
+            until: Only entries at or before this unix timestamp.
+
+        Returns:
+            Entries newest first.
+        """
+        level = level.lower() if level else None
+        results: list[dict[str, Any]] = []
+        for path, index in self._refresh():
+            with path.open("rb") as f:
+                for position in range(len(index.blocks) - 1, -1, -1):
+                    offset, first_ts, counts = index.blocks[position]
+                    # Everything before a block that starts before ``since`` is older still
+                    last_block = since is not None and first_ts is not None and first_ts < since
+                    skip = (level is not None and not counts.get(level)) or (
+                        until is not None and first_ts is not None and first_ts > until
+                    )
+                    if skip:
+                        if last_block:
+                            return results
+                        continue
+                    f.seek(offset)
+                    chunk = f.read(index.block_end(position) - offset)
+                    for line in reversed(chunk.split(b"\n")):
+                        timestamp, line_level = _scan(line)
+                        if line_level is None or (level is not None and line_level != level):
+                            continue
+                        if (until is not None and timestamp > until) or (since is not None and timestamp < since):
+                            continue
+                        entry = _entry(line)
+                        if entry is not None:
+                            results.append(entry)
+                            if len(results) >= limit:
+                                return results
+                    if last_block:
+                        return results
+        return results
+
+    def tail(self, cursor: str | None, limit: int, *, level: str | None = None) -> LogTail:
+        """
+        Follow the log from a cursor.
+
+        Without a cursor, returns the newest ``limit`` entries and a cursor at
+        the current end of the log. With one, returns up to ``limit`` entries
+        written after it (oldest first), continuing into newer files after a
+        rotation. If the cursor's file has been rotated away, or the cursor
+        cannot be parsed, reading restarts at the oldest retained file and
+        ``reset`` is set.
+
+        Args:
+            cursor: Cursor from a previous call, or None.
+            limit: Maximum number of entries.
+            level: Only entries with this level (case-insensitive).
+
+        Returns:
+            LogTail with entries oldest first and the cursor to resume from.
+        """
+        indexed = self._refresh()
+        if not indexed:
+            return LogTail([], cursor or "", reset=False)
+        end_cursor = f"{indexed[0][1].file_id}:{indexed[0][1].size}"
+        if cursor is None:
+            return LogTail(list(reversed(self.query(limit, level=level))), end_cursor)
+
+        file_id, _, raw_offset = cursor.partition(":")
+        oldest_first = list(reversed(indexed))
+        start = next((i for i, (_, index) in enumerate(oldest_first) if index.file_id == file_id), None)
+        if not (raw_offset or "0").isdigit():
+            start = None
+        reset = start is None
+        offset = 0 if reset else int(raw_offset or 0)
+        start = start or 0
+        level = level.lower() if level else None
+
+        entries: list[dict[str, Any]] = []
+        for path, index in oldest_first[start:]:
+            position = min(offset, index.size)
+            with path.open("rb") as f:
+                f.seek(position)
+                while position < index.size:
+                    chunk = f.read(min(self._block_bytes, index.size - position))
+                    lines = chunk.split(b"\n")
+                    if len(lines) > 1:
+                        lines.pop()  # empty piece after the final newline or a partial line
+                    else:
+                        # A single line longer than a block: read the rest of it
+                        lines = [(chunk + f.readline()).rstrip(b"\n")]
+                    for line in lines:
+                        position += len(line) + 1
+                        _, line_level = _scan(line)
+                        if line_level is None or (level is not None and line_level != level):
+                            continue
+                        entry = _entry(line)
+                        if entry is not None:
+                            entries.append(entry)
+                            if len(entries) >= limit:
+                                return LogTail(entries, f"{index.file_id}:{position}", reset)
+                    f.seek(position)
+            offset = 0
+        return LogTail(entries, end_cursor, reset)
+
+    def level_counts(self, *, include_rotated: bool = False) -> dict[str, int]:
+        """
+        Count entries per level from the index without reading log lines.
+
+        Args:
+            include_rotated: Also count rotated backups.
+
+        Returns:
+            Mapping of lowercase level to entry count.
+        """
+        indexed = self._refresh()
+        if not include_rotated:
+            indexed = indexed[:1]
+        counts: dict[str, int] = {}
+        for _, index in indexed:
+            for _, _, block_counts in index.blocks:
+                for level, count in block_counts.items():
+                    counts[level] = counts.get(level, 0) + count
+        return counts
+
+    def _refresh(self) -> list[tuple[Path, _FileIndex]]:
+        """Bring every file's index up to date; returns (path, index) newest first."""
+        with self._lock:
+            indexed: list[tuple[Path, _FileIndex]] = []
+            for path in self.files():
+                try:
+                    index = self._refresh_file(path)
+                except OSError as exc:
+                    logger.warning(f"Could not index log file {path}: {exc}")
+                    continue
+                if index is not None:
+                    indexed.append((path, index))
+            self._prune({index.file_id for _, index in indexed})
+            return indexed
+
+    def _refresh_file(self, path: Path) -> _FileIndex | None:
+        with path.open("rb") as f:
+            first_line = f.readline()
+            if not first_line.endswith(b"\n"):
+                return None
+            file_id = hashlib.sha1(first_line).hexdigest()[:16]
+            size = os.fstat(f.fileno()).st_size
+            index = self._indexes.get(file_id) or self._load(file_id)
+            if index is None or index.size > size:
+                index = _FileIndex(file_id)
+            self._indexes[file_id] = index
+            if index.size < size:
+                self._extend(f, index, size)
+                self._save(index)
+        return index
+
+    def _extend(self, f: Any, index: _FileIndex, size: int) -> None:
+        """Scan bytes appended since the last refresh into the index."""
+        position = index.size
+        f.seek(position)
+        pending = b""
+        while position + len(pending) < size:
+            data = f.read(min(self._block_bytes * 4, size - position - len(pending)))
+            if not data:
+                break
+            lines = (pending + data).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                if not index.blocks or position - index.blocks[-1][0] >= self._block_bytes:
+                    index.blocks.append([position, None, {}])
+                block = index.blocks[-1]
+                timestamp, level = _scan(line)
+                if level is not None:
+                    if block[1] is None:
+                        block[1] = timestamp
+                    block[2][level] = block[2].get(level, 0) + 1
+                position += len(line) + 1
+        # Only complete lines are indexed; a partial last line is picked up next time
+        index.size = position
+
+    def _sidecar(self, file_id: str) -> Path:
+        return self._index_dir / f"{file_id}.json"
+
+    def _load(self, file_id: str) -> _FileIndex | None:
+        try:
+            data = json.loads(self._sidecar(file_id).read_text(encoding="utf-8"))
+            return _FileIndex(file_id, int(data["size"]), list(data["blocks"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save(self, index: _FileIndex) -> None:
+        try:
+            self._index_dir.mkdir(parents=True, exist_ok=True)
+            target = self._sidecar(index.file_id)
+            tmp = target.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"size": index.size, "blocks": index.blocks}), encoding="utf-8")
+            tmp.replace(target)
+        except OSError as exc:
+            logger.warning(f"Could not save log index {index.file_id}: {exc}")
+
+    def _prune(self, live_ids: set[str]) -> None:
+        """Forget indexes of files that were rotated out."""
+        for file_id in list(self._indexes):
+            if file_id not in live_ids:
+                del self._indexes[file_id]
+        if not self._index_dir.exists():
+            return
+        for sidecar in self._index_dir.glob("*.json"):
+            if sidecar.stem not in live_ids:
+                sidecar.unlink(missing_ok=True)
+
+
+_backend_log_query: LogQueryEngine | None = None
+
+
+def get_backend_log_query() -> LogQueryEngine:
+    """Get or create the query engine for ``backend.log``."""
+    global _backend_log_query
+    if _backend_log_query is None:
+        _backend_log_query = LogQueryEngine(logs_dir() / "backend.log", log_index_dir())
+    return _backend_log_query
@@ -0,0 +1,120 @@
+"""Event loop lag monitor.
+
+A background task sleeps for a fixed interval and records how much later than
+requested it woke up. That overshoot is the time the event loop was busy with
+something else, typically a blocking call made from async code, and is exactly
+how long every other request on the worker was stalled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SAMPLE_INTERVAL_S = 0.1
+"""How often the loop is probed."""
+
+WINDOW_SAMPLES = 600
+"""Number of recent samples kept (one minute at the default interval)."""
+
+WARN_LAG_S = 0.5
+"""Lag above which a warning is logged."""
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop runs scheduled callbacks."""
+
+    def __init__(self, interval_s: float = SAMPLE_INTERVAL_S, window: int = WINDOW_SAMPLES) -> None:
+        """
+        Initialize the monitor.
+
+        Args:
+            interval_s: Sleep between probes.
+            window: Number of recent lag samples kept for statistics.
+        """
+        self.interval_s = interval_s
+        self._samples: deque[float] = deque(maxlen=window)
+        self._max_lag_s = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the probe task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start probing on the running event loop."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._probe_loop())
+
+    async def stop(self) -> None:
+        """Stop probing and wait for the task to finish."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _probe_loop(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval_s)
+            self.record(max(0.0, time.perf_counter() - start - self.interval_s))
+
+    def record(self, lag_s: float) -> None:
+        """Add a lag sample (seconds)."""
+        self._samples.append(lag_s)
+        self._max_lag_s = max(self._max_lag_s, lag_s)
+        if lag_s >= WARN_LAG_S:
+            logger.warning(f"Event loop blocked for {lag_s * 1000:.0f} ms")
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self._samples.clear()
+        self._max_lag_s = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Summarize recent event loop lag.
+
+        Returns:
+            Dictionary with sample count, mean, p99 and max lag of the window
+            (milliseconds) and the maximum seen since start.
+        """
+        samples = sorted(self._samples)
+        if not samples:
+            return {
+                "running": self.running,
+                "samples": 0,
+                "mean_ms": None,
+                "p99_ms": None,
+                "max_ms": None,
+                "max_since_start_ms": round(self._max_lag_s * 1000, 1),
+            }
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        return {
+            "running": self.running,
+            "samples": len(samples),
+            "mean_ms": round(sum(samples) / len(samples) * 1000, 1),
+            "p99_ms": round(p99 * 1000, 1),
+            "max_ms": round(samples[-1] * 1000, 1),
+            "max_since_start_ms": round(self._max_lag_s * 1000, 1),
+        }
+
+
+# Global instance for easy import
+_loop_lag_monitor: LoopLagMonitor | None = None
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """Get or create the global event loop lag monitor."""
+    global _loop_lag_monitor
+    if _loop_lag_monitor is None:
+        _loop_lag_monitor = LoopLagMonitor()
+    return _loop_lag_monitor
@@ -8,13 +8,14 @@ import json
 import shutil
 import threading
 import time
-import urllib.request
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.paths import config_dir, data_dir
+from app.services.segmented_download import BandwidthLimiter, DownloadCancelled, SegmentedDownload
 
 logger = get_logger(__name__)
 
@@ -65,6 +66,8 @@ class DownloadItem:
         finished_at: Timestamp when download finished (Unix timestamp), None if not finished.
         error: Error message if download failed, None otherwise.
         cancel_requested: Whether cancellation has been requested for this download.
+        segments: Number of parallel Range segments used (1 for a single stream).
+        resumed_from: Bytes already on disk when the download (re)started.
     """
     id: str
     model_id: str
@@ -77,18 +80,37 @@ class DownloadItem:
     finished_at: float | None = None
     error: str | None = None
     cancel_requested: bool = False
+    segments: int = 1
+    resumed_from: int = 0
 
 
 class ModelManager:
     """Manages AI model catalog, downloads, and installation."""
 
-    def __init__(self) -> None:
-        """Initialize model manager with thread lock and download queue."""
+    def __init__(
+        self,
+        workers: int | None = None,
+        segments: int | None = None,
+        bandwidth_mbps: float | None = None,
+    ) -> None:
+        """
+        Initialize model manager with thread lock, download queue and worker threads.
+
+        Args:
+            workers: Concurrent downloads (default: settings.model_download_workers).
+            segments: Range segments per download (default: settings.model_download_segments).
+            bandwidth_mbps: Combined cap in MB/s, 0 = unlimited (default: settings.model_download_bandwidth_mbps).
+        """
         self._lock = threading.Lock()
         self._cv = threading.Condition(self._lock)
         self._queue: collections.deque[str] = collections.deque()
         self._items: dict[str, DownloadItem] = {}
-        self._active_id: str | None = None
+        self._active_ids: list[str] = []
+
+        self._workers = max(1, workers if workers is not None else settings.model_download_workers)
+        self._segments = max(1, segments if segments is not None else settings.model_download_segments)
+        mbps = bandwidth_mbps if bandwidth_mbps is not None else settings.model_download_bandwidth_mbps
+        self._limiter = BandwidthLimiter(mbps * 1024 * 1024)
 
         self._models_root = data_dir() / "models"
         self._models_root.mkdir(parents=True, exist_ok=True)
@@ -181,9 +203,10 @@ class ModelManager:
         ]
         self._custom_catalog: list[CatalogModel] = self._load_custom_catalog()
 
-        # Background worker processes the queue one item at a time.
-        t = threading.Thread(target=self._worker_loop, name="model-manager-worker", daemon=True)
-        t.start()
+        # Background workers each process one queued item at a time.
+        for i in range(self._workers):
+            t = threading.Thread(target=self._worker_loop, name=f"model-manager-worker-{i}", daemon=True)
+            t.start()
 
     def catalog(self) -> list[dict[str, Any]]:
         # Built-in first (sorted by tier), then custom.
@@ -484,15 +507,48 @@ class ModelManager:
 
     def active(self) -> dict[str, Any] | None:
         """
-        Get currently active download item.
+        Get the longest-running active download item.
 
         Returns:
             Active download item dictionary, or None if no active download.
         """
         with self._lock:
-            if not self._active_id:
+            if not self._active_ids:
                 return None
-            return self._items[self._active_id].__dict__.copy()
+            return self._items[self._active_ids[0]].__dict__.copy()
+
+    def active_items(self) -> list[dict[str, Any]]:
+        """
+        Get all active download items.
+
+        Returns:
+            List of active download item dictionaries in start order.
+        """
+        with self._lock:
+            return [self._items[item_id].__dict__.copy() for item_id in self._active_ids]
+
+    def bandwidth_limit(self) -> float:
+        """
+        Get the combined download bandwidth cap.
+
+        Returns:
+            Cap in MB/s (0 = unlimited).
+        """
+        return self._limiter.rate / (1024 * 1024)
+
+    def set_bandwidth_limit(self, mbps: float) -> None:
+        """
+        Set the combined download bandwidth cap; applies to running downloads immediately.
+
+        Args:
+            mbps: Cap in MB/s (0 = unlimited).
+
+        Raises:
+            ValueError: If mbps is negative.
+        """
+        if mbps < 0:
+            raise ValueError("Bandwidth limit must be >= 0")
+        self._limiter.set_rate(mbps * 1024 * 1024)
 
     def items(self) -> list[dict[str, Any]]:
         """
@@ -530,8 +586,8 @@ class ModelManager:
 
         with self._cv:
             # Don't enqueue duplicates if already queued or active.
-            if self._active_id:
-                active = self._items.get(self._active_id)
+            for active_id in self._active_ids:
+                active = self._items.get(active_id)
                 if active and active.model_id == model_id and active.state in {"downloading"}:
                     raise ValueError("Model already downloading")
             for qid in self._queue:
@@ -603,7 +659,7 @@ class ModelManager:
                 while not self._queue:
                     self._cv.wait(timeout=1.0)
                 item_id = self._queue.popleft()
-                self._active_id = item_id
+                self._active_ids.append(item_id)
                 item = self._items[item_id]
                 item.state = "downloading"
                 item.started_at = time.time()
@@ -621,15 +677,18 @@ class ModelManager:
                     item.finished_at = time.time()
             finally:
                 with self._cv:
-                    self._active_id = None
+                    self._active_ids.remove(item_id)
 
     def _download_one(self, item: DownloadItem, model: CatalogModel) -> None:
         """
         Download a single model file from URL.
         
-        Downloads model to temporary file, verifies SHA256 checksum if provided,
-        and moves to final destination. Updates download item progress and state.
-        Handles cancellation and errors.
+        Downloads model to a temporary file in parallel Range segments when the
+        server supports them, hashing while downloading. Verifies the SHA256
+        checksum if provided and moves the file to its final destination.
+        Updates download item progress and state. On failure the partial file
+        and its checkpoint are kept so that re-queueing the model resumes it;
+        cancellation and checksum mismatches discard them.
         
         Args:
             item: Download item to process
@@ -642,87 +701,49 @@ class ModelManager:
         dest.parent.mkdir(parents=True, exist_ok=True)
 
         tmp = dest.with_suffix(dest.suffix + ".part")
-        
-        # Check if we can resume a partial download
-        resume_from = 0
-        h = hashlib.sha256()
-        if tmp.exists():
-            resume_from = tmp.stat().st_size
-            logger.info("Resuming download", extra={"model_id": model.id, "resume_from": resume_from})
-            # Read existing file to continue hash calculation
-            with open(tmp, "rb") as existing:
-                while True:
-                    chunk = existing.read(1024 * 256)
-                    if not chunk:
-                        break
-                    h.update(chunk)
-        
+
+        def is_cancelled() -> bool:
+            with self._cv:
+                return item.cancel_requested
+
+        def on_progress(downloaded: int, total: int | None) -> None:
+            with self._cv:
+                item.bytes_downloaded = downloaded
+
+        download = SegmentedDownload(
+            model.url,
+            tmp,
+            segments=self._segments,
+            limiter=self._limiter,
+            is_cancelled=is_cancelled,
+            on_progress=on_progress,
+        )
+        keep_partial = True
         try:
-            logger.info("Downloading model", extra={"model_id": model.id, "url": model.url, "dest": str(dest), "resume_from": resume_from})
-
-            req = urllib.request.Request(model.url, headers={"User-Agent": "AInfluencer/0.1"})
-            
-            # Add Range header if resuming
-            if resume_from > 0:
-                req.add_header("Range", f"bytes={resume_from}-")
-            
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                # Handle 206 Partial Content for resume, or 200 OK for fresh download
-                status = resp.getcode()
-                if status == 206:  # Partial Content (resume)
-                    total_header = resp.headers.get("Content-Range")
-                    if total_header:
-                        # Content-Range: bytes 0-1023/1048576
-                        total_match = total_header.split("/")
-                        if len(total_match) == 2:
-                            total_int = int(total_match[1])
-                        else:
-                            total_int = None
-                    else:
-                        total_int = None
-                    # Total size is resume_from + content_length
-                    content_length = resp.headers.get("Content-Length")
-                    if content_length and content_length.isdigit():
-                        total_int = resume_from + int(content_length)
-                elif status == 200:  # Full download
-                    total = resp.headers.get("Content-Length")
-                    total_int = int(total) if total and total.isdigit() else None
-                else:
-                    total_int = None
-                
-                with self._cv:
-                    item.bytes_total = total_int
-                    if resume_from > 0:
-                        item.bytes_downloaded = resume_from
-
-                # Preflight: if we know size, ensure we have enough free disk (plus 1GB buffer).
-                if total_int is not None:
-                    free = shutil.disk_usage(self._models_root).free
-                    buffer_bytes = 1024**3
-                    if free < total_int + buffer_bytes:
-                        raise RuntimeError(
-                            f"Insufficient disk space (need ~{round((total_int + buffer_bytes)/(1024**3),2)} GB free)."
-                        )
+            logger.info("Downloading model", extra={"model_id": model.id, "url": model.url, "dest": str(dest)})
+            total_int = download.prepare()
 
-                downloaded = resume_from
-                # Open in append mode if resuming, write mode if fresh
-                mode = "ab" if resume_from > 0 else "wb"
-                with open(tmp, mode) as f:
-                    while True:
-                        with self._cv:
-                            if item.cancel_requested:
-                                raise RuntimeError("Cancelled")
-                        chunk = resp.read(1024 * 256)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        h.update(chunk)
-                        downloaded += len(chunk)
-                        with self._cv:
-                            item.bytes_downloaded = downloaded
-
-            sha = h.hexdigest()
+            with self._cv:
+                item.bytes_total = total_int
+                item.segments = download.segment_count
+                item.resumed_from = download.resumed_from
+                item.bytes_downloaded = download.resumed_from
+
+            # Preflight: if we know size, ensure we have enough free disk (plus 1GB buffer).
+            # Runs before the .part file is preallocated; a resumed download only
+            # occupies the bytes it already fetched (the rest of the file is sparse).
+            if total_int is not None:
+                free = shutil.disk_usage(self._models_root).free
+                buffer_bytes = 1024**3
+                if free + download.resumed_from < total_int + buffer_bytes:
+                    keep_partial = False
+                    raise RuntimeError(
+                        f"Insufficient disk space (need ~{round((total_int + buffer_bytes)/(1024**3),2)} GB free)."
+                    )
+
+            sha = download.run()
             if model.sha256 and sha.lower() != model.sha256.lower():
+                keep_partial = False
                 raise RuntimeError("Checksum mismatch")
 
             tmp.replace(dest)
@@ -732,23 +753,20 @@ class ModelManager:
 
             logger.info("Model download complete", extra={"model_id": model.id, "sha256": sha})
         except Exception as exc:  # noqa: BLE001
+            cancelled = isinstance(exc, DownloadCancelled)
             with self._cv:
-                if str(exc) == "Cancelled":
+                if cancelled:
                     item.state = "cancelled"
                     item.finished_at = time.time()
                 else:
                     item.state = "failed"
                     item.error = str(exc)
                     item.finished_at = time.time()
-            try:
-                if tmp.exists():
-                    tmp.unlink()
-            except Exception:  # noqa: BLE001
-                pass
-            if str(exc) == "Cancelled":
+            if cancelled or not keep_partial or not download.ranges_supported:
+                download.discard()
+            if cancelled:
                 logger.info("Model download cancelled", extra={"model_id": model.id})
             else:
                 logger.error("Model download failed", extra={"model_id": model.id, "error": str(exc)})
 
-
 model_manager = ModelManager()
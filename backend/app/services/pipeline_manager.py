@@ -220,6 +220,28 @@ class PipelineManager:
         """
         return self.job_history.get_job(job_id)
 
+    async def list_jobs(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        status: str | None = None,
+        preset_id: str | None = None,
+    ) -> tuple[list[JobHistory], int]:
+        """List pipeline jobs from the job history index.
+        
+        Args:
+            limit: Maximum number of jobs to return
+            offset: Number of matching jobs to skip
+            status: Optional status filter
+            preset_id: Optional preset ID filter
+            
+        Returns:
+            Tuple of (jobs newest first, total matching jobs)
+        """
+        jobs = self.job_history.list_jobs(limit=limit, offset=offset, status=status, preset_id=preset_id)
+        total = self.job_history.count_jobs(status=status, preset_id=preset_id)
+        return jobs, total
+
     async def cancel_job(self, job_id: str) -> None:
         """Cancel a running pipeline job.
         
@@ -0,0 +1,225 @@
+"""Bounded executor for blocking platform SDK calls.
+
+instagrapi, tweepy, the Google API client and the other platform SDKs are
+synchronous. Calling them from ``async def`` code blocks the event loop for the
+whole request (an Instagram upload can take many seconds), stalling every other
+request on the worker. ``run_platform_call`` runs such calls on a dedicated,
+size-bounded thread pool instead, with a per-platform concurrency limit and
+timeout so one slow platform cannot take over the pool.
+
+A call that times out keeps its concurrency slot until the worker thread
+actually returns, because Python threads cannot be interrupted; the limit
+therefore always reflects the calls really in flight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class PlatformCallTimeout(TimeoutError):
+    """Error raised when a platform call does not finish within its timeout."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class PlatformLimit:
+    """Concurrency and timeout for calls to one platform.
+
+    Attributes:
+        concurrency: Maximum calls in flight at once.
+        timeout_s: Seconds to wait for a call before giving up.
+    """
+
+    concurrency: int
+    timeout_s: float
+
+
+PLATFORM_LIMITS: dict[str, PlatformLimit] = {
+    "instagram": PlatformLimit(concurrency=4, timeout_s=180.0),
+    "twitter": PlatformLimit(concurrency=4, timeout_s=60.0),
+    "facebook": PlatformLimit(concurrency=4, timeout_s=60.0),
+    "youtube": PlatformLimit(concurrency=2, timeout_s=1800.0),
+    "tiktok": PlatformLimit(concurrency=2, timeout_s=900.0),
+}
+"""Per-platform limits; video platforms get fewer, longer calls."""
+
+DEFAULT_LIMIT = PlatformLimit(concurrency=4, timeout_s=60.0)
+"""Limit for platforms without an entry in PLATFORM_LIMITS."""
+
+
+class PlatformExecutor:
+    """Runs blocking platform SDK calls off the event loop."""
+
+    def __init__(self, max_workers: int | None = None, limits: dict[str, PlatformLimit] | None = None) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Size of the thread pool shared by all platforms
+                (defaults to settings.platform_io_workers).
+            limits: Per-platform limits (defaults to PLATFORM_LIMITS).
+        """
+        self.max_workers = max_workers or settings.platform_io_workers
+        self.limits = dict(PLATFORM_LIMITS if limits is None else limits)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight: dict[str, int] = {}
+        self._calls: dict[str, int] = {}
+        self._timeouts: dict[str, int] = {}
+
+    def limit_for(self, platform: str) -> PlatformLimit:
+        """Return the limit that applies to a platform."""
+        return self.limits.get(platform, DEFAULT_LIMIT)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="platform-io")
+            return self._executor
+
+    def _semaphore(self, platform: str) -> asyncio.Semaphore:
+        # asyncio semaphores belong to one loop; start over if the loop changed (tests, reloads)
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphores = {}
+            self._semaphore_loop = loop
+        semaphore = self._semaphores.get(platform)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.limit_for(platform).concurrency)
+            self._semaphores[platform] = semaphore
+        return semaphore
+
+    async def run(
+        self,
+        platform: str,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout_s: float | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run a blocking call on the platform thread pool.
+
+        Waits for a free concurrency slot for the platform, then runs the call
+        in a worker thread while the event loop keeps serving other requests.
+
+        Args:
+            platform: Platform name used for the concurrency limit and timeout.
+            fn: Blocking callable.
+            *args: Positional arguments for fn.
+            timeout_s: Override of the platform's timeout.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            Whatever fn returns.
+
+        Raises:
+            PlatformCallTimeout: If the call does not finish in time.
+            Exception: Whatever fn raises.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(platform)
+        timeout = self.limit_for(platform).timeout_s if timeout_s is None else timeout_s
+
+        await semaphore.acquire()
+        try:
+            future = loop.run_in_executor(self._pool(), functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            semaphore.release()
+            raise
+        self._in_flight[platform] = self._in_flight.get(platform, 0) + 1
+        self._calls[platform] = self._calls.get(platform, 0) + 1
+
+        def _release(_: asyncio.Future[Any]) -> None:
+            self._in_flight[platform] -= 1
+            semaphore.release()
+
+        future.add_done_callback(_release)
+        try:
+            # shield: a timeout or cancellation stops the wait, not the thread, which keeps its slot
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError as exc:
+            self._timeouts[platform] = self._timeouts.get(platform, 0) + 1
+            logger.warning(f"{platform} call {getattr(fn, '__name__', fn)} timed out after {timeout:.0f}s")
+            raise PlatformCallTimeout(f"{platform} call timed out after {timeout:.0f}s") from exc
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Describe the executor.
+
+        Returns:
+            Dictionary with pool size and per-platform limits, calls in flight,
+            total calls and timeouts.
+        """
+        platforms = sorted(set(self.limits) | set(self._calls))
+        return {
+            "max_workers": self.max_workers,
+            "platforms": {
+                platform: {
+                    "concurrency": self.limit_for(platform).concurrency,
+                    "timeout_s": self.limit_for(platform).timeout_s,
+                    "in_flight": self._in_flight.get(platform, 0),
+                    "calls": self._calls.get(platform, 0),
+                    "timeouts": self._timeouts.get(platform, 0),
+                }
+                for platform in platforms
+            },
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads without waiting for calls still running."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global instance for easy import
+_platform_executor: PlatformExecutor | None = None
+
+
+def get_platform_executor() -> PlatformExecutor:
+    """Get or create the global platform executor."""
+    global _platform_executor
+    if _platform_executor is None:
+        _platform_executor = PlatformExecutor()
+    return _platform_executor
+
+
+async def run_platform_call(platform: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking platform SDK call on the shared platform executor.
+
+    Args:
+        platform: Platform name ("instagram", "twitter", ...).
+        fn: Blocking callable.
+        *args: Positional arguments for fn.
+        **kwargs: Keyword arguments for fn (``timeout_s`` overrides the platform timeout).
+
+    Returns:
+        Whatever fn returns.
+    """
+    return await get_platform_executor().run(platform, fn, *args, **kwargs)
+
+
+def shutdown_platform_executor() -> None:
+    """Stop the shared platform executor (called on shutdown)."""
+    if _platform_executor is not None:
+        _platform_executor.shutdown()
@@ -2,17 +2,88 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.paths import content_dir
 
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
+
+    from app.services.image_features import ImageFeatures
+
 logger = get_logger(__name__)
 
+QualityProfile = Literal["fast", "full"]
+
+IMAGE_CHECKS: tuple[str, ...] = (
+    "blur",
+    "artifacts",
+    "face_artifacts",
+    "color_contrast",
+    "lighting",
+    "background",
+    "hands",
+    "ai_signatures",
+)
+"""Selectable image checks, in execution order (resolution is always checked)."""
+
+QUALITY_PROFILES: dict[str, tuple[str, ...]] = {
+    # Cheap whole-image statistics for batch triage
+    "fast": ("blur", "artifacts", "color_contrast"),
+    # Every check, for final approval
+    "full": IMAGE_CHECKS,
+}
+"""Image checks run by each validation profile."""
+
+FACE_DETECTION_MAX_SIDE = 1024
+"""Images larger than this are searched for faces on a downscaled pyramid level."""
+
+
+@lru_cache(maxsize=1)
+def _face_cascade() -> Any:
+    """Load OpenCV's frontal face Haar cascade once (None if unavailable)."""
+    import cv2
+
+    cascade = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
+    return None if cascade.empty() else cascade
+
+
+def resolve_quality_checks(profile: QualityProfile = "full", checks: Iterable[str] | None = None) -> tuple[str, ...]:
+    """
+    Resolve the image checks to run for a profile or explicit selection.
+
+    Args:
+        profile: Validation profile ("fast" or "full"), used when checks is None.
+        checks: Explicit check names from IMAGE_CHECKS (overrides profile).
+
+    Returns:
+        Check names in execution order.
+
+    Raises:
+        ValueError: If the profile or a check name is unknown.
+    """
+    if checks is None:
+        if profile not in QUALITY_PROFILES:
+            raise ValueError(f"Unknown quality profile: {profile} (expected one of {sorted(QUALITY_PROFILES)})")
+        return QUALITY_PROFILES[profile]
+    selected = set(checks)
+    unknown = selected - set(IMAGE_CHECKS)
+    if unknown:
+        raise ValueError(f"Unknown quality checks: {sorted(unknown)} (expected from {list(IMAGE_CHECKS)})")
+    return tuple(name for name in IMAGE_CHECKS if name in selected)
+
 
 @dataclass
 class QualityResult:
@@ -46,7 +117,11 @@ class QualityValidator:
         self._preferred_resolution = (1024, 1024)  # Preferred resolution
 
     def validate_content(
-        self, content_id: str | None = None, file_path: str | None = None
+        self,
+        content_id: str | None = None,
+        file_path: str | None = None,
+        profile: QualityProfile = "full",
+        checks: Iterable[str] | None = None,
     ) -> QualityResult:
         """
         Validate content quality.
@@ -54,10 +129,16 @@ class QualityValidator:
         Args:
             content_id: Content ID (for database lookup, not implemented yet)
             file_path: Path to content file
+            profile: Image check profile ("fast" for batch triage, "full" for final approval)
+            checks: Explicit image check names from IMAGE_CHECKS (overrides profile)
 
         Returns:
             QualityResult with quality score and validation details
+
+        Raises:
+            ValueError: If the profile or a check name is unknown.
         """
+        selected_checks = resolve_quality_checks(profile, checks)
         if not file_path:
             return QualityResult(
                 quality_score=None,
@@ -69,15 +150,83 @@ class QualityValidator:
                 metadata={},
             )
 
-        # Resolve file path
+        return self._validate_file(self._resolve_path(file_path), selected_checks)
+
+    def validate_batch(
+        self,
+        file_paths: Iterable[str],
+        profile: QualityProfile = "full",
+        checks: Iterable[str] | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[tuple[str, QualityResult]]:
+        """
+        Validate several files in parallel worker processes, yielding results as they finish.
+
+        Files are spread across a shared process pool (bounded by the
+        quality_validation_workers setting), so CPU-bound checks use multiple
+        cores. Results stream back in completion order, so callers can act on
+        early results while the rest of the batch is still being scored.
+        Single files, or a pool size of 1, are validated inline.
+
+        Args:
+            file_paths: Paths to content files (relative paths resolve against the content directory)
+            profile: Image check profile ("fast" or "full")
+            checks: Explicit image check names from IMAGE_CHECKS (overrides profile)
+            max_workers: Maximum files in flight for this call (defaults to the pool size)
+
+        Yields:
+            Tuples of (file_path as given, QualityResult) in completion order
+
+        Raises:
+            ValueError: If the profile or a check name is unknown.
+        """
+        selected_checks = resolve_quality_checks(profile, checks)
+        pending = list(file_paths)
+        if not pending:
+            return
+        limit = max(1, min(max_workers or settings.quality_validation_workers, settings.quality_validation_workers))
+
+        pool = _get_validation_pool() if limit > 1 and len(pending) > 1 else None
+        if pool is None:
+            for file_path in pending:
+                yield file_path, self._validate_file(self._resolve_path(file_path), selected_checks)
+            return
+
+        in_flight: dict[Future[QualityResult], str] = {}
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < limit:
+                    file_path = pending.pop(0)
+                    future = pool.submit(_validate_in_worker, str(self._resolve_path(file_path)), selected_checks)
+                    in_flight[future] = file_path
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as exc:  # noqa: BLE001
+                        result = _error_result(f"Quality validation worker failed: {exc}")
+                    yield in_flight.pop(future), result
+        except BrokenProcessPool as exc:
+            # A worker died (e.g. OOM); finish the batch inline and rebuild the pool next time
+            logger.warning(f"Quality validation pool broke, validating remaining files inline: {exc}")
+            shutdown_validation_pool(wait=False)
+            for file_path in [*in_flight.values(), *pending]:
+                yield file_path, self._validate_file(self._resolve_path(file_path), selected_checks)
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    @staticmethod
+    def _resolve_path(file_path: str) -> Path:
+        """Resolve a content path (relative paths are relative to the content directory)."""
         file_path_obj = Path(file_path)
         if not file_path_obj.is_absolute():
-            # Try relative to content directory
             file_path_obj = content_dir() / file_path
+        return file_path_obj
 
-        return self._validate_file(file_path_obj)
-
-    def _validate_file(self, file_path: Path) -> QualityResult:
+    def _validate_file(self, file_path: Path, selected_checks: tuple[str, ...] = IMAGE_CHECKS) -> QualityResult:
         """Validate a single file."""
         checks_passed: list[str] = []
         checks_failed: list[str] = []
@@ -131,7 +280,7 @@ class QualityValidator:
         # Validate based on file type
         file_ext = file_path.suffix.lower()
         if file_ext in (".png", ".jpg", ".jpeg", ".webp"):
-            return self._validate_image(file_path, checks_passed, checks_failed, warnings, errors, metadata)
+            return self._validate_image(file_path, checks_passed, checks_failed, warnings, errors, metadata, selected_checks)
         elif file_ext in (".mp4", ".webm", ".mov"):
             return self._validate_video(file_path, checks_passed, checks_failed, warnings, errors, metadata)
         else:
@@ -156,10 +305,19 @@ class QualityValidator:
         warnings: list[str],
         errors: list[str],
         metadata: dict[str, Any],
+        selected_checks: tuple[str, ...] = IMAGE_CHECKS,
     ) -> QualityResult:
-        """Validate image file."""
+        """
+        Validate image file.
+
+        The image is decoded once; shared intermediates (grayscale, gradients,
+        histograms, ...) are computed lazily by ImageFeatures and reused by every
+        selected check.
+        """
+        metadata["quality_checks"] = list(selected_checks)
         try:
             from PIL import Image
+            from app.services.image_features import ImageFeatures
 
             with Image.open(file_path) as img:
                 width, height = img.size
@@ -167,6 +325,7 @@ class QualityValidator:
                 metadata["height"] = height
                 metadata["format"] = img.format
                 metadata["mode"] = img.mode
+                features = ImageFeatures(img)
 
                 # Check resolution
                 if width >= self._min_resolution[0] and height >= self._min_resolution[1]:
@@ -185,7 +344,7 @@ class QualityValidator:
                     )
 
                 # Blur detection using variance of Laplacian
-                blur_score = self._detect_blur(img)
+                blur_score = self._detect_blur(features) if "blur" in selected_checks else None
                 if blur_score is not None:
                     metadata["blur_score"] = float(blur_score)
                     # Threshold: < 100 is likely blurry, > 200 is sharp
@@ -197,7 +356,7 @@ class QualityValidator:
                         checks_failed.append(f"Image appears blurry (blur score: {blur_score:.2f}, threshold: 100)")
 
                 # Artifact detection
-                artifact_score = self._detect_artifacts(img)
+                artifact_score = self._detect_artifacts(features) if "artifacts" in selected_checks else None
                 if artifact_score is not None:
                     metadata["artifact_score"] = float(artifact_score)
                     # Threshold: < 0.3 = likely artifacts, 0.3-0.5 = possible artifacts, > 0.5 = clean
@@ -209,7 +368,7 @@ class QualityValidator:
                         checks_failed.append(f"Significant artifacts detected (artifact score: {artifact_score:.3f}, threshold: 0.3)")
 
                 # Face-specific artifact detection
-                face_artifact_result = self._detect_face_artifacts(img)
+                face_artifact_result = self._detect_face_artifacts(features) if "face_artifacts" in selected_checks else None
                 if face_artifact_result is not None:
                     face_artifact_score = face_artifact_result.get("score")
                     face_count = face_artifact_result.get("face_count", 0)
@@ -246,7 +405,7 @@ class QualityValidator:
                                 warnings.append("No faces detected in image (may be a portrait without clear face)")
 
                 # Color and contrast quality checks
-                color_contrast_metrics = self._check_color_contrast(img)
+                color_contrast_metrics = self._check_color_contrast(features) if "color_contrast" in selected_checks else None
                 if color_contrast_metrics is not None:
                     metadata.update(color_contrast_metrics)
                     
@@ -279,7 +438,7 @@ class QualityValidator:
                             checks_failed.append(f"Very low color saturation (saturation: {saturation:.3f}, threshold: 0.15)")
 
                 # Natural lighting analysis
-                lighting_score = self._analyze_lighting(img)
+                lighting_score = self._analyze_lighting(features) if "lighting" in selected_checks else None
                 if lighting_score is not None:
                     metadata["lighting_score"] = float(lighting_score)
                     # Threshold: < 0.4 = unnatural lighting, 0.4-0.6 = acceptable, >= 0.6 = natural
@@ -291,7 +450,7 @@ class QualityValidator:
                         checks_failed.append(f"Unnatural lighting detected (lighting score: {lighting_score:.3f}, threshold: 0.4)")
 
                 # Background coherence analysis
-                background_score = self._analyze_background_coherence(img)
+                background_score = self._analyze_background_coherence(features) if "background" in selected_checks else None
                 if background_score is not None:
                     metadata["background_coherence_score"] = float(background_score)
                     # Threshold: < 0.4 = incoherent background, 0.4-0.6 = acceptable, >= 0.6 = coherent
@@ -303,7 +462,7 @@ class QualityValidator:
                         checks_failed.append(f"Incoherent background detected (background coherence score: {background_score:.3f}, threshold: 0.4)")
 
                 # Hands/fingers detection
-                hands_score = self._detect_hands_fingers(img)
+                hands_score = self._detect_hands_fingers(features) if "hands" in selected_checks else None
                 if hands_score is not None:
                     metadata["hands_fingers_score"] = float(hands_score)
                     # Threshold: < 0.4 = incorrect hands/fingers, 0.4-0.6 = acceptable, >= 0.6 = correct
@@ -315,7 +474,7 @@ class QualityValidator:
                         checks_failed.append(f"Incorrect hands/fingers detected (hands score: {hands_score:.3f}, threshold: 0.4)")
 
                 # AI signatures detection
-                ai_signatures_score = self._detect_ai_signatures(img)
+                ai_signatures_score = self._detect_ai_signatures(features) if "ai_signatures" in selected_checks else None
                 if ai_signatures_score is not None:
                     metadata["ai_signatures_score"] = float(ai_signatures_score)
                     # Threshold: < 0.4 = obvious AI signatures, 0.4-0.6 = possible, >= 0.6 = no obvious signatures
@@ -447,7 +606,7 @@ class QualityValidator:
 
         return Decimal(str(round(score, 2)))
 
-    def _detect_artifacts(self, img: Image.Image) -> float | None:
+    def _detect_artifacts(self, img: Image.Image | ImageFeatures) -> float | None:
         """
         Detect artifacts in image using edge and texture analysis.
         
@@ -458,7 +617,7 @@ class QualityValidator:
         - Compression artifacts
         
         Args:
-            img: PIL Image object
+            img: PIL Image object or precomputed ImageFeatures
             
         Returns:
             Artifact score (0.0 to 1.0, higher = cleaner). None if detection failed.
@@ -466,28 +625,12 @@ class QualityValidator:
         """
         try:
             import numpy as np
-            from PIL import ImageFilter
+            from app.services.image_features import ImageFeatures
             
-            # Convert to grayscale if needed
-            if img.mode != "L":
-                gray = img.convert("L")
-            else:
-                gray = img
+            features = ImageFeatures.of(img)
             
-            # Convert to numpy array
-            img_array = np.array(gray, dtype=np.float32)
-            
-            # Calculate edge strength using Sobel-like filter
-            # Horizontal edges
-            h_kernel = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]], dtype=np.float32)
-            h_edges = self._apply_kernel(img_array, h_kernel)
-            
-            # Vertical edges
-            v_kernel = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]], dtype=np.float32)
-            v_edges = self._apply_kernel(img_array, v_kernel)
-            
-            # Calculate edge magnitude
-            edge_magnitude = np.sqrt(h_edges**2 + v_edges**2)
+            # Edge magnitude of the grayscale image (Sobel filter)
+            edge_magnitude = features.edge_magnitude
             
             # Calculate statistics
             edge_mean = np.mean(edge_magnitude)
@@ -511,8 +654,8 @@ class QualityValidator:
                 artifact_score = 0.2
             
             # Check for color banding (if color image)
-            if img.mode in ("RGB", "RGBA"):
-                banding_score = self._detect_color_banding(img)
+            if features.is_color:
+                banding_score = self._detect_color_banding(features)
                 if banding_score is not None:
                     # Combine edge-based and color-based artifact scores
                     artifact_score = (artifact_score + banding_score) / 2.0
@@ -525,7 +668,7 @@ class QualityValidator:
             # Any other error, return None
             return None
 
-    def _detect_face_artifacts(self, img: Image.Image) -> dict[str, Any] | None:
+    def _detect_face_artifacts(self, img: Image.Image | ImageFeatures) -> dict[str, Any] | None:
         """
         Detect artifacts specifically in face regions of the image.
         
@@ -538,7 +681,7 @@ class QualityValidator:
         - Unnatural edges around face boundaries
         
         Args:
-            img: PIL Image object
+            img: PIL Image object or precomputed ImageFeatures
             
         Returns:
             dict with:
@@ -549,46 +692,50 @@ class QualityValidator:
             
         Note:
             Uses OpenCV for face detection if available. Falls back gracefully if not installed.
+            Images larger than FACE_DETECTION_MAX_SIDE are searched on a downscaled
+            pyramid level; face regions are analyzed at full resolution.
         """
         try:
             import numpy as np
+            from app.services.image_features import ImageFeatures
             
             # Try to import OpenCV for face detection
             try:
                 import cv2
-                cv2_available = True
             except ImportError:
-                cv2_available = False
                 logger.debug("OpenCV not available - skipping face-specific artifact detection")
                 return None
             
-            # Convert PIL image to OpenCV format
-            img_array = np.array(img.convert("RGB"))
-            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+            features = ImageFeatures.of(img)
+            img_array = features.rgb_uint8
             
-            # Load face cascade classifier (Haar Cascade)
-            # Try to use OpenCV's built-in face detector
+            # Load face cascade classifier (Haar Cascade, cached)
             try:
-                # Try to load the default face cascade
-                cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-                face_cascade = cv2.CascadeClassifier(cascade_path)
-                
-                if face_cascade.empty():
-                    # Fallback: try alternative path or skip
-                    logger.debug("Face cascade classifier not found - skipping face detection")
-                    return None
+                face_cascade = _face_cascade()
             except Exception:
                 logger.debug("Failed to load face cascade classifier - skipping face detection")
                 return None
+            if face_cascade is None:
+                logger.debug("Face cascade classifier not found - skipping face detection")
+                return None
             
-            # Detect faces
-            faces = face_cascade.detectMultiScale(
+            # Detect faces (on a pyramid level for large images)
+            if max(features.width, features.height) > FACE_DETECTION_MAX_SIDE:
+                gray, scale = features.pyramid_level(FACE_DETECTION_MAX_SIDE)
+            else:
+                gray, scale = features.cv_gray, 1
+            min_face = max(24, 30 // scale)
+            detected = face_cascade.detectMultiScale(
                 gray,
                 scaleFactor=1.1,
                 minNeighbors=5,
-                minSize=(30, 30),
+                minSize=(min_face, min_face),
                 flags=cv2.CASCADE_SCALE_IMAGE
             )
+            faces = [
+                (int(fx) * scale, int(fy) * scale, int(fw) * scale, int(fh) * scale)
+                for (fx, fy, fw, fh) in detected
+            ]
             
             face_count = len(faces)
             if face_count == 0:
@@ -607,18 +754,17 @@ class QualityValidator:
             for (x, y, w, h) in faces:
                 face_regions.append({"x": int(x), "y": int(y), "w": int(w), "h": int(h)})
                 
-                # Extract face region
-                face_roi = img_array[y:y+h, x:x+w]
-                face_img = Image.fromarray(face_roi)
+                # Extract face region (features shared by both face analyses)
+                face_features = ImageFeatures(features.crop(x, y, w, h))
                 
                 # Analyze face region for artifacts
                 # 1. Check for unnatural edges (distorted features)
-                face_artifact_score = self._analyze_face_region_artifacts(face_img, img_array, x, y, w, h)
+                face_artifact_score = self._analyze_face_region_artifacts(face_features, img_array, x, y, w, h)
                 if face_artifact_score is not None:
                     face_scores.append(face_artifact_score)
                 
                 # 2. Analyze skin texture specifically
-                skin_texture_score = self._analyze_skin_texture(face_img)
+                skin_texture_score = self._analyze_skin_texture(face_features)
                 if skin_texture_score is not None:
                     skin_texture_scores.append(skin_texture_score)
             
@@ -656,7 +802,7 @@ class QualityValidator:
 
     def _analyze_face_region_artifacts(
         self,
-        face_img: Image.Image,
+        face_img: Image.Image | ImageFeatures,
         full_img_array: "np.ndarray",
         x: int,
         y: int,
@@ -667,7 +813,7 @@ class QualityValidator:
         Analyze a specific face region for artifacts.
         
         Args:
-            face_img: PIL Image of the face region
+            face_img: PIL Image (or ImageFeatures) of the face region
             full_img_array: Full image as numpy array
             x, y, w, h: Face bounding box coordinates
             
@@ -676,29 +822,16 @@ class QualityValidator:
         """
         try:
             import numpy as np
+            from app.services.image_features import ImageFeatures
             
-            # Convert face to grayscale
-            if face_img.mode != "L":
-                face_gray = face_img.convert("L")
-            else:
-                face_gray = face_img
-            
-            face_array = np.array(face_gray, dtype=np.float32)
+            features = ImageFeatures.of(face_img)
+            face_array = features.gray
             
             # 1. Check for unnatural edge patterns in face region
             # Faces should have smooth transitions, not harsh edges (except at boundaries)
             # Calculate edge strength
             edge_scores = []
-            
-            # Horizontal edges
-            h_kernel = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]], dtype=np.float32)
-            h_edges = self._apply_kernel(face_array, h_kernel)
-            
-            # Vertical edges
-            v_kernel = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]], dtype=np.float32)
-            v_edges = self._apply_kernel(face_array, v_kernel)
-            
-            edge_magnitude = np.sqrt(h_edges**2 + v_edges**2)
+            edge_magnitude = features.edge_magnitude
             
             # Face regions should have moderate, consistent edge patterns
             # Very high variance suggests artifacts (unnatural patterns)
@@ -724,8 +857,8 @@ class QualityValidator:
             edge_scores.append(edge_score)
             
             # 2. Check for color banding in face region (if color image)
-            if face_img.mode in ("RGB", "RGBA"):
-                banding_score = self._detect_color_banding(face_img)
+            if features.is_color:
+                banding_score = self._detect_color_banding(features)
                 if banding_score is not None:
                     edge_scores.append(banding_score)
             
@@ -754,7 +887,7 @@ class QualityValidator:
             edge_scores.append(texture_score)
             
             # 4. Analyze skin texture specifically for realism
-            skin_texture_score = self._analyze_skin_texture(face_img)
+            skin_texture_score = self._analyze_skin_texture(features)
             if skin_texture_score is not None:
                 edge_scores.append(skin_texture_score)
             
@@ -766,7 +899,7 @@ class QualityValidator:
         except Exception:
             return None
 
-    def _analyze_skin_texture(self, face_img: Image.Image) -> float | None:
+    def _analyze_skin_texture(self, face_img: Image.Image | ImageFeatures) -> float | None:
         """
         Analyze skin texture in face region for realism.
         
@@ -777,21 +910,19 @@ class QualityValidator:
         - Avoid AI-generated artifacts like plastic-looking or overly uniform skin
         
         Args:
-            face_img: PIL Image of the face region (can be RGB or grayscale)
+            face_img: PIL Image (or ImageFeatures) of the face region (can be RGB or grayscale)
             
         Returns:
             Skin texture realism score (0.0 to 1.0, higher = more realistic). None if analysis failed.
         """
         try:
             import numpy as np
+            from app.services.image_features import ImageFeatures
+            from app.services.image_filters import local_std
             
-            # Convert to grayscale for texture analysis
-            if face_img.mode != "L":
-                face_gray = face_img.convert("L")
-            else:
-                face_gray = face_img
-            
-            face_array = np.array(face_gray, dtype=np.float32)
+            # Grayscale for texture analysis
+            features = ImageFeatures.of(face_img)
+            face_array = features.gray
             h, w = face_array.shape
             
             # Skip if face region is too small for meaningful analysis
@@ -805,14 +936,9 @@ class QualityValidator:
             # Use local standard deviation in small windows
             window_size = min(5, h // 4, w // 4)  # Adaptive window size
             if window_size >= 3:
-                local_variations = []
-                for i in range(0, h - window_size + 1, window_size // 2):
-                    for j in range(0, w - window_size + 1, window_size // 2):
-                        window = face_array[i:i+window_size, j:j+window_size]
-                        local_std = np.std(window)
-                        local_variations.append(local_std)
+                local_variations = local_std(face_array, window_size, window_size // 2).ravel()
                 
-                if local_variations:
+                if local_variations.size:
                     mean_variation = float(np.mean(local_variations))
                     std_variation = float(np.std(local_variations))
                     
@@ -889,8 +1015,8 @@ class QualityValidator:
             # Real skin has natural balance between smoothness and detail
             # AI-generated skin often errs on too smooth (plastic) or too detailed (uncanny)
             # Use gradient analysis to measure smoothness
-            grad_h = np.abs(np.diff(face_array, axis=0))
-            grad_w = np.abs(np.diff(face_array, axis=1))
+            grad_h = features.abs_grad_h
+            grad_w = features.abs_grad_w
             
             mean_gradient = float(np.mean(np.concatenate([grad_h.flatten(), grad_w.flatten()])))
             
@@ -942,7 +1068,7 @@ class QualityValidator:
         except Exception:
             return None
 
-    def _analyze_lighting(self, img: Image.Image) -> float | None:
+    def _analyze_lighting(self, img: Image.Image | ImageFeatures) -> float | None:
         """
         Analyze lighting in image for naturalness.
         
@@ -955,21 +1081,18 @@ class QualityValidator:
         - Avoid overly dramatic/unnatural lighting (extreme contrast)
         
         Args:
-            img: PIL Image object (can be RGB or grayscale)
+            img: PIL Image object or precomputed ImageFeatures (can be RGB or grayscale)
             
         Returns:
             Lighting naturalness score (0.0 to 1.0, higher = more natural). None if analysis failed.
         """
         try:
             import numpy as np
+            from app.services.image_features import ImageFeatures
+            from app.services.image_filters import local_std
             
-            # Convert to grayscale for lighting analysis
-            if img.mode != "L":
-                gray = img.convert("L")
-            else:
-                gray = img
-            
-            img_array = np.array(gray, dtype=np.float32)
+            features = ImageFeatures.of(img)
+            img_array = features.gray
             h, w = img_array.shape
             
             # Skip if image is too small for meaningful analysis
@@ -1008,8 +1131,8 @@ class QualityValidator:
             # 2. Analyze directional consistency (light direction)
             # Natural lighting has consistent direction across the image
             # Calculate gradients to detect light direction
-            grad_h = np.diff(img_array, axis=0)  # Vertical gradients
-            grad_w = np.diff(img_array, axis=1)  # Horizontal gradients
+            grad_h = features.grad_h  # Vertical gradients
+            grad_w = features.grad_w  # Horizontal gradients
             
             # Analyze gradient directions to detect consistent light source
             # Split image into quadrants and check if gradients are consistent
@@ -1070,7 +1193,7 @@ class QualityValidator:
             # Overly dramatic lighting has extreme shadows/highlights
             
             # Calculate histogram to analyze brightness distribution
-            hist, _ = np.histogram(img_array, bins=32, range=(0, 255))
+            hist = features.histogram(32)
             hist_normalized = hist / (h * w)  # Normalize to probabilities
             
             # Calculate entropy of brightness distribution
@@ -1108,14 +1231,9 @@ class QualityValidator:
             # Calculate local standard deviation in small windows
             window_size = min(16, h // 4, w // 4)
             if window_size >= 8:
-                local_stds = []
-                for i in range(0, h - window_size + 1, window_size // 2):
-                    for j in range(0, w - window_size + 1, window_size // 2):
-                        window = img_array[i:i+window_size, j:j+window_size]
-                        local_std = np.std(window)
-                        local_stds.append(local_std)
+                local_stds = local_std(img_array, window_size, window_size // 2).ravel()
                 
-                if local_stds:
+                if local_stds.size:
                     mean_local_std = float(np.mean(local_stds))
                     std_local_std = float(np.std(local_stds))
                     
@@ -1149,264 +1267,18 @@ class QualityValidator:
         except Exception:
             return None
 
-    def _analyze_background_coherence(self, img: Image.Image) -> float | None:
-        """
-        Analyze background coherence in image.
-        
-        A coherent background should have:
-        - Consistent texture and patterns (not patchy or inconsistent)
-        - Natural transitions (no abrupt changes or artifacts)
-        - Contextual consistency (background elements make sense together)
-        - No obvious AI artifacts (floating objects, disconnected elements)
-        - Smooth color gradients (not banded or unnatural)
-        - Consistent depth/blur (background should be appropriately out of focus if foreground is in focus)
-        
-        Common AI generation issues:
-        - Inconsistent background textures (patchy, disconnected)
-        - Unnatural color transitions (banding, abrupt changes)
-        - Floating or disconnected objects
-        - Background elements that don't match the scene context
-        - Inconsistent blur/depth (background too sharp or too blurry relative to foreground)
-        
-        Args:
-            img: PIL Image object (can be RGB or grayscale)
-            
-        Returns:
-            Background coherence score (0.0 to 1.0, higher = more coherent). None if analysis failed.
-        """
-        try:
-            import numpy as np
-            
-            # Convert to RGB for analysis
-            if img.mode not in ("RGB", "RGBA"):
-                rgb_img = img.convert("RGB")
-            else:
-                rgb_img = img.convert("RGB")
-            
-            img_array = np.array(rgb_img, dtype=np.float32)
-            h, w, _ = img_array.shape
-            
-            # Skip if image is too small for meaningful analysis
-            if h < 64 or w < 64:
-                return None
-            
-            scores = []
-            
-            # 1. Analyze texture consistency across background regions
-            # Background should have consistent texture patterns
-            # Incoherent backgrounds have patchy, inconsistent textures
-            # Divide image into regions and compare texture consistency
-            num_regions = 4  # 2x2 grid
-            region_h = h // 2
-            region_w = w // 2
-            
-            # Extract edge/texture features from each region
-            region_textures = []
-            for i in range(2):
-                for j in range(2):
-                    y_start = i * region_h
-                    y_end = (i + 1) * region_h if i < 1 else h
-                    x_start = j * region_w
-                    x_end = (j + 1) * region_w if j < 1 else w
-                    
-                    region = img_array[y_start:y_end, x_start:x_end]
-                    # Convert to grayscale for texture analysis
-                    if region.shape[2] == 3:
-                        region_gray = np.mean(region, axis=2)
-                    else:
-                        region_gray = region[:, :, 0]
-                    
-                    # Calculate texture variance (local standard deviation)
-                    # Use small windows to measure local texture
-                    window_size = min(8, region_h // 4, region_w // 4)
-                    if window_size >= 4:
-                        local_stds = []
-                        for y in range(0, region_gray.shape[0] - window_size + 1, window_size // 2):
-                            for x in range(0, region_gray.shape[1] - window_size + 1, window_size // 2):
-                                window = region_gray[y:y+window_size, x:x+window_size]
-                                local_std = np.std(window)
-                                local_stds.append(local_std)
-                        
-                        if local_stds:
-                            texture_mean = float(np.mean(local_stds))
-                            texture_std = float(np.std(local_stds))
-                            region_textures.append({
-                                "mean": texture_mean,
-                                "std": texture_std
-                            })
-            
-            # Compare texture consistency across regions
-            if len(region_textures) >= 3:
-                texture_means = [r["mean"] for r in region_textures]
-                texture_stds = [r["std"] for r in region_textures]
-                
-                # Coherent backgrounds have similar texture across regions
-                mean_variance = float(np.var(texture_means))
-                std_variance = float(np.var(texture_stds))
-                
-                avg_texture_mean = float(np.mean(texture_means))
-                
-                if avg_texture_mean > 0:
-                    # Normalize variance relative to mean
-                    normalized_mean_var = mean_variance / (avg_texture_mean ** 2 + 1e-6)
-                    normalized_std_var = std_variance / (avg_texture_mean ** 2 + 1e-6)
-                    
-                    # Low variance = consistent = coherent
-                    # High variance = inconsistent = incoherent
-                    if normalized_mean_var < 0.1 and normalized_std_var < 0.1:
-                        texture_consistency_score = 0.9
-                    elif normalized_mean_var < 0.2 and normalized_std_var < 0.2:
-                        texture_consistency_score = 0.7
-                    elif normalized_mean_var < 0.4 and normalized_std_var < 0.4:
-                        texture_consistency_score = 0.5
-                    else:
-                        # High variance = patchy/incoherent background
-                        texture_consistency_score = 0.3
-                    
-                    scores.append(texture_consistency_score)
-            
-            # 2. Analyze color consistency and transitions
-            # Background should have smooth color transitions
-            # Abrupt color changes or banding indicate incoherence
-            # Convert to grayscale for gradient analysis
-            gray = np.mean(img_array, axis=2)
-            
-            # Calculate gradients to detect abrupt changes
-            grad_h = np.abs(np.diff(gray, axis=0))
-            grad_w = np.abs(np.diff(gray, axis=1))
-            
-            # Analyze gradient distribution
-            # Smooth backgrounds have moderate, consistent gradients
-            # Abrupt changes show up as high gradients
-            all_gradients = np.concatenate([grad_h.flatten(), grad_w.flatten()])
-            grad_mean = float(np.mean(all_gradients))
-            grad_std = float(np.std(all_gradients))
-            
-            # Check for abrupt transitions (high gradient spikes)
-            # Coherent backgrounds have smooth transitions
-            grad_95th = float(np.percentile(all_gradients, 95))
-            
-            if grad_mean > 0:
-                # Ratio of high gradients to mean indicates abruptness
-                abruptness_ratio = grad_95th / (grad_mean + 1e-6)
-                
-                # Smooth backgrounds: ratio < 3.0
-                # Abrupt transitions: ratio > 5.0
-                if abruptness_ratio < 3.0:
-                    transition_score = 0.9
-                elif abruptness_ratio < 4.0:
-                    transition_score = 0.7
-                elif abruptness_ratio < 5.0:
-                    transition_score = 0.5
-                else:
-                    # Very abrupt transitions (incoherent)
-                    transition_score = 0.3
-                
-                scores.append(transition_score)
-            
-            # 3. Check for color banding (unnatural color gradients)
-            # This is similar to the existing color banding check but focused on background
-            banding_score = self._detect_color_banding(rgb_img)
-            if banding_score is not None:
-                # Higher banding score = less banding = more coherent
-                scores.append(banding_score)
-            
-            # 4. Analyze spatial consistency (check for disconnected elements)
-            # Background elements should be spatially consistent
-            # Use edge detection to identify potential disconnected objects
-            # Convert to grayscale
-            gray_array = gray.astype(np.float32)
-            
-            # Calculate edge strength
-            # Horizontal edges
-            h_kernel = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]], dtype=np.float32)
-            h_edges = self._apply_kernel(gray_array, h_kernel)
-            
-            # Vertical edges
-            v_kernel = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]], dtype=np.float32)
-            v_edges = self._apply_kernel(gray_array, v_kernel)
-            
-            edge_magnitude = np.sqrt(h_edges**2 + v_edges**2)
-            
-            # Analyze edge distribution
-            # Coherent backgrounds have consistent edge patterns
-            # Incoherent backgrounds have isolated high-edge regions (disconnected objects)
-            edge_mean = float(np.mean(edge_magnitude))
-            edge_std = float(np.std(edge_magnitude))
-            
-            if edge_mean > 0:
-                # Coefficient of variation
-                edge_cv = edge_std / edge_mean
-                
-                # Very high CV indicates isolated high-edge regions (disconnected elements)
-                # Moderate CV indicates consistent background
-                if edge_cv < 0.8:
-                    # Consistent edge pattern (coherent)
-                    spatial_score = 0.9
-                elif edge_cv < 1.2:
-                    spatial_score = 0.7
-                elif edge_cv < 1.8:
-                    spatial_score = 0.5
-                else:
-                    # Very inconsistent (likely disconnected elements)
-                    spatial_score = 0.3
-                
-                scores.append(spatial_score)
-            
-            # 5. Analyze depth/blur consistency (if applicable)
-            # Background should be appropriately blurred if foreground is in focus
-            # This is a simplified check - full depth analysis would require more complex methods
-            # For now, check if background regions have consistent blur levels
-            blur_score = self._detect_blur(rgb_img)
-            if blur_score is not None:
-                # If image is sharp overall, background should also be reasonably sharp
-                # If image is blurry, it might be intentional (depth of field)
-                # For coherence, we mainly check that blur is consistent across background
-                # This is a simplified check - in practice, we'd need to separate foreground/background
-                # For now, if overall blur is consistent (not patchy), that's a good sign
-                if blur_score >= 100:  # Reasonably sharp
-                    blur_consistency_score = 0.8
-                else:
-                    # Blurry might be intentional (depth of field)
-                    blur_consistency_score = 0.6
-                
-                scores.append(blur_consistency_score)
-            
-            # Average all scores
-            if scores:
-                final_score = float(np.mean(scores))
-                return max(0.0, min(1.0, final_score))
-            
-            return None
-            
-        except Exception:
-            return None
-
     def _apply_kernel(self, img_array: "np.ndarray", kernel: "np.ndarray") -> "np.ndarray":
-        """Apply convolution kernel to image array (simple implementation)."""
-        import numpy as np
-        
-        h, w = img_array.shape
-        kh, kw = kernel.shape
-        pad_h, pad_w = kh // 2, kw // 2
-        
-        # Pad image
-        padded = np.pad(img_array, ((pad_h, pad_h), (pad_w, pad_w)), mode="edge")
+        """Apply convolution kernel to image array (edge-padded, same size output)."""
+        from app.services.image_filters import correlate2d
         
-        # Apply kernel
-        result = np.zeros_like(img_array)
-        for i in range(h):
-            for j in range(w):
-                result[i, j] = np.sum(padded[i:i+kh, j:j+kw] * kernel)
-        
-        return result
+        return correlate2d(img_array, kernel)
 
-    def _check_color_contrast(self, img: Image.Image) -> dict[str, float] | None:
+    def _check_color_contrast(self, img: Image.Image | ImageFeatures) -> dict[str, float] | None:
         """
         Check color and contrast quality metrics.
         
         Args:
-            img: PIL Image object
+            img: PIL Image object or precomputed ImageFeatures
             
         Returns:
             Dictionary with metrics: contrast, brightness, saturation (for color images).
@@ -1414,14 +1286,11 @@ class QualityValidator:
         """
         try:
             import numpy as np
+            from app.services.image_features import ImageFeatures
             
-            # Convert to grayscale for contrast/brightness
-            if img.mode != "L":
-                gray = img.convert("L")
-            else:
-                gray = img
-            
-            gray_array = np.array(gray, dtype=np.float32) / 255.0
+            # Grayscale luminance (0.0-1.0) for contrast/brightness
+            features = ImageFeatures.of(img)
+            gray_array = features.luminance
             
             # Calculate contrast (standard deviation of pixel values)
             # Higher std = more contrast
@@ -1437,23 +1306,16 @@ class QualityValidator:
             }
             
             # Calculate color saturation (for color images)
-            if img.mode in ("RGB", "RGBA"):
-                rgb_array = np.array(img.convert("RGB"), dtype=np.float32) / 255.0
-                
+            if features.is_color:
                 # Calculate saturation using HSV-like approach
                 # Saturation = std of RGB values per pixel, averaged
                 # Higher std = more saturated colors
-                pixel_saturations = []
-                for i in range(rgb_array.shape[0]):
-                    for j in range(rgb_array.shape[1]):
-                        pixel_rgb = rgb_array[i, j]
-                        # Saturation is the standard deviation of RGB values
-                        # For a grayscale pixel, std = 0 (no saturation)
-                        # For a pure color, std is high
-                        pixel_std = float(np.std(pixel_rgb))
-                        pixel_saturations.append(pixel_std)
+                # Saturation is the standard deviation of RGB values
+                # For a grayscale pixel, std = 0 (no saturation)
+                # For a pure color, std is high
+                pixel_saturations = np.std(features.rgb, axis=2) / 255.0
                 
-                saturation = float(np.mean(pixel_saturations)) if pixel_saturations else 0.0
+                saturation = float(np.mean(pixel_saturations)) if pixel_saturations.size else 0.0
                 metrics["saturation"] = saturation
             
             return metrics
@@ -1462,39 +1324,21 @@ class QualityValidator:
         except Exception:
             return None
 
-    def _detect_color_banding(self, img: Image.Image) -> float | None:
+    def _detect_color_banding(self, img: Image.Image | ImageFeatures) -> float | None:
         """
         Detect color banding artifacts (unnatural color gradients).
         
         Args:
-            img: PIL Image object (RGB/RGBA)
+            img: PIL Image object or precomputed ImageFeatures (RGB/RGBA)
             
         Returns:
             Banding score (0.0 to 1.0, higher = less banding). None if detection failed.
         """
         try:
-            import numpy as np
-            
-            # Convert to numpy array
-            img_array = np.array(img.convert("RGB"), dtype=np.float32)
+            from app.services.image_features import ImageFeatures
             
-            # Calculate gradient in each color channel
-            # Simple gradient: difference between adjacent pixels
-            gradients = []
-            for channel in range(3):  # R, G, B
-                channel_data = img_array[:, :, channel]
-                # Horizontal gradient
-                h_grad = np.abs(np.diff(channel_data, axis=1))
-                # Vertical gradient
-                v_grad = np.abs(np.diff(channel_data, axis=0))
-                gradients.extend([h_grad.flatten(), v_grad.flatten()])
-            
-            # Combine all gradients
-            all_gradients = np.concatenate(gradients)
-            
-            # Calculate gradient distribution
-            grad_mean = np.mean(all_gradients)
-            grad_std = np.std(all_gradients)
+            # Distribution of absolute neighbour differences across R, G, B
+            grad_mean, grad_std = ImageFeatures.of(img).rgb_gradient_stats
             
             # Color banding shows up as very uniform gradients (low variance)
             # Normal images have varied gradients
@@ -1513,12 +1357,12 @@ class QualityValidator:
         except Exception:
             return None
 
-    def _detect_blur(self, img: Image.Image) -> float | None:
+    def _detect_blur(self, img: Image.Image | ImageFeatures) -> float | None:
         """
         Detect blur in image using variance of Laplacian.
         
         Args:
-            img: PIL Image object
+            img: PIL Image object or precomputed ImageFeatures
             
         Returns:
             Blur score (higher = sharper). None if detection failed.
@@ -1526,23 +1370,10 @@ class QualityValidator:
         """
         try:
             import numpy as np
-            from PIL import ImageFilter
-            
-            # Convert to grayscale if needed
-            if img.mode != "L":
-                gray = img.convert("L")
-            else:
-                gray = img
-            
-            # Apply Laplacian filter
-            laplacian = gray.filter(ImageFilter.Kernel(
-                (3, 3),
-                [0, -1, 0, -1, 4, -1, 0, -1, 0],
-                scale=1
-            ))
+            from app.services.image_features import ImageFeatures
             
-            # Convert to numpy array and calculate variance
-            laplacian_array = np.array(laplacian)
+            # Variance of the grayscale Laplacian
+            laplacian_array = ImageFeatures.of(img).laplacian
             variance = float(np.var(laplacian_array))
             
             return variance
@@ -1586,7 +1417,7 @@ class QualityValidator:
 
         return Decimal(str(round(score, 2)))
     
-    def _analyze_background_coherence(self, img: Image.Image) -> float | None:
+    def _analyze_background_coherence(self, img: Image.Image | ImageFeatures) -> float | None:
         """
         Analyze background coherence in image.
         
@@ -1598,21 +1429,18 @@ class QualityValidator:
         - Natural color gradients and transitions
         
         Args:
-            img: PIL Image object (can be RGB or grayscale)
+            img: PIL Image object or precomputed ImageFeatures (can be RGB or grayscale)
             
         Returns:
             Background coherence score (0.0 to 1.0, higher = more coherent). None if analysis failed.
         """
         try:
             import numpy as np
+            from app.services.image_features import ImageFeatures
+            from app.services.image_filters import local_var
             
-            # Convert to grayscale for analysis
-            if img.mode != "L":
-                gray = img.convert("L")
-            else:
-                gray = img
-            
-            img_array = np.array(gray, dtype=np.float32)
+            features = ImageFeatures.of(img)
+            img_array = features.gray
             h, w = img_array.shape
             
             # Skip if image is too small
@@ -1626,8 +1454,8 @@ class QualityValidator:
             # Incoherent backgrounds have abrupt edge changes (seams, cut-paste artifacts)
             
             # Calculate gradients
-            grad_h = np.abs(np.diff(img_array, axis=0))
-            grad_w = np.abs(np.diff(img_array, axis=1))
+            grad_h = features.abs_grad_h
+            grad_w = features.abs_grad_w
             
             # Analyze gradient consistency across image regions
             # Split into 9 regions (3x3 grid)
@@ -1676,11 +1504,7 @@ class QualityValidator:
             # Calculate local texture variance in windows
             window_size = min(16, h // 8, w // 8)
             if window_size >= 8:
-                texture_vars = []
-                for i in range(0, h - window_size + 1, window_size // 2):
-                    for j in range(0, w - window_size + 1, window_size // 2):
-                        window = img_array[i:i+window_size, j:j+window_size]
-                        texture_vars.append(float(np.var(window)))
+                texture_vars = local_var(img_array, window_size, window_size // 2).ravel()
                 
                 if len(texture_vars) >= 4:
                     texture_var_std = float(np.std(texture_vars))
@@ -1700,8 +1524,8 @@ class QualityValidator:
                         scores.append(texture_score)
             
             # 3. Analyze color/grayscale continuity (for RGB images)
-            if img.mode in ("RGB", "RGBA"):
-                rgb_array = np.array(img.convert("RGB"), dtype=np.float32)
+            if features.is_color:
+                rgb_array = features.rgb
                 
                 # Check for abrupt color changes (cut-paste artifacts)
                 # Calculate color differences between adjacent regions
@@ -1765,7 +1589,7 @@ class QualityValidator:
         except Exception:
             return None
     
-    def _detect_hands_fingers(self, img: Image.Image) -> float | None:
+    def _detect_hands_fingers(self, img: Image.Image | ImageFeatures) -> float | None:
         """
         Detect if hands and fingers are correctly rendered.
         
@@ -1777,26 +1601,26 @@ class QualityValidator:
         - Fingers that don't connect properly to hands
         
         Args:
-            img: PIL Image object (can be RGB or grayscale)
+            img: PIL Image object or precomputed ImageFeatures (can be RGB or grayscale)
             
         Returns:
             Hands/fingers correctness score (0.0 to 1.0, higher = more correct). None if detection failed.
         """
         try:
             import numpy as np
+            from app.services.image_features import ImageFeatures
             
             # Try to import OpenCV for hand detection
             try:
                 import cv2
-                cv2_available = True
             except ImportError:
-                cv2_available = False
                 logger.debug("OpenCV not available - skipping hand detection")
                 return None
             
-            # Convert PIL image to OpenCV format
-            img_array = np.array(img.convert("RGB"))
-            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+            # OpenCV views of the image
+            features = ImageFeatures.of(img)
+            img_array = features.rgb_uint8
+            gray = features.cv_gray
             
             # Use hand detection (simplified approach)
             # Note: Full hand pose estimation would require MediaPipe or similar
@@ -1804,7 +1628,7 @@ class QualityValidator:
             
             # Detect skin-colored regions (potential hands)
             # Convert to HSV for better skin detection
-            hsv = cv2.cvtColor(img_array, cv2.COLOR_RGB2HSV)
+            hsv = features.cv_hsv
             
             # Skin color range in HSV (approximate)
             lower_skin = np.array([0, 20, 70], dtype=np.uint8)
@@ -1905,7 +1729,7 @@ class QualityValidator:
             logger.debug(f"Hand detection failed: {exc}")
             return None
     
-    def _check_character_consistency(self, img: Image.Image, reference_img: Image.Image | None = None) -> float | None:
+    def _check_character_consistency(self, img: Image.Image | ImageFeatures, reference_img: Image.Image | None = None) -> float | None:
         """
         Check character consistency across images.
         
@@ -1914,7 +1738,7 @@ class QualityValidator:
         checks internal consistency (facial features, proportions, etc.).
         
         Args:
-            img: PIL Image object to check
+            img: PIL Image object or precomputed ImageFeatures to check
             reference_img: Optional reference image for comparison (not used in single-image mode)
             
         Returns:
@@ -1922,17 +1746,13 @@ class QualityValidator:
         """
         try:
             import numpy as np
+            from app.services.image_features import ImageFeatures
             
             # For single-image validation, check internal consistency
             # (facial symmetry, feature proportions, etc.)
             
-            # Convert to grayscale
-            if img.mode != "L":
-                gray = img.convert("L")
-            else:
-                gray = img
-            
-            img_array = np.array(gray, dtype=np.float32)
+            features = ImageFeatures.of(img)
+            img_array = features.gray
             h, w = img_array.shape
             
             if h < 64 or w < 64:
@@ -1946,12 +1766,11 @@ class QualityValidator:
                 import cv2
                 
                 # Detect faces
-                face_cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-                face_cascade = cv2.CascadeClassifier(face_cascade_path)
+                face_cascade = _face_cascade()
                 
-                if not face_cascade.empty():
-                    rgb_array = np.array(img.convert("RGB"))
-                    gray_cv = cv2.cvtColor(rgb_array, cv2.COLOR_RGB2GRAY)
+                if face_cascade is not None:
+                    rgb_array = features.rgb_uint8
+                    gray_cv = features.cv_gray
                     faces = face_cascade.detectMultiScale(gray_cv, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
                     
                     if len(faces) > 0:
@@ -1989,8 +1808,8 @@ class QualityValidator:
             
             # 2. Check feature consistency (proportions)
             # Analyze edge patterns for consistent feature placement
-            grad_h = np.abs(np.diff(img_array, axis=0))
-            grad_w = np.abs(np.diff(img_array, axis=1))
+            grad_h = features.abs_grad_h
+            grad_w = features.abs_grad_w
             
             # Check for consistent edge patterns (suggests consistent features)
             edge_consistency = float(np.std([np.mean(grad_h), np.mean(grad_w)]))
@@ -2009,8 +1828,8 @@ class QualityValidator:
                 scores.append(feature_score)
             
             # 3. Check color consistency (for RGB images)
-            if img.mode in ("RGB", "RGBA"):
-                rgb_array = np.array(img.convert("RGB"), dtype=np.float32)
+            if features.is_color:
+                rgb_array = features.rgb
                 
                 # Analyze color distribution consistency
                 # Consistent characters have consistent color palettes
@@ -2040,7 +1859,7 @@ class QualityValidator:
         except Exception:
             return None
     
-    def _detect_ai_signatures(self, img: Image.Image) -> float | None:
+    def _detect_ai_signatures(self, img: Image.Image | ImageFeatures) -> float | None:
         """
         Detect obvious AI generation signatures.
         
@@ -2052,21 +1871,18 @@ class QualityValidator:
         - Specific AI model artifacts
         
         Args:
-            img: PIL Image object (can be RGB or grayscale)
+            img: PIL Image object or precomputed ImageFeatures (can be RGB or grayscale)
             
         Returns:
             AI signatures score (0.0 to 1.0, higher = fewer signatures). None if detection failed.
         """
         try:
             import numpy as np
+            from app.services.image_features import ImageFeatures
+            from app.services.image_filters import local_var
             
-            # Convert to grayscale
-            if img.mode != "L":
-                gray = img.convert("L")
-            else:
-                gray = img
-            
-            img_array = np.array(gray, dtype=np.float32)
+            features = ImageFeatures.of(img)
+            img_array = features.gray
             h, w = img_array.shape
             
             if h < 64 or w < 64:
@@ -2108,8 +1924,8 @@ class QualityValidator:
             # Check for rectangular high-contrast regions (potential watermarks)
             
             # Calculate edge strength
-            grad_h = np.abs(np.diff(img_array, axis=0))
-            grad_w = np.abs(np.diff(img_array, axis=1))
+            grad_h = features.abs_grad_h
+            grad_w = features.abs_grad_w
             edge_strength = (grad_h[:-1, :] + grad_w[:, :-1]) / 2.0 if grad_h.shape[0] > 0 and grad_w.shape[1] > 0 else np.zeros((h-1, w-1))
             
             # Check corners and edges for watermark-like patterns
@@ -2185,11 +2001,7 @@ class QualityValidator:
             
             window_size = min(16, h // 8, w // 8)
             if window_size >= 8:
-                texture_vars = []
-                for i in range(0, h - window_size + 1, window_size):
-                    for j in range(0, w - window_size + 1, window_size):
-                        window = img_array[i:i+window_size, j:j+window_size]
-                        texture_vars.append(float(np.var(window)))
+                texture_vars = local_var(img_array, window_size, window_size).ravel()
                 
                 if len(texture_vars) >= 4:
                     texture_var_mean = float(np.mean(texture_vars))
@@ -2255,6 +2067,67 @@ class QualityValidator:
         }
 
 
+def _error_result(message: str) -> QualityResult:
+    """Build a failed QualityResult carrying a single error message."""
+    return QualityResult(
+        quality_score=None,
+        is_valid=False,
+        checks_passed=[],
+        checks_failed=[],
+        warnings=[],
+        errors=[message],
+        metadata={},
+    )
+
+
+# ----------------------------------------------------------------------
+# Process pool for batch validation
+# ----------------------------------------------------------------------
+
+_validation_pool: ProcessPoolExecutor | None = None
+_validation_pool_lock = threading.Lock()
+_worker_validator: QualityValidator | None = None
+
+
+def _validate_in_worker(file_path: str, selected_checks: tuple[str, ...]) -> QualityResult:
+    """Validate one file inside a pool worker (validator is created once per process)."""
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = QualityValidator()
+    return _worker_validator._validate_file(Path(file_path), selected_checks)
+
+
+def _get_validation_pool() -> ProcessPoolExecutor | None:
+    """Get (and lazily create) the shared validation process pool, None if unavailable."""
+    global _validation_pool
+    with _validation_pool_lock:
+        if _validation_pool is None:
+            try:
+                # spawn: forking a multi-threaded server process is unsafe
+                _validation_pool = ProcessPoolExecutor(
+                    max_workers=max(1, settings.quality_validation_workers),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except (OSError, NotImplementedError) as exc:
+                logger.warning(f"Quality validation process pool unavailable, validating inline: {exc}")
+                return None
+        return _validation_pool
+
+
+def shutdown_validation_pool(wait: bool = True) -> None:
+    """
+    Stop batch validation worker processes (called on application shutdown).
+
+    Args:
+        wait: Block until worker processes have exited.
+    """
+    global _validation_pool
+    with _validation_pool_lock:
+        pool, _validation_pool = _validation_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
 # Singleton instance
 quality_validator = QualityValidator()
 
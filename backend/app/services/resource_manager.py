@@ -1,7 +1,9 @@
 """Resource management service for tracking and managing system resources.
 
 This service provides:
-- Real-time resource usage tracking (CPU, memory, disk, GPU)
+- Real-time resource usage tracking (CPU, memory, disk, GPU) from a background
+  sampler that keeps a ring buffer of recent samples
+- Windowed aggregates (min/avg/p95/max) over the recent samples
 - Configurable resource limits and thresholds
 - Automatic cleanup of temporary files and old data
 - Resource usage alerts and warnings
@@ -14,12 +16,15 @@ import platform
 import psutil
 import shutil
 import subprocess
+import threading
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from app.core.config import settings
 from app.core.paths import repo_root
 from app.services.unified_logging import get_unified_logger
 
@@ -67,20 +72,75 @@ class ResourceAlert:
     timestamp: float
 
 
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _aggregate(values: list[float]) -> dict[str, float]:
+    """Min/avg/p95/max of a non-empty list of values."""
+    ordered = sorted(values)
+    return {
+        "min": ordered[0],
+        "avg": round(sum(ordered) / len(ordered), 1),
+        "p95": _percentile(ordered, 95),
+        "max": ordered[-1],
+    }
+
+
+def _usage_series(samples: list[ResourceUsage]) -> dict[str, list[float]]:
+    """Split samples into per-metric value lists (percentages only)."""
+    series: dict[str, list[float]] = {
+        "cpu_percent": [],
+        "memory_percent": [],
+        "disk_percent": [],
+        "gpu_memory_percent": [],
+        "gpu_utilization_percent": [],
+    }
+    for usage in samples:
+        series["cpu_percent"].append(usage.cpu_percent)
+        series["memory_percent"].append(usage.memory_percent)
+        series["disk_percent"].append(usage.disk_percent)
+        if usage.gpu_memory_used_gb is not None and usage.gpu_memory_total_gb:
+            series["gpu_memory_percent"].append(
+                round(usage.gpu_memory_used_gb / usage.gpu_memory_total_gb * 100, 1)
+            )
+        if usage.gpu_utilization_percent is not None:
+            series["gpu_utilization_percent"].append(usage.gpu_utilization_percent)
+    return series
+
+
 class ResourceManager:
     """Manages system resources including tracking, limits, and cleanup."""
     
-    def __init__(self, limits: ResourceLimits | None = None) -> None:
+    def __init__(
+        self,
+        limits: ResourceLimits | None = None,
+        sample_interval_s: float | None = None,
+        history_minutes: float | None = None,
+    ) -> None:
         """
         Initialize resource manager.
         
         Args:
             limits: Optional resource limits configuration. Uses defaults if not provided.
+            sample_interval_s: Seconds between background samples (defaults to settings).
+            history_minutes: Minutes of samples kept for windowed aggregates (defaults to settings).
         """
         self.limits = limits or ResourceLimits()
         self.logger = get_unified_logger()
         self._project_root = repo_root()
         self._gpu_available = self._check_gpu_available()
+        self.sample_interval_s = sample_interval_s or settings.resource_sample_interval_s
+        history_minutes = history_minutes or settings.resource_sample_history_minutes
+        max_samples = max(1, int(history_minutes * 60 / self.sample_interval_s))
+        self._samples: deque[ResourceUsage] = deque(maxlen=max_samples)
+        self._samples_lock = threading.Lock()
+        self._sampler_thread: threading.Thread | None = None
+        self._sampler_stop = threading.Event()
+        # Prime psutil's CPU counters so the first non-blocking read is meaningful
+        psutil.cpu_percent(interval=None)
     
     def _check_gpu_available(self) -> bool:
         """Check if GPU is available via nvidia-smi."""
@@ -96,81 +156,59 @@ class ResourceManager:
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
     
-    def _get_gpu_memory(self) -> tuple[float | None, float | None]:
-        """Get GPU memory usage (used, total) in GB.
+    def _get_gpu_stats(self) -> tuple[float | None, float | None, float | None]:
+        """Get GPU memory usage and utilization with a single nvidia-smi call.
         
         Returns:
-            Tuple of (used_gb, total_gb) or (None, None) if unavailable.
+            Tuple of (memory_used_gb, memory_total_gb, utilization_percent) for the
+            first GPU, with None for anything unavailable.
         """
         if not self._gpu_available:
-            return None, None
+            return None, None, None
         
         try:
             result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=memory.used,memory.total", "--format=csv,noheader,nounits"],
+                [
+                    "nvidia-smi",
+                    "--query-gpu=memory.used,memory.total,utilization.gpu",
+                    "--format=csv,noheader,nounits",
+                ],
                 capture_output=True,
                 text=True,
                 timeout=2.0,
                 check=False,
             )
             if result.returncode != 0:
-                return None, None
+                return None, None, None
             
             lines = result.stdout.strip().split("\n")
             if not lines:
-                return None, None
+                return None, None, None
             
             # Get first GPU
             parts = lines[0].strip().split(",")
-            if len(parts) != 2:
-                return None, None
+            if len(parts) != 3:
+                return None, None, None
             
-            used_mb = float(parts[0].strip())
-            total_mb = float(parts[1].strip())
-            return round(used_mb / 1024, 2), round(total_mb / 1024, 2)
+            used_mb, total_mb, util = (float(part.strip()) for part in parts)
+            return round(used_mb / 1024, 2), round(total_mb / 1024, 2), round(util, 1)
         except Exception:  # noqa: BLE001
-            return None, None
+            return None, None, None
     
-    def _get_gpu_utilization(self) -> float | None:
-        """Get GPU utilization percentage.
+    def sample(self) -> ResourceUsage:
+        """Take a resource usage sample now without blocking on CPU measurement.
         
-        Returns:
-            GPU utilization percentage (0-100) or None if unavailable.
-        """
-        if not self._gpu_available:
-            return None
-        
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
-                capture_output=True,
-                text=True,
-                timeout=2.0,
-                check=False,
-            )
-            if result.returncode != 0:
-                return None
-            
-            lines = result.stdout.strip().split("\n")
-            if not lines:
-                return None
-            
-            # Get first GPU
-            util = float(lines[0].strip())
-            return round(util, 1)
-        except Exception:  # noqa: BLE001
-            return None
-    
-    def get_current_usage(self) -> ResourceUsage:
-        """Get current system resource usage.
+        CPU usage is measured since the previous sample (psutil keeps the
+        counters between calls), so the result is an average over the sampling
+        interval rather than over a fixed one-second sleep.
         
         Returns:
             ResourceUsage object with current metrics.
         """
         now = time.time()
         
-        # CPU usage (average over 1 second)
-        cpu_percent = psutil.cpu_percent(interval=1.0)
+        # CPU usage since the previous call (non-blocking)
+        cpu_percent = psutil.cpu_percent(interval=None)
         
         # Memory usage
         memory = psutil.virtual_memory()
@@ -185,8 +223,7 @@ class ResourceManager:
         disk_percent = round((disk.used / disk.total) * 100, 1)
         
         # GPU usage
-        gpu_memory_used, gpu_memory_total = self._get_gpu_memory()
-        gpu_utilization = self._get_gpu_utilization()
+        gpu_memory_used, gpu_memory_total, gpu_utilization = self._get_gpu_stats()
         
         return ResourceUsage(
             timestamp=now,
@@ -203,17 +240,155 @@ class ResourceManager:
             gpu_utilization_percent=gpu_utilization,
         )
     
-    def check_alerts(self, usage: ResourceUsage | None = None) -> list[ResourceAlert]:
+    def record_sample(self) -> ResourceUsage:
+        """Take a sample and append it to the in-memory history.
+        
+        Returns:
+            The recorded ResourceUsage.
+        """
+        usage = self.sample()
+        with self._samples_lock:
+            self._samples.append(usage)
+        return usage
+    
+    def get_current_usage(self) -> ResourceUsage:
+        """Get current system resource usage.
+        
+        Returns the latest background sample when it is recent (O(1), no
+        system calls); otherwise takes and records a sample on demand.
+        
+        Returns:
+            ResourceUsage object with current metrics.
+        """
+        with self._samples_lock:
+            latest = self._samples[-1] if self._samples else None
+        if latest is not None and time.time() - latest.timestamp <= 2 * self.sample_interval_s:
+            return latest
+        return self.record_sample()
+    
+    def get_usage_window(self, minutes: float) -> dict[str, Any]:
+        """Aggregate recorded samples over the last ``minutes``.
+        
+        Args:
+            minutes: Window length in minutes.
+        
+        Returns:
+            Dictionary with window_minutes, samples (count), start/end timestamps
+            and, per metric (cpu_percent, memory_percent, disk_percent,
+            gpu_memory_percent, gpu_utilization_percent), the min/avg/p95/max of
+            the window or None when the metric has no samples.
+        """
+        cutoff = time.time() - minutes * 60
+        with self._samples_lock:
+            window = [usage for usage in reversed(self._samples) if usage.timestamp >= cutoff]
+        if not window:
+            window = [self.record_sample()]
+        window.reverse()
+        
+        metrics: dict[str, dict[str, float] | None] = {}
+        for name, values in _usage_series(window).items():
+            metrics[name] = _aggregate(values) if values else None
+        
+        return {
+            "window_minutes": minutes,
+            "samples": len(window),
+            "start": window[0].timestamp,
+            "end": window[-1].timestamp,
+            "metrics": metrics,
+        }
+    
+    def get_window_usage(self, minutes: float, statistic: str = "avg") -> ResourceUsage:
+        """Summarize the last ``minutes`` of samples as a single ResourceUsage.
+        
+        Percentages use the requested statistic; absolute sizes (GB) come
+        from the latest sample.
+        
+        Args:
+            minutes: Window length in minutes.
+            statistic: One of "min", "avg", "p95" or "max".
+        
+        Returns:
+            ResourceUsage whose percentages are window aggregates.
+        """
+        window = self.get_usage_window(minutes)
+        latest = self.get_current_usage()
+        
+        def stat(name: str) -> float | None:
+            values = window["metrics"][name]
+            return None if values is None else values[statistic]
+        
+        gpu_memory_used = latest.gpu_memory_used_gb
+        gpu_memory_percent = stat("gpu_memory_percent")
+        if gpu_memory_percent is not None and latest.gpu_memory_total_gb:
+            gpu_memory_used = round(latest.gpu_memory_total_gb * gpu_memory_percent / 100, 2)
+        
+        return ResourceUsage(
+            timestamp=latest.timestamp,
+            cpu_percent=stat("cpu_percent"),
+            memory_used_gb=latest.memory_used_gb,
+            memory_total_gb=latest.memory_total_gb,
+            memory_percent=stat("memory_percent"),
+            disk_used_gb=latest.disk_used_gb,
+            disk_total_gb=latest.disk_total_gb,
+            disk_percent=stat("disk_percent"),
+            gpu_available=latest.gpu_available,
+            gpu_memory_used_gb=gpu_memory_used,
+            gpu_memory_total_gb=latest.gpu_memory_total_gb,
+            gpu_utilization_percent=stat("gpu_utilization_percent"),
+        )
+    
+    def start_sampler(self) -> None:
+        """Start the background sampling thread (no-op if already running)."""
+        if self._sampler_thread is not None and self._sampler_thread.is_alive():
+            return
+        self._sampler_stop.clear()
+        self._sampler_thread = threading.Thread(
+            target=self._sampler_loop, name="resource-sampler", daemon=True
+        )
+        self._sampler_thread.start()
+    
+    def stop_sampler(self, timeout: float = 5.0) -> None:
+        """Stop the background sampling thread.
+        
+        Args:
+            timeout: Seconds to wait for the thread to exit.
+        """
+        thread, self._sampler_thread = self._sampler_thread, None
+        self._sampler_stop.set()
+        if thread is not None:
+            thread.join(timeout=timeout)
+    
+    @property
+    def sampler_running(self) -> bool:
+        """Whether the background sampling thread is active."""
+        return self._sampler_thread is not None and self._sampler_thread.is_alive()
+    
+    def _sampler_loop(self) -> None:
+        while not self._sampler_stop.is_set():
+            try:
+                self.record_sample()
+            except Exception as exc:  # noqa: BLE001
+                self.logger.warning("backend", f"Resource sample failed: {exc}")
+            self._sampler_stop.wait(self.sample_interval_s)
+    
+    def check_alerts(
+        self,
+        usage: ResourceUsage | None = None,
+        window_minutes: float | None = None,
+    ) -> list[ResourceAlert]:
         """Check resource usage against limits and return alerts.
         
         Args:
-            usage: Optional ResourceUsage object. If not provided, fetches current usage.
+            usage: Optional ResourceUsage object. If not provided, uses the
+                average over the alert window.
+            window_minutes: Window to average over when ``usage`` is not given
+                (defaults to settings.resource_alert_window_minutes).
         
         Returns:
             List of ResourceAlert objects for any exceeded thresholds.
         """
         if usage is None:
-            usage = self.get_current_usage()
+            usage = self.get_window_usage(window_minutes or settings.resource_alert_window_minutes)
         
         alerts: list[ResourceAlert] = []
         
@@ -441,14 +616,21 @@ class ResourceManager:
         
         return result
     
-    def get_usage_summary(self) -> dict[str, Any]:
+    def get_usage_summary(self, window_minutes: float | None = None) -> dict[str, Any]:
         """Get comprehensive resource usage summary with alerts.
         
+        Args:
+            window_minutes: Window for aggregates and alerts (defaults to
+                settings.resource_alert_window_minutes).
+        
         Returns:
-            Dictionary containing usage metrics, alerts, and recommendations.
+            Dictionary containing latest usage metrics, windowed aggregates,
+            alerts, and limits.
         """
+        window_minutes = window_minutes or settings.resource_alert_window_minutes
         usage = self.get_current_usage()
-        alerts = self.check_alerts(usage)
+        window = self.get_usage_window(window_minutes)
+        alerts = self.check_alerts(window_minutes=window_minutes)
         
         # Convert to dictionaries for JSON serialization
         usage_dict = {
@@ -488,6 +670,7 @@ class ResourceManager:
         
         return {
             "usage": usage_dict,
+            "window": window,
             "alerts": alerts_dict,
             "limits": {
                 "cpu_warning_percent": self.limits.cpu_warning_percent,
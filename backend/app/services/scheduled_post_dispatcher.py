@@ -0,0 +1,463 @@
+"""Dispatcher that claims and posts due scheduled posts.
+
+Several backend processes may run the dispatcher against the same database.
+Each round claims a batch of due posts with a single UPDATE that marks them
+``processing`` and stamps them with a claim token and a lease expiry. On
+PostgreSQL the candidate rows are selected ``FOR UPDATE SKIP LOCKED``, so
+concurrent dispatchers pick disjoint batches without waiting on each other; on
+SQLite, which serializes writers, the UPDATE itself is atomic and the lease
+columns alone keep claims apart.
+
+Claimed posts are grouped into per-account lanes. Scheduled posts do not
+reference a platform account, so an account is identified by the post's
+character and platform. Posts within a lane run one after another in schedule
+order, lanes run concurrently on short-lived sessions. A heartbeat renews the
+leases while the batch runs. A claimed post is never claimed again: one may
+already be live on the platform, so a post interrupted by stop() and the
+claims of a process that died (once their lease lapses) are stored as failed
+for review instead of being posted a second time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, exists, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.logging import get_logger
+from app.models.content import ScheduledPost
+
+logger = get_logger(__name__)
+
+INTERRUPTED_MESSAGE = (
+    "Interrupted: the dispatcher stopped before the post finished; "
+    "it may already be live, check the platform before rescheduling"
+)
+
+PostExecutor = Callable[[AsyncSession, ScheduledPost], Awaitable[dict[str, Any]]]
+"""Posts one scheduled post on the given session and returns its result entry."""
+
+
+async def _execute_with_distribution_service(db: AsyncSession, post: ScheduledPost) -> dict[str, Any]:
+    # Imported here: ContentDistributionService delegates to this module
+    from app.services.content_distribution_service import ContentDistributionService
+
+    return await ContentDistributionService(db).execute_scheduled_post(post)
+
+
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()[:60]}:{os.getpid()}"
+
+
+class ScheduledPostDispatcher:
+    """Claims due scheduled posts and posts them with bounded concurrency."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        worker_id: str | None = None,
+        concurrency: int | None = None,
+        batch_size: int | None = None,
+        lease_s: float | None = None,
+        executor: PostExecutor | None = None,
+    ) -> None:
+        """
+        Initialize the dispatcher.
+
+        Args:
+            session_factory: Factory for the short-lived sessions used to claim
+                and run posts.
+            worker_id: Name of this dispatcher in claim tokens (defaults to
+                host:pid).
+            concurrency: Lanes (character and platform) posted at once
+                (defaults to settings.scheduled_post_workers).
+            batch_size: Maximum posts claimed per round (defaults to
+                settings.scheduled_post_batch_size).
+            lease_s: Seconds a claim lasts without renewal (defaults to
+                settings.scheduled_post_lease_s).
+            executor: Coroutine that posts one scheduled post (defaults to
+                ContentDistributionService.execute_scheduled_post).
+        """
+        self.session_factory = session_factory
+        self.worker_id = worker_id or _default_worker_id()
+        self.concurrency = max(1, concurrency or settings.scheduled_post_workers)
+        self.batch_size = max(1, batch_size or settings.scheduled_post_batch_size)
+        self.lease_s = lease_s or settings.scheduled_post_lease_s
+        self.executor = executor or _execute_with_distribution_service
+        self._task: asyncio.Task[None] | None = None
+        self._claimed = 0
+        self._released = 0
+        self._succeeded = 0
+        self._failed = 0
+
+    # ===== Claiming =====
+
+    def _due(self, post: Any, now: datetime) -> Any:
+        """Pending posts whose time has come."""
+        return and_(post.status == "pending", post.scheduled_time <= now)
+
+    async def fail_expired(self) -> int:
+        """
+        Store claims whose lease lapsed (their dispatcher died) as failed.
+
+        Such a post may have been published before the process died, so it is
+        left for review rather than claimed and posted again.
+
+        Returns:
+            Number of posts marked failed.
+        """
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(ScheduledPost)
+                .where(
+                    ScheduledPost.status == "processing",
+                    ScheduledPost.lease_expires_at < datetime.now(timezone.utc),
+                )
+                .values(status="failed", error_message=INTERRUPTED_MESSAGE, claimed_by=None, lease_expires_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        if result.rowcount:
+            logger.warning(f"Marked {result.rowcount} scheduled posts with lapsed claims as failed")
+        return result.rowcount
+
+    async def claim(self, limit: int, character_id: UUID | None = None) -> tuple[str, list[ScheduledPost]]:
+        """
+        Claim up to ``limit`` due posts for this dispatcher.
+
+        Claims whose lease lapsed are stored as failed first (see
+        fail_expired). Accounts (character and platform) with a post currently
+        being posted elsewhere are skipped, and claimed posts that would overtake an
+        earlier post of the same account held by another dispatcher are
+        released again, so each account's posts go out in schedule order.
+
+        Args:
+            limit: Maximum number of posts to claim.
+            character_id: Only claim posts of this character.
+
+        Returns:
+            Tuple of the claim token and the claimed posts in schedule order.
+        """
+        await self.fail_expired()
+        token = f"{self.worker_id}:{uuid4().hex[:12]}"
+        now = datetime.now(timezone.utc)
+        candidate = aliased(ScheduledPost, name="candidate")
+        other = aliased(ScheduledPost, name="other")
+
+        busy = exists().where(
+            other.character_id == candidate.character_id,
+            other.platform.is_not_distinct_from(candidate.platform),
+            other.status == "processing",
+            other.lease_expires_at >= now,
+        )
+        candidates = (
+            select(candidate.id)
+            .where(self._due(candidate, now), ~busy)
+            .order_by(candidate.scheduled_time.asc(), candidate.id.asc())
+            .limit(limit)
+        )
+        if character_id is not None:
+            candidates = candidates.where(candidate.character_id == character_id)
+
+        async with self.session_factory() as db:
+            if db.bind.dialect.name == "postgresql":
+                candidates = candidates.with_for_update(skip_locked=True)
+            await db.execute(
+                update(ScheduledPost)
+                # Due check repeated so a row claimed meanwhile is not taken twice
+                .where(ScheduledPost.id.in_(candidates), self._due(ScheduledPost, now))
+                .values(status="processing", claimed_by=token, lease_expires_at=now + timedelta(seconds=self.lease_s))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+            posts = await self._claimed_posts(db, token)
+            posts = await self._release_overtaking(db, token, posts, now)
+
+        self._claimed += len(posts)
+        return token, posts
+
+    async def _claimed_posts(self, db: AsyncSession, token: str) -> list[ScheduledPost]:
+        result = await db.execute(
+            select(ScheduledPost)
+            .where(ScheduledPost.claimed_by == token, ScheduledPost.status == "processing")
+            .order_by(ScheduledPost.scheduled_time.asc(), ScheduledPost.id.asc())
+        )
+        return list(result.scalars().all())
+
+    async def _release_overtaking(
+        self, db: AsyncSession, token: str, posts: list[ScheduledPost], now: datetime
+    ) -> list[ScheduledPost]:
+        """Give back claimed posts that have an earlier unfinished post of the same account elsewhere."""
+        if not posts:
+            return posts
+
+        result = await db.execute(
+            select(
+                ScheduledPost.character_id, ScheduledPost.platform, ScheduledPost.scheduled_time, ScheduledPost.id
+            ).where(
+                ScheduledPost.character_id.in_({post.character_id for post in posts}),
+                or_(ScheduledPost.claimed_by.is_(None), ScheduledPost.claimed_by != token),
+                or_(
+                    ScheduledPost.status == "processing",
+                    and_(ScheduledPost.status == "pending", ScheduledPost.scheduled_time <= now),
+                ),
+            )
+        )
+        first_foreign: dict[tuple[UUID, str | None], tuple[datetime, UUID]] = {}
+        for character_id, platform, scheduled_time, post_id in result.all():
+            lane, key = (character_id, platform), (scheduled_time, post_id)
+            if lane not in first_foreign or key < first_foreign[lane]:
+                first_foreign[lane] = key
+
+        keep: list[ScheduledPost] = []
+        release: list[UUID] = []
+        for post in posts:
+            blocker = first_foreign.get((post.character_id, post.platform))
+            if blocker is not None and blocker < (post.scheduled_time, post.id):
+                release.append(post.id)
+            else:
+                keep.append(post)
+
+        if release:
+            await self._release(db, token, release)
+        return keep
+
+    async def _release(self, db: AsyncSession, token: str, post_ids: list[UUID]) -> None:
+        """Return claimed posts to pending so any dispatcher can take them."""
+        await db.execute(
+            update(ScheduledPost)
+            .where(ScheduledPost.id.in_(post_ids), ScheduledPost.claimed_by == token)
+            .values(status="pending", claimed_by=None, lease_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        self._released += len(post_ids)
+
+    async def _release_unstarted(self, token: str, post_ids: list[UUID]) -> None:
+        async with self.session_factory() as db:
+            await self._release(db, token, post_ids)
+
+    async def _mark_interrupted(self, token: str, post_id: UUID) -> bool:
+        """Store a post cut off by stop() as failed; False if it had already finished."""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(ScheduledPost)
+                .where(
+                    ScheduledPost.id == post_id,
+                    ScheduledPost.claimed_by == token,
+                    ScheduledPost.status == "processing",
+                )
+                .values(status="failed", error_message=INTERRUPTED_MESSAGE, claimed_by=None, lease_expires_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        return result.rowcount == 1
+
+    async def _renew_leases(self, token: str) -> None:
+        """Extend the leases of a running batch until cancelled."""
+        while True:
+            await asyncio.sleep(self.lease_s / 3)
+            try:
+                async with self.session_factory() as db:
+                    await db.execute(
+                        update(ScheduledPost)
+                        .where(ScheduledPost.claimed_by == token, ScheduledPost.status == "processing")
+                        .values(lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=self.lease_s))
+                        .execution_options(synchronize_session=False)
+                    )
+                    await db.commit()
+            except Exception as exc:
+                logger.warning(f"Failed to renew scheduled post leases for {token}: {exc}")
+
+    # ===== Execution =====
+
+    async def _run_post(self, token: str, post_id: UUID) -> dict[str, Any] | None:
+        """Post one claimed post on its own session; None if the claim was lost."""
+        async with self.session_factory() as db:
+            post = (
+                await db.execute(
+                    select(ScheduledPost).where(
+                        ScheduledPost.id == post_id,
+                        ScheduledPost.claimed_by == token,
+                        ScheduledPost.status == "processing",
+                    )
+                )
+            ).scalar_one_or_none()
+            if post is None:
+                logger.warning(f"Lost claim on scheduled post {post_id}; skipping it")
+                return None
+
+            try:
+                entry = await self.executor(db, post)
+            except Exception as exc:
+                logger.error(f"Failed to execute scheduled post {post_id}: {exc}")
+                await db.rollback()
+                post = await db.get(ScheduledPost, post_id, populate_existing=True)
+                post.status = "failed"
+                post.error_message = str(exc)
+                post.retry_count += 1
+                entry = {"scheduled_post_id": str(post_id), "success": False, "error": str(exc)}
+
+            if post.status == "processing":
+                post.status = "failed"
+                post.error_message = post.error_message or "Scheduled post was not completed"
+            post.claimed_by = None
+            post.lease_expires_at = None
+            await db.commit()
+
+        if entry.get("success"):
+            self._succeeded += 1
+        else:
+            self._failed += 1
+        return entry
+
+    async def _run_lane(
+        self, token: str, post_ids: list[UUID], semaphore: asyncio.Semaphore, results: dict[UUID, dict[str, Any]]
+    ) -> None:
+        started = 0
+        try:
+            async with semaphore:
+                for post_id in post_ids:
+                    started += 1
+                    entry = await self._run_post(token, post_id)
+                    if entry is not None:
+                        results[post_id] = entry
+        except asyncio.CancelledError:
+            # The interrupted post may already be live on the platform, so it is not retried;
+            # posts not started yet are handed back
+            if started and await asyncio.shield(self._mark_interrupted(token, post_ids[started - 1])):
+                self._failed += 1
+            if started < len(post_ids):
+                await asyncio.shield(self._release_unstarted(token, post_ids[started:]))
+            raise
+
+    async def run_claimed(self, token: str, posts: list[ScheduledPost]) -> list[dict[str, Any]]:
+        """
+        Post a claimed batch.
+
+        Args:
+            token: Claim token returned by claim().
+            posts: Claimed posts in schedule order.
+
+        Returns:
+            Result entries in schedule order (posts whose claim was lost are omitted).
+        """
+        lanes: dict[tuple[UUID, str | None], list[UUID]] = {}
+        for post in posts:
+            lanes.setdefault((post.character_id, post.platform), []).append(post.id)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results: dict[UUID, dict[str, Any]] = {}
+        heartbeat = asyncio.create_task(self._renew_leases(token))
+        try:
+            await asyncio.gather(*(self._run_lane(token, ids, semaphore, results) for ids in lanes.values()))
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        return [results[post.id] for post in posts if post.id in results]
+
+    async def dispatch_once(self, max_posts: int | None = None, character_id: UUID | None = None) -> dict[str, Any]:
+        """
+        Claim and post one batch of due posts.
+
+        Args:
+            max_posts: Maximum posts to claim (defaults to the batch size).
+            character_id: Only dispatch posts of this character.
+
+        Returns:
+            Dictionary with total, succeeded, failed and per-post results.
+        """
+        token, posts = await self.claim(max_posts or self.batch_size, character_id=character_id)
+        results = await self.run_claimed(token, posts) if posts else []
+        succeeded = sum(1 for entry in results if entry.get("success"))
+        return {
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results,
+        }
+
+    # ===== Background loop =====
+
+    @property
+    def running(self) -> bool:
+        """Whether the background loop is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self, poll_interval_s: float | None = None) -> None:
+        """
+        Start dispatching in the background on the running event loop.
+
+        Args:
+            poll_interval_s: Wait between rounds that found nothing due
+                (defaults to settings.scheduled_post_poll_interval_s).
+        """
+        if self.running:
+            return
+        interval = poll_interval_s or settings.scheduled_post_poll_interval_s
+        self._task = asyncio.get_running_loop().create_task(self._dispatch_loop(interval))
+        logger.info(f"Scheduled post dispatcher {self.worker_id} started")
+
+    async def stop(self) -> None:
+        """Stop the background loop; posts not started yet are released, the one being posted is stored as failed."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _dispatch_loop(self, poll_interval_s: float) -> None:
+        while True:
+            try:
+                summary = await self.dispatch_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(f"Scheduled post dispatch round failed: {exc}")
+                summary = {"total": 0}
+            # A full batch means more is probably due; go again right away
+            if summary["total"] < self.batch_size:
+                await asyncio.sleep(poll_interval_s)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Describe the dispatcher.
+
+        Returns:
+            Dictionary with configuration and counts of claimed, released,
+            succeeded and failed posts since start.
+        """
+        return {
+            "worker_id": self.worker_id,
+            "running": self.running,
+            "concurrency": self.concurrency,
+            "batch_size": self.batch_size,
+            "lease_s": self.lease_s,
+            "claimed": self._claimed,
+            "released": self._released,
+            "succeeded": self._succeeded,
+            "failed": self._failed,
+        }
+
+
+# Global instance for easy import
+_scheduled_post_dispatcher: ScheduledPostDispatcher | None = None
+
+
+def get_scheduled_post_dispatcher() -> ScheduledPostDispatcher:
+    """Get or create the global scheduled post dispatcher."""
+    global _scheduled_post_dispatcher
+    if _scheduled_post_dispatcher is None:
+        _scheduled_post_dispatcher = ScheduledPostDispatcher(async_session_maker)
+    return _scheduled_post_dispatcher
@@ -0,0 +1,493 @@
+"""Parallel, resumable HTTP downloads for large model files.
+
+A download probes the server with a one-byte Range request. When ranges are
+supported and the size is known, the file is preallocated and split into
+segments fetched concurrently, each written at its own offset. Otherwise it
+falls back to a single stream.
+
+SHA-256 is computed while downloading over the contiguous prefix of the file
+that is already on disk, so no separate pass is needed at the end. Progress
+(segment positions, hashed offset and the raw SHA-256 state) is checkpointed
+to a JSON sidecar next to the ``.part`` file; a resumed download continues
+each segment where it stopped and restores the hash state instead of
+re-reading the data. Restoring the state needs OpenSSL's libcrypto via ctypes;
+without it a resume re-hashes the already-hashed prefix once.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import threading
+import time
+import urllib.request
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+USER_AGENT = "AInfluencer/0.1"
+READ_BYTES = 256 * 1024
+MIN_SEGMENT_BYTES = 8 * 1024 * 1024
+CHECKPOINT_INTERVAL_S = 2.0
+STATE_VERSION = 1
+
+
+class DownloadCancelled(RuntimeError):
+    """Raised when a download is cancelled by its owner."""
+
+    def __init__(self) -> None:
+        super().__init__("Cancelled")
+
+
+# ---------------------------------------------------------------------------
+# Resumable SHA-256
+# ---------------------------------------------------------------------------
+
+_SHA256_CTX_BYTES = 112  # 8 words of state, 2 length words, 16 data words, num, md_len (openssl/sha.h)
+
+
+def _load_libcrypto() -> Any | None:
+    """Load libcrypto's SHA256_* functions and check them against hashlib, or None."""
+    name = ctypes.util.find_library("crypto") or ctypes.util.find_library("libcrypto")
+    if not name:
+        return None
+    try:
+        lib = ctypes.CDLL(name)
+        for fn in (lib.SHA256_Init, lib.SHA256_Update, lib.SHA256_Final):
+            fn.restype = ctypes.c_int
+        lib.SHA256_Update.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t]
+
+        # Known-answer check, including a state save/restore in the middle
+        ctx = ctypes.create_string_buffer(_SHA256_CTX_BYTES)
+        lib.SHA256_Init(ctx)
+        lib.SHA256_Update(ctx, b"a" * 100, 100)
+        ctx = ctypes.create_string_buffer(ctx.raw, _SHA256_CTX_BYTES)
+        lib.SHA256_Update(ctx, b"b" * 29, 29)
+        out = ctypes.create_string_buffer(32)
+        lib.SHA256_Final(out, ctx)
+        if out.raw != hashlib.sha256(b"a" * 100 + b"b" * 29).digest():
+            return None
+        return lib
+    except (OSError, AttributeError):
+        return None
+
+
+_libcrypto = _load_libcrypto()
+
+
+class ResumableSha256:
+    """SHA-256 whose intermediate state can be saved and restored.
+
+    Uses libcrypto directly when available (state is the raw SHA256_CTX),
+    otherwise hashlib, in which case ``state()`` returns None.
+    """
+
+    def __init__(self, state: bytes | None = None) -> None:
+        """
+        Initialize the hash, optionally from a saved state.
+
+        Args:
+            state: State returned by ``state()`` on this machine.
+
+        Raises:
+            ValueError: If a state is given but cannot be restored here.
+        """
+        self._ctx: Any = None
+        self._hash: Any = None
+        if _libcrypto is not None:
+            if state is not None:
+                if len(state) != _SHA256_CTX_BYTES:
+                    raise ValueError("Incompatible SHA-256 state")
+                self._ctx = ctypes.create_string_buffer(state, _SHA256_CTX_BYTES)
+            else:
+                self._ctx = ctypes.create_string_buffer(_SHA256_CTX_BYTES)
+                _libcrypto.SHA256_Init(self._ctx)
+        elif state is not None:
+            raise ValueError("SHA-256 state cannot be restored without libcrypto")
+        else:
+            self._hash = hashlib.sha256()
+
+    @staticmethod
+    def resumable() -> bool:
+        """Whether hash states can be saved and restored on this machine."""
+        return _libcrypto is not None
+
+    def update(self, data: bytes) -> None:
+        """Feed more data."""
+        if self._ctx is not None:
+            _libcrypto.SHA256_Update(self._ctx, data, len(data))
+        else:
+            self._hash.update(data)
+
+    def state(self) -> bytes | None:
+        """Current intermediate state, or None if it cannot be saved."""
+        return self._ctx.raw if self._ctx is not None else None
+
+    def hexdigest(self) -> str:
+        """Digest of the data so far (the hash can keep being updated)."""
+        if self._ctx is None:
+            return self._hash.hexdigest()
+        ctx = ctypes.create_string_buffer(self._ctx.raw, _SHA256_CTX_BYTES)
+        out = ctypes.create_string_buffer(32)
+        _libcrypto.SHA256_Final(out, ctx)
+        return out.raw.hex()
+
+
+# ---------------------------------------------------------------------------
+# Bandwidth limiting
+# ---------------------------------------------------------------------------
+
+
+class BandwidthLimiter:
+    """Token bucket shared by all segments of all downloads."""
+
+    def __init__(self, bytes_per_second: float = 0.0) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            bytes_per_second: Maximum combined rate; 0 or less disables the cap.
+        """
+        self._lock = threading.Lock()
+        self._rate = 0.0
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self.set_rate(bytes_per_second)
+
+    @property
+    def rate(self) -> float:
+        """Current cap in bytes per second (0 = unlimited)."""
+        return self._rate
+
+    def set_rate(self, bytes_per_second: float) -> None:
+        """Change the cap; takes effect for the next reads."""
+        with self._lock:
+            self._rate = max(0.0, float(bytes_per_second))
+            # Allow bursts of at most a quarter second of traffic
+            self._tokens = min(self._tokens, self._rate / 4)
+            self._updated = time.monotonic()
+
+    def consume(self, nbytes: int) -> None:
+        """Account for ``nbytes`` just read, sleeping as long as needed to keep the rate."""
+        with self._lock:
+            if self._rate <= 0:
+                return
+            now = time.monotonic()
+            self._tokens = min(self._rate / 4, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= nbytes
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# ---------------------------------------------------------------------------
+# Segmented download
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Segment:
+    start: int
+    end: int  # inclusive
+    pos: int = 0  # bytes written so far
+
+    @property
+    def done(self) -> bool:
+        return self.start + self.pos > self.end
+
+
+def _content_range_total(header: str | None) -> int | None:
+    """Total size from a ``Content-Range: bytes a-b/total`` header."""
+    if not header or "/" not in header:
+        return None
+    total = header.rsplit("/", 1)[1].strip()
+    return int(total) if total.isdigit() else None
+
+
+class SegmentedDownload:
+    """Downloads one URL into a ``.part`` file, in parallel segments when possible."""
+
+    def __init__(
+        self,
+        url: str,
+        part_path: Path,
+        segments: int = 4,
+        limiter: BandwidthLimiter | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+        on_progress: Callable[[int, int | None], None] | None = None,
+        min_segment_bytes: int = MIN_SEGMENT_BYTES,
+        timeout: float = 60.0,
+    ) -> None:
+        """
+        Initialize a download.
+
+        Args:
+            url: Source URL.
+            part_path: Temporary file to download into (kept for resume on failure).
+            segments: Maximum number of concurrent Range requests.
+            limiter: Optional shared bandwidth limiter.
+            is_cancelled: Polled between reads; returning True aborts with DownloadCancelled.
+            on_progress: Called with (bytes downloaded, total bytes or None).
+            min_segment_bytes: Smallest segment worth a separate connection.
+            timeout: Socket timeout in seconds.
+        """
+        self.url = url
+        self.part_path = part_path
+        self.state_path = part_path.with_name(part_path.name + ".json")
+        self.segments = max(1, segments)
+        self.limiter = limiter or BandwidthLimiter()
+        self.is_cancelled = is_cancelled or (lambda: False)
+        self.on_progress = on_progress
+        self.min_segment_bytes = min_segment_bytes
+        self.timeout = timeout
+
+        self.total: int | None = None
+        self.ranges_supported = False
+        self.resumed_from = 0
+        self.rehashed_bytes = 0
+
+        self._lock = threading.Lock()
+        self._plan: list[_Segment] = []
+        self._hash = ResumableSha256()
+        self._hashed = 0
+        self._error: BaseException | None = None
+        self._first_response: Any = None
+
+    def prepare(self) -> int | None:
+        """
+        Load a checkpoint or probe the server, and plan the segments.
+
+        Nothing is written yet, so callers can check free disk space between
+        ``prepare`` and ``run``; a fresh segmented download preallocates its
+        file when ``run`` starts.
+
+        Returns:
+            Total size in bytes, or None if the server does not report it.
+        """
+        if self._load_checkpoint():
+            return self.total
+        self._discard()
+        req = self._request({"Range": "bytes=0-0"})
+        resp = urllib.request.urlopen(req, timeout=self.timeout)
+        if resp.getcode() == 206:
+            self.total = _content_range_total(resp.headers.get("Content-Range"))
+            self.ranges_supported = self.total is not None
+            resp.close()
+        else:
+            length = resp.headers.get("Content-Length")
+            self.total = int(length) if length and length.isdigit() else None
+            # No range support: keep this response and stream the body from it
+            self._first_response = resp
+
+        if self.ranges_supported:
+            count = max(1, min(self.segments, -(-self.total // self.min_segment_bytes)))
+            size = -(-self.total // count)
+            self._plan = [
+                _Segment(start, min(start + size, self.total) - 1) for start in range(0, self.total, size)
+            ]
+        return self.total
+
+    def run(self) -> str:
+        """
+        Download the file (call ``prepare`` first).
+
+        Returns:
+            SHA-256 hex digest of the complete file.
+
+        Raises:
+            DownloadCancelled: If ``is_cancelled`` returned True.
+            Exception: Network or HTTP errors; progress is checkpointed for resume.
+        """
+        if not self.ranges_supported:
+            return self._run_single()
+        if not self.part_path.exists():
+            with open(self.part_path, "wb") as f:
+                f.truncate(self.total)
+
+        threads = [
+            threading.Thread(target=self._segment_worker, args=(seg,), name=f"model-download-seg{i}", daemon=True)
+            for i, seg in enumerate(self._plan)
+            if not seg.done
+        ]
+        for t in threads:
+            t.start()
+        last_checkpoint = time.monotonic()
+        try:
+            with open(self.part_path, "rb") as reader:
+                while True:
+                    alive = any(t.is_alive() for t in threads)
+                    self._advance_hash(reader)
+                    if time.monotonic() - last_checkpoint >= CHECKPOINT_INTERVAL_S:
+                        self._save_checkpoint()
+                        last_checkpoint = time.monotonic()
+                    if self._error is not None or not alive:
+                        break
+                    time.sleep(0.05)
+                for t in threads:
+                    t.join()
+                self._advance_hash(reader)
+        finally:
+            self._save_checkpoint()
+        if self._error is not None:
+            raise self._error
+        if self._hashed != self.total:
+            raise RuntimeError("Download ended before all segments completed")
+        self.state_path.unlink(missing_ok=True)
+        return self._hash.hexdigest()
+
+    def discard(self) -> None:
+        """Delete the partial file and its checkpoint."""
+        self._discard()
+
+    @property
+    def segment_count(self) -> int:
+        """Number of parallel segments (1 for a single stream)."""
+        return len(self._plan) if self.ranges_supported else 1
+
+    @property
+    def downloaded(self) -> int:
+        """Bytes downloaded so far (including resumed bytes)."""
+        with self._lock:
+            return sum(seg.pos for seg in self._plan)
+
+    def _request(self, headers: dict[str, str] | None = None) -> urllib.request.Request:
+        return urllib.request.Request(self.url, headers={"User-Agent": USER_AGENT, **(headers or {})})
+
+    def _segment_worker(self, seg: _Segment) -> None:
+        try:
+            req = self._request({"Range": f"bytes={seg.start + seg.pos}-{seg.end}"})
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp, open(
+                self.part_path, "r+b", buffering=0
+            ) as f:
+                if resp.getcode() != 206:
+                    raise RuntimeError(f"Server ignored range request (HTTP {resp.getcode()})")
+                f.seek(seg.start + seg.pos)
+                while not seg.done:
+                    if self._error is not None:
+                        return
+                    if self.is_cancelled():
+                        raise DownloadCancelled()
+                    chunk = resp.read(min(READ_BYTES, seg.end + 1 - seg.start - seg.pos))
+                    if not chunk:
+                        raise RuntimeError("Connection closed before segment completed")
+                    self.limiter.consume(len(chunk))
+                    f.write(chunk)
+                    with self._lock:
+                        seg.pos += len(chunk)
+                    self._report()
+        except BaseException as exc:  # noqa: BLE001
+            with self._lock:
+                if self._error is None:
+                    self._error = exc
+
+    def _contiguous_end(self) -> int:
+        """End offset of the prefix of the file that is fully written."""
+        with self._lock:
+            for seg in self._plan:
+                if not seg.done:
+                    return seg.start + seg.pos
+            return self.total or 0
+
+    def _advance_hash(self, reader: Any) -> None:
+        end = self._contiguous_end()
+        if end <= self._hashed:
+            return
+        reader.seek(self._hashed)
+        while self._hashed < end:
+            block = reader.read(min(4 * READ_BYTES, end - self._hashed))
+            if not block:
+                break
+            self._hash.update(block)
+            self._hashed += len(block)
+
+    def _report(self) -> None:
+        if self.on_progress is not None:
+            self.on_progress(self.downloaded, self.total)
+
+    def _run_single(self) -> str:
+        resp = self._first_response or urllib.request.urlopen(self._request(), timeout=self.timeout)
+        self._first_response = None
+        downloaded = 0
+        with resp, open(self.part_path, "wb") as f:
+            while True:
+                if self.is_cancelled():
+                    raise DownloadCancelled()
+                chunk = resp.read(READ_BYTES)
+                if not chunk:
+                    break
+                self.limiter.consume(len(chunk))
+                f.write(chunk)
+                self._hash.update(chunk)
+                downloaded += len(chunk)
+                if self.on_progress is not None:
+                    self.on_progress(downloaded, self.total)
+        return self._hash.hexdigest()
+
+    def _save_checkpoint(self) -> None:
+        if not self.ranges_supported:
+            return
+        with self._lock:
+            segments = [[seg.start, seg.end, seg.pos] for seg in self._plan]
+        state = self._hash.state()
+        data = {
+            "version": STATE_VERSION,
+            "url": self.url,
+            "total": self.total,
+            "segments": segments,
+            "hashed": self._hashed,
+            "hash_state": state.hex() if state is not None else None,
+        }
+        tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(self.state_path)
+
+    def _load_checkpoint(self) -> bool:
+        """Restore progress from the sidecar; False if there is nothing usable."""
+        try:
+            data = json.loads(self.state_path.read_text(encoding="utf-8"))
+            if data.get("version") != STATE_VERSION or data.get("url") != self.url:
+                return False
+            total = int(data["total"])
+            if not self.part_path.exists() or self.part_path.stat().st_size != total:
+                return False
+            plan = [_Segment(int(s), int(e), int(p)) for s, e, p in data["segments"]]
+            hashed = int(data["hashed"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        self.total = total
+        self.ranges_supported = True
+        self._plan = plan
+        self.resumed_from = sum(seg.pos for seg in plan)
+        hash_state = data.get("hash_state")
+        try:
+            self._hash = ResumableSha256(bytes.fromhex(hash_state) if hash_state else None)
+            self._hashed = hashed if hash_state else 0
+        except ValueError:
+            self._hash = ResumableSha256()
+            self._hashed = 0
+        if self._hashed < hashed:
+            # Hash state could not be restored here: re-hash the prefix once
+            with open(self.part_path, "rb") as reader:
+                self._advance_hash(reader)
+            self.rehashed_bytes = self._hashed
+        logger.info(
+            "Resuming segmented download",
+            extra={"url": self.url, "resume_from": self.resumed_from, "rehashed": self.rehashed_bytes},
+        )
+        return True
+
+    def _discard(self) -> None:
+        for path in (self.part_path, self.state_path):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
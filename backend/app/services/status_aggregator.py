@@ -0,0 +1,154 @@
+"""In-memory status snapshot refreshed by independent background probes.
+
+Each probe (service state, ComfyUI reachability, system check, ...) has its own
+refresh interval: cheap, fast-changing probes such as port checks run every
+couple of seconds, expensive ones that rarely change (tool discovery,
+``nvidia-smi``) run every few minutes. Readers get the latest snapshot without
+running any probe, plus a per-field freshness record.
+
+Without a running background task (scripts, tests), ``snapshot`` refreshes
+stale probes inline so results are never older than their interval.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class StatusProbe:
+    """A named status field and how to refresh it."""
+
+    name: str
+    interval_s: float
+    collect: Callable[[], Any]
+
+
+@dataclass
+class _ProbeState:
+    value: Any = None
+    updated_at: float | None = None
+    updated_mono: float | None = None
+    duration_ms: float | None = None
+    error: str | None = None
+
+
+class StatusAggregator:
+    """Caches probe results and refreshes each on its own schedule."""
+
+    def __init__(self, probes: list[StatusProbe]) -> None:
+        """
+        Create an aggregator.
+
+        Args:
+            probes: Probes to run; names must be unique.
+        """
+        self._probes = {probe.name: probe for probe in probes}
+        self._states = {probe.name: _ProbeState() for probe in probes}
+        self._probe_locks = {probe.name: threading.Lock() for probe in probes}
+        self._lock = threading.Lock()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether the background refresh tasks are active."""
+        return any(not task.done() for task in self._tasks)
+
+    def refresh(self, name: str, *, max_age_s: float | None = None) -> None:
+        """
+        Run one probe now (blocking) unless it is fresher than ``max_age_s``.
+
+        Concurrent callers for the same probe wait for the first one instead of
+        running it again.
+
+        Args:
+            name: Probe name.
+            max_age_s: Skip the refresh if the value is younger than this (seconds).
+        """
+        probe = self._probes[name]
+        with self._probe_locks[name]:
+            if max_age_s is not None and self._age(name) < max_age_s:
+                return
+            started = time.monotonic()
+            try:
+                value = probe.collect()
+                error = None
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Status probe {name} failed: {exc}")
+                value, error = None, str(exc)
+            finished = time.monotonic()
+            with self._lock:
+                state = self._states[name]
+                if error is None or state.updated_at is None:
+                    state.value = value
+                state.updated_at = time.time()
+                state.updated_mono = finished
+                state.duration_ms = round((finished - started) * 1000, 1)
+                state.error = error
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return the latest value of every probe plus freshness metadata.
+
+        Probes that never ran are refreshed inline. When the background tasks
+        are not running, probes older than their interval are refreshed too.
+
+        Returns:
+            Dict mapping probe name to value, plus ``freshness`` mapping probe
+            name to updated_at, age_s, interval_s, duration_ms and error. A
+            failing probe keeps its last good value and reports the error.
+        """
+        background = self.running
+        for name, probe in self._probes.items():
+            if self._states[name].updated_at is None:
+                self.refresh(name, max_age_s=float("inf"))
+            elif not background:
+                self.refresh(name, max_age_s=probe.interval_s)
+
+        now = time.monotonic()
+        with self._lock:
+            result: dict[str, Any] = {name: state.value for name, state in self._states.items()}
+            result["freshness"] = {
+                name: {
+                    "updated_at": state.updated_at,
+                    "age_s": round(now - state.updated_mono, 3) if state.updated_mono is not None else None,
+                    "interval_s": self._probes[name].interval_s,
+                    "duration_ms": state.duration_ms,
+                    "error": state.error,
+                }
+                for name, state in self._states.items()
+            }
+        return result
+
+    def start(self) -> None:
+        """Start one background refresh task per probe on the running event loop."""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._refresh_loop(probe)) for probe in self._probes.values()]
+
+    async def stop(self) -> None:
+        """Cancel the background refresh tasks and wait for them to finish."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _refresh_loop(self, probe: StatusProbe) -> None:
+        while True:
+            # Probes block (subprocesses, sockets); keep them off the event loop
+            await asyncio.to_thread(self.refresh, probe.name, max_age_s=probe.interval_s / 2)
+            await asyncio.sleep(probe.interval_s)
+
+    def _age(self, name: str) -> float:
+        with self._lock:
+            updated = self._states[name].updated_mono
+        return float("inf") if updated is None else time.monotonic() - updated
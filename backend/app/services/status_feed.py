@@ -0,0 +1,144 @@
+"""Versioned status feed with JSON-patch deltas for monitoring broadcasts.
+
+``StatusFeed`` keeps the last published status document and a version number.
+Publishing a new document bumps the version only if something changed and
+yields two pre-serialized messages shared by every subscriber:
+
+- ``{"type": "snapshot", "version": N, "data": {...}}`` for clients that are
+  joining or have to resync.
+- ``{"type": "patch", "version": N, "base": N - 1, "ops": [...]}`` with RFC 6902
+  style ``add`` / ``remove`` / ``replace`` operations for clients at ``N - 1``.
+
+Lists are compared as a whole and replaced when they differ.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """
+    Compute patch operations that turn ``old`` into ``new``.
+
+    Args:
+        old: Previous JSON-compatible document.
+        new: Current JSON-compatible document.
+        path: JSON pointer prefix of the compared documents.
+
+    Returns:
+        List of ``add``/``remove``/``replace`` operations (empty if equal).
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = []
+        for key in old.keys() - new.keys():
+            ops.append({"op": "remove", "path": f"{path}/{_escape(str(key))}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(str(key))}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif old[key] != value:
+                ops.extend(json_diff(old[key], value, child))
+        return ops
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, ops: list[dict[str, Any]]) -> Any:
+    """
+    Apply operations produced by ``json_diff`` to a document.
+
+    Args:
+        document: JSON-compatible document (not modified).
+        ops: Patch operations.
+
+    Returns:
+        The patched document.
+    """
+    result = copy.deepcopy(document)
+    for op in ops:
+        if op["path"] == "":
+            result = copy.deepcopy(op["value"])
+            continue
+        *parents, last = [_unescape(token) for token in op["path"].split("/")[1:]]
+        target = result
+        for token in parents:
+            target = target[token]
+        if op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = copy.deepcopy(op["value"])
+    return result
+
+
+@dataclass(frozen=True)
+class StatusUpdate:
+    """Messages for one published status version."""
+
+    version: int
+    snapshot_message: str
+    patch_message: str | None
+
+
+class StatusFeed:
+    """Holds the latest status document and turns changes into versioned deltas."""
+
+    def __init__(self) -> None:
+        """Create an empty feed (version 0, no document)."""
+        self._lock = threading.Lock()
+        self._document: Any = None
+        self._version = 0
+        self._snapshot_message: str | None = None
+
+    @property
+    def version(self) -> int:
+        """Version of the latest published document (0 before the first publish)."""
+        return self._version
+
+    @property
+    def snapshot_message(self) -> str | None:
+        """Serialized snapshot message of the latest version, if any."""
+        return self._snapshot_message
+
+    def publish(self, document: dict[str, Any]) -> StatusUpdate | None:
+        """
+        Publish a new status document.
+
+        Args:
+            document: Current JSON-compatible status.
+
+        Returns:
+            StatusUpdate for the new version, or None if nothing changed.
+        """
+        with self._lock:
+            if self._document is None:
+                ops = None
+            else:
+                ops = json_diff(self._document, document)
+                if not ops:
+                    return None
+            self._version += 1
+            self._document = copy.deepcopy(document)
+            self._snapshot_message = json.dumps(
+                {"type": "snapshot", "version": self._version, "data": document}, default=str
+            )
+            patch_message = None
+            if ops is not None:
+                patch_message = json.dumps(
+                    {"type": "patch", "version": self._version, "base": self._version - 1, "ops": ops},
+                    default=str,
+                )
+            return StatusUpdate(self._version, self._snapshot_message, patch_message)
@@ -26,12 +26,14 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Literal, Optional
 
+from app.core.config import settings
 from app.core.logging import get_logger
-from app.core.paths import video_jobs_file
+from app.core.paths import video_editing_jobs_journal_file, video_jobs_file
 from app.services.audio_video_sync_service import (
     AudioVideoSyncMode,
     audio_video_sync_service,
 )
+from app.services.job_store import JobStore
 
 logger = get_logger(__name__)
 
@@ -89,45 +91,41 @@ class VideoEditingService:
         self._lock = threading.Lock()
         self._jobs: dict[str, VideoEditingJob] = {}
         video_jobs_file().parent.mkdir(parents=True, exist_ok=True)
+        self._store = JobStore(video_editing_jobs_journal_file(), max_jobs=settings.job_history_max_jobs)
         self._load_jobs_from_disk()
     
     def _load_jobs_from_disk(self) -> None:
-        """Load jobs from disk if available."""
+        """Load jobs from the job journal, importing the legacy shared video_jobs.json once."""
+        records = self._store.load()
+        if not records and not self._store.exists():
+            records = self._load_legacy_jobs()
+            for job_id, record in records.items():
+                self._store.put(job_id, record)
+        for job_id, job_data in records.items():
+            try:
+                self._jobs[job_id] = VideoEditingJob(**job_data)
+            except Exception as e:
+                self.logger.warning(f"Skipping malformed video editing job {job_id}: {e}")
+    
+    def _load_legacy_jobs(self) -> dict[str, dict[str, Any]]:
+        """Read jobs from the legacy "editing_jobs" section of video_jobs.json."""
         try:
             if video_jobs_file().exists():
                 with open(video_jobs_file(), "r") as f:
                     data = json.load(f)
-                    for job_data in data.get("editing_jobs", []):
-                        job = VideoEditingJob(**job_data)
-                        self._jobs[job.id] = job
-        except Exception as e:
-            self.logger.warning(f"Failed to load video editing jobs from disk: {e}")
-    
-    def _save_jobs_to_disk(self) -> None:
-        """Save jobs to disk."""
-        try:
-            data = {
-                "editing_jobs": [
-                    {
-                        "id": job.id,
-                        "state": job.state,
-                        "message": job.message,
-                        "created_at": job.created_at,
-                        "started_at": job.started_at,
-                        "finished_at": job.finished_at,
-                        "cancelled_at": job.cancelled_at,
-                        "output_path": job.output_path,
-                        "error": job.error,
-                        "params": job.params,
-                        "cancel_requested": job.cancel_requested,
+                if isinstance(data, dict):
+                    return {
+                        job_data["id"]: job_data
+                        for job_data in data.get("editing_jobs", [])
+                        if isinstance(job_data, dict) and isinstance(job_data.get("id"), str)
                     }
-                    for job in self._jobs.values()
-                ]
-            }
-            with open(video_jobs_file(), "w") as f:
-                json.dump(data, f, indent=2)
         except Exception as e:
-            self.logger.error(f"Failed to save video editing jobs to disk: {e}")
+            self.logger.warning(f"Failed to load legacy video editing jobs from disk: {e}")
+        return {}
+    
+    def _persist_job(self, job: VideoEditingJob) -> None:
+        """Append the job's current state to the job journal (caller holds self._lock)."""
+        self._store.put(job.id, job.__dict__)
     
     def edit_video(
         self,
@@ -166,7 +164,7 @@ class VideoEditingService:
         
         with self._lock:
             self._jobs[job_id] = job
-            self._save_jobs_to_disk()
+            self._persist_job(job)
         
         # Handle ADD_AUDIO operation using audio-video sync service
         if operation == VideoEditingOperation.ADD_AUDIO:
@@ -176,7 +174,7 @@ class VideoEditingService:
                     job.state = "failed"
                     job.error = "audio_path is required for ADD_AUDIO operation"
                     job.message = "Audio path is required"
-                    self._save_jobs_to_disk()
+                    self._persist_job(job)
                 return {
                     "job_id": job_id,
                     "status": "failed",
@@ -203,7 +201,7 @@ class VideoEditingService:
                 with self._lock:
                     job.params["sync_job_id"] = sync_result.get("job_id")
                     job.message = f"Audio-video synchronization job created: {sync_result.get('job_id')}"
-                    self._save_jobs_to_disk()
+                    self._persist_job(job)
                 
                 self.logger.info(f"Video editing job {job_id} delegated to audio-video sync: {sync_result.get('job_id')}")
                 
@@ -221,7 +219,7 @@ class VideoEditingService:
                     job.state = "failed"
                     job.error = error_msg
                     job.message = error_msg
-                    self._save_jobs_to_disk()
+                    self._persist_job(job)
                 return {
                     "job_id": job_id,
                     "status": "failed",
@@ -317,7 +315,7 @@ class VideoEditingService:
                 job.state = "cancelled"
                 job.cancelled_at = time.time()
                 job.message = "Cancellation requested"
-                self._save_jobs_to_disk()
+                self._persist_job(job)
                 return True
         
         return False
@@ -27,9 +27,11 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Literal, Optional
 
+from app.core.config import settings
 from app.core.logging import get_logger
-from app.core.paths import video_jobs_file
+from app.core.paths import video_jobs_file, video_jobs_journal_file
 from app.services.comfyui_client import ComfyUiClient, ComfyUiError
+from app.services.job_store import JobStore
 
 logger = get_logger(__name__)
 
@@ -90,6 +92,7 @@ class VideoGenerationService:
         self._lock = threading.Lock()
         self._jobs: dict[str, VideoJob] = {}
         video_jobs_file().parent.mkdir(parents=True, exist_ok=True)
+        self._store = JobStore(video_jobs_journal_file(), max_jobs=settings.job_history_max_jobs)
         self._load_jobs_from_disk()
 
     def generate_video(
@@ -144,7 +147,7 @@ class VideoGenerationService:
         
         with self._lock:
             self._jobs[job_id] = job
-        self._persist_jobs_to_disk()
+            self._store.put(job_id, job.__dict__)
         
         try:
             # Build workflow based on method
@@ -165,7 +168,7 @@ class VideoGenerationService:
             with self._lock:
                 job.prompt_id = prompt_id
                 job.message = f"Video generation job queued with {method.value}"
-            self._persist_jobs_to_disk()
+                self._store.patch(job_id, fields={"prompt_id": prompt_id, "message": job.message})
             
             self.logger.info(f"Video generation job queued: job_id={job_id}, prompt_id={prompt_id}, method={method.value}")
             
@@ -182,7 +185,7 @@ class VideoGenerationService:
                 job.state = "failed"
                 job.error = str(e)
                 job.message = f"Failed to queue video generation: {str(e)}"
-            self._persist_jobs_to_disk()
+                self._store.patch(job_id, fields={"state": job.state, "error": job.error, "message": job.message})
             return {
                 "status": "failed",
                 "method": method.value,
@@ -196,7 +199,7 @@ class VideoGenerationService:
                 job.state = "failed"
                 job.error = str(e)
                 job.message = f"Video generation failed: {str(e)}"
-            self._persist_jobs_to_disk()
+                self._store.patch(job_id, fields={"state": job.state, "error": job.error, "message": job.message})
             return {
                 "status": "failed",
                 "method": method.value,
@@ -450,32 +453,31 @@ class VideoGenerationService:
             job.message = "Cancelling…"
             job.state = "cancelled"
             job.cancelled_at = time.time()
-            self._persist_jobs_to_disk()
+            self._store.patch(
+                job_id,
+                fields={
+                    "cancel_requested": True,
+                    "message": job.message,
+                    "state": job.state,
+                    "cancelled_at": job.cancelled_at,
+                },
+            )
             return True
 
     def _load_jobs_from_disk(self) -> None:
         """
-        Load video generation jobs from disk storage.
+        Load video generation jobs from the job journal.
         
-        Reads jobs from JSON file and populates in-memory job dictionary.
-        Silently handles missing files, invalid JSON, or malformed data.
+        On first start with a journal, jobs from the legacy video_jobs.json
+        snapshot are imported into it. Malformed records are skipped.
         """
-        path = video_jobs_file()
-        if not path.exists():
-            return
-        try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return
-        if not isinstance(raw, list):
-            return
+        records = self._store.load()
+        if not records and not self._store.exists():
+            records = self._load_legacy_jobs()
+            for job_id, record in records.items():
+                self._store.put(job_id, record)
         loaded: dict[str, VideoJob] = {}
-        for item in raw:
-            if not isinstance(item, dict):
-                continue
-            job_id = item.get("id")
-            if not isinstance(job_id, str):
-                continue
+        for job_id, item in records.items():
             try:
                 loaded[job_id] = VideoJob(**item)
             except Exception:
@@ -483,22 +485,30 @@ class VideoGenerationService:
         with self._lock:
             self._jobs = loaded
 
-    def _persist_jobs_to_disk(self) -> None:
+    @staticmethod
+    def _load_legacy_jobs() -> dict[str, dict[str, Any]]:
         """
-        Persist video generation jobs to disk storage.
+        Read jobs from the legacy video_jobs.json snapshot file.
+        
+        Silently handles missing files, invalid JSON, or malformed data.
         
-        Saves jobs to JSON file, keeping only the most recent 200 jobs
-        to prevent unbounded growth. Uses atomic write (tmp file + replace).
+        Returns:
+            Mapping of job ID to job record dict.
         """
         path = video_jobs_file()
-        tmp = path.with_suffix(".tmp")
-        # Keep last N jobs to avoid unbounded growth
-        with self._lock:
-            jobs = list(self._jobs.values())
-        jobs.sort(key=lambda j: j.created_at, reverse=True)
-        jobs = jobs[:200]
-        tmp.write_text(json.dumps([j.__dict__ for j in jobs], indent=2, sort_keys=True), encoding="utf-8")
-        tmp.replace(path)
+        if not path.exists():
+            return {}
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        if not isinstance(raw, list):
+            return {}
+        return {
+            item["id"]: item
+            for item in raw
+            if isinstance(item, dict) and isinstance(item.get("id"), str)
+        }
 
     def health_check(self) -> dict[str, Any]:
         """Check service health.
@@ -0,0 +1,167 @@
+"""Streaming ZIP archive writer.
+
+Builds a ZIP archive as a sequence of byte chunks instead of an in-memory
+buffer: each file is read in blocks, compressed (or stored) into the archive
+and handed to the caller as soon as a chunk is full, so memory stays at about
+one chunk regardless of archive size and the first bytes go out right away.
+
+Entries are written with data descriptors (the archive is never seeked), and
+files whose format is already compressed (PNG, JPEG, MP4, ...) are stored
+rather than deflated, which saves CPU for no size gain.
+"""
+
+from __future__ import annotations
+
+import time
+import zipfile
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CHUNK_BYTES = 1024 * 1024
+"""Target size of yielded chunks (and of file reads)."""
+
+STORED_SUFFIXES = frozenset(
+    {
+        ".png", ".jpg", ".jpeg", ".webp", ".gif", ".avif", ".heic",
+        ".mp4", ".mov", ".m4v", ".webm", ".mkv", ".avi",
+        ".mp3", ".m4a", ".aac", ".ogg", ".opus", ".flac",
+        ".zip", ".gz", ".7z", ".rar",
+    }
+)
+"""File suffixes of already-compressed formats, stored without deflate."""
+
+
+@dataclass(frozen=True)
+class ZipEntry:
+    """One archive member: a file on disk or in-memory bytes.
+
+    Attributes:
+        arcname: Path of the member inside the archive.
+        path: File to read (mutually exclusive with data).
+        data: In-memory content, e.g. a manifest (mutually exclusive with path).
+    """
+
+    arcname: str
+    path: Path | None = None
+    data: bytes | None = None
+
+
+class _ChunkSink:
+    """Write-only, non-seekable file object that collects ZIP output for draining."""
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._parts.append(bytes(data))
+            self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        chunk = b"".join(self._parts)
+        self._parts.clear()
+        self.size = 0
+        return chunk
+
+
+def compression_for(arcname: str) -> int:
+    """
+    Choose the ZIP compression method for a member name.
+
+    Args:
+        arcname: Member name (only the suffix is used).
+
+    Returns:
+        zipfile.ZIP_STORED for already-compressed formats, else zipfile.ZIP_DEFLATED.
+    """
+    return zipfile.ZIP_STORED if Path(arcname).suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+
+def iter_zip(entries: Iterable[ZipEntry], chunk_bytes: int = CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Generate a ZIP archive of the given entries as byte chunks.
+
+    Files that are missing or unreadable when their turn comes are skipped
+    with a warning. Closing the generator early (e.g. the client went away)
+    stops reading and closes the open file.
+
+    Args:
+        entries: Members to write, in archive order.
+        chunk_bytes: Approximate size of each yielded chunk.
+
+    Yields:
+        Consecutive pieces of the archive; concatenated they form a valid ZIP file.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", allowZip64=True) as zf:
+        for entry in entries:
+            if entry.data is not None:
+                zinfo = zipfile.ZipInfo(entry.arcname, date_time=time.localtime()[:6])
+                zinfo.external_attr = 0o644 << 16
+                zinfo.compress_type = compression_for(entry.arcname)
+                zinfo.file_size = len(entry.data)
+                with zf.open(zinfo, mode="w") as dest:
+                    dest.write(entry.data)
+            else:
+                try:
+                    # from_file records the size up front, which lets zipfile pick ZIP64 headers
+                    zinfo = zipfile.ZipInfo.from_file(entry.path, entry.arcname)
+                    src = entry.path.open("rb")
+                except OSError as exc:
+                    logger.warning(f"Skipping {entry.path} in ZIP export: {exc}")
+                    continue
+                zinfo.compress_type = compression_for(entry.arcname)
+                with src, zf.open(zinfo, mode="w") as dest:
+                    while block := src.read(chunk_bytes):
+                        dest.write(block)
+                        if sink.size >= chunk_bytes:
+                            yield sink.drain()
+            if sink.size >= chunk_bytes:
+                yield sink.drain()
+    # Closing the archive wrote the central directory
+    if sink.size:
+        yield sink.drain()
+
+
+async def aiter_zip(
+    entries: Iterable[ZipEntry],
+    is_cancelled: Callable[[], Awaitable[bool]] | None = None,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> AsyncIterator[bytes]:
+    """
+    Async version of ``iter_zip`` that reads and compresses in the threadpool.
+
+    Args:
+        entries: Members to write, in archive order.
+        is_cancelled: Optional async callable checked between chunks, e.g.
+            ``request.is_disconnected``; when it returns true the export stops.
+        chunk_bytes: Approximate size of each yielded chunk.
+
+    Yields:
+        Consecutive pieces of the archive.
+    """
+    chunks = iter_zip(entries, chunk_bytes)
+    try:
+        while True:
+            chunk = await run_in_threadpool(next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+            if is_cancelled is not None and await is_cancelled():
+                logger.info("ZIP export cancelled by client")
+                return
+    finally:
+        # Runs the generator's cleanup (closes the current file) in a worker thread
+        await run_in_threadpool(chunks.close)
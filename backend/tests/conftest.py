@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import ARRAY, insert
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgresUUID
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.pool import StaticPool
 
+import app.models  # noqa: F401  (registers every table so foreign keys resolve)
 from app.core.database import Base
 
 
@@ -14,6 +18,25 @@ from app.core.database import Base
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+# SQLite renderings of the PostgreSQL column types used by the models (DDL only)
+
+@compiles(ARRAY, "sqlite")
+def _array_as_json(element, compiler, **kw):
+    # Binding Python lists still fails; tests leave array columns (hashtags, mentions, ...) unset
+    return "JSON"
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(element, compiler, **kw):
+    return "JSON"
+
+
+@compiles(PostgresUUID, "sqlite")
+def _uuid_as_text(element, compiler, **kw):
+    # A bare UUID column gets NUMERIC affinity, which turns hex like "123e4567..." into floats
+    return "CHAR(32)"
+
+
 @pytest.fixture
 async def db_session():
     """Create a test database session with in-memory SQLite."""
@@ -36,6 +59,36 @@ async def db_session():
     await engine.dispose()
 
 
+@pytest.fixture
+async def sqlite_engine():
+    """Factory for SQLite engines holding only the given tables.
+
+    ``await sqlite_engine(Post, Content, rows={Post: [...]})`` returns an
+    in-memory engine (one shared connection); pass ``path`` for a file
+    database that several engines or sessions can open concurrently. All
+    engines are disposed after the test.
+    """
+    engines = []
+
+    async def make(*models, rows: dict | None = None, path=None):
+        if path is None:
+            engine = create_async_engine(TEST_DATABASE_URL, poolclass=StaticPool)
+        else:
+            engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        engines.append(engine)
+        async with engine.begin() as conn:
+            for model in models:
+                await conn.run_sync(model.__table__.create)
+            for model, model_rows in (rows or {}).items():
+                for start in range(0, len(model_rows), 50_000):
+                    await conn.execute(insert(model.__table__), model_rows[start:start + 50_000])
+        return engine
+
+    yield make
+    for engine in engines:
+        await engine.dispose()
+
+
 @pytest.fixture
 def mock_db_session():
     """Create a mock database session for testing without database."""
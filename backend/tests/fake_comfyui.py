@@ -0,0 +1,112 @@
+"""Minimal in-process fake ComfyUI server for offline client tests.
+
+Implements POST /prompt, GET /history/{prompt_id} and the /ws event stream.
+Each queued prompt "executes" on a timer, emitting the same websocket messages
+as ComfyUI (execution_start, progress, executed, executing node=None) to the
+client_id given in the prompt request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+import uuid
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+
+
+class FakeComfyUi:
+    """Fake ComfyUI server running on a background thread."""
+
+    def __init__(self, *, websocket_enabled: bool = True, execution_s: float = 0.3, steps: int = 3) -> None:
+        self.websocket_enabled = websocket_enabled
+        self.execution_s = execution_s
+        self.steps = steps
+        self.history: dict[str, Any] = {}
+        self.history_requests = 0
+        self._sockets: dict[str, WebSocket] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(("127.0.0.1", 0))
+        self.port = self._sock.getsockname()[1]
+        self.app = self._build_app()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.post("/prompt")
+        async def prompt(body: dict[str, Any]) -> dict[str, Any]:
+            prompt_id = uuid.uuid4().hex
+            asyncio.create_task(self._execute(prompt_id, body.get("client_id")))
+            return {"prompt_id": prompt_id, "number": 0}
+
+        @app.get("/history/{prompt_id}")
+        async def history(prompt_id: str) -> dict[str, Any]:
+            self.history_requests += 1
+            entry = self.history.get(prompt_id)
+            return {prompt_id: entry} if entry else {}
+
+        @app.websocket("/ws")
+        async def ws(websocket: WebSocket) -> None:
+            if not self.websocket_enabled:
+                await websocket.close(code=1008)
+                return
+            client_id = websocket.query_params.get("clientId") or uuid.uuid4().hex
+            await websocket.accept()
+            self._sockets[client_id] = websocket
+            await websocket.send_json({"type": "status", "data": {"status": {"exec_info": {"queue_remaining": 0}}, "sid": client_id}})
+            try:
+                while True:
+                    await websocket.receive_text()
+            except WebSocketDisconnect:
+                self._sockets.pop(client_id, None)
+
+        return app
+
+    async def _send(self, client_id: str | None, message: dict[str, Any]) -> None:
+        targets = [self._sockets[client_id]] if client_id in self._sockets else []
+        if client_id is None:
+            targets = list(self._sockets.values())
+        for ws in targets:
+            try:
+                await ws.send_json(message)
+            except Exception:
+                pass
+
+    async def _execute(self, prompt_id: str, client_id: str | None) -> None:
+        image = {"filename": f"{prompt_id}.png", "subfolder": "", "type": "output"}
+        await self._send(client_id, {"type": "execution_start", "data": {"prompt_id": prompt_id}})
+        for step in range(1, self.steps + 1):
+            await asyncio.sleep(self.execution_s / self.steps)
+            await self._send(client_id, {"type": "progress", "data": {"value": step, "max": self.steps, "prompt_id": prompt_id, "node": "5"}})
+        await self._send(client_id, {"type": "executed", "data": {"node": "7", "output": {"images": [image]}, "prompt_id": prompt_id}})
+        self.history[prompt_id] = {"outputs": {"7": {"images": [image]}}, "status": {"completed": True}}
+        await self._send(client_id, {"type": "executing", "data": {"node": None, "prompt_id": prompt_id}})
+
+    def start(self) -> "FakeComfyUi":
+        config = uvicorn.Config(self.app, log_level="warning", lifespan="off")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, kwargs={"sockets": [self._sock]}, daemon=True)
+        self._thread.start()
+        deadline = time.time() + 10
+        while not self._server.started and time.time() < deadline:
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.should_exit = True
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._sock.close()
@@ -0,0 +1,31 @@
+"""Minimal async Redis stand-in for cache tests (get/setex and incr pipelines)."""
+
+from __future__ import annotations
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for the rollup cache (get/setex/incr pipelines)."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.data[key] = value
+
+    def pipeline(self) -> "FakeRedis._Pipeline":
+        return FakeRedis._Pipeline(self)
+
+    class _Pipeline:
+        def __init__(self, redis: "FakeRedis") -> None:
+            self.redis = redis
+            self.keys: list[str] = []
+
+        def incr(self, key: str) -> None:
+            self.keys.append(key)
+
+        async def execute(self) -> None:
+            for key in self.keys:
+                self.redis.data[key] = str(int(self.redis.data.get(key, "0")) + 1)
@@ -0,0 +1,36 @@
+"""Builders for seeded ``posts`` rows shared by the analytics and rollup tests."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+PLATFORMS = ("instagram", "twitter", "facebook")
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def post_rows(count: int, characters: list, seed: int = 1) -> list[dict]:
+    rng = random.Random(seed)
+    account_id = uuid4()
+    return [
+        {
+            "id": uuid4(),
+            "character_id": characters[i % len(characters)],
+            "platform_account_id": account_id,
+            "platform": PLATFORMS[i % len(PLATFORMS)],
+            "post_type": "post",
+            "status": "draft" if i % 10 == 0 else "published",
+            "likes_count": rng.randrange(1000),
+            "comments_count": rng.randrange(100),
+            "shares_count": rng.randrange(50),
+            "views_count": rng.randrange(10_000),
+            "published_at": NOW - timedelta(minutes=i),
+            "retry_count": 0,
+        }
+        for i in range(count)
+    ]
+
+
+def engagement(row: dict) -> int:
+    return row["likes_count"] + row["comments_count"] + row["shares_count"]
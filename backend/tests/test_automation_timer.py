@@ -0,0 +1,351 @@
+"""Tests for the deferred automation action timer."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.automation_rule import AutomationPendingAction
+from app.services import automation_timer
+from app.services.automation_scheduler_service import AutomationSchedulerError, AutomationSchedulerService
+from app.services.automation_timer import AutomationTimer
+
+
+class RecordingFire:
+    """Stands in for AutomationSchedulerService.run_rule_action."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.fired: list = []
+        self.fired_at: dict = {}
+        self.sessions: set = set()
+
+    async def __call__(self, db, action):
+        self.fired.append(action.id)
+        self.fired_at[action.id] = time.time()
+        self.sessions.add(id(db))
+        if self.fail:
+            raise RuntimeError("like rejected")
+        return {"success": True, "rule_id": action.rule_id, "action_type": action.action_type}
+
+
+@pytest.fixture
+async def sessions(tmp_path, sqlite_engine):
+    """Session factory on a file database, shared like separate backend processes would."""
+    engine = await sqlite_engine(AutomationPendingAction, path=tmp_path / "actions.db")
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def _wait_for(condition, timeout_s: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+async def _rows(sessions) -> dict:
+    async with sessions() as db:
+        return {row.id: row for row in (await db.execute(select(AutomationPendingAction))).scalars()}
+
+
+class TestAutomationTimer:
+    """Test suite for AutomationTimer."""
+
+    async def test_fires_after_delay_on_own_session(self, sessions):
+        """Test an action fires once due and its outcome is stored."""
+        fire = RecordingFire()
+        timer = AutomationTimer(sessions, fire=fire)
+        timer.start()
+        try:
+            action = await timer.schedule(uuid4(), uuid4(), "like", delay_s=0.1)
+            assert fire.fired == []
+            await _wait_for(lambda: timer.stats()["executed"] == 1)
+        finally:
+            await timer.stop()
+
+        row = (await _rows(sessions))[action.id]
+        assert fire.fired == [action.id]
+        assert fire.fired_at[action.id] >= action.execute_at.timestamp()
+        assert row.status == "executed"
+        assert row.result["action_type"] == "like"
+        assert row.executed_at is not None
+
+    async def test_fires_in_due_order(self, sessions):
+        """Test actions scheduled out of order fire soonest first."""
+        fire = RecordingFire()
+        timer = AutomationTimer(sessions, fire=fire, max_concurrent=1)
+        timer.start()
+        try:
+            late = await timer.schedule(uuid4(), uuid4(), "like", delay_s=0.2)
+            early = await timer.schedule(uuid4(), uuid4(), "like", delay_s=0.05)
+            await _wait_for(lambda: len(fire.fired) == 2)
+        finally:
+            await timer.stop()
+
+        assert fire.fired == [early.id, late.id]
+
+    async def test_cancelled_action_does_not_fire(self, sessions):
+        """Test a cancelled action is skipped and listed as cancelled."""
+        fire = RecordingFire()
+        timer = AutomationTimer(sessions, fire=fire)
+        timer.start()
+        try:
+            rule_id = uuid4()
+            action = await timer.schedule(rule_id, uuid4(), "follow", delay_s=0.1)
+            assert [a.id for a in await timer.list_actions(rule_id=rule_id)] == [action.id]
+
+            cancelled = await timer.cancel(action.id)
+            await asyncio.sleep(0.2)
+        finally:
+            await timer.stop()
+
+        assert cancelled.status == "cancelled"
+        assert fire.fired == []
+        assert await timer.list_actions(rule_id=rule_id) == []
+        assert [a.id for a in await timer.list_actions(rule_id=rule_id, status="cancelled")] == [action.id]
+
+    async def test_cancel_after_execution_keeps_status(self, sessions):
+        """Test cancelling an action that already ran leaves it executed."""
+        timer = AutomationTimer(sessions, fire=RecordingFire())
+        timer.start()
+        try:
+            action = await timer.schedule(uuid4(), uuid4(), "like", delay_s=0)
+            await _wait_for(lambda: timer.stats()["executed"] == 1)
+            assert (await timer.cancel(action.id)).status == "executed"
+            assert await timer.cancel(uuid4()) is None
+        finally:
+            await timer.stop()
+
+    async def test_pending_actions_survive_restart(self, sessions):
+        """Test actions scheduled before a restart fire after the next start."""
+        before = AutomationTimer(sessions, fire=RecordingFire())
+        action = await before.schedule(uuid4(), uuid4(), "like", delay_s=0.05)
+        await before.stop()
+
+        fire = RecordingFire()
+        after = AutomationTimer(sessions, fire=fire)
+        after.start()
+        try:
+            await _wait_for(lambda: fire.fired == [action.id])
+        finally:
+            await after.stop()
+
+        assert (await _rows(sessions))[action.id].status == "executed"
+
+    async def test_action_fires_once_across_processes(self, sessions):
+        """Test an action known to several timers is executed by only one of them."""
+        fire = RecordingFire()
+        timers = [AutomationTimer(sessions, fire=fire) for _ in range(3)]
+        action = await timers[0].schedule(uuid4(), uuid4(), "like", delay_s=0.05)
+        for timer in timers:
+            timer.start()
+        try:
+            await _wait_for(lambda: sum(t.stats()["fired"] + t.stats()["skipped"] for t in timers) == 3)
+        finally:
+            for timer in timers:
+                await timer.stop()
+
+        assert fire.fired == [action.id]
+
+    async def test_failure_is_recorded(self, sessions):
+        """Test an action that raises is stored as failed with its error."""
+        timer = AutomationTimer(sessions, fire=RecordingFire(fail=True))
+        timer.start()
+        try:
+            action = await timer.schedule(uuid4(), uuid4(), "comment", delay_s=0)
+            await _wait_for(lambda: timer.stats()["failed"] == 1)
+        finally:
+            await timer.stop()
+
+        row = (await _rows(sessions))[action.id]
+        assert (row.status, row.error_message) == ("failed", "like rejected")
+
+    async def test_action_cut_off_by_stop_is_marked_failed(self, sessions, monkeypatch):
+        """Test an action still running when stop() gives up is stored as failed, not left running."""
+        monkeypatch.setattr(automation_timer, "STOP_GRACE_S", 0.05)
+
+        async def hang(db, action):
+            await asyncio.sleep(60)
+
+        timer = AutomationTimer(sessions, fire=hang)
+        timer.start()
+        action = await timer.schedule(uuid4(), uuid4(), "like", delay_s=0)
+        await _wait_for(lambda: timer.stats()["fired"] == 1)
+        await timer.stop()
+
+        row = (await _rows(sessions))[action.id]
+        assert row.status == "failed"
+        assert row.error_message.startswith("Interrupted")
+        assert timer.stats()["failed"] == 1
+
+    async def test_stale_running_action_is_run_again(self, sessions):
+        """Test a running row left by a dead process is returned to pending after the timeout."""
+        now = datetime.now(timezone.utc)
+        async with sessions() as db:
+            stale, recent = (
+                AutomationPendingAction(
+                    rule_id=uuid4(),
+                    platform_account_id=uuid4(),
+                    action_type="like",
+                    execute_at=now - timedelta(minutes=30),
+                    status="running",
+                    started_at=started_at,
+                )
+                for started_at in (now - timedelta(minutes=20), now - timedelta(seconds=5))
+            )
+            db.add_all([stale, recent])
+            await db.commit()
+        fire = RecordingFire()
+        timer = AutomationTimer(sessions, fire=fire, running_timeout_s=600)
+        timer.start()
+        try:
+            await _wait_for(lambda: fire.fired == [stale.id])
+        finally:
+            await timer.stop()
+
+        rows = await _rows(sessions)
+        assert rows[stale.id].status == "executed"
+        assert rows[stale.id].started_at is not None
+        assert rows[recent.id].status == "running"
+
+
+def _rule(**overrides) -> SimpleNamespace:
+    """Stand-in for an AutomationRule that may be executed now."""
+    fields = dict(
+        id=uuid4(),
+        platform_account_id=uuid4(),
+        action_type="follow",
+        action_config={},
+        is_enabled=True,
+        last_executed_at=None,
+        cooldown_minutes=60,
+        times_executed=0,
+        success_count=0,
+        failure_count=0,
+        max_executions_per_day=None,
+        max_executions_per_week=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+async def _scheduler(sessions, timer, rule) -> AutomationSchedulerService:
+    """Scheduler whose rule lookup returns ``rule`` and whose randomization never skips."""
+    async with sessions() as db:
+        scheduler = AutomationSchedulerService(db, timer=timer)
+
+    async def get_rule(rule_id):
+        return rule
+
+    scheduler.rule_service.get_rule = get_rule
+    scheduler.timing_service.should_skip_action = lambda: False
+    scheduler.timing_service.get_engagement_delay = lambda action_type: 120.0
+    scheduler.behavior_service.should_take_break = lambda: False
+    return scheduler
+
+
+class TestAutomationSchedulerDeferral:
+    """Test suite for AutomationSchedulerService.execute_rule scheduling."""
+
+    async def test_execute_rule_returns_without_waiting(self, sessions):
+        """Test execute_rule stores a pending action instead of sleeping for the delay."""
+        timer = AutomationTimer(sessions, fire=RecordingFire())
+        rule = _rule()
+        scheduler = await _scheduler(sessions, timer, rule)
+
+        start = time.perf_counter()
+        result = await scheduler.execute_rule(rule.id)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert result["result"]["status"] == "scheduled"
+        [action] = await timer.list_actions(rule_id=rule.id)
+        assert str(action.id) == result["result"]["pending_action_id"]
+        assert action.platform_account_id == rule.platform_account_id
+        delay = action.execute_at.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)
+        assert 60 < delay.total_seconds() <= 160
+
+    async def test_execute_rule_returns_action_already_waiting(self, sessions):
+        """Test a rule with a pending action is not scheduled a second time."""
+        timer = AutomationTimer(sessions, fire=RecordingFire())
+        rule = _rule()
+        scheduler = await _scheduler(sessions, timer, rule)
+
+        first = await scheduler.execute_rule(rule.id)
+        second = await scheduler.execute_rule(rule.id)
+
+        assert second["result"]["pending_action_id"] == first["result"]["pending_action_id"]
+        assert second["result"]["already_scheduled"] is True
+        assert len(await timer.list_actions(rule_id=rule.id)) == 1
+
+    async def test_run_rule_action_rechecks_rule(self, sessions):
+        """Test a due action is refused when the rule ran meanwhile and is cooling down."""
+        rule = _rule(last_executed_at=datetime.now(timezone.utc) - timedelta(minutes=5))
+        scheduler = await _scheduler(sessions, AutomationTimer(sessions, fire=RecordingFire()), rule)
+
+        async def follow(rule, platform_account_id):
+            raise AssertionError("action must not run")
+
+        scheduler._execute_follow_action = follow
+
+        with pytest.raises(AutomationSchedulerError, match="Cooldown active"):
+            await scheduler.run_rule_action(rule.id, rule.platform_account_id)
+        assert (rule.times_executed, rule.failure_count) == (0, 0)
+
+
+class FakeClock:
+    """Settable UNIX time injected as the timer's clock."""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAutomationTimerHeap:
+    """Test many deferred actions waiting on one timer task."""
+
+    async def test_many_pending_actions_fire_in_due_order(self, sqlite_engine):
+        """Test 300 deferred actions wait as heap entries and fire in due order as the clock advances."""
+        engine = await sqlite_engine(AutomationPendingAction)
+        clock = FakeClock(1_750_000_000.0)
+        start = clock.now
+        fire = RecordingFire()
+        timer = AutomationTimer(
+            async_sessionmaker(engine, expire_on_commit=False), fire=fire, max_concurrent=1, clock=clock
+        )
+        timer.start()
+        try:
+            await asyncio.sleep(0.05)  # let the timer settle into its wait
+            tasks_before = len(asyncio.all_tasks())
+            actions = [
+                await timer.schedule(uuid4(), uuid4(), "like", delay_s=1.0 + (n % 50) / 100)
+                for n in range(300)
+            ]
+            assert len(asyncio.all_tasks()) == tasks_before
+            assert timer.stats()["queued"] == 300
+            assert fire.fired == []
+
+            clock.now = start + 1.245
+            timer._wakeup.set()
+            await _wait_for(lambda: len(fire.fired) == 150, timeout_s=10.0)
+            assert timer.stats()["queued"] == 150
+
+            clock.now = start + 2.0
+            timer._wakeup.set()
+            await _wait_for(lambda: timer.stats()["executed"] == 300, timeout_s=10.0)
+        finally:
+            await timer.stop()
+
+        due_order = [a.id for a in sorted(actions, key=lambda a: a.execute_at)]
+        assert fire.fired == due_order
+        assert timer.stats()["queued"] == 0
@@ -0,0 +1,84 @@
+"""Tests for event-driven ComfyUI completion against a local fake server."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services.comfyui_client import ComfyUiClient, ComfyUiError
+from app.services.comfyui_events import (
+    ComfyUiEventListener,
+    PromptEvents,
+    get_comfyui_event_listener,
+    stop_comfyui_event_listeners,
+)
+from tests.fake_comfyui import FakeComfyUi
+
+
+@pytest.fixture
+def fake_comfyui():
+    servers: list[FakeComfyUi] = []
+
+    def _start(**kwargs) -> FakeComfyUi:
+        server = FakeComfyUi(**kwargs).start()
+        servers.append(server)
+        return server
+
+    yield _start
+    stop_comfyui_event_listeners()
+    for server in servers:
+        server.stop()
+
+
+class TestComfyUiEvents:
+    """Test suite for the shared ComfyUI websocket listener."""
+
+    def test_wait_for_images_uses_websocket_events(self, fake_comfyui):
+        """Test completion is driven by events with a bounded number of /history reads."""
+        server = fake_comfyui(execution_s=0.6, steps=3)
+        listener = get_comfyui_event_listener(server.base_url)
+        assert listener is not None
+        assert listener.wait_connected(5.0)
+
+        progress: list[PromptEvents] = []
+        with ComfyUiClient(base_url=server.base_url) as client:
+            prompt_id = client.queue_prompt({})
+            images = client.wait_for_images(prompt_id, timeout_s=10, on_progress=progress.append)
+
+        assert images == [{"filename": f"{prompt_id}.png", "subfolder": "", "type": "output"}]
+        # One read when waiting starts and one on completion, no polling in between
+        assert server.history_requests <= 2
+        assert any(p.progress_max == 3 for p in progress)
+
+    def test_falls_back_to_polling_without_websocket(self, fake_comfyui):
+        """Test /history polling is used when the socket cannot connect."""
+        server = fake_comfyui(websocket_enabled=False, execution_s=0.2)
+        with ComfyUiClient(base_url=server.base_url) as client:
+            prompt_id = client.queue_prompt({})
+            image = client.wait_for_first_image(prompt_id, timeout_s=10)
+
+        assert image["filename"] == f"{prompt_id}.png"
+        assert server.history_requests >= 1
+
+    def test_execution_error_event_marks_prompt_failed(self):
+        """Test execution_error messages are recorded as failures."""
+        listener = ComfyUiEventListener("http://127.0.0.1:1")
+        listener.handle_message({"type": "execution_start", "data": {"prompt_id": "p1"}})
+        listener.handle_message(
+            {"type": "execution_error", "data": {"prompt_id": "p1", "exception_message": "CUDA out of memory"}}
+        )
+
+        state = listener.get("p1")
+        assert state is not None
+        assert state.status == "failed"
+        assert state.error == "CUDA out of memory"
+        assert state.finished
+
+    def test_cancel_while_waiting(self, fake_comfyui):
+        """Test should_cancel aborts an event-driven wait."""
+        server = fake_comfyui(execution_s=5.0)
+        listener = get_comfyui_event_listener(server.base_url)
+        assert listener is not None and listener.wait_connected(5.0)
+        with ComfyUiClient(base_url=server.base_url) as client:
+            prompt_id = client.queue_prompt({})
+            with pytest.raises(ComfyUiError, match="Cancelled"):
+                client.wait_for_images(prompt_id, timeout_s=10, should_cancel=lambda: True)
@@ -0,0 +1,152 @@
+"""Tests for content library keyset pagination and total modes."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.content import Content
+from app.services import content_service
+from app.services.content_service import (
+    ContentService,
+    _ExplainJson,
+    decode_content_cursor,
+    encode_content_cursor,
+)
+from tests.fake_redis import FakeRedis
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _rows(count: int) -> list[dict]:
+    """Content rows where every three consecutive items share a created_at (to exercise id tie-breaks)."""
+    character_id = uuid4()
+    return [
+        {
+            "id": uuid4(),
+            "character_id": character_id,
+            "content_type": "image" if i % 4 else "video",
+            "file_path": f"/content/{i}.png",
+            "prompt": f"portrait {'beach' if i % 5 == 0 else 'studio'} #{i}",
+            "is_nsfw": False,
+            "is_approved": False,
+            "approval_status": "pending",
+            "times_used": 0,
+            "created_at": START + timedelta(seconds=i // 3),
+            "updated_at": START,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+async def library(sqlite_engine):
+    """Session factory and rows for 100 content items."""
+    rows = _rows(100)
+    engine = await sqlite_engine(Content, rows={Content: rows})
+    return async_sessionmaker(engine, expire_on_commit=False), rows
+
+
+async def _walk(service: ContentService, limit: int, **filters) -> list:
+    """All ids reached by following cursors from the first page."""
+    ids, cursor = [], None
+    while True:
+        page, _ = await service.list_content(
+            limit=limit, cursor=cursor, include_character=False, total="none", **filters
+        )
+        ids.extend(item.id for item in page)
+        if len(page) < limit:
+            return ids
+        cursor = encode_content_cursor(page[-1])
+
+
+class TestKeysetPagination:
+    """Test suite for cursor-based library paging."""
+
+    async def test_cursor_pages_match_offset_order(self, library):
+        """Test following cursors visits every item once, in the same order as offset paging."""
+        sessions, rows = library
+        async with sessions() as db:
+            service = ContentService(db)
+            by_cursor = await _walk(service, limit=7)
+            by_offset, _ = await service.list_content(limit=100, include_character=False)
+
+        assert by_cursor == [item.id for item in by_offset]
+        assert len(set(by_cursor)) == len(rows)
+
+    async def test_cursor_with_search_filter(self, library):
+        """Test cursors compose with filters."""
+        sessions, rows = library
+        expected = {r["id"] for r in rows if "beach" in r["prompt"] and r["content_type"] == "image"}
+        async with sessions() as db:
+            ids = await _walk(ContentService(db), limit=3, search="BEACH", content_type="image")
+
+        assert set(ids) == expected and len(ids) == len(expected)
+
+    def test_cursor_round_trip_and_invalid(self):
+        """Test cursors decode to their keyset position and garbage is rejected."""
+        item = Content(id=uuid4(), created_at=START)
+
+        assert decode_content_cursor(encode_content_cursor(item)) == (START, item.id)
+        with pytest.raises(ValueError):
+            decode_content_cursor("not-a-cursor")
+
+
+class TestTotals:
+    """Test suite for library total modes."""
+
+    async def test_modes(self, library, monkeypatch):
+        """Test none skips counting, estimated is exact off PostgreSQL, and cached reuses counts."""
+        sessions, rows = library
+        redis = FakeRedis()
+
+        async def get_redis():
+            return redis
+
+        monkeypatch.setattr(content_service, "get_redis", get_redis)
+        videos = sum(1 for r in rows if r["content_type"] == "video")
+        async with sessions() as db:
+            service = ContentService(db)
+            _, none = await service.list_content(limit=1, include_character=False, total="none")
+            _, estimated = await service.list_content(limit=1, include_character=False, total="estimated")
+            _, cached = await service.list_content(
+                limit=1, include_character=False, total="cached", content_type="video"
+            )
+            await db.execute(insert(Content.__table__), _rows(3))
+            _, still_cached = await service.list_content(
+                limit=1, include_character=False, total="cached", content_type="video"
+            )
+            _, exact = await service.list_content(limit=1, include_character=False, content_type="video")
+
+        assert none is None
+        assert estimated == len(rows)
+        assert cached == still_cached == videos
+        assert exact == videos + 1
+
+    def test_estimate_keeps_search_as_bound_parameter(self):
+        """Test the EXPLAIN used for estimates binds the search term instead of inlining it."""
+        query = select(Content).where(Content.prompt.ilike("%:word 'quoted'%"))
+
+        compiled = _ExplainJson(query).compile(dialect=postgresql.asyncpg.dialect())
+
+        assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert ":word" not in str(compiled)
+        assert list(compiled.params.values()) == ["%:word 'quoted'%"]
+
+
+class TestGetContents:
+    """Test suite for fetching several content rows at once."""
+
+    async def test_one_query_in_requested_order(self, library):
+        """Test rows come back in the requested order, skipping unknown and repeated ids."""
+        sessions, rows = library
+        wanted = [rows[5]["id"], uuid4(), rows[2]["id"], rows[5]["id"], rows[9]["id"]]
+        async with sessions() as db:
+            contents = await ContentService(db).get_contents(wanted)
+
+        assert [c.id for c in contents] == [rows[5]["id"], rows[2]["id"], rows[9]["id"]]
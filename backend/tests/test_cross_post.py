@@ -0,0 +1,282 @@
+"""Tests for concurrent cross-posting."""
+
+from __future__ import annotations
+
+import time
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.character import Character
+from app.models.content import Content
+from app.models.engagement_rollup import EngagementDailyRollup
+from app.models.platform_account import PlatformAccount
+from app.models.post import Post
+from app.services import engagement_rollup_service, integrated_posting_service
+from app.services.facebook_client import FacebookApiError
+from app.services.engagement_rollup_service import EngagementRollupService
+from app.services.integrated_posting_service import IntegratedPostingError, IntegratedPostingService
+from app.services.platform_image_optimization_service import Platform
+from app.services.twitter_client import TwitterApiError
+
+UPLOAD_S = 0.2
+
+
+class TooManyRequests(Exception):
+    """Stands in for tweepy.TooManyRequests (matched by name)."""
+
+
+class FakeTwitterClient:
+    """TwitterApiClient double whose uploads take UPLOAD_S."""
+
+    failures: list[Exception] = []
+
+    def __init__(self, **credentials) -> None:
+        pass
+
+    def post_tweet(self, text: str) -> dict:
+        time.sleep(UPLOAD_S)
+        if self.failures:
+            raise self.failures.pop(0)
+        return {"id": "tweet-1", "text": text}
+
+
+class FakeFacebookClient:
+    """FacebookApiClient double whose uploads take UPLOAD_S."""
+
+    error: Exception | None = None
+    delay_s = UPLOAD_S
+
+    def __init__(self, **credentials) -> None:
+        pass
+
+    def create_post(self, message: str, page_id: str | None = None) -> dict:
+        time.sleep(self.delay_s)
+        if self.error is not None:
+            raise self.error
+        return {"id": f"{page_id}_1"}
+
+
+def _rate_limited() -> TwitterApiError:
+    try:
+        raise TooManyRequests("429 Too Many Requests")
+    except TooManyRequests as exc:
+        try:
+            raise TwitterApiError(f"Failed to post tweet: {exc}") from exc
+        except TwitterApiError as wrapped:
+            return wrapped
+
+
+@pytest.fixture(autouse=True)
+def fake_clients(monkeypatch):
+    async def no_redis():
+        raise ConnectionError("redis disabled in tests")
+
+    monkeypatch.setattr(engagement_rollup_service, "get_redis", no_redis)
+    monkeypatch.setattr(integrated_posting_service, "TwitterApiClient", FakeTwitterClient)
+    monkeypatch.setattr(integrated_posting_service, "FacebookApiClient", FakeFacebookClient)
+    monkeypatch.setattr(integrated_posting_service, "CROSS_POST_RETRY_BACKOFF_S", 0.0)
+    monkeypatch.setattr(FakeTwitterClient, "failures", [])
+    monkeypatch.setattr(FakeFacebookClient, "error", None)
+    monkeypatch.setattr(FakeFacebookClient, "delay_s", UPLOAD_S)
+
+
+@pytest.fixture
+async def setup(tmp_path, sqlite_engine):
+    """Session factory, engine, content id and account ids (twitter, facebook, instagram)."""
+    engine = await sqlite_engine(Character, Content, PlatformAccount, Post, EngagementDailyRollup)
+    character_id, content_id = uuid4(), uuid4()
+    image = tmp_path / "image.png"
+    image.write_bytes(b"png")
+    accounts = {platform: uuid4() for platform in ("twitter", "facebook", "instagram")}
+    auth = {
+        "twitter": {"consumer_key": "k", "consumer_secret": "s", "access_token": "t", "access_token_secret": "ts"},
+        "facebook": {"access_token": "fb"},
+        "instagram": {"username": "u", "password": "p"},
+    }
+    async with engine.begin() as conn:
+        await conn.execute(insert(Character.__table__), [{"id": character_id, "user_id": uuid4(), "name": "Ava"}])
+        await conn.execute(
+            insert(Content.__table__),
+            [{
+                "id": content_id,
+                "character_id": character_id,
+                "content_type": "image",
+                "file_path": str(image),
+                "is_nsfw": False,
+                "is_approved": True,
+                "approval_status": "approved",
+                "times_used": 0,
+            }],
+        )
+        await conn.execute(
+            insert(PlatformAccount.__table__),
+            [
+                {
+                    "id": account_id,
+                    "character_id": character_id,
+                    "platform": platform,
+                    "account_id": f"{platform}-page",
+                    "auth_data": auth[platform],
+                    "is_connected": True,
+                    "connection_status": "connected",
+                    "follower_count": 0,
+                    "following_count": 0,
+                    "post_count": 0,
+                    "auto_posting_enabled": True,
+                    "auto_engagement_enabled": True,
+                }
+                for platform, account_id in accounts.items()
+            ],
+        )
+    return async_sessionmaker(engine, expire_on_commit=False), engine, content_id, accounts
+
+
+class TestCrossPostImage:
+    """Test suite for IntegratedPostingService.cross_post_image_detailed."""
+
+    async def test_uploads_run_concurrently(self, setup):
+        """Test total latency is about one upload, not the sum, and both posts are published."""
+        sessions, _, content_id, accounts = setup
+        async with sessions() as db:
+            start = time.perf_counter()
+            outcome = await IntegratedPostingService(db).cross_post_image_detailed(
+                content_id, [accounts["twitter"], accounts["facebook"]], caption="hi"
+            )
+            elapsed = time.perf_counter() - start
+
+        assert set(outcome.posts) == {"twitter", "facebook"}
+        assert outcome.errors == {}
+        assert elapsed < UPLOAD_S * 1.75
+        async with sessions() as db:
+            posts = (await db.execute(select(Post))).scalars().all()
+            content = await db.get(Content, content_id)
+        assert {p.status for p in posts} == {"published"}
+        assert {p.platform_post_id for p in posts} == {"tweet-1", "facebook-page_1"}
+        assert content.times_used == 2
+
+    async def test_partial_failure_is_reported(self, setup):
+        """Test a failing platform is reported while the others still publish."""
+        sessions, _, content_id, accounts = setup
+        FakeFacebookClient.error = FacebookApiError("Facebook Graph API error: invalid token")
+        async with sessions() as db:
+            outcome = await IntegratedPostingService(db).cross_post_image_detailed(
+                content_id, list(accounts.values()), caption="hi"
+            )
+
+        assert set(outcome.posts) == {"twitter"}
+        assert "invalid token" in outcome.errors["facebook"]
+        assert outcome.attempts["facebook"] == 1
+        if not integrated_posting_service.INSTAGRAM_AVAILABLE:
+            assert "not available" in outcome.errors["instagram"]
+        async with sessions() as db:
+            statuses = {p.platform: p.status for p in (await db.execute(select(Post))).scalars()}
+        assert statuses["facebook"] == "failed"
+
+    async def test_published_posts_update_rollups(self, setup):
+        """Test published cross-posts are added to their day's engagement rollups."""
+        sessions, _, content_id, accounts = setup
+        async with sessions() as db:
+            await IntegratedPostingService(db).cross_post_image_detailed(
+                content_id, [accounts["twitter"], accounts["facebook"]], caption="hi"
+            )
+            rollups = (await db.execute(select(EngagementDailyRollup))).scalars().all()
+
+        assert sorted((r.platform, r.post_count) for r in rollups) == [("facebook", 1), ("twitter", 1)]
+
+    async def test_rollup_failure_keeps_published_posts(self, setup, monkeypatch):
+        """Test a failing rollup refresh is logged and the live posts stay recorded."""
+        sessions, _, content_id, accounts = setup
+
+        async def broken(self, post):
+            raise RuntimeError("rollups unavailable")
+
+        monkeypatch.setattr(EngagementRollupService, "refresh_post", broken)
+        async with sessions() as db:
+            outcome = await IntegratedPostingService(db).cross_post_image_detailed(
+                content_id, [accounts["twitter"]], caption="hi"
+            )
+
+        assert outcome.posts["twitter"].status == "published"
+        async with sessions() as db:
+            posts = (await db.execute(select(Post))).scalars().all()
+        assert [(p.status, p.platform_post_id) for p in posts] == [("published", "tweet-1")]
+
+    async def test_transient_errors_are_retried(self, setup):
+        """Test a rate-limited upload is retried and the attempt count recorded."""
+        sessions, _, content_id, accounts = setup
+        FakeTwitterClient.failures = [_rate_limited()]
+        async with sessions() as db:
+            outcome = await IntegratedPostingService(db).cross_post_image_detailed(
+                content_id, [accounts["twitter"]], caption="hi"
+            )
+
+        assert set(outcome.posts) == {"twitter"}
+        assert outcome.attempts["twitter"] == 2
+        assert outcome.posts["twitter"].retry_count == 1
+
+    async def test_timeouts_are_not_retried(self, setup):
+        """Test a timed-out upload fails once without a retry that could double-post."""
+        sessions, _, content_id, accounts = setup
+        FakeFacebookClient.delay_s = 1.0
+        async with sessions() as db:
+            outcome = await IntegratedPostingService(db).cross_post_image_detailed(
+                content_id, [accounts["twitter"], accounts["facebook"]], caption="hi", timeout_s=0.5
+            )
+
+        assert set(outcome.posts) == {"twitter"}
+        assert "timed out" in outcome.errors["facebook"]
+        assert outcome.attempts["facebook"] == 1
+
+    async def test_accounts_loaded_in_one_query(self, setup):
+        """Test all target accounts are fetched with a single SELECT."""
+        sessions, engine, content_id, accounts = setup
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            async with sessions() as db:
+                await IntegratedPostingService(db).cross_post_image_detailed(
+                    content_id, [accounts["twitter"], accounts["facebook"]], caption="hi"
+                )
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+        assert len([s for s in statements if "FROM platform_accounts" in s]) == 1
+
+    async def test_all_failed_raises(self, setup):
+        """Test cross_post_image still raises when no platform succeeded."""
+        sessions, _, content_id, accounts = setup
+        FakeFacebookClient.error = FacebookApiError("down")
+        async with sessions() as db:
+            with pytest.raises(IntegratedPostingError, match="failed for all platforms"):
+                await IntegratedPostingService(db).cross_post_image(content_id, [accounts["facebook"]])
+
+    async def test_derivatives_prepared_in_parallel(self, setup, monkeypatch, tmp_path):
+        """Test platform-optimized images are produced concurrently."""
+        sessions, *_ = setup
+
+        class SlowOptimizer:
+            def optimize_for_platform(self, image_path, platform):
+                time.sleep(UPLOAD_S)
+                return tmp_path / f"{platform.value}.jpg"
+
+        monkeypatch.setattr(
+            integrated_posting_service,
+            "CROSS_POST_MEDIA_PLATFORMS",
+            {"instagram": Platform.INSTAGRAM, "twitter": Platform.TWITTER, "facebook": Platform.FACEBOOK},
+        )
+        async with sessions() as db:
+            service = IntegratedPostingService(db)
+            service.image_optimizer = SlowOptimizer()
+            start = time.perf_counter()
+            paths = await service._prepare_derivatives(tmp_path / "image.png", {"instagram", "twitter", "facebook"})
+            elapsed = time.perf_counter() - start
+
+        assert paths == {p: tmp_path / f"{p}.jpg" for p in ("facebook", "instagram", "twitter")}
+        assert elapsed < UPLOAD_S * 2
@@ -0,0 +1,149 @@
+"""Tests for SQL-side engagement analytics aggregation."""
+
+from __future__ import annotations
+
+import os
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.analytics import Analytics
+from app.models.engagement_rollup import EngagementDailyRollup
+from app.models.post import Post
+from app.services import engagement_rollup_service
+from app.services.engagement_analytics_service import EngagementAnalyticsService
+from app.services.engagement_rollup_service import EngagementRollupService
+from tests.post_rows import NOW, PLATFORMS, engagement, post_rows
+
+
+async def _seed(sqlite_engine, count: int, characters: list):
+    """Database with the posts, analytics and rollup tables, seeded with ``count`` posts."""
+    rows = post_rows(count, characters)
+    engine = await sqlite_engine(Post, Analytics, EngagementDailyRollup, rows={Post: rows})
+    return engine, rows
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    """Make the rollup cache unavailable so series are always read from the database."""
+
+    async def unavailable():
+        raise ConnectionError("redis disabled in tests")
+
+    monkeypatch.setattr(engagement_rollup_service, "get_redis", unavailable)
+
+
+@pytest.fixture
+async def seeded(sqlite_engine):
+    """Session factory, rows and character ids for 600 seeded posts."""
+    characters = [uuid4() for _ in range(4)]
+    engine, rows = await _seed(sqlite_engine, 600, characters)
+    return async_sessionmaker(engine, expire_on_commit=False), rows, characters
+
+
+class TestOverviewAggregation:
+    """Test suite for get_overview computed in SQL."""
+
+    async def test_totals_and_breakdown_match_rows(self, seeded):
+        """Test totals, platform breakdown and top posts agree with the raw rows."""
+        sessions, rows, characters = seeded
+        published = [r for r in rows if r["status"] == "published" and r["character_id"] == characters[1]]
+
+        async with sessions() as db:
+            overview = await EngagementAnalyticsService(db).get_overview(character_id=characters[1])
+
+        assert overview["total_posts"] == len(published)
+        assert overview["total_engagement"] == sum(engagement(r) for r in published)
+        assert overview["total_reach"] == sum(r["views_count"] for r in published)
+        for platform in PLATFORMS:
+            subset = [r for r in published if r["platform"] == platform]
+            assert overview["platform_breakdown"][platform] == {
+                "posts": len(subset),
+                "engagement": sum(engagement(r) for r in subset),
+                "likes": sum(r["likes_count"] for r in subset),
+                "comments": sum(r["comments_count"] for r in subset),
+                "shares": sum(r["shares_count"] for r in subset),
+                "views": sum(r["views_count"] for r in subset),
+            }
+        top = [post["likes"] + post["comments"] + post["shares"] for post in overview["top_performing_posts"]]
+        assert top == sorted((engagement(r) for r in published), reverse=True)[:10]
+
+    async def test_platform_and_date_filters(self, seeded):
+        """Test platform and date filters apply to totals, and to the daily trend by whole day."""
+        sessions, rows, _ = seeded
+        from_date = NOW - timedelta(minutes=100)
+        twitter = [r for r in rows if r["status"] == "published" and r["platform"] == "twitter"]
+        expected = [r for r in twitter if r["published_at"] >= from_date]
+
+        async with sessions() as db:
+            overview = await EngagementAnalyticsService(db).get_overview(
+                platform="twitter", from_date=from_date, to_date=NOW
+            )
+
+        assert list(overview["platform_breakdown"]) == ["twitter"]
+        assert overview["total_posts"] == len(expected)
+        # All seeded posts fall on NOW's day, which is the only day bucket in range
+        assert overview["trends"]["engagement"] == [sum(engagement(r) for r in twitter)]
+
+    async def test_trend_merges_rollups_with_unrolled_days(self, seeded):
+        """Test rolled-up days are read from rollups and days without rollups from posts."""
+        sessions, rows, characters = seeded
+        published = [r for r in rows if r["status"] == "published" and r["character_id"] == characters[0]]
+
+        async with sessions() as db:
+            service = EngagementAnalyticsService(db)
+            before = await service.get_overview(character_id=characters[0], to_date=NOW)
+            await EngagementRollupService(db).backfill(character_id=characters[0])
+            after = await service.get_overview(character_id=characters[0], to_date=NOW)
+            # A post on a day without rollup rows is grouped from posts
+            earlier = NOW - timedelta(days=3)
+            db.add(Post(**{**published[0], "id": uuid4(), "published_at": earlier}))
+            await db.commit()
+            merged = await service.get_overview(character_id=characters[0], to_date=NOW)
+
+        expected = sum(engagement(r) for r in published)
+        assert before["trends"]["engagement"] == [expected]
+        assert after["trends"]["engagement"] == [expected]
+        assert merged["trends"]["engagement"] == [engagement(published[0]), expected]
+
+    async def test_no_posts(self, seeded):
+        """Test an unknown character yields empty aggregates and the default rate."""
+        sessions, _, _ = seeded
+
+        async with sessions() as db:
+            overview = await EngagementAnalyticsService(db).get_overview(character_id=uuid4())
+
+        assert overview["total_posts"] == 0
+        assert overview["platform_breakdown"] == {}
+        assert overview["top_performing_posts"] == []
+        assert overview["engagement_rate"] == 0.05
+
+
+class TestOverviewPerformance:
+    """Benchmark for get_overview on a large posts table."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    async def test_overview_vs_loading_posts(self, sqlite_engine):
+        """Test SQL aggregation beats loading every post row (AINFLUENCER_BENCH_POSTS rows, default 200k)."""
+        count = int(os.environ.get("AINFLUENCER_BENCH_POSTS", "200000"))
+        characters = [uuid4() for _ in range(20)]
+        engine, _ = await _seed(sqlite_engine, count, characters)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        async with sessions() as db:
+            start = time.perf_counter()
+            overview = await EngagementAnalyticsService(db).get_overview()
+            sql_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            posts = (await db.execute(select(Post).where(Post.status == "published"))).scalars().all()
+            sum(p.likes_count + p.comments_count + p.shares_count for p in posts)
+            load_s = time.perf_counter() - start
+
+        print(f"\n{count} posts: SQL aggregates {sql_s * 1000:.0f} ms, loading rows {load_s * 1000:.0f} ms")
+        assert overview["total_posts"] == len(posts)
+        assert sql_s * 5 < load_s
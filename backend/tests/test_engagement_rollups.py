@@ -0,0 +1,262 @@
+"""Tests for daily engagement rollups."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.analytics import Analytics
+from app.models.engagement_rollup import EngagementDailyRollup
+from app.models.post import Post
+from app.services import engagement_rollup_service
+from app.services.character_performance_tracking_service import CharacterPerformanceTrackingService
+from app.services.engagement_rollup_service import EngagementRollupService
+from tests.fake_redis import FakeRedis
+from tests.post_rows import NOW, engagement, post_rows
+
+
+@pytest.fixture
+def redis(monkeypatch) -> FakeRedis:
+    """Fake Redis used by the rollup cache."""
+    fake = FakeRedis()
+
+    async def get_redis():
+        return fake
+
+    monkeypatch.setattr(engagement_rollup_service, "get_redis", get_redis)
+    return fake
+
+
+def _spread_rows(count: int, characters: list) -> list[dict]:
+    """Post rows published over roughly ``count / 4`` days (one post every 6 hours)."""
+    rows = post_rows(count, characters)
+    for i, row in enumerate(rows):
+        row["published_at"] = NOW - timedelta(hours=6 * i)
+    return rows
+
+
+@pytest.fixture
+async def db_rows(redis, sqlite_engine):
+    """Session factory, post rows and character ids for 200 posts over 50 days."""
+    characters = [uuid4() for _ in range(2)]
+    rows = _spread_rows(200, characters)
+    engine = await sqlite_engine(Post, Analytics, EngagementDailyRollup, rows={Post: rows})
+    return async_sessionmaker(engine, expire_on_commit=False), rows, characters
+
+
+def _expected_series(rows: list[dict], character_id) -> dict[str, tuple[int, int]]:
+    """(posts, engagement) per ISO day of a character's published rows."""
+    series: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    for row in rows:
+        if row["status"] == "published" and row["character_id"] == character_id:
+            bucket = series[row["published_at"].date().isoformat()]
+            bucket[0] += 1
+            bucket[1] += engagement(row)
+    return {day: (posts, total) for day, (posts, total) in series.items()}
+
+
+class TestRollupMaintenance:
+    """Test suite for backfilling and incrementally refreshing rollups."""
+
+    async def test_backfill_matches_posts_and_follower_counts(self, db_rows):
+        """Test backfilled series equal per-day totals of posts, with recorded follower counts."""
+        sessions, rows, characters = db_rows
+        async with sessions() as db:
+            db.add(
+                Analytics(
+                    character_id=characters[0],
+                    metric_date=NOW.date(),
+                    platform="instagram",
+                    metric_type="follower_count",
+                    metric_value=1234,
+                )
+            )
+            await db.commit()
+            stats = await EngagementRollupService(db).backfill()
+            series = await EngagementRollupService(db).get_daily_series(characters[0])
+
+        assert stats["characters"] == 2
+        assert {p["date"]: (p["posts"], p["engagement"]) for p in series} == _expected_series(rows, characters[0])
+        assert [p["date"] for p in series] == sorted(p["date"] for p in series)
+        assert series[-1]["follower_count"] == 1234
+        assert series[0]["follower_count"] is None
+
+    async def test_backfill_day_range_includes_both_end_days(self, db_rows):
+        """Test a ranged backfill rebuilds exactly the posts published on from_day through to_day."""
+        sessions, rows, characters = db_rows
+        from_day, to_day = (NOW - timedelta(days=10)).date(), (NOW - timedelta(days=5)).date()
+        async with sessions() as db:
+            await EngagementRollupService(db).backfill(from_day=from_day, to_day=to_day)
+            series = await EngagementRollupService(db).get_daily_series(characters[1])
+
+        expected = {
+            day: totals
+            for day, totals in _expected_series(rows, characters[1]).items()
+            if from_day.isoformat() <= day <= to_day.isoformat()
+        }
+        assert len(expected) == 6
+        assert {p["date"]: (p["posts"], p["engagement"]) for p in series} == expected
+
+    async def test_refresh_post_and_refresh_days(self, db_rows):
+        """Test engagement changes and unpublishing update only the touched bucket."""
+        sessions, rows, characters = db_rows
+        target = next(r for r in rows if r["status"] == "published" and r["character_id"] == characters[0])
+        day = target["published_at"].date()
+        async with sessions() as db:
+            await EngagementRollupService(db).backfill()
+
+            post = await db.get(Post, target["id"])
+            post.likes_count += 1000
+            service = EngagementRollupService(db)
+            await service.refresh_post(post)
+            await db.commit()
+            await service.invalidate_cache()
+            target["likes_count"] += 1000
+            series = await service.get_daily_series(characters[0])
+            assert {p["date"]: (p["posts"], p["engagement"]) for p in series} == _expected_series(
+                rows, characters[0]
+            )
+
+            same_day = [
+                r for r in rows
+                if r["character_id"] == characters[0] and r["published_at"].date() == day
+            ]
+            await db.execute(
+                update(Post).where(Post.id.in_([r["id"] for r in same_day])).values(status="draft")
+            )
+            await service.refresh_days(characters[0], [day])
+            await db.commit()
+            await service.invalidate_cache()
+            series = await service.get_daily_series(characters[0])
+            remaining = await db.scalar(
+                select(func.count())
+                .select_from(EngagementDailyRollup)
+                .where(EngagementDailyRollup.character_id == characters[0], EngagementDailyRollup.day == day)
+            )
+
+        assert day.isoformat() not in {p["date"] for p in series}
+        assert remaining == 0
+
+    async def test_record_metrics_stores_follower_count(self, db_rows):
+        """Test recording a follower count updates the rollup for that platform and day."""
+        sessions, _, characters = db_rows
+        async with sessions() as db:
+            await EngagementRollupService(db).backfill()
+            await CharacterPerformanceTrackingService(db).record_metrics(
+                characters[1], date(2020, 1, 1), {"follower_count": 42}, platform="twitter"
+            )
+            series = await EngagementRollupService(db).get_daily_series(
+                characters[1], from_day=date(2020, 1, 1), to_day=date(2020, 1, 1)
+            )
+
+        assert series == [
+            {
+                "date": "2020-01-01",
+                "posts": 0,
+                "likes": 0,
+                "comments": 0,
+                "shares": 0,
+                "views": 0,
+                "engagement": 0,
+                "follower_count": 42,
+            }
+        ]
+
+
+class TestRollupCache:
+    """Test suite for versioned series caching."""
+
+    async def test_changes_invalidate_only_affected_series(self, db_rows, redis):
+        """Test a character's cached series survives other characters' changes but not its own."""
+        sessions, rows, characters = db_rows
+        async with sessions() as db:
+            service = EngagementRollupService(db)
+            await service.backfill()
+            first = await service.get_daily_series(characters[0])
+
+            # Served from the cache: a direct table change is not visible until invalidated
+            await db.execute(update(EngagementDailyRollup).values(likes_count=0))
+            await db.commit()
+            assert await service.get_daily_series(characters[0]) == first
+
+            await service.refresh_days(characters[1], [NOW.date()])
+            await db.commit()
+            await service.invalidate_cache()
+            assert await service.get_daily_series(characters[0]) == first
+
+            await service.refresh_days(characters[0], [NOW.date()])
+            await db.commit()
+            await service.invalidate_cache()
+            refreshed = await service.get_daily_series(characters[0])
+
+        assert refreshed != first
+        assert refreshed[-1] == first[-1]
+        assert redis.data[f"{engagement_rollup_service.CACHE_PREFIX}:version:all"] == "3"
+
+    async def test_redis_unavailable_falls_back_to_database(self, db_rows, monkeypatch):
+        """Test series are still served when Redis cannot be reached."""
+        sessions, rows, characters = db_rows
+
+        async def unavailable():
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(engagement_rollup_service, "get_redis", unavailable)
+        async with sessions() as db:
+            await EngagementRollupService(db).backfill()
+            series = await EngagementRollupService(db).get_daily_series(characters[0])
+
+        assert {p["date"]: (p["posts"], p["engagement"]) for p in series} == _expected_series(rows, characters[0])
+
+
+class TestRollupPerformance:
+    """Benchmark for reading daily series from rollups."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    async def test_series_vs_grouping_posts(self, monkeypatch, sqlite_engine):
+        """Test a 90-day series from rollups beats grouping posts (AINFLUENCER_BENCH_POSTS rows, default 200k)."""
+        async def unavailable():
+            raise ConnectionError("measure database reads only")
+
+        monkeypatch.setattr(engagement_rollup_service, "get_redis", unavailable)
+        count = int(os.environ.get("AINFLUENCER_BENCH_POSTS", "200000"))
+        characters = [uuid4() for _ in range(20)]
+        rows = post_rows(count, characters)
+        for i, row in enumerate(rows):
+            row["published_at"] = NOW - timedelta(minutes=5 * i)
+        engine = await sqlite_engine(Post, Analytics, EngagementDailyRollup, rows={Post: rows})
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        from_day = (NOW - timedelta(days=90)).date()
+        async with sessions() as db:
+            start = time.perf_counter()
+            await EngagementRollupService(db).backfill()
+            backfill_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            series = await EngagementRollupService(db).get_daily_series(from_day=from_day)
+            rollup_s = time.perf_counter() - start
+
+            day = func.date(Post.published_at)
+            start = time.perf_counter()
+            grouped = (
+                await db.execute(
+                    select(day, func.sum(Post.likes_count + Post.comments_count + Post.shares_count))
+                    .where(Post.status == "published", Post.published_at >= NOW - timedelta(days=91))
+                    .group_by(day)
+                )
+            ).all()
+            scan_s = time.perf_counter() - start
+
+        print(
+            f"\n{count} posts: backfill {backfill_s * 1000:.0f} ms, "
+            f"series from rollups {rollup_s * 1000:.1f} ms, grouping posts {scan_s * 1000:.0f} ms"
+        )
+        assert len(series) >= 90 and grouped
+        assert rollup_s * 5 < scan_s
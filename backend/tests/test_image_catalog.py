@@ -0,0 +1,119 @@
+"""Tests for the image catalog behind ImageStorageService listings."""
+
+from __future__ import annotations
+
+import io
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from app.services import image_metadata_service as metadata_module
+from app.services import image_storage_service as storage_module
+from app.services.image_catalog import ImageCatalog
+
+
+def _png_bytes(color: tuple[int, int, int] = (200, 50, 50)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (32, 32), color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """ImageStorageService (and its metadata sidecars) rooted in a temporary directory."""
+    images = tmp_path / "images"
+    monkeypatch.setattr(storage_module, "images_dir", lambda: images)
+    monkeypatch.setattr(metadata_module, "images_dir", lambda: images)
+    monkeypatch.setattr(storage_module, "image_hash_index_file", lambda: tmp_path / "hashes.sqlite3")
+    monkeypatch.setattr(storage_module, "image_catalog_file", lambda: tmp_path / "catalog.sqlite3")
+    return storage_module.ImageStorageService()
+
+
+def _save(storage, name: str, prompt: str, mtime: float) -> None:
+    storage.save_image_bytes(_png_bytes(), filename=name, generation_params={"prompt": prompt})
+    os.utime(storage.resolve_path(name), (mtime, mtime))
+    storage.upsert_metadata(name, generation_params={"prompt": prompt})
+
+
+class TestImageCatalog:
+    """Test suite for catalog-backed listing, search, stats and cleanup."""
+
+    def test_listing_sorts_paginates_and_searches(self, storage):
+        """Test list_images answers sort, paging and filename/prompt search from the catalog."""
+        now = time.time()
+        _save(storage, "b-beach.png", "sunset over the beach", now - 30)
+        _save(storage, "a-city.png", "neon city at night", now - 20)
+        _save(storage, "c-forest.png", "misty forest, morning", now - 10)
+
+        newest = storage.list_images(sort="newest", limit=2)
+        assert [item["path"] for item in newest["items"]] == ["c-forest.png", "a-city.png"]
+        assert newest["total"] == 3
+        assert newest["items"][0]["url"] == "/content/images/c-forest.png"
+        assert newest["items"][0]["metadata"]["generation_params"]["prompt"] == "misty forest, morning"
+
+        assert [i["path"] for i in storage.list_images(sort="oldest", offset=1)["items"]] == ["a-city.png", "c-forest.png"]
+        assert [i["path"] for i in storage.list_images(sort="name")["items"]] == ["a-city.png", "b-beach.png", "c-forest.png"]
+
+        assert [i["path"] for i in storage.list_images(q="NEON")["items"]] == ["a-city.png"]
+        assert [i["path"] for i in storage.list_images(q="beach")["items"]] == ["b-beach.png"]
+        assert [i["path"] for i in storage.list_images(q="c-")["items"]] == ["c-forest.png"]
+        assert storage.list_images(q="desert")["total"] == 0
+
+    def test_delete_stats_and_cleanup_keep_catalog_current(self, storage):
+        """Test deletes drop catalog rows and cleanup uses catalog mtimes."""
+        now = time.time()
+        _save(storage, "old.png", "old render", now - 40 * 86400)
+        _save(storage, "new.png", "new render", now)
+        stats = storage.storage_stats()
+        assert stats["images_count"] == 2
+        assert stats["images_bytes"] == sum(storage.resolve_path(n).stat().st_size for n in ("old.png", "new.png"))
+
+        assert storage.cleanup_old_images(older_than_days=30) == {"deleted": 1, "skipped": 0, "older_than_days": 30}
+        assert [i["path"] for i in storage.list_images()["items"]] == ["new.png"]
+
+        assert storage.delete_image("new.png") is True
+        assert storage.storage_stats() == {"images_count": 0, "images_bytes": 0}
+
+    def test_register_image_catalogs_files_saved_by_other_services(self, storage, tmp_path):
+        """Test an image written straight into storage is listed and hashed once registered."""
+        storage.save_image_bytes(_png_bytes(), filename="source.png")
+        derived = storage.resolve_path("source_upscaled_2x.png")
+        derived.write_bytes(_png_bytes())
+        assert storage.list_images()["total"] == 1
+
+        assert storage.register_image(derived) is not None
+        assert {i["path"] for i in storage.list_images()["items"]} == {"source.png", "source_upscaled_2x.png"}
+        assert [m["filename"] for m in storage.find_similar_images("source.png")] == ["source_upscaled_2x.png"]
+
+        outside = tmp_path / "elsewhere.png"
+        outside.write_bytes(_png_bytes())
+        assert storage.register_image(outside) is None
+        assert storage.register_image("missing.png") is None
+        assert storage.storage_stats()["images_count"] == 2
+
+    def test_reconcile_picks_up_changes_made_behind_the_service(self, storage):
+        """Test the reconcile pass adds new files, refreshes changed ones and drops missing ones."""
+        _save(storage, "kept.png", "kept", time.time() - 100)
+        _save(storage, "gone.png", "gone", time.time() - 100)
+        storage.resolve_path("gone.png").unlink()
+        Image.new("RGB", (8, 8)).save(storage.resolve_path("dropped-in.png"))
+        storage.resolve_path("notes.txt").write_text("not an image")
+
+        result = storage.reconcile_catalog()
+
+        assert result == {"added": 1, "updated": 0, "removed": 1, "unchanged": 1}
+        assert sorted(i["path"] for i in storage.list_images()["items"]) == ["dropped-in.png", "kept.png"]
+        assert storage.reconcile_catalog()["unchanged"] == 2
+
+    def test_catalog_persists_across_reopen(self, tmp_path):
+        """Test rows and the FTS index survive reopening the database."""
+        catalog = ImageCatalog(tmp_path / "catalog.sqlite3")
+        catalog.upsert("x.png", mtime=1.0, size_bytes=10, metadata={"generation_params": {"prompt": "red fox"}})
+        catalog.upsert("x.png", mtime=2.0, size_bytes=12, metadata={"generation_params": {"prompt": "blue jay"}})
+
+        reopened = ImageCatalog(tmp_path / "catalog.sqlite3")
+        assert reopened.list_images(q="fox") == ([], 0)
+        items, total = reopened.list_images(q="blue jay")
+        assert total == 1 and items[0]["size_bytes"] == 12
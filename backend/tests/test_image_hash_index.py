@@ -0,0 +1,198 @@
+"""Tests for the perceptual-hash index and near-duplicate lookups."""
+
+from __future__ import annotations
+
+import io
+import random
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.services import image_storage_service as storage_module
+from app.services.image_hash_index import (
+    HammingIndex,
+    ImageHashIndex,
+    compute_image_hashes,
+    hamming_distance,
+)
+
+
+def _render(seed: int, size: int = 256) -> Image.Image:
+    """Smooth random RGB image (upscaled noise) that survives resizing."""
+    rng = np.random.default_rng(seed)
+    small = Image.fromarray((rng.random((12, 12, 3)) * 255).astype("uint8"))
+    return small.resize((size, size), Image.BICUBIC)
+
+
+def _png_bytes(img: Image.Image) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class TestImageHashes:
+    """Test suite for pHash/dHash/embedding fingerprints."""
+
+    def test_variants_of_an_image_stay_close(self):
+        """Test resized and JPEG re-encoded copies hash near the original."""
+        original = _render(1)
+        buf = io.BytesIO()
+        original.resize((180, 180)).save(buf, format="JPEG", quality=70)
+        variant = Image.open(io.BytesIO(buf.getvalue()))
+
+        a, b = compute_image_hashes(original), compute_image_hashes(variant)
+
+        assert hamming_distance(a.phash, b.phash) <= 6
+        assert hamming_distance(a.dhash, b.dhash) <= 10
+        assert float(np.dot(a.embedding, b.embedding)) > 0.95
+
+    def test_unrelated_images_are_far_apart(self):
+        """Test different renders are well outside the duplicate radius."""
+        a, b = compute_image_hashes(_render(1)), compute_image_hashes(_render(2))
+
+        assert hamming_distance(a.phash, b.phash) > 16
+
+
+class TestHammingIndex:
+    """Test suite for the multi-index Hamming radius query."""
+
+    def test_query_matches_linear_scan(self):
+        """Test radius queries return exactly the hashes a full scan finds."""
+        rng = random.Random(0)
+        values = [rng.getrandbits(64) for _ in range(2000)]
+        # Near neighbours of a few values so small radii have hits
+        values += [v ^ (1 << rng.randrange(64)) for v in values[:50]]
+        index = HammingIndex()
+        for v in values:
+            index.add(v)
+
+        for probe in values[:20]:
+            for radius in (0, 3, 8, 12, 40):
+                expected = sorted({(hamming_distance(probe, v), v) for v in values if hamming_distance(probe, v) <= radius})
+                assert sorted(index.query(probe, radius)) == expected
+
+    def test_duplicate_values_are_stored_once_and_discarded(self):
+        """Test re-adding a hash does not grow the index and discard removes it from queries."""
+        index = HammingIndex()
+        assert index.add(5) is True
+        assert index.add(5) is False
+        assert len(index) == 1
+        index.discard(5)
+        assert len(index) == 0
+        assert index.query(5, 0) == []
+
+
+class TestImageHashIndex:
+    """Test suite for ImageHashIndex persistence and lookups."""
+
+    def test_query_finds_near_duplicates_and_survives_reopen(self, tmp_path):
+        """Test lookups rank the re-encoded copy first and state persists in SQLite."""
+        index = ImageHashIndex(tmp_path / "hashes.sqlite3")
+        index.add("a.png", compute_image_hashes(_render(1)))
+        index.add("a-small.png", compute_image_hashes(_render(1).resize((128, 128))))
+        index.add("b.png", compute_image_hashes(_render(2)))
+
+        matches = index.query(compute_image_hashes(_render(1)), exclude="a.png")
+        assert [m["filename"] for m in matches] == ["a-small.png"]
+
+        reopened = ImageHashIndex(tmp_path / "hashes.sqlite3")
+        assert len(reopened) == 3
+        assert reopened.get("b.png").phash == index.get("b.png").phash
+
+    def test_remove_and_find_duplicates(self, tmp_path):
+        """Test duplicate groups are connected components and removals drop out."""
+        index = ImageHashIndex(tmp_path / "hashes.sqlite3")
+        for name, img in {
+            "a1.png": _render(1),
+            "a2.png": _render(1).resize((200, 200)),
+            "a3.png": _render(1).resize((150, 150)),
+            "b1.png": _render(2),
+            "b2.png": _render(2),
+            "c.png": _render(3),
+        }.items():
+            index.add(name, compute_image_hashes(img))
+
+        assert index.find_duplicates() == [["a1.png", "a2.png", "a3.png"], ["b1.png", "b2.png"]]
+
+        assert index.remove("b2.png") is True
+        assert index.remove("b2.png") is False
+        assert index.find_duplicates() == [["a1.png", "a2.png", "a3.png"]]
+
+    def test_sync_indexes_new_files_and_drops_missing(self, tmp_path):
+        """Test sync reconciles the index with the directory contents."""
+        index = ImageHashIndex(tmp_path / "hashes.sqlite3")
+        images = tmp_path / "images"
+        images.mkdir()
+        _render(1).save(images / "a.png")
+        _render(2).save(images / "b.png")
+        index.add("gone.png", compute_image_hashes(_render(3)))
+
+        assert index.sync(images) == {"added": 2, "removed": 1, "unchanged": 0, "failed": 0}
+        assert index.sync(images) == {"added": 0, "removed": 0, "unchanged": 2, "failed": 0}
+        assert index.get("gone.png") is None
+
+
+class TestImageStorageHashIndex:
+    """Test suite for hash indexing through ImageStorageService."""
+
+    @pytest.fixture
+    def storage(self, tmp_path, monkeypatch):
+        """ImageStorageService rooted in a temporary directory."""
+        monkeypatch.setattr(storage_module, "images_dir", lambda: tmp_path / "images")
+        monkeypatch.setattr(storage_module, "image_hash_index_file", lambda: tmp_path / "hashes.sqlite3")
+        monkeypatch.setattr(storage_module, "image_catalog_file", lambda: tmp_path / "catalog.sqlite3")
+        return storage_module.ImageStorageService()
+
+    def test_saved_images_are_indexed_and_deletes_are_forgotten(self, storage):
+        """Test save_image_bytes fills the index and delete_image removes the entry."""
+        storage.save_image_bytes(_png_bytes(_render(1)), filename="a.png")
+        storage.save_image_bytes(_png_bytes(_render(1).resize((200, 200))), filename="a-copy.png")
+        storage.save_image_bytes(_png_bytes(_render(2)), filename="b.png")
+
+        matches = storage.find_similar_images("a.png")
+        assert [m["filename"] for m in matches] == ["a-copy.png"]
+        assert matches[0]["url"] == "/content/images/a-copy.png"
+        assert storage.find_duplicate_images() == [["a-copy.png", "a.png"]]
+
+        assert storage.delete_image("a-copy.png") is True
+        assert storage.find_similar_images("a.png") == []
+        assert storage.find_similar_images("missing.png") is None
+
+    def test_files_deleted_behind_the_service_are_pruned(self, storage):
+        """Test stale index entries for files removed elsewhere are not reported."""
+        storage.save_image_bytes(_png_bytes(_render(1)), filename="a.png")
+        storage.save_image_bytes(_png_bytes(_render(1)), filename="b.png")
+        storage.resolve_path("b.png").unlink()
+
+        assert storage.find_duplicate_images() == []
+        assert storage._hash_index.get("b.png") is None
+
+
+class TestHashIndexPerformance:
+    """Benchmarks for multi-index lookups against a full scan."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_indexed_query_beats_linear_scan(self):
+        """Test radius queries on a 50k-hash library are faster than scanning every hash."""
+        rng = random.Random(1)
+        values = [rng.getrandbits(64) for _ in range(50_000)]
+        index = HammingIndex()
+        for v in values:
+            index.add(v)
+        probes = values[:200]
+
+        start = time.perf_counter()
+        for probe in probes:
+            index.query(probe, 8)
+        index_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for probe in probes:
+            [v for v in values if (probe ^ v).bit_count() <= 8]
+        scan_s = time.perf_counter() - start
+
+        print(f"\n50k hashes, radius 8: indexed {index_s * 5:.2f} ms/query, scan {scan_s * 5:.2f} ms/query")
+        assert index_s < scan_s
@@ -0,0 +1,103 @@
+"""Tests for batch image similarity scoring."""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.services import image_similarity_service as similarity_module
+from app.services.image_similarity_service import ImageSimilarityService
+
+
+@pytest.fixture(autouse=True)
+def images_root(tmp_path, monkeypatch):
+    """Resolve relative image paths against a temporary directory."""
+    monkeypatch.setattr(similarity_module, "images_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def _write_batch(directory, count: int, size: int) -> list[str]:
+    """Write ``count`` related renders (shared base plus per-image noise) and return their filenames."""
+    rng = np.random.default_rng(0)
+    base = rng.random((16, 16, 3)) * 255
+    paths = []
+    for i in range(count):
+        small = np.clip(base + rng.normal(0, 10 + 5 * i, base.shape), 0, 255).astype("uint8")
+        path = directory / f"img_{i}.png"
+        Image.fromarray(small).resize((size, size), Image.BICUBIC).save(path)
+        paths.append(path.name)
+    return paths
+
+
+class TestCompareBatchMatrix:
+    """Test suite for the vectorized similarity matrix."""
+
+    def test_matrix_matches_pairwise_scores(self, tmp_path):
+        """Test matrix entries equal compare_images when no resampling is needed."""
+        service = ImageSimilarityService()
+        paths = _write_batch(tmp_path, 5, 128)
+
+        batch = service.compare_batch_matrix(paths, size=128)
+
+        assert batch["index"] == paths
+        assert batch["comparisons_count"] == 10
+        matrix = np.array(batch["matrix"])
+        assert matrix.shape == (5, 5)
+        assert np.allclose(matrix, matrix.T)
+        assert np.all(np.diag(matrix) == 1.0)
+        for i in range(5):
+            for j in range(i + 1, 5):
+                pair = service.compare_images(paths[i], paths[j])
+                assert matrix[i, j] == pytest.approx(pair["similarity_score"], abs=1e-4)
+                assert batch["mse"][i][j] == pytest.approx(pair["mse"] / 255.0**2, abs=1e-6)
+
+    def test_unreadable_images_are_reported_and_skipped(self, tmp_path):
+        """Test missing files are listed under failed and left out of the index."""
+        service = ImageSimilarityService()
+        paths = _write_batch(tmp_path, 2, 64)
+        missing = "missing.png"
+
+        batch = service.compare_batch_matrix([paths[0], missing, paths[1]])
+
+        assert batch["index"] == paths
+        assert [f["path"] for f in batch["failed"]] == [missing]
+        assert batch["comparisons_count"] == 1
+
+    def test_compare_batch_images_keeps_response_shape(self, tmp_path):
+        """Test the nested upper-triangle dict is built from the matrix."""
+        service = ImageSimilarityService()
+        paths = _write_batch(tmp_path, 3, 64)
+
+        result = service.compare_batch_images(paths)
+
+        pairwise = service.compare_batch_images(paths, vectorized=False)
+        assert result["average_similarity"] == pytest.approx(pairwise["average_similarity"], abs=0.01)
+        assert set(result["similarity_matrix"][paths[0]]) == {paths[1], paths[2]}
+        assert set(result["similarity_matrix"][paths[1]]) == {paths[2]}
+        assert result["similarity_matrix"][paths[2]] == {}
+        assert result["comparisons_count"] == 3
+
+
+class TestSimilarityPerformance:
+    """Benchmarks for batch similarity scoring."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_matrix_faster_than_pairwise(self, tmp_path):
+        """Test a 16-image batch scores faster with one decode per image than per pair."""
+        service = ImageSimilarityService()
+        paths = _write_batch(tmp_path, 16, 512)
+
+        start = time.perf_counter()
+        service.compare_batch_images(paths, vectorized=False)
+        pairwise_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        service.compare_batch_images(paths)
+        matrix_s = time.perf_counter() - start
+
+        print(f"\n16 images (120 pairs): pairwise {pairwise_s:.2f}s, matrix {matrix_s:.3f}s")
+        assert matrix_s * 5 < pairwise_s
@@ -0,0 +1,162 @@
+"""Tests for the pooled instagrapi sessions."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app.services.instagram_session_pool import (
+    InstagramCredentials,
+    InstagramSessionError,
+    InstagramSessionPool,
+)
+
+CREDS = InstagramCredentials("influencer", "secret")
+
+
+class LoginRequired(Exception):
+    """Stands in for instagrapi.exceptions.LoginRequired (matched by name)."""
+
+
+class FakeClient:
+    """Minimal instagrapi client double that counts logins."""
+
+    fail_login = False
+
+    def __init__(self) -> None:
+        self.logged_in_as: str | None = None
+        self.dumped: list[str] = []
+        self.loaded: list[str] = []
+
+    def login(self, username: str, password: str) -> bool:
+        if self.fail_login:
+            raise RuntimeError("bad password")
+        self.logged_in_as = username
+        return True
+
+    def load_settings(self, path: str) -> None:
+        self.loaded.append(path)
+
+    def dump_settings(self, path: str) -> None:
+        self.dumped.append(path)
+
+
+@pytest.fixture
+def clients() -> list[FakeClient]:
+    return []
+
+
+@pytest.fixture
+def pool(clients) -> InstagramSessionPool:
+    def factory() -> FakeClient:
+        client = FakeClient()
+        clients.append(client)
+        return client
+
+    return InstagramSessionPool(idle_ttl_s=60, max_sessions=10, client_factory=factory)
+
+
+class TestInstagramSessionPool:
+    """Test suite for InstagramSessionPool."""
+
+    def test_reuses_session_across_actions(self, pool, clients):
+        """Test a burst of actions on one account logs in once."""
+        results = [pool.run("acct-1", CREDS, lambda client: client.logged_in_as) for _ in range(50)]
+
+        assert results == ["influencer"] * 50
+        assert pool.logins == 1
+        assert len(clients) == 1
+
+    def test_separate_sessions_per_account(self, pool):
+        """Test each platform account gets its own client."""
+        first = pool.run("acct-1", CREDS, lambda client: client)
+        second = pool.run("acct-2", InstagramCredentials("other", "pw"), lambda client: client)
+
+        assert first is not second
+        assert pool.stats()["sessions"] == 2
+
+    def test_relogin_on_login_required(self, pool, clients):
+        """Test an expired session logs in again and the action is retried once."""
+        pool.run("acct-1", CREDS, lambda client: None)
+        calls = []
+
+        def action(client):
+            calls.append(client)
+            if len(calls) == 1:
+                try:
+                    raise LoginRequired("session expired")
+                except LoginRequired as exc:
+                    raise RuntimeError("Failed to like post") from exc
+            return "liked"
+
+        assert pool.run("acct-1", CREDS, action) == "liked"
+        assert pool.logins == 2
+        assert calls[0] is not calls[1]
+
+    def test_other_errors_are_not_retried(self, pool):
+        """Test failures unrelated to the login propagate without a new login."""
+        with pytest.raises(ValueError):
+            pool.run("acct-1", CREDS, lambda client: (_ for _ in ()).throw(ValueError("boom")))
+
+        assert pool.logins == 1
+
+    def test_login_failure_raises_session_error(self, pool, monkeypatch):
+        """Test a failed login surfaces as InstagramSessionError."""
+        monkeypatch.setattr(FakeClient, "fail_login", True)
+
+        with pytest.raises(InstagramSessionError):
+            pool.run("acct-1", CREDS, lambda client: None)
+
+    def test_changed_credentials_log_in_again(self, pool):
+        """Test a password change replaces the pooled client."""
+        first = pool.run("acct-1", CREDS, lambda client: client)
+        second = pool.run("acct-1", InstagramCredentials("influencer", "new-secret"), lambda client: client)
+
+        assert first is not second
+        assert pool.logins == 2
+
+    def test_idle_sessions_are_evicted_and_saved(self, pool, clients, tmp_path):
+        """Test idle sessions are dropped after the TTL with their settings saved."""
+        session_file = str(tmp_path / "session.json")
+        creds = InstagramCredentials("influencer", "secret", session_file)
+        pool.run("acct-1", creds, lambda client: None)
+        pool.idle_ttl_s = 0.0
+
+        assert pool.evict_idle() == 1
+        assert pool.stats()["sessions"] == 0
+        # Saved once after login and once on eviction
+        assert clients[0].dumped == [session_file, session_file]
+
+    def test_lru_session_evicted_beyond_max(self, pool):
+        """Test the least recently used session is dropped when the pool is full."""
+        pool.max_sessions = 2
+        for key in ("a", "b", "a", "c"):
+            pool.run(key, CREDS, lambda client: None)
+
+        assert set(pool._sessions) == {"a", "c"}
+
+    def test_actions_on_one_account_are_serialized(self, pool):
+        """Test the per-session lock keeps one client from being used by two threads at once."""
+        active = 0
+        overlap = False
+        guard = threading.Lock()
+
+        def action(client):
+            nonlocal active, overlap
+            with guard:
+                active += 1
+                overlap = overlap or active > 1
+            time.sleep(0.01)
+            with guard:
+                active -= 1
+
+        threads = [threading.Thread(target=pool.run, args=("acct-1", CREDS, action)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not overlap
+        assert pool.logins == 1
@@ -0,0 +1,62 @@
+"""Unit tests for the indexed pipeline job history store."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from app.models.pipeline_contracts import JobHistory
+from app.services.job_history import JobHistoryStore
+
+
+def _job(idx: int, *, status: str = "completed", preset_id: str = "portrait") -> JobHistory:
+    return JobHistory(
+        job_id=f"job-{idx:03d}",
+        preset_id=preset_id,
+        status=status,  # type: ignore[arg-type]
+        created_at=datetime(2026, 1, 1) + timedelta(minutes=idx),
+        quality_level="standard",
+        inputs={"prompt": f"prompt {idx}", "api_key": "secret"},
+    )
+
+
+class TestJobHistoryStore:
+    """Test suite for JobHistoryStore listing index."""
+
+    def test_list_jobs_filters_and_paginates_from_index(self, tmp_path):
+        """Test filtered pagination newest first without reading job files."""
+        store = JobHistoryStore(jobs_dir=tmp_path)
+        for idx in range(30):
+            store.save_job(_job(idx, status="failed" if idx % 3 == 0 else "completed", preset_id="a" if idx % 2 else "b"))
+
+        # Listing must not depend on the per-job files
+        for job_file in tmp_path.glob("job-*.json"):
+            job_file.unlink()
+
+        page = store.list_jobs(limit=3, offset=1, status="failed")
+        assert [j.job_id for j in page] == ["job-024", "job-021", "job-018"]
+        assert store.count_jobs(status="failed") == 10
+        assert store.count_jobs(status="failed", preset_id="a") == 5
+        assert page[0].inputs["api_key"] == "***REDACTED***"
+
+    def test_update_job_status_updates_index(self, tmp_path):
+        """Test status updates are reflected in filtered listings."""
+        store = JobHistoryStore(jobs_dir=tmp_path)
+        store.save_job(_job(1, status="queued"))
+        assert store.update_job_status("job-001", "running")
+
+        assert [j.job_id for j in store.list_jobs(status="running")] == ["job-001"]
+        assert store.list_jobs(status="queued") == []
+        assert store.list_jobs(status="running")[0].started_at is not None
+
+    def test_index_rebuilt_from_existing_files(self, tmp_path):
+        """Test a missing index is rebuilt from job files on startup."""
+        store = JobHistoryStore(jobs_dir=tmp_path)
+        for idx in range(5):
+            store.save_job(_job(idx))
+        store._index.close()
+        for suffix in ("", "-wal", "-shm"):
+            (tmp_path / f"index.sqlite3{suffix}").unlink(missing_ok=True)
+
+        reopened = JobHistoryStore(jobs_dir=tmp_path)
+        assert reopened.count_jobs() == 5
+        assert reopened.list_jobs(limit=1)[0].job_id == "job-004"
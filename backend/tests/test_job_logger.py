@@ -0,0 +1,121 @@
+"""Tests for the buffered job logger and secret redaction."""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from app.services.job_logger import JobLogger, JobLogWriter, redact_secrets
+
+
+def _read_lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+class TestRedactSecrets:
+    """Test suite for redact_secrets."""
+
+    def test_redacts_keys_and_secret_looking_values(self):
+        """Test key patterns match case-insensitively and long secret-like values are hidden."""
+        data = {
+            "API_KEY": "abc",
+            "nested": {"userPassword": "pw", "ok": 1},
+            "items": [{"Authorization": "Bearer x"}, "plain"],
+            "note": "my token is 1234567890",
+            "short": "token",
+        }
+
+        assert redact_secrets(data) == {
+            "API_KEY": "***REDACTED***",
+            "nested": {"userPassword": "***REDACTED***", "ok": 1},
+            "items": [{"Authorization": "***REDACTED***"}, "plain"],
+            "note": "***REDACTED***",
+            "short": "token",
+        }
+
+
+class TestJobLogger:
+    """Test suite for JobLogger buffering and file handling."""
+
+    def test_events_are_written_in_order_after_flush(self, tmp_path):
+        """Test buffered events reach each job's logs.jsonl in order."""
+        job_logger = JobLogger(jobs_dir=tmp_path)
+        try:
+            for idx in range(5):
+                job_logger.log_job_event("job-a", "info", f"step {idx}", {"api_key": "x", "step": idx})
+            job_logger.log_job_event("job-b", "warning", "other")
+            assert job_logger.flush()
+        finally:
+            job_logger.close()
+
+        lines = _read_lines(tmp_path / "job-a" / "logs.jsonl")
+        assert [line["message"] for line in lines] == [f"step {idx}" for idx in range(5)]
+        assert lines[0]["metadata"] == {"api_key": "***REDACTED***", "step": 0}
+        assert _read_lines(tmp_path / "job-b" / "logs.jsonl")[0]["level"] == "warning"
+
+    def test_time_threshold_flushes_without_explicit_flush(self, tmp_path):
+        """Test lines are written once they have been buffered for flush_interval_s."""
+        writer = JobLogWriter(tmp_path, flush_interval_s=0.05)
+        try:
+            writer.write("job-a", '{"message": "hello"}\n')
+            log_file = tmp_path / "job-a" / "logs.jsonl"
+            deadline = time.time() + 5
+            while not log_file.exists() and time.time() < deadline:
+                time.sleep(0.01)
+            assert log_file.read_text(encoding="utf-8") == '{"message": "hello"}\n'
+        finally:
+            writer.close()
+
+    def test_open_handles_are_bounded(self, tmp_path):
+        """Test least recently used handles are closed beyond max_open_files."""
+        writer = JobLogWriter(tmp_path, max_open_files=2)
+        try:
+            for idx in range(5):
+                writer.write(f"job-{idx}", f'{{"n": {idx}}}\n')
+                writer.flush()
+            assert list(writer._handles) == ["job-3", "job-4"]
+            writer.write("job-0", '{"n": 5}\n')
+            writer.flush()
+        finally:
+            writer.close()
+
+        assert _read_lines(tmp_path / "job-0" / "logs.jsonl") == [{"n": 0}, {"n": 5}]
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_buffered_writer_throughput(self, tmp_path):
+        """Benchmark events/sec of per-event open/append against the buffered writer."""
+        events = 5000
+        metadata = {"progress": 0.5, "api_key": "x", "params": {"steps": 30, "seed": 1}}
+
+        def log_unbuffered(job_id: str, message: str) -> None:
+            # Previous behaviour: mkdir + open/append/close per event
+            job_log_dir = tmp_path / "unbuffered" / job_id
+            job_log_dir.mkdir(parents=True, exist_ok=True)
+            entry = {"timestamp": datetime.utcnow().isoformat(), "level": "info", "message": message}
+            entry["metadata"] = redact_secrets(metadata)
+            with open(job_log_dir / "logs.jsonl", "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+        start = time.perf_counter()
+        for idx in range(events):
+            log_unbuffered(f"job-{idx % 8}", "Sampling")
+        unbuffered_rate = events / (time.perf_counter() - start)
+
+        writer = JobLogWriter(tmp_path / "buffered")
+        start = time.perf_counter()
+        for idx in range(events):
+            entry = {"timestamp": datetime.utcnow().isoformat(), "level": "info", "message": "Sampling"}
+            entry["metadata"] = redact_secrets(metadata)
+            writer.write(f"job-{idx % 8}", json.dumps(entry) + "\n")
+        assert writer.flush(timeout_s=30)
+        buffered_rate = events / (time.perf_counter() - start)
+        writer.close()
+
+        print(f"\njob log events/sec: unbuffered={unbuffered_rate:,.0f} buffered={buffered_rate:,.0f}")
+        total = sum(len(_read_lines(path)) for path in (tmp_path / "buffered").glob("*/logs.jsonl"))
+        assert total == events
+        assert buffered_rate > unbuffered_rate
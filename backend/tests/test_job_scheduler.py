@@ -0,0 +1,134 @@
+"""Unit tests for the background job scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api import generate as generate_api
+from app.main import create_app
+from app.services.job_scheduler import JobScheduler, QueueFullError
+
+
+def _wait_until(predicate, timeout_s: float = 5.0) -> bool:
+    deadline = time.time() + timeout_s
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestJobScheduler:
+    """Test suite for JobScheduler lanes, backpressure and persistence."""
+
+    def test_interactive_lane_served_first_without_starving_batch(self, tmp_path):
+        """Test interactive jobs run first but a batch job is served after a burst."""
+        scheduler = JobScheduler(
+            name="test",
+            runner=lambda job_id: None,
+            state_path=tmp_path / "queue.json",
+            workers=1,
+            interactive_burst=2,
+        )
+        scheduler.submit("b1", lane="batch")
+        for idx in range(3):
+            scheduler.submit(f"i{idx}", lane="interactive")
+
+        assert scheduler.position("i0") == 1
+        assert scheduler.position("i1") == 2
+        assert scheduler.position("b1") == 3
+        assert scheduler.position("i2") == 4
+
+    def test_submit_rejects_when_queue_full(self, tmp_path):
+        """Test backpressure once the depth limit is reached."""
+        scheduler = JobScheduler(
+            name="test",
+            runner=lambda job_id: None,
+            state_path=tmp_path / "queue.json",
+            max_depth=2,
+        )
+        scheduler.submit("a")
+        scheduler.submit("b")
+        with pytest.raises(QueueFullError) as exc_info:
+            scheduler.submit("c")
+        assert exc_info.value.depth == 2
+
+        # Restored jobs bypass the limit
+        assert scheduler.submit("d", force=True) == 3
+
+    def test_queue_state_survives_restart(self, tmp_path):
+        """Test waiting jobs are persisted and can be reloaded by a new scheduler."""
+        state_path = tmp_path / "queue.json"
+        first = JobScheduler(name="test", runner=lambda job_id: None, state_path=state_path)
+        first.submit("i1", lane="interactive")
+        first.submit("b1", lane="batch")
+        first.remove("i1")
+
+        second = JobScheduler(name="test", runner=lambda job_id: None, state_path=state_path)
+        assert second.load_persisted() == {"interactive": [], "batch": ["b1"]}
+
+    def test_worker_count_bounds_concurrency(self, tmp_path):
+        """Test no more than the configured number of jobs run at once."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+        done: list[str] = []
+
+        def runner(job_id: str) -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+                done.append(job_id)
+
+        scheduler = JobScheduler(name="test", runner=runner, state_path=tmp_path / "queue.json", workers=3)
+        for idx in range(12):
+            scheduler.submit(f"job-{idx}")
+        scheduler.start()
+        try:
+            assert _wait_until(lambda: len(done) == 12)
+        finally:
+            scheduler.shutdown()
+
+        assert peak <= 3
+        assert scheduler.stats()["depth"] == 0
+
+
+class _GpuOptimizer:
+    def recommend_batch_size(self, width, height, batch_size, conservative):
+        return {"recommended_batch_size": batch_size, "can_use_requested": True}
+
+
+class TestGenerateImageQueueFull:
+    """Test suite for POST /api/generate/image when the job queue is full."""
+
+    @pytest.fixture
+    def full_queue(self, monkeypatch):
+        def create_image_job(**kwargs):
+            raise QueueFullError(depth=5, max_depth=5)
+
+        monkeypatch.setattr(generate_api, "get_gpu_optimizer", lambda: _GpuOptimizer())
+        monkeypatch.setattr(generate_api.generation_service, "create_image_job", create_image_job)
+        monkeypatch.setattr(
+            generate_api.face_consistency_service,
+            "get_face_embedding_metadata",
+            lambda embedding_id: {"image_path": "face.png", "status": "ready"},
+        )
+
+    @pytest.mark.parametrize("extra", [{}, {"face_embedding_id": "face-1"}])
+    async def test_full_queue_returns_429(self, full_queue, extra):
+        """Test a full queue answers 429 with the depth and Retry-After, with or without a face embedding."""
+        async with AsyncClient(transport=ASGITransport(app=create_app()), base_url="http://test") as client:
+            response = await client.post("/api/generate/image", json={"prompt": "portrait", **extra})
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "30"
+        body = response.json()
+        assert (body["error"], body["queue_depth"], body["max_queue_depth"]) == ("queue_full", 5, 5)
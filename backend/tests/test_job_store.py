@@ -0,0 +1,82 @@
+"""Unit tests for the append-only job journal."""
+
+from __future__ import annotations
+
+from app.services.job_store import JobStore
+
+
+class TestJobStore:
+    """Test suite for JobStore append, replay and compaction."""
+
+    def test_replay_applies_deltas_in_order(self, tmp_path):
+        """Test put/patch/delete entries rebuild the latest job state."""
+        store = JobStore(tmp_path / "jobs.jsonl")
+        store.put("a", {"id": "a", "state": "queued", "created_at": 1.0, "params": {"prompt": "x"}})
+        store.put("b", {"id": "b", "state": "queued", "created_at": 2.0, "params": None})
+        store.patch("a", fields={"state": "running"}, params={"batch_progress": {"completed": 1}})
+        store.patch("b", params={"seed": 7})
+        store.delete("b")
+        store.close()
+
+        records = JobStore(tmp_path / "jobs.jsonl").load()
+        assert list(records) == ["a"]
+        assert records["a"]["state"] == "running"
+        assert records["a"]["params"] == {"prompt": "x", "batch_progress": {"completed": 1}}
+
+    def test_updates_append_instead_of_rewriting(self, tmp_path):
+        """Test each update adds exactly one journal line."""
+        path = tmp_path / "jobs.jsonl"
+        store = JobStore(path)
+        store.put("a", {"id": "a", "created_at": 1.0})
+        for step in range(50):
+            store.patch("a", fields={"message": f"step {step}"})
+        store.close()
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 51
+
+    def test_compaction_folds_journal_and_keeps_newest(self, tmp_path):
+        """Test compaction writes a snapshot, truncates the journal and applies retention."""
+        path = tmp_path / "jobs.jsonl"
+        store = JobStore(path, max_jobs=2, compact_threshold=10_000)
+        for idx in range(4):
+            store.put(f"job-{idx}", {"id": f"job-{idx}", "created_at": float(idx)})
+            store.patch(f"job-{idx}", fields={"state": "succeeded"})
+        store.compact(wait=True)
+        store.patch("job-3", fields={"message": "after compaction"})
+        store.close()
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+        records = JobStore(path).load()
+        assert sorted(records) == ["job-2", "job-3"]
+        assert records["job-3"]["message"] == "after compaction"
+
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        """Test a partially written final line does not break loading."""
+        path = tmp_path / "jobs.jsonl"
+        store = JobStore(path)
+        store.put("a", {"id": "a", "created_at": 1.0})
+        store.close()
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write('{"op": "patch", "id": "a", "fie')
+
+        assert JobStore(path).load() == {"a": {"id": "a", "created_at": 1.0}}
+
+    def test_append_after_torn_last_line_is_kept(self, tmp_path):
+        """Test a record appended after a crash mid-write is not merged into the torn line."""
+        path = tmp_path / "jobs.jsonl"
+        store = JobStore(path)
+        store.put("a", {"id": "a", "created_at": 1.0})
+        store.close()
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write('{"op": "patch", "id": "a", "fie')
+
+        store = JobStore(path)
+        store.patch("a", fields={"state": "running"})
+        store.put("b", {"id": "b", "created_at": 2.0})
+        store.close()
+
+        records = JobStore(path).load()
+        assert records == {
+            "a": {"id": "a", "created_at": 1.0, "state": "running"},
+            "b": {"id": "b", "created_at": 2.0},
+        }
@@ -0,0 +1,213 @@
+"""Tests for the indexed, tail-first backend log query engine."""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from app.services import log_query
+from app.services.log_query import LogQueryEngine, iter_lines_reversed
+
+_BASE = datetime(2024, 1, 1, 12, 0, 0).timestamp()
+
+
+def _line(seconds: int, level: str = "INFO", message: str | None = None) -> str:
+    asctime = datetime.fromtimestamp(_BASE + seconds).strftime("%Y-%m-%d %H:%M:%S") + ",000"
+    record = {
+        "asctime": asctime,
+        "levelname": level,
+        "name": "app.test",
+        "message": message or f"event {seconds}",
+        "correlation_id": None,
+    }
+    return json.dumps(record) + "\n"
+
+
+def _write(path: Path, lines: list[str], mode: str = "w") -> None:
+    with path.open(mode, encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    """Active log file path inside a temporary logs directory."""
+    return tmp_path / "backend.log"
+
+
+def _engine(log_file: Path) -> LogQueryEngine:
+    return LogQueryEngine(log_file, log_file.parent / ".index", block_bytes=1024)
+
+
+class TestLogQuery:
+    """Test suite for LogQueryEngine.query."""
+
+    def test_newest_first_across_rotated_files(self, log_file):
+        """Test entries come newest first, continuing into rotated backups."""
+        _write(log_file.with_name("backend.log.1"), [_line(s) for s in range(0, 50)])
+        _write(log_file, [_line(s) for s in range(50, 60)])
+
+        entries = _engine(log_file).query(15)
+
+        assert [e["message"] for e in entries] == [f"event {s}" for s in range(59, 44, -1)]
+        assert entries[0]["timestamp"] == _BASE + 59
+        assert entries[0]["source"] == "backend" and entries[0]["level"] == "info"
+
+    def test_level_filter_skips_blocks_and_decodes_only_matches(self, log_file, monkeypatch):
+        """Test only matching lines are JSON-decoded and non-matching blocks are not read."""
+        lines = [_line(s, "ERROR" if s in (5, 400) else "INFO") for s in range(500)]
+        _write(log_file, lines)
+        engine = _engine(log_file)
+        engine.query(1)  # build the index
+        decoded: list[bytes] = []
+        original = log_query._entry
+        monkeypatch.setattr(log_query, "_entry", lambda line: decoded.append(line) or original(line))
+
+        entries = engine.query(10, level="error")
+
+        assert [e["message"] for e in entries] == ["event 400", "event 5"]
+        assert len(decoded) == 2
+
+    def test_time_range(self, log_file):
+        """Test since/until bound the returned entries."""
+        _write(log_file.with_name("backend.log.1"), [_line(s) for s in range(0, 100)])
+        _write(log_file, [_line(s) for s in range(100, 200)])
+
+        entries = _engine(log_file).query(1000, since=_BASE + 90, until=_BASE + 110)
+
+        assert [e["timestamp"] - _BASE for e in entries] == list(range(110, 89, -1))
+
+    def test_partial_last_line_is_ignored_until_complete(self, log_file):
+        """Test a line still being written is not returned or indexed."""
+        complete = _line(1)
+        partial = _line(2)
+        _write(log_file, [complete, partial[:20]])
+        engine = _engine(log_file)
+
+        assert [e["message"] for e in engine.query(10)] == ["event 1"]
+
+        _write(log_file, [partial[20:]], mode="a")
+        assert [e["message"] for e in engine.query(10)] == ["event 2", "event 1"]
+
+    def test_index_is_reused_after_rotation_and_pruned(self, log_file, monkeypatch):
+        """Test a rotated file keeps its sidecar and sidecars of deleted files are removed."""
+        _write(log_file, [_line(s) for s in range(100)])
+        _engine(log_file).query(1)
+        log_file.rename(log_file.with_name("backend.log.1"))
+        _write(log_file, [_line(s) for s in range(100, 110)])
+        extended: list[int] = []
+        engine = _engine(log_file)
+        original = engine._extend
+        monkeypatch.setattr(engine, "_extend", lambda f, index, size: extended.append(size) or original(f, index, size))
+
+        assert len(engine.query(200)) == 110
+        assert extended == [log_file.stat().st_size]
+
+        log_file.with_name("backend.log.1").unlink()
+        engine.query(1)
+        assert len(list((log_file.parent / ".index").glob("*.json"))) == 1
+
+    def test_level_counts_from_index(self, log_file):
+        """Test level counts come from the sidecar index."""
+        _write(log_file, [_line(s, "WARNING" if s % 10 == 0 else "INFO") for s in range(100)])
+
+        assert _engine(log_file).level_counts() == {"info": 90, "warning": 10}
+
+
+class TestLogTail:
+    """Test suite for cursor-based following."""
+
+    def test_follow_returns_only_new_entries_across_rotation(self, log_file):
+        """Test a cursor resumes after the last entry, including after rotation."""
+        _write(log_file, [_line(s) for s in range(5)])
+        engine = _engine(log_file)
+
+        first = engine.tail(None, 3)
+        assert [e["message"] for e in first.entries] == ["event 2", "event 3", "event 4"]
+
+        _write(log_file, [_line(5), _line(6)], mode="a")
+        second = engine.tail(first.cursor, 100)
+        assert [e["message"] for e in second.entries] == ["event 5", "event 6"]
+
+        _write(log_file, [_line(7)], mode="a")
+        log_file.rename(log_file.with_name("backend.log.1"))
+        _write(log_file, [_line(8), _line(9)])
+        third = engine.tail(second.cursor, 2)
+        assert [e["message"] for e in third.entries] == ["event 7", "event 8"]
+        fourth = engine.tail(third.cursor, 100)
+        assert [e["message"] for e in fourth.entries] == ["event 9"]
+        assert engine.tail(fourth.cursor, 100).entries == []
+        assert not fourth.reset
+
+    def test_unknown_cursor_resets_to_oldest_file(self, log_file):
+        """Test a cursor for a file that is gone restarts from the oldest retained file."""
+        _write(log_file, [_line(s) for s in range(3)])
+
+        tail = _engine(log_file).tail("deadbeef:10", 100)
+
+        assert tail.reset
+        assert [e["message"] for e in tail.entries] == ["event 0", "event 1", "event 2"]
+
+    @pytest.mark.parametrize("offset", ["abc", "-5", "1.5"])
+    def test_malformed_cursor_resets_to_oldest_file(self, log_file, offset):
+        """Test a cursor with an unparsable offset restarts from the oldest file instead of raising."""
+        _write(log_file, [_line(s) for s in range(3)])
+        engine = _engine(log_file)
+        file_id = engine.tail(None, 1).cursor.partition(":")[0]
+
+        tail = engine.tail(f"{file_id}:{offset}", 100)
+
+        assert tail.reset
+        assert [e["message"] for e in tail.entries] == ["event 0", "event 1", "event 2"]
+
+
+class TestIterLinesReversed:
+    """Test suite for backwards line reading."""
+
+    def test_lines_spanning_blocks(self, tmp_path):
+        """Test lines longer than the block size come back whole and in reverse order."""
+        path = tmp_path / "events.jsonl"
+        lines = [f"{i}:" + "x" * (i * 7) for i in range(30)]
+        path.write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+
+        assert [line.decode() for line in iter_lines_reversed(path, block_bytes=16)] == lines[::-1]
+
+
+class TestLogQueryPerformance:
+    """Benchmarks for tail-first log queries."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_newest_entries_without_full_scan(self, log_file):
+        """Test the newest entries are served far faster than parsing every line."""
+        lines = [_line(s, "ERROR" if s % 5000 == 0 else "INFO", "x" * 150) for s in range(120_000)]
+        _write(log_file, lines)
+        engine = LogQueryEngine(log_file, log_file.parent / ".index")
+
+        start = time.perf_counter()
+        engine.query(1)
+        index_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        newest = engine.query(100)
+        errors = engine.query(100, level="error")
+        indexed_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parsed = []
+        with log_file.open("r", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                datetime.strptime(record["asctime"].split(",")[0], "%Y-%m-%d %H:%M:%S")
+                parsed.append(record)
+        scan_s = time.perf_counter() - start
+
+        print(
+            f"\n{log_file.stat().st_size / 1e6:.1f} MB: first index build {index_s * 1000:.0f} ms, "
+            f"indexed queries {indexed_s * 1000:.1f} ms, full parse {scan_s * 1000:.0f} ms"
+        )
+        assert len(newest) == 100 and len(errors) == 24
+        assert indexed_s * 10 < scan_s
@@ -0,0 +1,137 @@
+"""Tests for the platform I/O executor and the event loop lag monitor."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.loop_lag import LoopLagMonitor
+from app.services.platform_executor import PlatformCallTimeout, PlatformExecutor, PlatformLimit
+
+
+@pytest.fixture
+def executor():
+    executor = PlatformExecutor(max_workers=8, limits={"slow": PlatformLimit(concurrency=2, timeout_s=5.0)})
+    yield executor
+    executor.shutdown()
+
+
+class TestPlatformExecutor:
+    """Test suite for PlatformExecutor."""
+
+    async def test_runs_call_in_worker_thread(self, executor):
+        """Test the call runs off the event loop thread and returns its result."""
+        result = await executor.run("twitter", lambda a, b=0: (threading.current_thread().name, a + b), 1, b=2)
+
+        assert result[0].startswith("platform-io")
+        assert result[1] == 3
+        assert executor.stats()["platforms"]["twitter"]["calls"] == 1
+
+    async def test_errors_propagate(self, executor):
+        """Test exceptions raised by the SDK reach the caller unchanged."""
+        def fail():
+            raise ValueError("rate limited")
+
+        with pytest.raises(ValueError, match="rate limited"):
+            await executor.run("twitter", fail)
+
+    async def test_per_platform_concurrency_limit(self, executor):
+        """Test no more than the platform's limit run at once."""
+        active = 0
+        peak = 0
+        guard = threading.Lock()
+
+        def upload():
+            nonlocal active, peak
+            with guard:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with guard:
+                active -= 1
+
+        await asyncio.gather(*(executor.run("slow", upload) for _ in range(6)))
+
+        assert peak == 2
+        assert executor.stats()["platforms"]["slow"]["in_flight"] == 0
+
+    async def test_timeout_keeps_slot_until_thread_returns(self, executor):
+        """Test a timed-out call raises but still counts against the limit while it runs."""
+        release = threading.Event()
+
+        with pytest.raises(PlatformCallTimeout):
+            await executor.run("slow", release.wait, timeout_s=0.05)
+
+        stats = executor.stats()["platforms"]["slow"]
+        assert stats["timeouts"] == 1
+        assert stats["in_flight"] == 1
+
+        release.set()
+        for _ in range(100):
+            if executor.stats()["platforms"]["slow"]["in_flight"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.stats()["platforms"]["slow"]["in_flight"] == 0
+
+
+class TestLoopLagMonitor:
+    """Test suite for LoopLagMonitor."""
+
+    async def test_detects_blocked_loop(self):
+        """Test a blocking call on the loop shows up as lag."""
+        monitor = LoopLagMonitor(interval_s=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.2)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        stats = monitor.stats()
+        assert stats["samples"] > 0
+        assert stats["max_ms"] >= 150
+        assert not stats["running"]
+
+    def test_empty_stats(self):
+        """Test stats before any sample."""
+        assert LoopLagMonitor().stats()["samples"] == 0
+
+
+class TestPlatformExecutorPerformance:
+    """Benchmark for event loop lag under concurrent platform calls."""
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    async def test_offloading_keeps_loop_responsive(self, executor):
+        """Test offloaded uploads leave the loop free while inline calls block it."""
+        def upload():
+            time.sleep(0.1)  # stands in for a blocking SDK upload
+            return "ok"
+
+        async def inline_upload():
+            return upload()
+
+        async def measure(make_call) -> dict:
+            monitor = LoopLagMonitor(interval_s=0.01)
+            monitor.start()
+            await asyncio.sleep(0.02)
+            start = time.perf_counter()
+            await asyncio.gather(*(make_call() for _ in range(8)))
+            elapsed = time.perf_counter() - start
+            await asyncio.sleep(0.03)  # let the probe record the last sample
+            await monitor.stop()
+            return {**monitor.stats(), "elapsed_s": elapsed}
+
+        executor.limits["instagram"] = PlatformLimit(concurrency=4, timeout_s=5.0)
+        inline = await measure(inline_upload)
+        offloaded = await measure(lambda: executor.run("instagram", upload))
+
+        print(
+            f"\n8 x 100 ms uploads: inline max lag {inline['max_ms']:.0f} ms in {inline['elapsed_s']:.2f} s, "
+            f"offloaded max lag {offloaded['max_ms']:.0f} ms in {offloaded['elapsed_s']:.2f} s"
+        )
+        assert inline["max_ms"] >= 700
+        assert offloaded["max_ms"] < 100
+        assert offloaded["elapsed_s"] < inline["elapsed_s"]
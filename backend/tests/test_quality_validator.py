@@ -0,0 +1,182 @@
+"""Tests for QualityValidator check profiles and shared image features."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.services.image_features import ImageFeatures
+from app.services.quality_validator import (
+    QUALITY_PROFILES,
+    QualityValidator,
+    resolve_quality_checks,
+    shutdown_validation_pool,
+)
+
+
+@pytest.fixture
+def sample_image(tmp_path):
+    """Write a smooth 640x640 RGB test image and return its path."""
+    rng = np.random.default_rng(0)
+    small = Image.fromarray((rng.random((40, 40, 3)) * 255).astype("uint8"))
+    path = tmp_path / "sample.png"
+    small.resize((640, 640), Image.BICUBIC).save(path)
+    return path
+
+
+class TestImageFeatures:
+    """Test suite for ImageFeatures caching."""
+
+    def test_intermediates_are_computed_once_and_read_only(self, sample_image):
+        """Test cached arrays are shared between accesses and protected from mutation."""
+        with Image.open(sample_image) as img:
+            features = ImageFeatures(img)
+
+        assert features.gray is features.gray
+        assert features.edge_magnitude is features.edge_magnitude
+        assert features.histogram(32) is features.histogram(32)
+        assert ImageFeatures.of(features) is features
+        with pytest.raises(ValueError):
+            features.gray[0, 0] = 1.0
+
+    def test_pyramid_levels_halve_until_small(self, sample_image):
+        """Test pyramid levels and pyramid_level scale factors."""
+        with Image.open(sample_image) as img:
+            features = ImageFeatures(img)
+
+        assert [level.shape for level in features.pyramid] == [(640, 640), (320, 320), (160, 160), (80, 80)]
+        level, scale = features.pyramid_level(400)
+        assert level.shape == (320, 320) and scale == 2
+
+
+class TestQualityProfiles:
+    """Test suite for profile-based check selection."""
+
+    def test_fast_profile_runs_subset(self, sample_image):
+        """Test the fast profile skips the expensive checks."""
+        result = QualityValidator().validate_content(file_path=str(sample_image), profile="fast")
+
+        assert result.metadata["quality_checks"] == list(QUALITY_PROFILES["fast"])
+        assert "blur_score" in result.metadata
+        assert "artifact_score" in result.metadata
+        assert "lighting_score" not in result.metadata
+        assert "background_coherence_score" not in result.metadata
+
+    def test_shared_features_match_per_check_decoding(self, sample_image):
+        """Test analysers return the same scores for a PIL image and shared features."""
+        validator = QualityValidator()
+        with Image.open(sample_image) as img:
+            img.load()
+            features = ImageFeatures(img)
+            for analyser in (
+                validator._detect_blur,
+                validator._detect_artifacts,
+                validator._analyze_lighting,
+                validator._analyze_background_coherence,
+                validator._detect_ai_signatures,
+            ):
+                assert analyser(img) == pytest.approx(analyser(features))
+            assert validator._check_color_contrast(img) == pytest.approx(validator._check_color_contrast(features))
+
+    def test_explicit_checks_and_validation(self):
+        """Test explicit check lists are ordered and unknown names are rejected."""
+        assert resolve_quality_checks(checks=["lighting", "blur"]) == ("blur", "lighting")
+        with pytest.raises(ValueError):
+            resolve_quality_checks(checks=["nope"])
+        with pytest.raises(ValueError):
+            resolve_quality_checks(profile="thorough")  # type: ignore[arg-type]
+
+
+class TestValidateBatch:
+    """Test suite for parallel batch validation."""
+
+    @pytest.fixture(autouse=True)
+    def _stop_pool(self):
+        yield
+        shutdown_validation_pool()
+
+    @pytest.fixture
+    def batch_paths(self, tmp_path):
+        rng = np.random.default_rng(1)
+        paths = []
+        for idx in range(4):
+            small = Image.fromarray((rng.random((32, 32, 3)) * 255).astype("uint8"))
+            path = tmp_path / f"batch-{idx}.png"
+            small.resize((512, 512), Image.BICUBIC).save(path)
+            paths.append(str(path))
+        return paths
+
+    def test_streams_same_results_as_serial_validation(self, batch_paths, monkeypatch):
+        """Test every file is yielded once with the same scores as validate_content."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "quality_validation_workers", 2)
+        validator = QualityValidator()
+
+        streamed = dict(validator.validate_batch(batch_paths, profile="fast"))
+
+        assert sorted(streamed) == sorted(batch_paths)
+        for path in batch_paths:
+            expected = validator.validate_content(file_path=path, profile="fast")
+            assert streamed[path].quality_score == expected.quality_score
+            assert streamed[path].metadata["blur_score"] == pytest.approx(expected.metadata["blur_score"])
+
+    def test_single_worker_validates_inline(self, batch_paths, monkeypatch):
+        """Test a pool size of 1 never starts worker processes."""
+        from app.core.config import settings
+        from app.services import quality_validator as qv_module
+
+        monkeypatch.setattr(settings, "quality_validation_workers", 1)
+        monkeypatch.setattr(qv_module, "_get_validation_pool", lambda: pytest.fail("pool should not be used"))
+
+        results = list(QualityValidator().validate_batch(batch_paths, profile="fast"))
+
+        assert [path for path, _ in results] == batch_paths
+
+    def test_missing_file_reports_error(self, batch_paths, monkeypatch):
+        """Test per-file errors are returned as results rather than raised."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "quality_validation_workers", 2)
+        missing = str(Path(batch_paths[0]).with_name("missing.png"))
+
+        results = dict(QualityValidator().validate_batch([batch_paths[0], missing], profile="fast"))
+
+        assert results[missing].is_valid is False
+        assert results[batch_paths[0]].is_valid is True
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_batch_throughput(self, tmp_path, monkeypatch):
+        """Benchmark an 8-image full-profile batch: serial loop against the process pool."""
+        from app.core.config import settings
+
+        rng = np.random.default_rng(2)
+        paths = []
+        for idx in range(8):
+            small = Image.fromarray((rng.random((64, 64, 3)) * 255).astype("uint8"))
+            path = tmp_path / f"bench-{idx}.png"
+            small.resize((1024, 1024), Image.BICUBIC).save(path)
+            paths.append(str(path))
+        validator = QualityValidator()
+        monkeypatch.setattr(settings, "quality_validation_workers", 4)
+        list(validator.validate_batch(paths[:2]))  # warm up worker processes
+
+        start = time.perf_counter()
+        for path in paths:
+            validator.validate_content(file_path=path)
+        serial_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        first_s = None
+        for _ in validator.validate_batch(paths):
+            if first_s is None:
+                first_s = time.perf_counter() - start
+        pooled_s = time.perf_counter() - start
+
+        print(f"\n8x1024px full validation: serial={serial_s:.2f}s pooled={pooled_s:.2f}s first_result={first_s:.2f}s")
+        assert first_s < serial_s
@@ -0,0 +1,118 @@
+"""Tests for the background resource sampler and windowed aggregates."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from app.services.resource_manager import ResourceLimits, ResourceManager, ResourceUsage
+
+
+def _usage(timestamp: float, cpu: float, memory: float = 50.0, gpu_util: float | None = None) -> ResourceUsage:
+    return ResourceUsage(
+        timestamp=timestamp,
+        cpu_percent=cpu,
+        memory_used_gb=8.0,
+        memory_total_gb=16.0,
+        memory_percent=memory,
+        disk_used_gb=100.0,
+        disk_total_gb=200.0,
+        disk_percent=50.0,
+        gpu_available=gpu_util is not None,
+        gpu_memory_used_gb=None,
+        gpu_memory_total_gb=None,
+        gpu_utilization_percent=gpu_util,
+    )
+
+
+@pytest.fixture
+def manager() -> Iterator[ResourceManager]:
+    """Resource manager with a short sampling interval."""
+    manager = ResourceManager(sample_interval_s=0.02, history_minutes=1)
+    yield manager
+    manager.stop_sampler()
+
+
+class TestResourceSampler:
+    """Test suite for ResourceManager sampling."""
+
+    def test_ring_buffer_is_bounded_by_history(self):
+        """Test the sample buffer holds history_minutes / interval samples at most."""
+        manager = ResourceManager(sample_interval_s=30.0, history_minutes=2)
+
+        for _ in range(10):
+            manager.record_sample()
+
+        assert len(manager._samples) == 4
+
+    def test_current_usage_reads_latest_sample_without_sampling(self, manager, monkeypatch):
+        """Test a fresh sample is returned as-is instead of querying the system."""
+        recorded = manager.record_sample()
+        monkeypatch.setattr(manager, "sample", lambda: pytest.fail("sampled on read"))
+
+        assert manager.get_current_usage() is recorded
+
+    def test_stale_sample_triggers_on_demand_sample(self, manager):
+        """Test a missing or stale buffer falls back to sampling now."""
+        manager._samples.append(_usage(time.time() - 60, cpu=1.0))
+
+        usage = manager.get_current_usage()
+
+        assert time.time() - usage.timestamp < 1
+        assert len(manager._samples) == 2
+
+    def test_background_sampler_fills_buffer(self, manager):
+        """Test the sampler thread records samples until stopped."""
+        manager.start_sampler()
+        time.sleep(0.15)
+        manager.stop_sampler()
+        count = len(manager._samples)
+        time.sleep(0.05)
+
+        assert count >= 3
+        assert len(manager._samples) == count
+        assert not manager.sampler_running
+
+
+class TestUsageWindow:
+    """Test suite for windowed aggregates and alerts."""
+
+    def test_window_aggregates_only_recent_samples(self, manager):
+        """Test min/avg/p95/max cover samples inside the window only."""
+        now = time.time()
+        manager._samples.append(_usage(now - 600, cpu=100.0))
+        for index, cpu in enumerate(range(1, 21)):
+            manager._samples.append(_usage(now - 20 + index, cpu=float(cpu), gpu_util=10.0))
+
+        window = manager.get_usage_window(minutes=1)
+
+        assert window["samples"] == 20
+        assert window["metrics"]["cpu_percent"] == {"min": 1.0, "avg": 10.5, "p95": 19.0, "max": 20.0}
+        assert window["metrics"]["gpu_utilization_percent"]["avg"] == 10.0
+        assert window["metrics"]["gpu_memory_percent"] is None
+
+    def test_alerts_use_window_average_not_spikes(self):
+        """Test a single CPU spike does not alert while sustained load does."""
+        manager = ResourceManager(ResourceLimits(cpu_warning_percent=80.0), sample_interval_s=60.0)
+        now = time.time()
+        for offset in range(5):
+            manager._samples.append(_usage(now - 50 + offset * 10, cpu=20.0))
+        manager._samples.append(_usage(now, cpu=99.0))
+
+        assert [a.resource_type for a in manager.check_alerts(window_minutes=1)] == []
+
+        for _ in range(20):
+            manager._samples.append(_usage(now, cpu=95.0))
+        alerts = manager.check_alerts(window_minutes=1)
+        assert [(a.resource_type, a.severity) for a in alerts] == [("cpu", "warning")]
+
+    def test_summary_includes_window(self, manager):
+        """Test the usage summary carries the windowed aggregates."""
+        manager.record_sample()
+
+        summary = manager.get_usage_summary(window_minutes=1)
+
+        assert summary["window"]["samples"] >= 1
+        assert set(summary["window"]["metrics"]) >= {"cpu_percent", "memory_percent", "disk_percent"}
@@ -0,0 +1,281 @@
+"""Tests for the scheduled post dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.content import ScheduledPost
+from app.services.scheduled_post_dispatcher import ScheduledPostDispatcher
+
+POST_S = 0.02
+
+
+class RecordingExecutor:
+    """Stands in for ContentDistributionService.execute_scheduled_post."""
+
+    def __init__(self, delay_s: float = POST_S, fail: set | None = None) -> None:
+        self.delay_s = delay_s
+        self.fail = fail or set()
+        self.posted: list = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, db, post):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay_s)
+        finally:
+            self.active -= 1
+        self.posted.append((post.character_id, post.id))
+        if post.id in self.fail:
+            post.status = "failed"
+            post.error_message = "upload rejected"
+            return {"scheduled_post_id": str(post.id), "success": False, "error": "upload rejected"}
+        post.status = "posted"
+        post.posted_at = datetime.now(timezone.utc)
+        return {"scheduled_post_id": str(post.id), "success": True, "platforms": [post.platform]}
+
+
+@pytest.fixture
+async def sessions(tmp_path, sqlite_engine):
+    """Session factory on a file database, shared like separate backend processes would."""
+    engine = await sqlite_engine(ScheduledPost, path=tmp_path / "posts.db")
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def _schedule(sessions, characters: int, per_character: int, **overrides) -> dict:
+    """Insert due posts; returns post ids per character in schedule order."""
+    start = datetime.now(timezone.utc) - timedelta(hours=1)
+    posts: dict = {}
+    rows = []
+    for _ in range(characters):
+        character_id = uuid4()
+        posts[character_id] = []
+        for index in range(per_character):
+            post_id = uuid4()
+            posts[character_id].append(post_id)
+            rows.append({
+                "id": post_id,
+                "character_id": character_id,
+                "scheduled_time": start + timedelta(minutes=index),
+                "status": "pending",
+                "platform": "twitter",
+                "retry_count": 0,
+                **overrides,
+            })
+    async with sessions() as db:
+        await db.execute(insert(ScheduledPost.__table__), rows)
+        await db.commit()
+    return posts
+
+
+async def _statuses(sessions) -> dict:
+    async with sessions() as db:
+        return {post.id: post for post in (await db.execute(select(ScheduledPost))).scalars()}
+
+
+class TestScheduledPostDispatcher:
+    """Test suite for ScheduledPostDispatcher."""
+
+    async def test_dispatches_due_posts(self, sessions):
+        """Test due posts are posted and their claims cleared; future posts are left alone."""
+        posts = await _schedule(sessions, characters=2, per_character=2)
+        future_id = uuid4()
+        async with sessions() as db:
+            db.add(ScheduledPost(
+                id=future_id,
+                character_id=uuid4(),
+                scheduled_time=datetime.now(timezone.utc) + timedelta(hours=1),
+                platform="twitter",
+            ))
+            await db.commit()
+        executor = RecordingExecutor()
+
+        summary = await ScheduledPostDispatcher(sessions, executor=executor).dispatch_once()
+
+        assert summary["total"] == summary["succeeded"] == 4
+        rows = await _statuses(sessions)
+        for ids in posts.values():
+            for post_id in ids:
+                assert rows[post_id].status == "posted"
+                assert rows[post_id].claimed_by is None
+                assert rows[post_id].lease_expires_at is None
+        assert rows[future_id].status == "pending"
+
+    async def test_failures_are_recorded(self, sessions):
+        """Test a failed post is reported and stored as failed."""
+        posts = await _schedule(sessions, characters=1, per_character=2)
+        failing = next(iter(posts.values()))[0]
+
+        summary = await ScheduledPostDispatcher(
+            sessions, executor=RecordingExecutor(fail={failing})
+        ).dispatch_once()
+
+        assert (summary["succeeded"], summary["failed"]) == (1, 1)
+        assert (await _statuses(sessions))[failing].status == "failed"
+
+    async def test_executor_exception_marks_post_failed(self, sessions):
+        """Test an exception escaping the executor fails the post instead of leaving it claimed."""
+        posts = await _schedule(sessions, characters=1, per_character=1)
+
+        async def explode(db, post):
+            raise RuntimeError("boom")
+
+        summary = await ScheduledPostDispatcher(sessions, executor=explode).dispatch_once()
+
+        post = (await _statuses(sessions))[next(iter(posts.values()))[0]]
+        assert summary["failed"] == 1
+        assert (post.status, post.error_message, post.retry_count, post.claimed_by) == ("failed", "boom", 1, None)
+
+    async def test_concurrent_dispatchers_never_double_post(self, sessions):
+        """Test two dispatchers draining the same table post every post exactly once."""
+        await _schedule(sessions, characters=10, per_character=5)
+        executor = RecordingExecutor()
+        dispatchers = [
+            ScheduledPostDispatcher(sessions, worker_id=f"worker-{n}", batch_size=7, executor=executor)
+            for n in range(2)
+        ]
+
+        async def drain(dispatcher):
+            while (await dispatcher.dispatch_once())["total"]:
+                pass
+
+        await asyncio.gather(*(drain(d) for d in dispatchers))
+
+        posted_ids = [post_id for _, post_id in executor.posted]
+        assert len(posted_ids) == len(set(posted_ids)) == 50
+        assert {post.status for post in (await _statuses(sessions)).values()} == {"posted"}
+
+    async def test_per_account_order_is_kept(self, sessions):
+        """Test each account's posts go out in schedule order, even across dispatchers."""
+        posts = await _schedule(sessions, characters=4, per_character=6)
+        executor = RecordingExecutor(delay_s=0.005)
+        dispatchers = [
+            ScheduledPostDispatcher(sessions, worker_id=f"worker-{n}", batch_size=5, executor=executor)
+            for n in range(3)
+        ]
+
+        async def drain(dispatcher):
+            while (await dispatcher.dispatch_once())["total"]:
+                pass
+
+        await asyncio.gather(*(drain(d) for d in dispatchers))
+
+        for character_id, ids in posts.items():
+            assert [post_id for owner, post_id in executor.posted if owner == character_id] == ids
+
+    async def test_busy_account_is_skipped(self, sessions):
+        """Test an account with a post claimed elsewhere is not claimed again; its other platforms are."""
+        posts = await _schedule(sessions, characters=1, per_character=2)
+        character_id, (first, _) = next(iter(posts.items()))
+        other_platform = uuid4()
+        async with sessions() as db:
+            db.add(ScheduledPost(
+                id=other_platform,
+                character_id=character_id,
+                scheduled_time=datetime.now(timezone.utc) - timedelta(minutes=1),
+                platform="instagram",
+            ))
+            await db.commit()
+        async with sessions() as db:
+            await db.execute(
+                update(ScheduledPost)
+                .where(ScheduledPost.id == first)
+                .values(
+                    status="processing",
+                    claimed_by="other-worker",
+                    lease_expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+                )
+            )
+            await db.commit()
+
+        _, claimed = await ScheduledPostDispatcher(sessions, executor=RecordingExecutor()).claim(10)
+
+        assert [post.id for post in claimed] == [other_platform]
+
+    async def test_expired_lease_is_failed_not_reposted(self, sessions):
+        """Test a post claimed by a dispatcher that died is stored as failed, not posted again."""
+        posts = await _schedule(
+            sessions,
+            characters=1,
+            per_character=1,
+            status="processing",
+            claimed_by="dead-worker",
+            lease_expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+        )
+        executor = RecordingExecutor()
+
+        summary = await ScheduledPostDispatcher(sessions, executor=executor).dispatch_once()
+
+        post = (await _statuses(sessions))[next(iter(posts.values()))[0]]
+        assert summary["total"] == 0
+        assert executor.posted == []
+        assert (post.status, post.claimed_by, post.lease_expires_at) == ("failed", None, None)
+        assert post.error_message.startswith("Interrupted")
+
+    async def test_live_lease_is_left_alone(self, sessions):
+        """Test a claim whose lease has not lapsed is neither failed nor posted."""
+        posts = await _schedule(
+            sessions,
+            characters=1,
+            per_character=1,
+            status="processing",
+            claimed_by="other-worker",
+            lease_expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+        )
+
+        assert await ScheduledPostDispatcher(sessions, executor=RecordingExecutor()).fail_expired() == 0
+        assert (await _statuses(sessions))[next(iter(posts.values()))[0]].status == "processing"
+
+    async def test_stop_releases_unstarted_posts(self, sessions):
+        """Test stopping the loop hands back unstarted posts and fails the interrupted one."""
+        posts = await _schedule(sessions, characters=1, per_character=3)
+        dispatcher = ScheduledPostDispatcher(sessions, executor=RecordingExecutor(delay_s=0.5))
+
+        dispatcher.start(poll_interval_s=0.01)
+        await asyncio.sleep(0.2)
+        await dispatcher.stop()
+
+        rows = await _statuses(sessions)
+        first, *rest = next(iter(posts.values()))
+        assert (rows[first].status, rows[first].claimed_by) == ("failed", None)
+        assert rows[first].error_message.startswith("Interrupted")
+        assert [rows[post_id].status for post_id in rest] == ["pending", "pending"]
+        assert (dispatcher.stats()["released"], dispatcher.stats()["failed"]) == (2, 1)
+
+    async def test_lanes_run_concurrently_within_limit(self, sessions):
+        """Test different characters post in parallel, capped at the concurrency."""
+        await _schedule(sessions, characters=6, per_character=1)
+        executor = RecordingExecutor(delay_s=0.05)
+
+        await ScheduledPostDispatcher(sessions, concurrency=3, executor=executor).dispatch_once()
+
+        assert executor.peak == 3
+
+    async def test_platforms_of_one_character_run_concurrently(self, sessions):
+        """Test a character's posts on different platforms are separate lanes."""
+        posts = await _schedule(sessions, characters=1, per_character=1, platform="twitter")
+        character_id = next(iter(posts))
+        async with sessions() as db:
+            db.add_all(
+                ScheduledPost(
+                    character_id=character_id,
+                    scheduled_time=datetime.now(timezone.utc) - timedelta(minutes=1),
+                    platform=platform,
+                )
+                for platform in ("instagram", "facebook")
+            )
+            await db.commit()
+        executor = RecordingExecutor(delay_s=0.05)
+
+        summary = await ScheduledPostDispatcher(sessions, concurrency=3, executor=executor).dispatch_once()
+
+        assert summary["succeeded"] == 3
+        assert executor.peak == 3
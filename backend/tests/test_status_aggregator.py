@@ -0,0 +1,88 @@
+"""Tests for the cached status snapshot."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from app.services.status_aggregator import StatusAggregator, StatusProbe
+
+
+class _CountingProbe:
+    """Probe callable that counts calls and can be made slow or failing."""
+
+    def __init__(self, delay_s: float = 0.0) -> None:
+        self.calls = 0
+        self.delay_s = delay_s
+        self.fail = False
+
+    def __call__(self) -> dict:
+        self.calls += 1
+        time.sleep(self.delay_s)
+        if self.fail:
+            raise RuntimeError("probe down")
+        return {"calls": self.calls}
+
+
+class TestStatusAggregator:
+    """Test suite for StatusAggregator refresh scheduling."""
+
+    def test_inline_refresh_respects_intervals(self):
+        """Test probes are only re-run once older than their own interval."""
+        fast, slow = _CountingProbe(), _CountingProbe()
+        aggregator = StatusAggregator([StatusProbe("fast", 0.05, fast), StatusProbe("slow", 60.0, slow)])
+
+        first = aggregator.snapshot()
+        time.sleep(0.06)
+        second = aggregator.snapshot()
+
+        assert first["slow"] == second["slow"] == {"calls": 1}
+        assert second["fast"] == {"calls": 2}
+        assert second["freshness"]["slow"]["interval_s"] == 60.0
+        assert second["freshness"]["slow"]["age_s"] >= 0.06
+        assert second["freshness"]["fast"]["error"] is None
+
+    def test_failing_probe_keeps_last_value_and_reports_error(self):
+        """Test a probe error is surfaced in freshness without dropping the last good value."""
+        probe = _CountingProbe()
+        aggregator = StatusAggregator([StatusProbe("svc", 0.0, probe)])
+        aggregator.snapshot()
+        probe.fail = True
+
+        snapshot = aggregator.snapshot()
+
+        assert snapshot["svc"] == {"calls": 1}
+        assert snapshot["freshness"]["svc"]["error"] == "probe down"
+
+    def test_concurrent_readers_share_one_refresh(self):
+        """Test readers arriving during a refresh wait for it instead of re-running the probe."""
+        probe = _CountingProbe(delay_s=0.1)
+        aggregator = StatusAggregator([StatusProbe("svc", 60.0, probe)])
+
+        threads = [threading.Thread(target=aggregator.snapshot) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert probe.calls == 1
+
+    async def test_background_refresh_keeps_reads_off_the_probe_path(self):
+        """Test started aggregators refresh on their own and snapshot never runs a probe."""
+        probe = _CountingProbe(delay_s=0.05)
+        aggregator = StatusAggregator([StatusProbe("svc", 0.1, probe)])
+        aggregator.start()
+        try:
+            await asyncio.sleep(0.35)
+            calls = probe.calls
+            start = time.perf_counter()
+            snapshot = aggregator.snapshot()
+            elapsed = time.perf_counter() - start
+        finally:
+            await aggregator.stop()
+
+        assert calls >= 2
+        assert snapshot["svc"]["calls"] >= 2
+        assert elapsed < 0.01
+        assert not aggregator.running
@@ -0,0 +1,148 @@
+"""Tests for delta-encoded monitoring broadcasts."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+from fastapi.websockets import WebSocketState
+
+from app.api import monitoring
+from app.services.status_feed import StatusFeed, apply_patch, json_diff
+
+
+class _FakeWebSocket:
+    """WebSocket stand-in that records sent messages, optionally slowly."""
+
+    def __init__(self, delay_s: float = 0.0) -> None:
+        self.client_state = WebSocketState.CONNECTED
+        self.delay_s = delay_s
+        self.sent: list[str] = []
+
+    async def send_text(self, text: str) -> None:
+        await asyncio.sleep(self.delay_s)
+        self.sent.append(text)
+
+    async def close(self) -> None:
+        self.client_state = WebSocketState.DISCONNECTED
+
+
+def _status(**backend) -> dict:
+    return {
+        "overall_status": "ok",
+        "backend": {"state": "running", "port": 8000, **backend},
+        "system": {"issues": [], "gpu": {"nvidia_smi": False}},
+    }
+
+
+class TestJsonDiff:
+    """Test suite for json_diff/apply_patch."""
+
+    def test_diff_round_trips(self):
+        """Test applying the diff reproduces the new document, including escaped keys."""
+        old = {"a": {"b": 1, "c": [1, 2], "gone": True}, "x/y": {"~k": 1}, "same": "s"}
+        new = {"a": {"b": 2, "c": [1, 2, 3], "new": None}, "x/y": {"~k": 2}, "same": "s"}
+
+        ops = json_diff(old, new)
+
+        assert apply_patch(old, ops) == new
+        assert {"op": "replace", "path": "/x~1y/~0k", "value": 2} in ops
+        assert {"op": "remove", "path": "/a/gone"} in ops
+        assert all(not op["path"].startswith("/same") for op in ops)
+
+    def test_equal_documents_produce_no_ops(self):
+        """Test unchanged documents diff to an empty patch."""
+        assert json_diff(_status(), _status()) == []
+
+
+class TestStatusFeed:
+    """Test suite for StatusFeed versioning."""
+
+    def test_publish_versions_only_changes(self):
+        """Test unchanged status is not republished and patches chain by version."""
+        feed = StatusFeed()
+
+        first = feed.publish(_status())
+        assert first.version == 1 and first.patch_message is None
+        assert feed.publish(_status()) is None
+
+        second = feed.publish(_status(state="stopped"))
+        patch = json.loads(second.patch_message)
+        assert (patch["version"], patch["base"]) == (2, 1)
+        assert patch["ops"] == [{"op": "replace", "path": "/backend/state", "value": "stopped"}]
+        assert json.loads(second.snapshot_message)["data"] == _status(state="stopped")
+
+    def test_patch_is_smaller_than_snapshot(self):
+        """Test a one-field change broadcasts a small fraction of the full status."""
+        feed = StatusFeed()
+        big = _status()
+        big["system"]["notes"] = ["x" * 200] * 20
+        feed.publish(big)
+        changed = json.loads(json.dumps(big))
+        changed["backend"]["last_check"] = time.time()
+
+        update = feed.publish(changed)
+
+        assert len(update.patch_message) * 20 < len(update.snapshot_message)
+
+
+class TestMonitoringClients:
+    """Test suite for per-client queues in the monitoring websocket."""
+
+    async def test_slow_client_does_not_delay_others_and_is_resynced(self):
+        """Test fast clients get patches promptly while a backlogged client gets a snapshot."""
+        feed = StatusFeed()
+        fast_ws, slow_ws = _FakeWebSocket(), _FakeWebSocket(delay_s=0.5)
+        fast, slow = monitoring._MonitoringClient(fast_ws), monitoring._MonitoringClient(slow_ws)
+        initial = feed.publish(_status(port=0))
+        for client in (fast, slow):
+            client.deliver_snapshot(initial.version, initial.snapshot_message)
+            client.start()
+        try:
+            for port in range(1, monitoring._client_queue_max + 3):
+                update = feed.publish(_status(port=port))
+                fast.deliver(update)
+                slow.deliver(update)
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+            # The slow client is still sending its first message
+            assert slow_ws.sent == []
+        finally:
+            await fast.stop()
+            await slow.stop()
+
+        fast_types = [json.loads(m)["type"] for m in fast_ws.sent]
+        assert fast_types == ["snapshot"] + ["patch"] * (monitoring._client_queue_max + 2)
+        assert slow.dropped > 0
+        # Backlog collapsed into a snapshot followed by patches on top of it
+        queued = [json.loads(m) for m in slow._queue]
+        assert [m["type"] for m in queued] == ["snapshot"] + ["patch"] * (len(queued) - 1)
+        assert queued[-1]["version"] == feed.version
+
+    async def test_patches_rebuild_the_latest_snapshot(self):
+        """Test a client applying every message ends with the latest status."""
+        feed = StatusFeed()
+        ws = _FakeWebSocket()
+        client = monitoring._MonitoringClient(ws)
+        first = feed.publish(_status())
+        client.deliver_snapshot(first.version, first.snapshot_message)
+        client.start()
+        try:
+            for state in ("stopped", "error", "running"):
+                client.deliver(feed.publish(_status(state=state, port=9000)))
+            await asyncio.sleep(0.05)
+        finally:
+            await client.stop()
+
+        document, version = None, 0
+        for raw in ws.sent:
+            message = json.loads(raw)
+            if message["type"] == "snapshot":
+                document = message["data"]
+            else:
+                assert message["base"] == version
+                document = apply_patch(document, message["ops"])
+            version = message["version"]
+        assert document == _status(state="running", port=9000)
+        assert [json.loads(m)["type"] for m in ws.sent] == ["snapshot", "patch", "patch", "patch"]
@@ -0,0 +1,90 @@
+"""Tests for the streaming ZIP writer."""
+
+from __future__ import annotations
+
+import io
+import os
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+from app.services.zip_stream import ZipEntry, aiter_zip, iter_zip
+
+
+def _files(tmp_path: Path) -> dict[str, Path]:
+    """A compressible text file and an incompressible "PNG"."""
+    text = tmp_path / "caption.txt"
+    text.write_text("hello world\n" * 50_000)
+    png = tmp_path / "image.png"
+    png.write_bytes(os.urandom(300_000))
+    return {"text/caption.txt": text, "image/image.png": png}
+
+
+class TestIterZip:
+    """Test suite for iter_zip."""
+
+    def test_archive_round_trips_with_per_type_compression(self, tmp_path):
+        """Test the chunks form a valid ZIP, media is stored and other files deflated."""
+        files = _files(tmp_path)
+        entries = [ZipEntry(name, path=path) for name, path in files.items()]
+        entries.append(ZipEntry("manifest.json", data=b'{"count": 2}'))
+
+        chunks = list(iter_zip(entries, chunk_bytes=64 * 1024))
+
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+            assert zf.testzip() is None
+            assert zf.read("manifest.json") == b'{"count": 2}'
+            for name, path in files.items():
+                assert zf.read(name) == path.read_bytes()
+            assert zf.getinfo("image/image.png").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("text/caption.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert len(chunks) > 3
+        assert max(len(c) for c in chunks) < 2 * 64 * 1024
+
+    def test_missing_file_is_skipped(self, tmp_path):
+        """Test a file deleted before its turn is left out instead of failing the export."""
+        entries = [ZipEntry("image/gone.png", path=tmp_path / "gone.png"), ZipEntry("a.txt", data=b"a")]
+
+        with zipfile.ZipFile(io.BytesIO(b"".join(iter_zip(entries)))) as zf:
+            assert zf.namelist() == ["a.txt"]
+
+    def test_memory_stays_near_chunk_size(self, tmp_path):
+        """Test streaming several large files never holds a whole file in memory."""
+        videos = []
+        for i in range(4):
+            path = tmp_path / f"clip{i}.mp4"
+            path.write_bytes(os.urandom(4 * 1024 * 1024))
+            videos.append(path)
+
+        tracemalloc.start()
+        try:
+            total = sum(
+                len(chunk)
+                for chunk in iter_zip((ZipEntry(f"video/{p.name}", path=p) for p in videos), chunk_bytes=64 * 1024)
+            )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert total > 16 * 1024 * 1024
+        assert peak < 1024 * 1024
+
+
+class TestAiterZip:
+    """Test suite for the async wrapper."""
+
+    async def test_stops_when_cancelled(self, tmp_path):
+        """Test the export stops reading once the client disconnects."""
+        big = tmp_path / "clip.mp4"
+        big.write_bytes(os.urandom(1024 * 1024))
+        checks = 0
+
+        async def is_disconnected() -> bool:
+            nonlocal checks
+            checks += 1
+            return checks >= 2
+
+        chunks = [c async for c in aiter_zip([ZipEntry("video/clip.mp4", path=big)], is_disconnected, 64 * 1024)]
+
+        assert len(chunks) == 2
+        assert sum(len(c) for c in chunks) < big.stat().st_size
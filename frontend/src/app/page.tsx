@@ -4,6 +4,7 @@ import Link from "next/link";
 import { useRouter } from "next/navigation";
 import { useEffect, useState } from "react";
 import { apiGet } from "@/lib/api";
+import { applyJsonPatch, type StatusMessage } from "@/lib/jsonPatch";
 import {
   MetricCard,
   StatusChip,
@@ -368,6 +369,8 @@ export default function Home() {
     let ws: WebSocket | null = null;
     let reconnectTimeout: NodeJS.Timeout | null = null;
     let reconnectAttempts = 0;
+    let liveStatus: UnifiedStatus | null = null;
+    let liveVersion = 0;
     const maxReconnectAttempts = 5;
     const reconnectDelay = 3000;
 
@@ -391,8 +394,17 @@ export default function Home() {
               return;
             }
 
-            const data = JSON.parse(event.data) as UnifiedStatus;
-            setStatus(data);
+            const message = JSON.parse(event.data) as StatusMessage<UnifiedStatus>;
+            if (message.type === "snapshot") {
+              liveStatus = message.data;
+            } else if (message.type === "patch" && liveStatus && message.base === liveVersion) {
+              liveStatus = applyJsonPatch(liveStatus, message.ops);
+            } else {
+              // Out of sequence; wait for the next snapshot
+              return;
+            }
+            liveVersion = message.version;
+            setStatus(liveStatus);
             setLoading(false);
             setError(null);
           } catch (e) {
@@ -0,0 +1,43 @@
+/**
+ * Minimal JSON patch support for the monitoring websocket.
+ *
+ * The backend sends `add` / `remove` / `replace` operations (RFC 6902 subset)
+ * produced by diffing consecutive status snapshots.
+ */
+
+export type JsonPatchOp =
+  | { op: "add" | "replace"; path: string; value: unknown }
+  | { op: "remove"; path: string };
+
+export type StatusMessage<T> =
+  | { type: "snapshot"; version: number; data: T }
+  | { type: "patch"; version: number; base: number; ops: JsonPatchOp[] };
+
+function unescapeToken(token: string): string {
+  return token.replace(/~1/g, "/").replace(/~0/g, "~");
+}
+
+/**
+ * Apply patch operations to a document without mutating it.
+ */
+export function applyJsonPatch<T>(document: T, ops: JsonPatchOp[]): T {
+  let result: unknown = structuredClone(document);
+  for (const op of ops) {
+    if (op.path === "") {
+      result = op.op === "remove" ? undefined : structuredClone(op.value);
+      continue;
+    }
+    const tokens = op.path.split("/").slice(1).map(unescapeToken);
+    const last = tokens.pop() as string;
+    let target = result as Record<string, unknown>;
+    for (const token of tokens) {
+      target = target[token] as Record<string, unknown>;
+    }
+    if (op.op === "remove") {
+      delete target[last];
+    } else {
+      target[last] = structuredClone(op.value);
+    }
+  }
+  return result as T;
+}